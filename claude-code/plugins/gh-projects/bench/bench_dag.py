@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark: SCC-condensed blast engine vs. the per-node DFS it replaced.
+
+Builds synthetic blocked-by boards from 1k to 100k items — mostly forward edges
+(long dependency chains) with a sprinkle of back-edges (cycles), closed items
+and release blockers — and times `dag.compute` against a reference that walks
+`_downstream` from every node. The reference is O(V·E) and is skipped above
+`--dfs-max` nodes; the two are asserted identical wherever both run.
+
+    python3 bench/bench_dag.py [--sizes 1000,10000,100000] [--dfs-max 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "lib"))
+
+import dag  # noqa: E402
+
+
+def synthetic_board(n: int, *, seed: int = 1, degree: int = 2, back_edges: float = 0.01) -> dict:
+    rng = random.Random(seed)
+    ids = [str(i) for i in range(n)]
+    items = {}
+    for i, k in enumerate(ids):
+        blockers = []
+        if i:
+            for _ in range(rng.randint(1, degree)):
+                # Mostly near predecessors -> long chains, plus a few far edges.
+                lo = max(0, i - 50) if rng.random() < 0.9 else 0
+                blockers.append(ids[rng.randrange(lo, i)])
+        if rng.random() < back_edges:
+            blockers.append(ids[rng.randrange(i, n)])  # may close a cycle
+        items[k] = {"blocked_by": blockers,
+                    "state": "closed" if rng.random() < 0.1 else "open",
+                    "release_blocker": rng.random() < 0.002}
+    return items
+
+
+def per_node_dfs(items: dict) -> dict:
+    blocks = dag._build_blocks(items)
+    out = {}
+    for k in items:
+        down = dag._downstream(k, blocks)
+        out[k] = {"blocked": dag.is_blocked(k, items),
+                  "blast_radius": dag._radius(
+                      len(down), any(items[d].get("release_blocker") for d in down)),
+                  "blast_count": len(down)}
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_dag.py")
+    parser.add_argument("--sizes", default="1000,5000,10000,50000,100000")
+    parser.add_argument("--dfs-max", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    print(f"{'nodes':>8} {'edges':>9} {'condensed':>11} {'per-node dfs':>13}  speedup")
+    for n in (int(x) for x in args.sizes.split(",")):
+        items = synthetic_board(n)
+        edges = sum(len(v["blocked_by"]) for v in items.values())
+        t0 = time.perf_counter()
+        fast = dag.compute(items)
+        t_fast = time.perf_counter() - t0
+        if n <= args.dfs_max:
+            t0 = time.perf_counter()
+            slow = per_node_dfs(items)
+            t_slow = time.perf_counter() - t0
+            assert fast == slow, f"engines disagree at n={n}"
+            print(f"{n:>8} {edges:>9} {t_fast:>10.3f}s {t_slow:>12.3f}s  {t_slow / t_fast:6.1f}x")
+        else:
+            print(f"{n:>8} {edges:>9} {t_fast:>10.3f}s {'(skipped)':>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark: columnar `analysis.Snapshot` rules vs. the per-item dict pass.
+
+Builds synthetic boards from 1k to 20k items with a realistic spread of
+statuses, health, blast radius, decisions and blocked-by edges, and times
+`compute_findings` + `rollup_counts` over a `Snapshot` against a reference
+that normalizes every item into its own dict and runs all rules item by item
+(the shape the engine had before). The two are asserted identical.
+
+    python3 bench/bench_findings.py [--sizes 1000,5000,20000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "lib"))
+
+import analysis as a  # noqa: E402
+
+TODAY = dt.date(2026, 1, 15)
+
+
+def synthetic_board(n: int, *, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    # Weighted like a real board: mostly closed or healthy work, so findings
+    # are the exception the rules have to pick out.
+    statuses = ["Done"] * 10 + ["Backlog"] * 4 + [a.STATUS_READY, "In progress", "In review"]
+    health = ["On track"] * 6 + [""] * 4 + [a.HEALTH_AT_RISK, a.HEALTH_OVERDUE]
+    blast = ["Blocks none"] * 6 + ["Blocks one", a.BLAST_MANY, a.BLAST_RELEASE]
+    decisions = [a.DECISION_NONE] * 40 + ["Move date", "Cut scope", None]
+    items = []
+    for i in range(1, n + 1):
+        epic = rng.random() < 0.05
+        total = rng.randint(1, 12) if epic else 0
+        items.append({
+            "number": i if rng.random() < 0.5 else str(i),
+            "status": rng.choice(statuses),
+            "type": "Epic" if epic else rng.choice(["Feature", "Bug", "Task"]),
+            "size": rng.choice(["S", "M", "L", "M", None]),
+            "target": rng.choice(["2026-01-10", "2026-02-01", "2026-03-01", None]),
+            "assignees": rng.sample(["ana", "bo", "cy"], rng.choice([1, 1, 1, 2, 0])),
+            "has_ac_table": rng.choice([True, True, True, False, None]),
+            "sub_issues_total": total,
+            "sub_issues_done": rng.randint(0, total),
+            "schedule_health": rng.choice(health),
+            "blast_radius": rng.choice(blast),
+            "blocked": a.BLOCKED_YES if rng.random() < 0.05 else "Unblocked",
+            "impact": a.IMPACT_RELEASE if rng.random() < 0.02 else "Normal",
+            "decision_needed": rng.choice(decisions),
+            "blocked_by": [rng.randint(1, n) for _ in range(rng.randint(0, 2))],
+        })
+    rng.shuffle(items)
+    return items
+
+
+def _norm(it: dict) -> dict:
+    return {
+        "number": str(it.get("number", "")),
+        "status": it.get("status") or "",
+        "type": it.get("type") or "",
+        "size": it.get("size"),
+        "target": it.get("target"),
+        "assignees": list(it.get("assignees") or []),
+        "has_ac_table": bool(it.get("has_ac_table")),
+        "sub_issues_total": int(it.get("sub_issues_total") or 0),
+        "sub_issues_done": int(it.get("sub_issues_done") or 0),
+        "schedule_health": it.get("schedule_health") or "",
+        "blast_radius": it.get("blast_radius") or "",
+        "blocked": it.get("blocked") or "",
+        "impact": it.get("impact") or "",
+        "decision_needed": it.get("decision_needed") or a.DECISION_NONE,
+        "blocked_by": [str(b) for b in (it.get("blocked_by") or [])],
+    }
+
+
+def per_item(items: list) -> tuple:
+    """The row-at-a-time reference: one normalized dict per item, every rule
+    tested against it, then the same deterministic sort."""
+    counts = {"items": 0, "overdue": 0, "at_risk": 0, "blocked": 0, "decisions_owed": 0}
+    findings = []
+    for raw in items:
+        it = _norm(raw)
+        num = it["number"]
+        counts["items"] += 1
+        counts["overdue"] += it["schedule_health"] == a.HEALTH_OVERDUE
+        counts["at_risk"] += it["schedule_health"] == a.HEALTH_AT_RISK
+        counts["blocked"] += it["blocked"] == a.BLOCKED_YES
+        counts["decisions_owed"] += it["decision_needed"] not in ("", a.DECISION_NONE)
+        if (it["impact"] == a.IMPACT_RELEASE or it["blast_radius"] == a.BLAST_RELEASE) \
+                and it["blocked"] == a.BLOCKED_YES:
+            b = it["blocked_by"]
+            findings.append(a._finding(
+                a.KIND_CRITICAL_CHAIN, a.SEV_CRITICAL_CHAIN, num,
+                title=f"Release-blocker #{num} is itself blocked",
+                summary=(f"#{num} is on the critical path (Impact "
+                         f"{it['impact'] or '—'} / Blast {it['blast_radius'] or '—'}) "
+                         f"but held by an open dependency."),
+                evidence={"number": num, "impact": it["impact"],
+                          "blast_radius": it["blast_radius"],
+                          "blocked": it["blocked"], "blocked_by": b},
+                action=a._action(a.SKILL_START_ISSUE, f"#{b[0]}" if b else f"#{num}",
+                                 note=("clear the upstream blocker to free the critical chain"
+                                       if b else None))))
+        if it["schedule_health"] == a.HEALTH_OVERDUE \
+                and it["blast_radius"] in (a.BLAST_RELEASE, a.BLAST_MANY):
+            findings.append(a._finding(
+                a.KIND_OVERDUE_HIGH_BLAST, a.SEV_OVERDUE_HIGH_BLAST, num,
+                title=f"#{num} is overdue and high blast-radius",
+                summary=(f"#{num} is Overdue with Blast radius "
+                         f"{it['blast_radius']} — its slip stalls downstream work."),
+                evidence={"number": num, "schedule_health": it["schedule_health"],
+                          "blast_radius": it["blast_radius"], "target": it["target"]},
+                action=a._action(a.SKILL_PLAN_SPRINT, f"reschedule #{num}",
+                                 note="move the date or cut scope, then re-plan")))
+        if (it["type"] == "Epic" and it["schedule_health"] in (a.HEALTH_AT_RISK, a.HEALTH_OVERDUE)
+                and 0 < it["sub_issues_total"] > it["sub_issues_done"]):
+            findings.append(a._finding(
+                a.KIND_STALLED_EPIC, a.SEV_STALLED_EPIC, num,
+                title=f"Epic #{num} is stalling",
+                summary=(f"Epic #{num} is {it['schedule_health']} with "
+                         f"{it['sub_issues_done']}/{it['sub_issues_total']} sub-issues done."),
+                evidence={"number": num, "schedule_health": it["schedule_health"],
+                          "sub_issues_done": it["sub_issues_done"],
+                          "sub_issues_total": it["sub_issues_total"]},
+                action=a._action(a.SKILL_PLAN_SPRINT, f"re-plan epic #{num}",
+                                 note="re-plan or start the next sub-issue")))
+        if it["status"] == a.STATUS_READY:
+            gaps = [g for g, ok in (("AC table", it["has_ac_table"]), ("Size", it["size"]),
+                                    ("Target date", it["target"])) if not ok]
+            if gaps:
+                findings.append(a._finding(
+                    a.KIND_INTAKE_HYGIENE, a.SEV_INTAKE_HYGIENE, num,
+                    title=f"Ready #{num} has intake gaps",
+                    summary=f"#{num} is Ready but missing: {', '.join(gaps)}.",
+                    evidence={"number": num, "status": it["status"], "missing": gaps,
+                              "size": it["size"], "target": it["target"],
+                              "has_ac_table": it["has_ac_table"]},
+                    action=a._action(a.SKILL_CREATE_ISSUES, f"#{num}",
+                                     note="complete intake fields before it is worked")))
+        if it["status"] in a.IN_SPRINT_STATUSES and not it["assignees"]:
+            findings.append(a._finding(
+                a.KIND_UNASSIGNED_IN_SPRINT, a.SEV_UNASSIGNED_IN_SPRINT, num,
+                title=f"In-sprint #{num} is unassigned",
+                summary=f"#{num} is {it['status']} with no assignee.",
+                evidence={"number": num, "status": it["status"], "assignees": []},
+                action=a._action(a.SKILL_PLAN_SPRINT, f"assign #{num}",
+                                 note="assign an owner during planning")))
+        d = it["decision_needed"]
+        if d and d != a.DECISION_NONE:
+            findings.append(a._finding(
+                a.KIND_DECISION_NEEDED, a.SEV_DECISION_NEEDED, num,
+                title=f"#{num} needs a decision: {d}",
+                summary=f"#{num} has Decision needed = {d} — a PM/CTO call is owed.",
+                evidence={"number": num, "decision_needed": d},
+                action=a._action(None, None, note=d)))
+    findings.sort(key=lambda f: (f["severity"], a._num_key(f["number"]), f["kind"]))
+    return counts, findings
+
+
+def columnar(items: list) -> tuple:
+    snap = a.Snapshot(items)
+    return snap.counts(), a.compute_findings(snap, today=TODAY)
+
+
+def _best(fn, items, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(items)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_findings.py")
+    parser.add_argument("--sizes", default="1000,5000,20000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'items':>8} {'findings':>9} {'columnar':>10} {'per-item':>10}  speedup")
+    for n in (int(x) for x in args.sizes.split(",")):
+        items = synthetic_board(n)
+        t_fast, fast = _best(columnar, items, args.repeat)
+        t_slow, slow = _best(per_item, items, args.repeat)
+        assert fast == slow, f"engines disagree at n={n}"
+        print(f"{n:>8} {len(fast[1]):>9} {t_fast * 1000:>8.1f}ms {t_slow * 1000:>8.1f}ms"
+              f"  {t_slow / t_fast:6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
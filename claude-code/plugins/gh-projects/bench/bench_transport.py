@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: pooled in-process transport vs. a fresh process per round-trip.
+
+Stands up a local keep-alive HTTP stub that answers every request with a small
+GraphQL payload, then times N sequential `gh api graphql` round-trips two ways:
+
+  * subprocess — one child process per call that opens its own connection,
+    sends one request and exits (the shape of `_default_run` forking `gh`);
+  * http       — `gh.HttpTransport` pointed at the stub, reusing one pooled
+    keep-alive connection.
+
+Offline and dev-only. The subprocess arm forks `python`, not `gh`, and the stub
+is plain HTTP on loopback, so this UNDER-states the real gap: it models neither
+gh's Go startup + auth/config lookup nor the TLS handshake a live
+api.github.com call pays per process.
+
+    python3 bench/bench_transport.py [--calls 200]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "lib"))
+
+import gh  # noqa: E402
+
+BODY = json.dumps({"data": {"viewer": {"login": "bench"}}}).encode("utf-8")
+
+_CHILD = """
+import http.client, json, sys
+conn = http.client.HTTPConnection(sys.argv[1])
+conn.request("POST", "/graphql", body=sys.argv[2].encode(),
+             headers={"Content-Type": "application/json", "Connection": "close"})
+sys.stdout.write(conn.getresponse().read().decode())
+"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers + body are separate writes
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _time(label, fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<11} {calls} calls  {elapsed:8.3f}s  {elapsed / calls * 1000:8.2f} ms/call")
+    return elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_transport.py")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    netloc = f"127.0.0.1:{server.server_address[1]}"
+    query = "query{viewer{login}}"
+    payload = json.dumps({"query": query, "variables": {}})
+    os.environ.setdefault("GH_APP_TOKEN", "bench-token")
+
+    def via_subprocess():
+        subprocess.run([sys.executable, "-c", _CHILD, netloc, payload],
+                       capture_output=True, text=True, check=True)
+
+    transport = gh.HttpTransport(base_url=f"http://{netloc}")
+
+    def via_http():
+        transport(["api", "graphql", "-f", f"query={query}"])
+
+    try:
+        slow = _time("subprocess", via_subprocess, args.calls)
+        fast = _time("http", via_http, args.calls)
+        print(f"speedup     {slow / fast:.1f}x  "
+              f"(connections opened: {transport.stats['connections']})")
+    finally:
+        transport.close()
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,21 @@ Two layers, split for offline testability and a clean read-only seam:
   * `compute_findings(items, *, today)` — the PURE, testable core. Pure dict/date
     math over a normalized board snapshot; no I/O, no network, no model call.
     The same snapshot always yields the identical ranked list (stable order).
-  * `load_board(owner, number)` / `run(...)` — page the live board into that
-    snapshot through the injectable `RUN`/`graphql` seam, then call
-    `compute_findings`. Only READS go over the seam (GraphQL queries); the engine
-    issues no mutation. Tests override `RUN` (offline) or call `compute_findings`
-    directly on fixtures.
+  * `iter_board` / `load_board(owner, number)` / `run(...)` — page the live
+    board into that snapshot through the injectable `RUN`/`graphql` seam (the
+    next page prefetched while the current one is normalized; `run` folds
+    items as they stream), then apply the same per-item rules. Only READS go
+    over the seam (GraphQL queries); the engine issues no mutation. Tests
+    override `RUN` (offline) or call `compute_findings` directly on fixtures.
+  * `run_org(owner)` — the org-wide mode: discovers the owner's open projects,
+    reads the boards concurrently (`gh.fan_out`), analyses each issue ONCE
+    however many boards carry it, and returns one merged ranked report plus
+    per-project rollup counts.
+
+With a `history.HistoryStore`, every live run is appended to a local log: a
+board whose snapshot hash matches the last run reuses that run's findings, and
+otherwise only rows whose content hash is new go through the rules. `--since`
+then reports the NEW / RESOLVED / ESCALATED findings against an earlier run.
 
 Each finding carries:
   * `kind`     — a stable machine identifier for the finding category.
@@ -40,10 +50,19 @@ Exit codes (the CLI entrypoint): 0 ok · 2 usage/validation · 3 not found ·
 from __future__ import annotations
 
 import datetime as _dt
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+import gh
+import history as _history
+import ratelimit
 
 # --------------------------------------------------------------------------- #
 # Field/option names + the resolving-skill identifiers (the EXACT board
@@ -111,7 +130,8 @@ def _default_run(args) -> str:
     return proc.stdout
 
 
-RUN = _default_run
+# Paced + retried by the shared rate-limit scheduler (lib/ratelimit.py).
+RUN = ratelimit.wrap(_default_run)
 
 
 _TOKENISH = ("ghp_", "ghs_", "gho_", "ghu_", "ghr_", "github_pat_")
@@ -154,7 +174,8 @@ def _utc_today() -> _dt.date:
 #    "size": <"S"|"M"|"L"|None>,            # appetite
 #    "target": <"YYYY-MM-DD"|None>,         # Target date
 #    "assignees": [<login>, ...],           # native assignees
-#    "has_ac_table": <bool>,                # body has a "## Acceptance Criteria" table
+#    "has_ac_table": <bool|None>,           # body has a "## Acceptance Criteria" table
+#                                           # (None: not read — see iter_board)
 #    "sub_issues_total": <int>,             # Epic sub-issue count (0 if not an epic)
 #    "sub_issues_done": <int>,              # completed sub-issues
 #    "schedule_health": <"On track"|... >,  # the WRITTEN Schedule health value
@@ -162,31 +183,91 @@ def _utc_today() -> _dt.date:
 #    "blocked": <"Blocked"|"Unblocked">,    # the WRITTEN Blocked value
 #    "impact": <"Release blocker"|... >,    # Impact level (human-set)
 #    "decision_needed": <"No decision"|"Move date"|...>,  # Decision needed (human-set)
-#    "blocked_by": [<number>, ...]}         # the native blocked-by edges
+#    "blocked_by": [<number>, ...],         # the native blocked-by edges
+#    "repo": <"owner/name">}                # the issue's repository (org-wide dedupe key)
 #
 # Missing keys degrade to safe defaults — a snapshot from `load_board` always
-# fills them; a fixture may omit the ones a given finding does not read.
+# fills them; a fixture may omit the ones a given finding does not read. The
+# rules themselves run over a `Snapshot`, the same data held column-wise.
 # --------------------------------------------------------------------------- #
-def _norm(item: dict) -> dict:
-    """Normalize one snapshot item to the full key set with safe defaults."""
-    it = item or {}
-    return {
-        "number": str(it.get("number", "")),
-        "status": it.get("status") or "",
-        "type": it.get("type") or "",
-        "size": it.get("size"),
-        "target": it.get("target"),
-        "assignees": list(it.get("assignees") or []),
-        "has_ac_table": bool(it.get("has_ac_table")),
-        "sub_issues_total": int(it.get("sub_issues_total") or 0),
-        "sub_issues_done": int(it.get("sub_issues_done") or 0),
-        "schedule_health": it.get("schedule_health") or "",
-        "blast_radius": it.get("blast_radius") or "",
-        "blocked": it.get("blocked") or "",
-        "impact": it.get("impact") or "",
-        "decision_needed": it.get("decision_needed") or DECISION_NONE,
-        "blocked_by": [str(b) for b in (it.get("blocked_by") or [])],
-    }
+class Snapshot:
+    """A COLUMNAR board snapshot: one parallel list per field.
+
+    Items are normalized once on ingest (safe defaults for missing keys, issue
+    number as str, option strings interned to one object per distinct value)
+    and never held as per-item dicts. `index(column)` groups row indices by
+    value, so a rule visits only its candidate rows; counts are column
+    tallies. A 20k-item org-wide board is a few flat lists.
+    """
+
+    COLUMNS = ("number", "status", "type", "size", "target", "assignees",
+               "has_ac_table", "sub_total", "sub_done", "health", "blast", "blocked",
+               "impact", "decision", "blocked_by")
+    __slots__ = COLUMNS + ("_symbols", "_indexes")
+    _INTERNED = frozenset(("status", "type", "size", "health", "blast", "blocked",
+                           "impact", "decision"))
+
+    def __init__(self, items=()):
+        for column in self.COLUMNS:
+            setattr(self, column, [])
+        self._symbols, self._indexes = {}, {}
+        self.extend(items or ())
+
+    def __len__(self) -> int:
+        return len(self.number)
+
+    def append(self, item: dict) -> None:
+        """Normalize one snapshot item into the columns."""
+        self.extend((item,))
+
+    def extend(self, items) -> None:
+        """Normalize a batch of snapshot items into the columns.
+
+        Each item is read once into a row tuple and the batch is transposed
+        with `zip`; `assignees` / `blocked_by` keep the item's own list (or
+        None), since the rules only test them for emptiness and a finding
+        copies the few it reports (`_blockers`).
+        """
+        rows = [(str(g("number", "")), g("status") or "", g("type") or "", g("size"),
+                 g("target"), g("assignees"), bool(g("has_ac_table")),
+                 int(g("sub_issues_total") or 0), int(g("sub_issues_done") or 0),
+                 g("schedule_health") or "", g("blast_radius") or "", g("blocked") or "",
+                 g("impact") or "", g("decision_needed") or DECISION_NONE, g("blocked_by"))
+                for g in ((it or {}).get for it in items)]
+        if not rows:
+            return
+        sym = self._symbols.setdefault
+        for column, values in zip(self.COLUMNS, zip(*rows)):
+            if column in self._INTERNED:
+                values = map(sym, values, values)
+            getattr(self, column).extend(values)
+        self._indexes.clear()
+
+    def index(self, column: str) -> dict:
+        """{value: [row index, ...]} for one enum column, ascending; built on
+        first use and shared by every rule keyed on that column."""
+        found = self._indexes.get(column)
+        if found is None:
+            found = {}
+            for i, value in enumerate(getattr(self, column)):
+                rows = found.get(value)
+                if rows is None:
+                    found[value] = [i]
+                else:
+                    rows.append(i)
+            self._indexes[column] = found
+        return found
+
+    def counts(self) -> dict:
+        """The rollup counts, as column tallies."""
+        decision = self.decision
+        return {
+            "items": len(self.number),
+            "overdue": self.health.count(HEALTH_OVERDUE),
+            "at_risk": self.health.count(HEALTH_AT_RISK),
+            "blocked": self.blocked.count(BLOCKED_YES),
+            "decisions_owed": len(decision) - decision.count("") - decision.count(DECISION_NONE),
+        }
 
 
 def _finding(kind, severity, number, *, title, summary, evidence, action):
@@ -214,125 +295,226 @@ def _action(skill, args, *, note=None):
 # --------------------------------------------------------------------------- #
 # The PURE findings core — deterministic, no I/O.
 # --------------------------------------------------------------------------- #
-def compute_findings(items, *, today=None):
+def compute_findings(items, *, today=None, stats=None):
     """Return the ranked findings list for a board snapshot. Pure function.
 
-    `items` is the snapshot (see the schema note above). `today` defaults to the
-    UTC date; pass it explicitly for reproducible tests. Reads only what is on
-    the board; computes no new persisted data. Findings are sorted by a fully
-    deterministic key — (severity, issue number, kind) — so the SAME snapshot
-    always yields the IDENTICAL order regardless of input ordering.
+    `items` is the snapshot (see the schema note above) or a `Snapshot`.
+    `today` defaults to the UTC date; pass it explicitly for reproducible
+    tests. Reads only what is on the board; computes no new persisted data.
+    Findings are sorted by a fully deterministic key — (severity, issue number,
+    kind) — so the SAME snapshot always yields the IDENTICAL order regardless of
+    input ordering. `stats`, a dict, collects per-rule counters (`_ranked`).
     """
     today = today or _utc_today()
-    norm = [_norm(it) for it in (items or [])]
-    findings = []
+    snap = items if isinstance(items, Snapshot) else Snapshot(items)
+    return [finding for _, finding in _ranked(snap, stats)]
 
-    for it in norm:
-        num = it["number"]
 
-        # --- critical chain: a release-blocker that is itself blocked --------
-        is_release_blocker = (
-            it["impact"] == IMPACT_RELEASE or it["blast_radius"] == BLAST_RELEASE
-        )
-        if is_release_blocker and it["blocked"] == BLOCKED_YES:
-            blockers = it["blocked_by"]
-            findings.append(_finding(
-                KIND_CRITICAL_CHAIN, SEV_CRITICAL_CHAIN, num,
-                title=f"Release-blocker #{num} is itself blocked",
-                summary=(f"#{num} is on the critical path (Impact "
-                         f"{it['impact'] or '—'} / Blast {it['blast_radius'] or '—'}) "
-                         f"but held by an open dependency."),
-                evidence={"number": num, "impact": it["impact"],
-                          "blast_radius": it["blast_radius"],
-                          "blocked": it["blocked"], "blocked_by": blockers},
-                action=_action(
-                    SKILL_START_ISSUE,
-                    f"#{blockers[0]}" if blockers else f"#{num}",
-                    note=("clear the upstream blocker to free the critical chain"
-                          if blockers else None)),
-            ))
-
-        # --- overdue x high blast radius ------------------------------------
-        high_blast = it["blast_radius"] in (BLAST_RELEASE, BLAST_MANY)
-        if it["schedule_health"] == HEALTH_OVERDUE and high_blast:
-            findings.append(_finding(
-                KIND_OVERDUE_HIGH_BLAST, SEV_OVERDUE_HIGH_BLAST, num,
-                title=f"#{num} is overdue and high blast-radius",
-                summary=(f"#{num} is Overdue with Blast radius "
-                         f"{it['blast_radius']} — its slip stalls downstream work."),
-                evidence={"number": num, "schedule_health": it["schedule_health"],
-                          "blast_radius": it["blast_radius"], "target": it["target"]},
-                action=_action(SKILL_PLAN_SPRINT, f"reschedule #{num}",
-                               note="move the date or cut scope, then re-plan"),
-            ))
-
-        # --- stalled epic: At risk/Overdue epic with incomplete sub-issues --
-        if (it["type"] == "Epic"
-                and it["schedule_health"] in (HEALTH_AT_RISK, HEALTH_OVERDUE)
-                and it["sub_issues_total"] > 0
-                and it["sub_issues_done"] < it["sub_issues_total"]):
-            findings.append(_finding(
-                KIND_STALLED_EPIC, SEV_STALLED_EPIC, num,
-                title=f"Epic #{num} is stalling",
-                summary=(f"Epic #{num} is {it['schedule_health']} with "
-                         f"{it['sub_issues_done']}/{it['sub_issues_total']} "
-                         f"sub-issues done."),
-                evidence={"number": num, "schedule_health": it["schedule_health"],
-                          "sub_issues_done": it["sub_issues_done"],
-                          "sub_issues_total": it["sub_issues_total"]},
-                action=_action(SKILL_PLAN_SPRINT, f"re-plan epic #{num}",
-                               note="re-plan or start the next sub-issue"),
-            ))
-
-        # --- intake-hygiene gaps: Ready item missing AC table/Size/Target ----
-        if it["status"] == STATUS_READY:
-            gaps = []
-            if not it["has_ac_table"]:
-                gaps.append("AC table")
-            if not it["size"]:
-                gaps.append("Size")
-            if not it["target"]:
-                gaps.append("Target date")
-            if gaps:
-                findings.append(_finding(
-                    KIND_INTAKE_HYGIENE, SEV_INTAKE_HYGIENE, num,
-                    title=f"Ready #{num} has intake gaps",
-                    summary=(f"#{num} is Ready but missing: "
-                             f"{', '.join(gaps)}."),
-                    evidence={"number": num, "status": it["status"],
-                              "missing": gaps, "size": it["size"],
-                              "target": it["target"],
-                              "has_ac_table": it["has_ac_table"]},
-                    action=_action(SKILL_CREATE_ISSUES, f"#{num}",
-                                   note="complete intake fields before it is worked"),
-                ))
-
-        # --- unassigned in-sprint work --------------------------------------
-        if it["status"] in IN_SPRINT_STATUSES and not it["assignees"]:
-            findings.append(_finding(
-                KIND_UNASSIGNED_IN_SPRINT, SEV_UNASSIGNED_IN_SPRINT, num,
-                title=f"In-sprint #{num} is unassigned",
-                summary=f"#{num} is {it['status']} with no assignee.",
-                evidence={"number": num, "status": it["status"], "assignees": []},
-                action=_action(SKILL_PLAN_SPRINT, f"assign #{num}",
-                               note="assign an owner during planning"),
-            ))
-
-        # --- Decision needed != No (the PM owns the named decision) ----------
-        if it["decision_needed"] and it["decision_needed"] != DECISION_NONE:
-            findings.append(_finding(
-                KIND_DECISION_NEEDED, SEV_DECISION_NEEDED, num,
-                title=f"#{num} needs a decision: {it['decision_needed']}",
-                summary=(f"#{num} has Decision needed = "
-                         f"{it['decision_needed']} — a PM/CTO call is owed."),
-                evidence={"number": num, "decision_needed": it["decision_needed"]},
-                # No skill resolves a product/architecture call — the option
-                # names the move the PM must make.
-                action=_action(None, None, note=it["decision_needed"]),
-            ))
-
-    findings.sort(key=lambda f: (f["severity"], _num_key(f["number"]), f["kind"]))
-    return findings
+def _ranked(snap: "Snapshot", stats=None) -> list:
+    """[(row index, finding)] over every registered rule, in rank order.
+
+    With `stats`, each rule adds to `stats[kind]`: the candidate rows it
+    visited, the findings it raised and the seconds it took.
+    """
+    ranked = []
+    for r in RULES:
+        started = time.perf_counter()
+        rows = r.candidates(snap)
+        match, build = r.match, r.build
+        hits = [(i, f) for i in rows if match is None or match(snap, i)
+                for f in (build(snap, i),) if f is not None]
+        ranked += hits
+        if stats is not None:
+            entry = stats.setdefault(r.kind, {"candidates": 0, "findings": 0, "seconds": 0.0})
+            entry["candidates"] += len(rows)
+            entry["findings"] += len(hits)
+            entry["seconds"] += time.perf_counter() - started
+    ranked.sort(key=lambda hit: (hit[1]["severity"], _num_key(snap.number[hit[0]]),
+                                 hit[1]["kind"]))
+    return ranked
+
+
+# --------------------------------------------------------------------------- #
+# The rule registry. A rule DECLARES what it needs and is registered with
+# `@rule(kind, severity, reads=..., on=(column, values), match=...)`:
+#
+#   * `reads` — the Snapshot columns it reads (checked at registration);
+#   * `on`    — the indexed enum column and the values (a tuple, or a predicate
+#               on the value) that make a row a CANDIDATE — only those rows of
+#               `Snapshot.index(column)` are visited;
+#   * `match` — an optional (snap, i) -> bool test on a candidate;
+#   * the decorated `build(snap, i)` returns the finding, or None.
+#
+# Each finding rule reads a single row. Adding a rule is one registration; no
+# loop changes.
+# --------------------------------------------------------------------------- #
+class Rule:
+    """One registered finding rule (see the registry note above)."""
+
+    __slots__ = ("kind", "severity", "reads", "on", "match", "build")
+
+    def __init__(self, kind, severity, reads, on, match, build):
+        self.kind, self.severity, self.reads = kind, severity, tuple(reads)
+        self.on, self.match, self.build = on, match, build
+
+    def candidates(self, snap: Snapshot) -> list:
+        """The rows whose `on` column holds an accepted value, ascending."""
+        column, accept = self.on
+        index = snap.index(column)
+        test = accept.__contains__ if isinstance(accept, (tuple, frozenset)) else accept
+        groups = [rows for value, rows in index.items() if test(value)]
+        if len(groups) == 1:
+            return groups[0]
+        return sorted(i for rows in groups for i in rows)
+
+
+RULES: list = []
+
+
+def rule(kind: str, severity: int, *, reads, on, match=None):
+    """Register the decorated `build(snap, i)` as a finding rule."""
+    unknown = sorted(set(reads) - set(Snapshot.COLUMNS))
+    if unknown or on[0] not in reads:
+        raise ValueError(f"rule {kind}: reads unknown columns {unknown} or `on` "
+                         f"column {on[0]!r} is not in `reads`")
+
+    def register(build):
+        RULES.append(Rule(kind, severity, reads, on, match, build))
+        return build
+    return register
+
+
+def _blockers(raw) -> list:
+    return [str(b) for b in (raw or [])]
+
+
+@rule(KIND_CRITICAL_CHAIN, SEV_CRITICAL_CHAIN,
+      reads=("number", "blocked", "impact", "blast", "blocked_by"),
+      on=("blocked", (BLOCKED_YES,)),
+      match=lambda s, i: s.impact[i] == IMPACT_RELEASE or s.blast[i] == BLAST_RELEASE)
+def _critical_chain(s: Snapshot, i: int):
+    """A release-blocker that is itself blocked."""
+    num, blockers = s.number[i], _blockers(s.blocked_by[i])
+    return _finding(
+        KIND_CRITICAL_CHAIN, SEV_CRITICAL_CHAIN, num,
+        title=f"Release-blocker #{num} is itself blocked",
+        summary=(f"#{num} is on the critical path (Impact "
+                 f"{s.impact[i] or '—'} / Blast {s.blast[i] or '—'}) "
+                 f"but held by an open dependency."),
+        evidence={"number": num, "impact": s.impact[i],
+                  "blast_radius": s.blast[i],
+                  "blocked": s.blocked[i], "blocked_by": blockers},
+        action=_action(
+            SKILL_START_ISSUE,
+            f"#{blockers[0]}" if blockers else f"#{num}",
+            note=("clear the upstream blocker to free the critical chain"
+                  if blockers else None)),
+    )
+
+
+@rule(KIND_OVERDUE_HIGH_BLAST, SEV_OVERDUE_HIGH_BLAST,
+      reads=("number", "health", "blast", "target"),
+      on=("health", (HEALTH_OVERDUE,)),
+      match=lambda s, i: s.blast[i] in (BLAST_RELEASE, BLAST_MANY))
+def _overdue_high_blast(s: Snapshot, i: int):
+    """Overdue x high blast radius."""
+    num = s.number[i]
+    return _finding(
+        KIND_OVERDUE_HIGH_BLAST, SEV_OVERDUE_HIGH_BLAST, num,
+        title=f"#{num} is overdue and high blast-radius",
+        summary=(f"#{num} is Overdue with Blast radius "
+                 f"{s.blast[i]} — its slip stalls downstream work."),
+        evidence={"number": num, "schedule_health": s.health[i],
+                  "blast_radius": s.blast[i], "target": s.target[i]},
+        action=_action(SKILL_PLAN_SPRINT, f"reschedule #{num}",
+                       note="move the date or cut scope, then re-plan"),
+    )
+
+
+@rule(KIND_STALLED_EPIC, SEV_STALLED_EPIC,
+      reads=("number", "type", "health", "sub_total", "sub_done"),
+      on=("type", ("Epic",)),
+      match=lambda s, i: (s.health[i] in (HEALTH_AT_RISK, HEALTH_OVERDUE)
+                          and s.sub_total[i] > 0 and s.sub_total[i] > s.sub_done[i]))
+def _stalled_epic(s: Snapshot, i: int):
+    """An At risk/Overdue epic with incomplete sub-issues."""
+    num = s.number[i]
+    return _finding(
+        KIND_STALLED_EPIC, SEV_STALLED_EPIC, num,
+        title=f"Epic #{num} is stalling",
+        summary=(f"Epic #{num} is {s.health[i]} with "
+                 f"{s.sub_done[i]}/{s.sub_total[i]} "
+                 f"sub-issues done."),
+        evidence={"number": num, "schedule_health": s.health[i],
+                  "sub_issues_done": s.sub_done[i],
+                  "sub_issues_total": s.sub_total[i]},
+        action=_action(SKILL_PLAN_SPRINT, f"re-plan epic #{num}",
+                       note="re-plan or start the next sub-issue"),
+    )
+
+
+@rule(KIND_INTAKE_HYGIENE, SEV_INTAKE_HYGIENE,
+      reads=("number", "status", "has_ac_table", "size", "target"),
+      on=("status", (STATUS_READY,)))
+def _intake_hygiene(s: Snapshot, i: int):
+    """A Ready item missing its AC table / Size / Target date."""
+    gaps = []
+    if not s.has_ac_table[i]:
+        gaps.append("AC table")
+    if not s.size[i]:
+        gaps.append("Size")
+    if not s.target[i]:
+        gaps.append("Target date")
+    if not gaps:
+        return None
+    num = s.number[i]
+    return _finding(
+        KIND_INTAKE_HYGIENE, SEV_INTAKE_HYGIENE, num,
+        title=f"Ready #{num} has intake gaps",
+        summary=(f"#{num} is Ready but missing: "
+                 f"{', '.join(gaps)}."),
+        evidence={"number": num, "status": s.status[i],
+                  "missing": gaps, "size": s.size[i],
+                  "target": s.target[i],
+                  "has_ac_table": s.has_ac_table[i]},
+        action=_action(SKILL_CREATE_ISSUES, f"#{num}",
+                       note="complete intake fields before it is worked"),
+    )
+
+
+@rule(KIND_UNASSIGNED_IN_SPRINT, SEV_UNASSIGNED_IN_SPRINT,
+      reads=("number", "status", "assignees"),
+      on=("status", IN_SPRINT_STATUSES),
+      match=lambda s, i: not s.assignees[i])
+def _unassigned_in_sprint(s: Snapshot, i: int):
+    """In-sprint work with no assignee."""
+    num = s.number[i]
+    return _finding(
+        KIND_UNASSIGNED_IN_SPRINT, SEV_UNASSIGNED_IN_SPRINT, num,
+        title=f"In-sprint #{num} is unassigned",
+        summary=f"#{num} is {s.status[i]} with no assignee.",
+        evidence={"number": num, "status": s.status[i], "assignees": []},
+        action=_action(SKILL_PLAN_SPRINT, f"assign #{num}",
+                       note="assign an owner during planning"),
+    )
+
+
+@rule(KIND_DECISION_NEEDED, SEV_DECISION_NEEDED,
+      reads=("number", "decision"),
+      on=("decision", lambda value: bool(value) and value != DECISION_NONE))
+def _decision_needed(s: Snapshot, i: int):
+    """Decision needed != No decision — the PM owns the named decision."""
+    num, decision = s.number[i], s.decision[i]
+    return _finding(
+        KIND_DECISION_NEEDED, SEV_DECISION_NEEDED, num,
+        title=f"#{num} needs a decision: {decision}",
+        summary=(f"#{num} has Decision needed = "
+                 f"{decision} — a PM/CTO call is owed."),
+        evidence={"number": num, "decision_needed": decision},
+        # No skill resolves a product/architecture call — the option
+        # names the move the PM must make.
+        action=_action(None, None, note=decision),
+    )
 
 
 def _num_key(number):
@@ -348,16 +530,9 @@ def _num_key(number):
 # Rollup counts the skills surface alongside the findings (pure).
 # --------------------------------------------------------------------------- #
 def rollup_counts(items):
-    """Deterministic top-line counts over the snapshot (no AI)."""
-    norm = [_norm(it) for it in (items or [])]
-    return {
-        "items": len(norm),
-        "overdue": sum(1 for it in norm if it["schedule_health"] == HEALTH_OVERDUE),
-        "at_risk": sum(1 for it in norm if it["schedule_health"] == HEALTH_AT_RISK),
-        "blocked": sum(1 for it in norm if it["blocked"] == BLOCKED_YES),
-        "decisions_owed": sum(1 for it in norm
-                              if it["decision_needed"] not in ("", DECISION_NONE)),
-    }
+    """Deterministic top-line counts over the snapshot (no AI). `items` is the
+    snapshot list (or any iterable of items, e.g. `iter_board`) or a `Snapshot`."""
+    return (items if isinstance(items, Snapshot) else Snapshot(items)).counts()
 
 
 # --------------------------------------------------------------------------- #
@@ -381,19 +556,19 @@ def graphql(query: str, variables: dict | None = None) -> dict:
 
 # A single read-only query: the item content + the WRITTEN signal/decision field
 # values the findings read. No mutation is ever issued by this engine.
-_ITEMS_QUERY = """
-query($owner:String!, $number:Int!, $after:String){
-  organization(login:$owner){
-    projectV2(number:$number){
-      id
-      items(first:100, after:$after){
-        pageInfo { hasNextPage endCursor }
-        nodes{
+# The per-item selection, shared by the full page query and the by-id re-read
+# (`nodes(ids:)`) the snapshot cache uses to refresh only changed items. It is
+# LEAN: no issue `body` — see `_AC_QUERY`.
+_ITEM_SELECTION = """
+          id
+          updatedAt
           content{
             __typename
             ... on Issue {
+              id
               number
-              body
+              updatedAt
+              repository { nameWithOwner }
               issueType { name }
               assignees(first:20){ nodes { login } }
               subIssuesSummary { total completed }
@@ -408,13 +583,52 @@ query($owner:String!, $number:Int!, $after:String){
           blockedField:  fieldValueByName(name:"Blocked"){         ... on ProjectV2ItemFieldSingleSelectValue { name } }
           impact:        fieldValueByName(name:"Impact level"){    ... on ProjectV2ItemFieldSingleSelectValue { name } }
           decision:      fieldValueByName(name:"Decision needed"){ ... on ProjectV2ItemFieldSingleSelectValue { name } }
-        }
+"""
+
+_ITEMS_QUERY = """
+query($owner:String!, $number:Int!, $after:String){
+  organization(login:$owner){
+    projectV2(number:$number){
+      id
+      items(first:100, after:$after){
+        pageInfo { hasNextPage endCursor }
+        nodes{%s        }
+      }
+    }
+  }
+}
+""" % _ITEM_SELECTION
+
+# Revalidation probe: stamps only — no bodies, no field values.
+_PROBE_QUERY = """
+query($owner:String!, $number:Int!, $after:String){
+  organization(login:$owner){
+    projectV2(number:$number){
+      id
+      items(first:100, after:$after){
+        pageInfo { hasNextPage endCursor }
+        nodes{ id updatedAt content{ ... on Issue { updatedAt } } }
       }
     }
   }
 }
 """
 
+_NODES_QUERY = "query{ nodes(ids:%s){ ... on ProjectV2Item {%s} } }"
+
+# Second tier: markdown bodies — by far the bulk of a board read — are fetched
+# by item id only for items whose findings read `has_ac_table` (intake hygiene
+# fires on Ready items only) and whose AC presence is not already known for the
+# issue's current `updatedAt`. The bool is kept, never the body: with a
+# snapshot cache it persists (kind "ac") so bodies are not re-downloaded across
+# runs; an edited body bumps `updatedAt`, so a stamp match is exact.
+_AC_QUERY = ("query{ nodes(ids:%s){ ... on ProjectV2Item { id "
+             "content{ ... on Issue { updatedAt body } } } } }")
+_AC_STATUSES = (STATUS_READY,)
+AC_MAX_AGE = 30 * 24 * 3600
+_CHUNK = cache.NODES_PER_FETCH
+
+
 _AC_HEADING = "## acceptance criteria"
 
 
@@ -440,71 +654,397 @@ def _opt(node, key) -> str:
     return ((node.get(key) or {}).get("name")) or ""
 
 
-def load_board(owner: str, number: int):
-    """Page the project items into the analysis snapshot (READ-ONLY).
+def _stamp(node) -> str:
+    """An item's change stamp: the item's and its issue's `updatedAt`."""
+    return f"{node.get('updatedAt') or ''}|{((node.get('content') or {}).get('updatedAt')) or ''}"
 
-    Returns the list of snapshot dicts `compute_findings` consumes. Only GraphQL
-    READ queries go over the seam — the engine issues no mutation.
+
+def _prefetched(fetch):
+    """Yield the pages `fetch(cursor) -> (nodes, next_cursor | None)` returns,
+    requesting page N+1 on a worker thread as soon as page N's cursor is known —
+    the caller normalizes page N while the next one is in flight. Requests stay
+    strictly sequential (each needs the previous cursor), so the call order a
+    fake RUN sees is unchanged; an error surfaces at the page that raised it.
     """
-    snapshot = []
-    after = None
-    seen_project = False
-    while True:
-        data = graphql(_ITEMS_QUERY, {"owner": owner, "number": int(number), "after": after})
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(fetch, None)
+        try:
+            while pending is not None:
+                nodes, cursor = pending.result()
+                pending = pool.submit(fetch, cursor) if cursor else None
+                yield nodes
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+def _pages(query: str, owner: str, number: int):
+    """Yield the item-node list of each page of `query` as it arrives (raises on
+    not-found)."""
+    def fetch(after):
+        data = graphql(query, {"owner": owner, "number": int(number), "after": after})
         proj = (((data or {}).get("organization") or {}).get("projectV2")) or {}
         if not proj.get("id"):
             raise AnalysisError(f"project {owner}#{number} not found", code=3)
-        seen_project = True
         conn = proj.get("items") or {}
-        for node in (conn.get("nodes") or []):
-            content = node.get("content") or {}
-            if content.get("__typename") != "Issue":
-                continue  # draft issues / PRs carry no analysis content
-            sub = content.get("subIssuesSummary") or {}
-            blocked_by = ((content.get("blockedBy") or {}).get("blockedBy")) or []
-            assignees = [a.get("login") for a in
-                         ((content.get("assignees") or {}).get("nodes") or [])
-                         if a.get("login")]
-            snapshot.append({
-                "number": str(content.get("number")),
-                "status": _opt(node, "status"),
-                "type": ((content.get("issueType") or {}).get("name")) or "",
-                "size": _opt(node, "size") or None,
-                "target": ((node.get("target") or {}).get("date")),
-                "assignees": assignees,
-                "has_ac_table": _has_ac_table(content.get("body")),
-                "sub_issues_total": int(sub.get("total") or 0),
-                "sub_issues_done": int(sub.get("completed") or 0),
-                "schedule_health": _opt(node, "health"),
-                "blast_radius": _opt(node, "blast"),
-                "blocked": _opt(node, "blockedField"),
-                "impact": _opt(node, "impact"),
-                "decision_needed": _opt(node, "decision") or DECISION_NONE,
-                "blocked_by": [str(b) for b in blocked_by],
-            })
         page = conn.get("pageInfo") or {}
-        if page.get("hasNextPage"):
-            after = page.get("endCursor")
+        return (conn.get("nodes") or []), (page.get("endCursor") if page.get("hasNextPage") else None)
+
+    return _prefetched(fetch)
+
+
+def _page(query: str, owner: str, number: int):
+    """Yield every item node of `query`, page by page."""
+    for nodes in _pages(query, owner, number):
+        yield from nodes
+
+
+def _fetch_nodes(ids) -> dict:
+    data = graphql(_NODES_QUERY % (json.dumps(list(ids)), _ITEM_SELECTION))
+    return {n["id"]: (_stamp(n), n) for n in (data.get("nodes") or []) if n and n.get("id")}
+
+
+def _fetch_ac(ids) -> dict:
+    """{item id: [issue updatedAt, has AC table]} — reads bodies, keeps bools."""
+    data = graphql(_AC_QUERY % json.dumps(list(ids)))
+    out = {}
+    for n in (data.get("nodes") or []):
+        content = (n or {}).get("content") or {}
+        if n and n.get("id") and "body" in content:
+            out[n["id"]] = [content.get("updatedAt") or "", _has_ac_table(content["body"])]
+    return out
+
+
+class _SharedAC:
+    """AC results of one org-wide run, shared across its boards by issue id.
+
+    An issue carried by several boards is one body read: the first board that
+    needs it claims it, the others wait for that read instead of repeating it.
+    A board always reads (and publishes) its own claims before it waits on
+    another's, so boards read concurrently can never wait on each other in a
+    cycle. `reads` counts the bodies actually fetched.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done: dict = {}     # issue id -> [updatedAt, has AC table]
+        self._reading: dict = {}  # issue id -> Event, set once its read is published
+        self.reads = 0
+
+    def claim(self, issue_id: str):
+        """(result, None) when known, (None, event) when another board is
+        reading it, (None, None) when the caller must read it now."""
+        with self._lock:
+            if issue_id in self._done:
+                return self._done[issue_id], None
+            if issue_id in self._reading:
+                return None, self._reading[issue_id]
+            self._reading[issue_id] = threading.Event()
+            return None, None
+
+    def publish(self, results: dict) -> None:
+        """Release claims: {issue id: [updatedAt, has AC] or None (not read)}."""
+        with self._lock:
+            for issue_id, value in results.items():
+                if value is not None:
+                    self._done[issue_id] = value
+                    self.reads += 1
+                self._reading.pop(issue_id).set()
+
+    def get(self, issue_id: str):
+        with self._lock:
+            return self._done.get(issue_id)
+
+
+def _with_ac(nodes, known: dict, seen: dict, shared: "_SharedAC | None" = None):
+    """Yield (node, has_ac) for one page, fetching the bodies it still needs.
+
+    `known` is the AC map from earlier runs; `seen` collects this run's map
+    (what gets persisted). A lean node of a Ready issue whose stamp is not in
+    `known` gets its body read — all such nodes of the page in one request.
+    With `shared` (org-wide), a body another board already read, or is
+    reading, is taken from it instead.
+    """
+    need, claimed, waits = [], {}, []
+    for node in nodes:
+        content = node.get("content") or {}
+        if "body" in content or not node.get("id"):
             continue
-        break
-    if not seen_project:
-        raise AnalysisError(f"project {owner}#{number} not found", code=3)
-    return snapshot
+        hit = known.get(node["id"])
+        if hit and hit[0] == (content.get("updatedAt") or ""):
+            seen[node["id"]] = hit
+        elif content.get("__typename") == "Issue" and _opt(node, "status") in _AC_STATUSES:
+            issue_id = content.get("id")
+            if shared is not None and issue_id:
+                hit, event = shared.claim(issue_id)
+                if hit is not None:
+                    seen[node["id"]] = hit
+                    continue
+                if event is not None:
+                    waits.append((node["id"], issue_id, event))
+                    continue
+                claimed[node["id"]] = issue_id
+            need.append(node["id"])
+    try:
+        for i in range(0, len(need), _CHUNK):
+            seen.update(_fetch_ac(need[i:i + _CHUNK]))
+    finally:
+        if claimed:
+            shared.publish({issue_id: seen.get(item) for item, issue_id in claimed.items()})
+    for item, issue_id, event in waits:
+        event.wait()
+        hit = shared.get(issue_id)
+        if hit is not None:
+            seen[item] = hit
+    for node in nodes:
+        yield node, (seen.get(node.get("id")) or (None, None))[1]
+
+
+def _ac_store(snap_cache):
+    """The AC map's store: the snapshot cache's directory with a long TTL."""
+    if snap_cache is None:
+        return None
+    return type(snap_cache)(snap_cache.root, max_age=AC_MAX_AGE, clock=snap_cache.clock)
+
 
+def _snapshot_row(node, has_ac=None):
+    """Normalize one raw item node into a snapshot dict (None for non-issues).
+
+    `has_ac` is the second-tier AC result for a lean node (one without `body`).
+    """
+    content = node.get("content") or {}
+    if content.get("__typename") != "Issue":
+        return None  # draft issues / PRs carry no analysis content
+    sub = content.get("subIssuesSummary") or {}
+    blocked_by = ((content.get("blockedBy") or {}).get("blockedBy")) or []
+    assignees = [a.get("login") for a in
+                 ((content.get("assignees") or {}).get("nodes") or [])
+                 if a.get("login")]
+    return {
+        "number": str(content.get("number")),
+        "status": _opt(node, "status"),
+        "type": ((content.get("issueType") or {}).get("name")) or "",
+        "size": _opt(node, "size") or None,
+        "target": ((node.get("target") or {}).get("date")),
+        "assignees": assignees,
+        "has_ac_table": _has_ac_table(content["body"]) if "body" in content else has_ac,
+        "sub_issues_total": int(sub.get("total") or 0),
+        "sub_issues_done": int(sub.get("completed") or 0),
+        "schedule_health": _opt(node, "health"),
+        "blast_radius": _opt(node, "blast"),
+        "blocked": _opt(node, "blockedField"),
+        "impact": _opt(node, "impact"),
+        "decision_needed": _opt(node, "decision") or DECISION_NONE,
+        "blocked_by": [str(b) for b in blocked_by],
+        "repo": ((content.get("repository") or {}).get("nameWithOwner")) or "",
+    }
+
+
+def iter_board(owner: str, number: int, *, board_cache=None, shared_ac=None):
+    """Yield the analysis snapshot rows of the project, one per issue item.
+
+    Two tiers: the paged read is LEAN (no issue bodies); each page's Ready
+    items whose AC presence is not known for their `updatedAt` then have just
+    their bodies read (`_AC_QUERY`). An item that was not read carries
+    `has_ac_table: None` — no finding reads it.
+
+    Uncached, rows stream as pages arrive (the next page is prefetched while
+    this one is normalized), so a consumer folding them — `run`,
+    `rollup_counts` — starts on page 1 and never holds the raw board. With
+    `board_cache` (a `cache.SnapshotCache`), a cached board is revalidated by a
+    stamps-only probe and only changed items are re-read; the entry is written
+    whole, so that path yields once revalidation is done. The AC map is kept
+    alongside it (kind "ac") once the board has been fully read. `shared_ac`
+    (a `_SharedAC`) lets the boards of one org-wide run share body reads.
+    """
+    if board_cache is None:
+        pages = _pages(_ITEMS_QUERY, owner, number)
+    else:
+        nodes = board_cache.items(
+            "board", owner, number, _ITEMS_QUERY,
+            probe=lambda: [(n["id"], _stamp(n)) for n in _page(_PROBE_QUERY, owner, number)],
+            fetch_all=lambda: [(n["id"], _stamp(n), n) for n in _page(_ITEMS_QUERY, owner, number)],
+            fetch_nodes=_fetch_nodes,
+        )
+        pages = (nodes[i:i + _CHUNK] for i in range(0, len(nodes), _CHUNK))
+    store = _ac_store(board_cache)
+    known = ((store.load("ac", owner, number, _AC_QUERY) or {}).get("ac") or {}) if store else {}
+    seen: dict = {}
+    for nodes in pages:
+        for node, has_ac in _with_ac(nodes, known, seen, shared_ac):
+            row = _snapshot_row(node, has_ac)
+            if row is not None:
+                yield row
+    if store is not None and seen != known:
+        store.store("ac", owner, number, _AC_QUERY, {"ac": seen})
+
+
+def load_board(owner: str, number: int, *, board_cache=None):
+    """Page the project items into the analysis snapshot (READ-ONLY).
+
+    Returns the list of snapshot dicts `compute_findings` consumes. Only GraphQL
+    READ queries go over the seam — the engine issues no mutation. See
+    `iter_board` for the streaming form and the cache behaviour.
+    """
+    return list(iter_board(owner, number, board_cache=board_cache))
 
-def run(owner: str, number: int, *, today=None) -> dict:
+
+def run(owner: str, number: int, *, today=None, board_cache=None, history=None,
+        stats=None) -> dict:
     """Fetch the live board (read-only) and emit the ranked findings + counts.
 
-    The whole result is computed by `compute_findings` over the snapshot — this
-    function only does the read seam + assembly. It NEVER writes.
+    Streams `iter_board` straight into a columnar `Snapshot` (no per-item
+    dicts are kept), then runs the counts and finding rules over it. With
+    `history`, the rows are content-hashed instead so unchanged ones skip the
+    rules (`_remembered`), and the run is recorded (`run_id` in the result).
+    `stats` collects the per-rule counters. It NEVER writes to GitHub.
     """
-    snapshot = load_board(owner, number)
-    findings = compute_findings(snapshot, today=today)
+    project = f"{owner}#{number}"
+    if history is not None:
+        rows = list(iter_board(owner, number, board_cache=board_cache))
+        return {"project": project, **_remembered(history, project, rows, stats)}
+    snap = Snapshot(iter_board(owner, number, board_cache=board_cache))
     return {
-        "project": f"{owner}#{number}",
-        "counts": rollup_counts(snapshot),
+        "project": project,
+        "counts": snap.counts(),
+        "findings": compute_findings(snap, today=today, stats=stats),
+    }
+
+
+def _rules_digest() -> str:
+    """Salt for the history memo: this module's source, so any rule edit
+    invalidates remembered per-row findings. (No rule reads `today`.)"""
+    global _RULES_DIGEST
+    if _RULES_DIGEST is None:
+        with open(os.path.abspath(__file__), "rb") as fh:
+            _RULES_DIGEST = hashlib.sha256(fh.read()).hexdigest()
+    return _RULES_DIGEST
+
+
+_RULES_DIGEST = None
+
+
+def _remembered(store, project: str, rows: list, stats=None) -> dict:
+    """{counts, findings, run_id} for `rows`, reusing `store` wherever it can.
+
+    Identical to `rollup_counts` / `compute_findings` over the rows: every rule
+    reads a single row, so the findings of a row whose content hash is already
+    memoized are taken as stored, and the ranking is re-applied over the
+    combination (ties by row order, as `compute_findings` breaks them).
+    """
+    salt = _rules_digest()
+    hashes = [_history.row_hash(row, salt) for row in rows]
+    snap_hash = _history.snapshot_hash(hashes)
+    last = store.latest(project)
+    if last is not None and last["snapshot_hash"] == snap_hash:
+        counts, findings = last["counts"], store.findings(last["id"])
+    else:
+        memo = store.item_findings(hashes)
+        fresh = [i for i, h in enumerate(hashes) if h not in memo]
+        learned = {hashes[i]: [] for i in fresh}
+        for j, finding in _ranked(Snapshot(rows[i] for i in fresh), stats):
+            learned[hashes[fresh[j]]].append(finding)
+        store.remember_items(learned)
+        memo.update(learned)
+        hits = [(i, f) for i, h in enumerate(hashes) for f in memo[h]]
+        hits.sort(key=lambda hit: (hit[1]["severity"], _num_key(hit[1]["number"]),
+                                   hit[1]["kind"], hit[0]))
+        counts, findings = rollup_counts(rows), [f for _, f in hits]
+    run_id = store.record(project, snap_hash, counts, findings)
+    return {"counts": counts, "findings": findings, "run_id": run_id}
+
+
+# --------------------------------------------------------------------------- #
+# Org-wide mode — every open project of an owner, one merged report.
+# --------------------------------------------------------------------------- #
+_PROJECTS_QUERY = """
+query($owner:String!, $after:String){
+  organization(login:$owner){
+    projectsV2(first:100, after:$after){
+      pageInfo { hasNextPage endCursor }
+      nodes { number title closed }
+    }
+  }
+}
+"""
+
+
+def discover_projects(owner: str, *, include_closed: bool = False) -> list:
+    """[{number, title}] of the owner's projects, by number (closed ones skipped
+    unless `include_closed`). Raises code 3 if the org is not found."""
+    out, after = [], None
+    while True:
+        data = graphql(_PROJECTS_QUERY, {"owner": owner, "after": after})
+        org = (data or {}).get("organization")
+        if not org:
+            raise AnalysisError(f"organization {owner} not found", code=3)
+        conn = org.get("projectsV2") or {}
+        for node in conn.get("nodes") or []:
+            if node and node.get("number") is not None and (include_closed or not node.get("closed")):
+                out.append({"number": int(node["number"]), "title": node.get("title") or ""})
+        page = conn.get("pageInfo") or {}
+        if not page.get("hasNextPage"):
+            break
+        after = page.get("endCursor")
+    return sorted(out, key=lambda p: p["number"])
+
+
+def run_org(owner: str, *, numbers=None, today=None, board_cache=None,
+            include_closed: bool = False, history=None, stats=None) -> dict:
+    """Analyse every project of `owner` (or just `numbers`) as one org board.
+
+    The boards are read concurrently through `gh.fan_out` (bounded by
+    GH_PROJECTS_MAX_CONCURRENCY; each board still pages with its own prefetch),
+    and an issue carried by several boards has its body read once.
+    Each board's rows give its rollup counts. The merged snapshot holds each
+    issue ONCE — keyed by (repo, number); an issue on several boards takes its
+    field values from the lowest-numbered one — so the merged findings are
+    computed once per issue and name every project that carries it. With
+    `history`, the merged result is recorded as project "OWNER#org". It NEVER
+    writes to GitHub.
+    """
+    if numbers is None:
+        projects = discover_projects(owner, include_closed=include_closed)
+    else:
+        projects = [{"number": int(n), "title": ""} for n in sorted(set(numbers))]
+    shared_ac = _SharedAC()
+    boards = gh.fan_out(
+        [lambda n=p["number"]: list(iter_board(owner, n, board_cache=board_cache,
+                                               shared_ac=shared_ac))
+         for p in projects])
+    merged, keys, carried_by, rollups, kept = Snapshot(), [], {}, [], []
+    for proj, rows in zip(projects, boards):
+        rollups.append({"project": f"{owner}#{proj['number']}", "title": proj["title"],
+                        "counts": rollup_counts(rows)})
+        for row in rows:
+            key = (row.get("repo") or "", str(row.get("number", "")))
+            if key not in carried_by:
+                carried_by[key] = []
+                keys.append(key)
+                merged.append(row)
+                kept.append(row)
+            if proj["number"] not in carried_by[key]:
+                carried_by[key].append(proj["number"])
+    findings = [{**finding, "repo": keys[i][0], "projects": carried_by[keys[i]]}
+                for i, finding in _ranked(merged, stats)]
+    # Same issue number in two repos: break the tie by repo, not board order.
+    findings.sort(key=lambda f: (f["severity"], _num_key(f["number"]), f["repo"], f["kind"]))
+    result = {
+        "owner": owner,
+        "counts": merged.counts(),
+        "projects": rollups,
         "findings": findings,
     }
+    if history is not None:
+        snap_hash = _history.snapshot_hash(_history.row_hash(row) for row in kept)
+        result["run_id"] = history.record(org_project(owner), snap_hash,
+                                          result["counts"], findings)
+    return result
+
+
+def org_project(owner: str) -> str:
+    """The history key of an org-wide run."""
+    return f"{owner}#org"
 
 
 # --------------------------------------------------------------------------- #
@@ -521,7 +1061,25 @@ def build_parser():
     p.add_argument("--snapshot", default=None,
                    help="path to a board-snapshot JSON array, or - for stdin "
                         "(offline; skips the live read)")
+    p.add_argument("--org-wide", action="store_true",
+                   help="analyse every open project of --owner as one merged report "
+                        "(per-project rollups included)")
+    p.add_argument("--include-closed", action="store_true",
+                   help="with --org-wide, also analyse closed projects")
     p.add_argument("--today", default=None, help="reference date YYYY-MM-DD (default: UTC today)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="re-read the whole board instead of revalidating the local "
+                        "snapshot cache (see cache.py)")
+    p.add_argument("--since", default=None, metavar="WHEN",
+                   help="also report NEW / RESOLVED / ESCALATED findings against a "
+                        "recorded run: 'last', a run id, or a date/time (see history.py)")
+    p.add_argument("--no-history", action="store_true",
+                   help="do not record this run in (or reuse findings from) the local "
+                        "findings history")
+    p.add_argument("--rule-stats", action="store_true",
+                   help="print each finding rule's candidate rows, findings and time (stderr)")
+    p.add_argument("--cost-report", action="store_true",
+                   help="print the GraphQL points GitHub charged per query page (stderr)")
     return p
 
 
@@ -534,8 +1092,11 @@ def main(argv=None) -> int:
     if args.today and today is None:
         sys.stderr.write(f"error: invalid --today {args.today!r}\n")
         return 2
+    stats = {} if args.rule_stats else None
     try:
         if args.snapshot is not None:
+            if args.since is not None:
+                raise AnalysisError("--since needs a live read (--owner), not --snapshot", code=2)
             raw = sys.stdin.read() if args.snapshot == "-" else _read_file(args.snapshot)
             items = json.loads(raw) if raw and raw.strip() else []
             if not isinstance(items, list):
@@ -543,15 +1104,23 @@ def main(argv=None) -> int:
             result = {
                 "project": "(snapshot)",
                 "counts": rollup_counts(items),
-                "findings": compute_findings(items, today=today),
+                "findings": compute_findings(items, today=today, stats=stats),
             }
         else:
-            if not args.owner or args.number is None:
+            if args.org_wide and (not args.owner or args.number is not None):
+                raise AnalysisError("--org-wide needs --owner and no --number", code=2)
+            if not args.org_wide and (not args.owner or args.number is None):
                 raise AnalysisError("need --owner and --number (or --snapshot)", code=2)
-            result = run(args.owner, args.number, today=today)
+            snap_cache = None if args.no_cache else cache.SnapshotCache.default()
+            store = None if args.no_history else _history.HistoryStore.default()
+            try:
+                result = _live(args, today, snap_cache, store, stats)
+            finally:
+                if store is not None:
+                    store.close()
         sys.stdout.write(_scrub(json.dumps(result)) + "\n")
         return 0
-    except AnalysisError as e:
+    except (AnalysisError, _history.HistoryError) as e:
         sys.stderr.write("error: " + _scrub(str(e)) + "\n")
         return e.code
     except json.JSONDecodeError as e:
@@ -560,6 +1129,44 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + _scrub(str(e)) + "\n")
         return 1
+    finally:
+        if stats is not None:
+            emit_rule_stats(stats)
+        ratelimit.emit(RUN, pages=args.cost_report)
+
+
+def emit_rule_stats(stats: dict, stream=None) -> None:
+    """One `rule: {...}` line per rule that ran (stderr), registry order."""
+    stream = stream or sys.stderr
+    for r in RULES:
+        entry = stats.get(r.kind)
+        if entry is not None:
+            stream.write("rule: " + json.dumps({
+                "kind": r.kind, "candidates": entry["candidates"],
+                "findings": entry["findings"], "ms": round(entry["seconds"] * 1000, 3),
+            }) + "\n")
+
+
+def _live(args, today, snap_cache, store, stats=None) -> dict:
+    """The live read for `main`, plus the `--since` delta when asked for."""
+    project = org_project(args.owner) if args.org_wide else f"{args.owner}#{args.number}"
+    baseline = None
+    if args.since is not None:
+        if store is None:
+            raise AnalysisError("--since needs the findings history (drop --no-history; "
+                                "GH_PROJECTS_CACHE must not be off)", code=2)
+        baseline = store.resolve(project, args.since)  # before this run is recorded
+    if args.org_wide:
+        result = run_org(args.owner, today=today, board_cache=snap_cache,
+                         include_closed=args.include_closed, history=store, stats=stats)
+    else:
+        result = run(args.owner, args.number, today=today, board_cache=snap_cache, history=store,
+                     stats=stats)
+    if baseline is not None:
+        result["since"] = {"run_id": baseline["id"], "at": _dt.datetime.fromtimestamp(
+            baseline["at"], _dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}
+        result["delta"] = _history.delta(store.findings(baseline["id"]), result["findings"])
+    return result
 
 
 def _read_file(path) -> str:
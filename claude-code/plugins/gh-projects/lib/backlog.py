@@ -46,6 +46,7 @@ import sys
 import gh
 import intake
 import pm
+import ratelimit
 
 # --------------------------------------------------------------------------- #
 # Errors — mirror the lib's error-class + CLI exit map.
@@ -450,29 +451,35 @@ def promote_draft(staging: "Staging", slug: str, *, owner, project_number,
     # (5b) Projects v2 writes — App installation token, never GITHUB_TOKEN.
     proj = gh.Project(owner, project_number).resolve()
     content_id = gh.issue_node_id(target_repo, issue_number)
-    gh.add_item(proj.id, content_id)
-    for fname in TRIAGE_SINGLE_SELECTS:
-        val = plan["fields"].get(fname)
-        if val:
-            gh.write_field(proj, content_id, fname, val)
+    values = {f: plan["fields"][f] for f in TRIAGE_SINGLE_SELECTS if plan["fields"].get(f)}
     if pm_id:
-        gh.write_field(proj, content_id, "PM-ID", pm_id)
+        values["PM-ID"] = pm_id
     if spec_path:
-        gh.write_field(proj, content_id, "Spec", spec_path)
+        values["Spec"] = spec_path
+    if values:
+        gh.write_fields(proj, content_id, values)  # adds the item too
+    else:
+        gh.add_item(proj.id, content_id)
 
     # (5c) re-establish the recorded parent/sub-issue + blocked-by edges by the
     #      promoted issue numbers of the linked drafts.
+    #      The edges are independent, so they fan out (gh.fan_out): the parent
+    #      node-id read overlaps the blocker writes; the writes stay one-at-a-time.
+    edges = []
     if parent:
         parent_entry = data["drafts"].get(parent) or {}
         parent_issue = parent_entry.get("issue")
         if parent_issue:
-            parent_id = gh.issue_node_id(target_repo, parent_issue)
-            gh.add_sub_issue(parent_id, content_id)
+            edges.append(lambda: gh.add_sub_issue(
+                gh.issue_node_id(target_repo, parent_issue), content_id))
+    caps = gh.Capabilities()
     for b in blockers:
         b_entry = data["drafts"].get(b) or {}
         b_issue = b_entry.get("issue")
         if b_issue:
-            gh.add_blocked_by(target_repo, issue_number, b_issue)
+            edges.append(lambda b_issue=b_issue: gh.add_blocked_by(
+                target_repo, issue_number, b_issue, caps))
+    gh.fan_out(edges)
 
     # (6) one-way: mark promoted, REMOVE the staging file, record the results.
     entry["status"] = "promoted"
@@ -559,9 +566,11 @@ def build_parser():
                                 description="gh-projects staging-ledger engine")
     p.add_argument("--root", default=None,
                    help="staging git-root override (default: git rev-parse --show-toplevel)")
+    p.add_argument("--cost-report", action="store_true", help=ratelimit.COST_REPORT_HELP)
     sub = p.add_subparsers(dest="cmd", required=True)
+    cost = [ratelimit.cost_report_parent()]
 
-    sp = sub.add_parser("add", help="capture a draft stub (file + ledger entry)")
+    sp = sub.add_parser("add", parents=cost, help="capture a draft stub (file + ledger entry)")
     sp.add_argument("--title", required=True)
     sp.add_argument("--type", default=None)
     sp.add_argument("--tier", default=None)
@@ -573,13 +582,14 @@ def build_parser():
     sp.add_argument("--force", action="store_true")
     sp.set_defaults(func=_cmd_add)
 
-    sp = sub.add_parser("set-status", help="advance a draft (stub/drafting/ready)")
+    sp = sub.add_parser("set-status", parents=cost, help="advance a draft (stub/drafting/ready)")
     sp.add_argument("slug")
     sp.add_argument("status", choices=["stub", "drafting", "ready"])
     sp.add_argument("--force", action="store_true")
     sp.set_defaults(func=_cmd_set_status)
 
-    sp = sub.add_parser("set-fields", help="upsert a draft's proposed triage fields / target repo")
+    sp = sub.add_parser("set-fields", parents=cost,
+                        help="upsert a draft's proposed triage fields / target repo")
     sp.add_argument("slug")
     sp.add_argument("--type", default=None)
     sp.add_argument("--tier", default=None)
@@ -590,7 +600,7 @@ def build_parser():
     sp.add_argument("--force", action="store_true")
     sp.set_defaults(func=_cmd_set_fields)
 
-    sp = sub.add_parser("link", help="link a draft into the epic/sub-issue tree")
+    sp = sub.add_parser("link", parents=cost, help="link a draft into the epic/sub-issue tree")
     sp.add_argument("slug")
     sp.add_argument("--parent", default=None, help="parent Epic slug")
     sp.add_argument("--blocked-by", dest="blocked_by", action="append", default=[],
@@ -598,14 +608,16 @@ def build_parser():
     sp.add_argument("--force", action="store_true")
     sp.set_defaults(func=_cmd_link)
 
-    sp = sub.add_parser("list", help="render the drafts + statuses (documented columns)")
+    sp = sub.add_parser("list", parents=cost,
+                        help="render the drafts + statuses (documented columns)")
     sp.set_defaults(func=_cmd_list)
 
-    sp = sub.add_parser("show", help="show one draft's full ledger entry")
+    sp = sub.add_parser("show", parents=cost, help="show one draft's full ledger entry")
     sp.add_argument("slug")
     sp.set_defaults(func=_cmd_show)
 
-    sp = sub.add_parser("promote", help="promote a ready draft to a board issue (App-token writes)")
+    sp = sub.add_parser("promote", parents=cost,
+                        help="promote a ready draft to a board issue (App-token writes)")
     sp.add_argument("slug")
     sp.add_argument("--owner", required=True, help="org login")
     sp.add_argument("--number", type=int, required=True, help="project number")
@@ -627,6 +639,8 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + gh._scrub(str(e)) + "\n")
         return 1
+    finally:
+        ratelimit.emit(gh.RUN, pages=args.cost_report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""gh-projects on-disk board snapshot cache (stdlib only, no network).
+
+Every skill invocation is a fresh process, so back-to-back `analyze-board` /
+`analyze-sprint` runs used to re-page the same project from scratch. This keeps
+the last read of a board on disk, keyed by (owner, project number, query shape),
+and lets the caller REVALIDATE it instead of re-downloading it:
+
+  * a cheap probe pages only `{id updatedAt}` per item (no bodies, no field
+    values), then
+  * only items whose stamp changed — or that are new — are re-fetched by id
+    (`nodes(ids:)`); items gone from the board are dropped.
+
+The cache never talks to GitHub itself: the caller passes `probe` /
+`fetch_all` / `fetch_nodes` callables built on its own `graphql` seam, so it
+stays offline-testable and each module keeps its own error type.
+
+Staleness bound: `updatedAt` does not move for every derived value GitHub shows
+(e.g. a parent's sub-issue rollup), so a board whose last FULL read is older
+than `max_age` seconds (default 1h, `GH_PROJECTS_CACHE_MAX_AGE`) is re-read in
+full. Warm revalidations carry that `full_at` forward unchanged, so a board
+read often still expires on schedule.
+
+`gh.py` keeps its resolved project field/option/iteration ids here too
+(kind "resolve", its own TTL) so each `engine.sh` verb skips the resolve query.
+
+Location: `$GH_PROJECTS_CACHE_DIR`, else `$XDG_CACHE_HOME/gh-projects`, else
+`~/.cache/gh-projects`. The directory is 0700 and every file 0600 — entries hold
+issue content. `GH_PROJECTS_CACHE=off` disables the cache (the test suite sets
+it). A corrupt or unreadable entry is a miss, never an error.
+
+CLI:
+  clear [--owner ORG] [--number N]   drop cached snapshots (all, or one board)
+  path                               print the cache directory
+
+Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+CACHE_ENV = "GH_PROJECTS_CACHE"
+CACHE_DIR_ENV = "GH_PROJECTS_CACHE_DIR"
+MAX_AGE_ENV = "GH_PROJECTS_CACHE_MAX_AGE"
+DEFAULT_MAX_AGE = 3600
+FORMAT_VERSION = 1
+NODES_PER_FETCH = 100  # GitHub's cap on `nodes(ids:)`
+
+
+class CacheError(Exception):
+    def __init__(self, msg: str, code: int = 2):
+        super().__init__(msg)
+        self.code = code
+
+
+def cache_dir() -> str:
+    explicit = os.environ.get(CACHE_DIR_ENV)
+    if explicit:
+        return explicit
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gh-projects")
+
+
+def enabled() -> bool:
+    return os.environ.get(CACHE_ENV, "").lower() not in ("off", "0", "false", "no")
+
+
+class SnapshotCache:
+    """One JSON file per (kind, owner, number, query shape)."""
+
+    def __init__(self, root: str | None = None, *, max_age: float | None = None, clock=None):
+        self.root = root or cache_dir()
+        if max_age is None:
+            max_age = float(os.environ.get(MAX_AGE_ENV) or DEFAULT_MAX_AGE)
+        self.max_age = max_age
+        self.clock = clock or time.time
+        self.last = {}  # stats of the most recent revalidate: mode/items/refetched
+
+    @classmethod
+    def default(cls, **kwargs) -> "SnapshotCache | None":
+        """The user-level cache, or None when `GH_PROJECTS_CACHE=off`."""
+        return cls(**kwargs) if enabled() else None
+
+    # -- files ---------------------------------------------------------------- #
+    def path(self, kind: str, owner: str, number: int, shape: str) -> str:
+        safe_owner = re.sub(r"[^A-Za-z0-9_.-]", "_", str(owner))
+        digest = hashlib.sha256(shape.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, f"{kind}-{safe_owner}-{int(number)}-{digest}.json")
+
+    def load(self, kind: str, owner: str, number: int, shape: str) -> dict | None:
+        """The stored entry, or None when absent, corrupt, foreign or expired."""
+        try:
+            with open(self.path(kind, owner, number, shape), "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != FORMAT_VERSION:
+            return None
+        full_at = entry.get("full_at", entry.get("saved_at"))
+        if self.clock() - float(full_at or 0) > self.max_age:
+            return None
+        return entry
+
+    def store(self, kind: str, owner: str, number: int, shape: str, entry: dict) -> None:
+        """Atomically write `entry` (0600). A write failure only loses the cache.
+
+        The entry ages from its `full_at` when it carries one, else from now.
+        """
+        now = self.clock()
+        entry = dict(entry, version=FORMAT_VERSION, saved_at=now)
+        entry.setdefault("full_at", now)
+        target = self.path(kind, owner, number, shape)
+        tmp = None
+        try:
+            os.makedirs(self.root, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".json")
+            os.chmod(tmp, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp, target)
+            tmp = None
+        except OSError:
+            pass
+        finally:
+            if tmp and os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def discard(self, kind: str, owner: str, number: int, shape: str) -> bool:
+        """Drop one entry (e.g. after the server rejected an id it held)."""
+        try:
+            os.unlink(self.path(kind, owner, number, shape))
+            return True
+        except OSError:
+            return False
+
+    def clear(self, owner: str | None = None, number: int | None = None) -> int:
+        """Remove cached entries (all, or one owner / board). Returns the count."""
+        if not os.path.isdir(self.root):
+            return 0
+        removed = 0
+        safe_owner = re.sub(r"[^A-Za-z0-9_.-]", "_", str(owner)) if owner else None
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            parts = name[:-5].split("-")
+            if len(parts) < 4:
+                continue
+            owner_part, number_part = "-".join(parts[1:-2]), parts[-2]
+            if safe_owner is not None and owner_part != safe_owner:
+                continue
+            if number is not None and number_part != str(int(number)):
+                continue
+            try:
+                os.unlink(os.path.join(self.root, name))
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    # -- revalidation --------------------------------------------------------- #
+    def items(self, kind: str, owner: str, number: int, shape: str, *,
+              probe, fetch_all, fetch_nodes) -> list:
+        """Return the board's raw item nodes, revalidating any cached copy.
+
+        `fetch_all()` -> [(id, stamp, node)] pages the full query (cold path).
+        `probe()` -> [(id, stamp)] pages only stamps, in board order.
+        `fetch_nodes(ids)` -> {id: (stamp, node)} re-reads items by id.
+        """
+        entry = self.load(kind, owner, number, shape)
+        if entry is None:
+            rows = fetch_all()
+            self._save_rows(kind, owner, number, shape, rows)
+            self.last = {"mode": "cold", "items": len(rows), "refetched": len(rows)}
+            return [node for _, _, node in rows]
+
+        cached = entry.get("items") or {}
+        current = probe()
+        stale = [item_id for item_id, stamp in current
+                 if item_id not in cached or cached[item_id][0] != stamp]
+        fresh: dict = {}
+        for i in range(0, len(stale), NODES_PER_FETCH):
+            fresh.update(fetch_nodes(stale[i:i + NODES_PER_FETCH]))
+        rows = []
+        for item_id, stamp in current:
+            if item_id in fresh:
+                new_stamp, node = fresh[item_id]
+                rows.append((item_id, new_stamp, node))
+            elif item_id in cached and item_id not in stale:
+                rows.append((item_id, stamp, cached[item_id][1]))
+            # else: vanished between probe and fetch — leave it out
+        self._save_rows(kind, owner, number, shape, rows, full_at=entry.get("full_at"))
+        self.last = {"mode": "warm", "items": len(rows), "refetched": len(stale)}
+        return [node for _, _, node in rows]
+
+    def _save_rows(self, kind, owner, number, shape, rows, full_at=None) -> None:
+        entry = {"items": {item_id: [stamp, node] for item_id, stamp, node in rows}}
+        if full_at is not None:
+            entry["full_at"] = full_at  # a warm save keeps the last full read's time
+        self.store(kind, owner, number, shape, entry)
+
+
+# --------------------------------------------------------------------------- #
+# CLI
+# --------------------------------------------------------------------------- #
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="cache.py", description="gh-projects snapshot cache")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    clear = sub.add_parser("clear", help="drop cached snapshots")
+    clear.add_argument("--owner")
+    clear.add_argument("--number", type=int)
+    sub.add_parser("path", help="print the cache directory")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 2 if e.code not in (0, None) else (e.code or 0)
+    try:
+        if args.cmd == "path":
+            print(cache_dir())
+        else:
+            if args.number is not None and not args.owner:
+                raise CacheError("--number needs --owner")
+            removed = SnapshotCache().clear(args.owner, args.number)
+            print(json.dumps({"removed": removed}))
+        return 0
+    except CacheError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return e.code
+    except Exception as e:  # noqa: BLE001
+        sys.stderr.write(f"error: unexpected: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
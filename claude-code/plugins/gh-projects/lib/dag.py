@@ -18,12 +18,18 @@ Edge convention: `blocked_by[A] = [B, C]` means "A is blocked by B and C", i.e.
 B and C each BLOCK A. So the "downstream" of B (what B blocks) is everything
 reachable by following reversed edges.
 
+`critical_path` schedules the same graph: with Size as a duration estimate it
+derives each open item's earliest finish (no item can finish before its open
+blockers do), the projected slippage against its Target date, and the longest
+chain ending at each release blocker.
+
 Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
 """
 from __future__ import annotations
 
 import json
 import sys
+from datetime import date, datetime, timedelta, timezone
 
 BLAST_NONE = "Blocks none"
 BLAST_ONE = "Blocks 1"
@@ -37,23 +43,84 @@ class DagError(Exception):
         self.code = code
 
 
-def _build_blocks(items: dict) -> dict:
-    """From per-item `blocked_by` lists, build `blocks[x] = set(items x blocks)`.
+class DepGraph:
+    """The blocked-by graph of one snapshot, built once and shared by every query.
+
+    * `blockers[x]` — x's known blockers (any state), deduplicated, in order;
+    * `blocks[x]`   — the items x blocks while it is OPEN (the reverse edges;
+                      a closed blocker no longer blocks);
+    * `dependents[x]` — every item that lists x as a blocker, open or not
+                      (what a close/reopen of x can unblock/re-block);
+    * `open` / `release` / `blocked` — the open items, the release blockers
+                      and the items with >=1 open known blocker, as sets
+                      (`has_open_blocker(x)` is one membership test).
 
-    Ignores edges whose blocker is closed (a closed blocker no longer blocks)
-    and edges referencing unknown ids (degrade, don't fail).
+    Edges to unknown ids are dropped (degrade, don't fail).
     """
-    blocks: dict[str, set] = {k: set() for k in items}
-    for item_id, meta in items.items():
-        for blocker in (meta.get("blocked_by") or []):
-            b = str(blocker)
-            if b not in items:
-                continue  # unknown id — skip rather than crash
-            blocker_open = items[b].get("state", "open") != "closed"
-            if not blocker_open:
-                continue  # a closed blocker no longer blocks
-            blocks[b].add(str(item_id))
-    return blocks
+
+    __slots__ = ("ids", "index", "blockers", "blocks", "dependents", "open", "release",
+                 "blocked")
+
+    def __init__(self, items: dict):
+        self.ids = [str(k) for k in items]
+        self.index = {k: i for i, k in enumerate(self.ids)}
+        self.open = {str(k) for k, meta in items.items()
+                     if meta.get("state", "open") != "closed"}
+        self.release = {str(k) for k, meta in items.items() if meta.get("release_blocker")}
+        self.blockers: dict[str, list] = {}
+        self.blocks: dict[str, set] = {k: set() for k in self.ids}
+        self.dependents: dict[str, set] = {k: set() for k in self.ids}
+        self.blocked: set = set()
+        for item_id, meta in items.items():
+            k = str(item_id)
+            known = []
+            for blocker in (meta.get("blocked_by") or []):
+                b = str(blocker)
+                if b not in self.index or b in known:
+                    continue  # unknown id — skip rather than crash
+                known.append(b)
+                self.dependents[b].add(k)
+                if b in self.open:
+                    self.blocks[b].add(k)
+                    self.blocked.add(k)
+            self.blockers[k] = known
+
+    def __contains__(self, item_id) -> bool:
+        return str(item_id) in self.index
+
+    def is_open(self, item_id: str) -> bool:
+        return str(item_id) in self.open
+
+    def has_open_blocker(self, item_id: str) -> bool:
+        return str(item_id) in self.blocked
+
+    def open_blockers(self, item_id: str) -> list:
+        return [b for b in self.blockers.get(str(item_id), ()) if b in self.open]
+
+    def downstream(self, item_id: str) -> set:
+        return _downstream(str(item_id), self.blocks)
+
+    def upstream(self, item_id: str) -> set:
+        """Everything that transitively blocks `item_id` (open known blockers),
+        plus `item_id` — the only nodes whose downstream can include an edge
+        out of it."""
+        start = str(item_id)
+        seen = {start}
+        stack = [start]
+        while stack:
+            for b in self.open_blockers(stack.pop()):
+                if b not in seen:
+                    seen.add(b)
+                    stack.append(b)
+        return seen
+
+    def blocks_release(self, nodes) -> bool:
+        return not self.release.isdisjoint(nodes)
+
+
+def _build_blocks(items: dict) -> dict:
+    """`blocks[x] = set(items x blocks)` — the reverse edges of `DepGraph`."""
+    return DepGraph(items).blocks
 
 
 def _downstream(start: str, blocks: dict) -> set:
@@ -74,8 +141,139 @@ def _downstream(start: str, blocks: dict) -> set:
     return seen
 
 
-def is_blocked(item_id: str, items: dict) -> bool:
-    """True if the item has at least one OPEN blocker (drives the Blocked flag)."""
+def _sccs(nodes, succ: dict) -> list:
+    """Strongly-connected components of `succ`, iterative Tarjan.
+
+    Components come out in REVERSE topological order: every component reachable
+    from C is emitted before C — the order a bottom-up pass over the condensed
+    DAG needs. Iterative so a 100k-long chain can't blow the recursion limit.
+    """
+    index: dict = {}
+    low: dict = {}
+    on_stack: set = set()
+    stack: list = []
+    out: list = []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(succ.get(root, ())))]
+        while work:
+            v, it = work[-1]
+            descended = False
+            for w in it:
+                if w not in index:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(succ.get(w, ()))))
+                    descended = True
+                    break
+                if w in on_stack and index[w] < low[v]:
+                    low[v] = index[w]
+            if descended:
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+            if low[v] == index[v]:
+                comp = []
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    comp.append(w)
+                    if w == v:
+                        break
+                out.append(comp)
+    return out
+
+
+def _blast(graph: DepGraph) -> dict:
+    """{item_id: (blast_count, blocks_release)} for every item, in one pass.
+
+    Equivalent to running `_downstream` from every node, without the O(V·E)
+    repeat work: the blocks-graph is condensed into SCCs (GitHub permits
+    dependency cycles), then each component's downstream set is built bottom-up
+    as a bitset — the union of its successors' members and their own sets — so
+    shared tails are computed once. A bitset is dropped as soon as its last
+    predecessor has consumed it.
+
+    For a member v of component C with downstream set R(C) (other components
+    only): count = |R(C)| + |C| - 1 (the rest of v's own cycle counts, v does
+    not), and v blocks release if R(C) holds a release blocker or ANOTHER member
+    of C is one.
+    """
+    blocks = graph.blocks
+    comps = _sccs(graph.ids, blocks)
+    comp_of: dict = {}
+    for cid, members in enumerate(comps):
+        for v in members:
+            comp_of[v] = cid
+    # Bits follow component order, so a reach set only spans the (lower) bits
+    # of what is downstream of it.
+    bit = {v: 1 << i for i, v in enumerate(comp_of)}
+    release_mask = 0
+    for v in graph.release:
+        release_mask |= bit[v]
+
+    succs: list = []
+    pending_preds = [0] * len(comps)
+    for cid, members in enumerate(comps):
+        out = {comp_of[w] for v in members for w in blocks.get(v, ())} - {cid}
+        succs.append(out)
+        for d in out:
+            pending_preds[d] += 1
+
+    reach: dict = {}    # cid -> downstream bitset (live until consumed)
+    members_bits: dict = {}
+    result: dict = {}
+    for cid, members in enumerate(comps):  # reverse-topological: successors first
+        r = 0
+        for d in succs[cid]:
+            r |= reach[d] | members_bits[d]
+            pending_preds[d] -= 1
+            if pending_preds[d] == 0:
+                del reach[d], members_bits[d]
+        own = 0
+        for v in members:
+            own |= bit[v]
+        if pending_preds[cid]:
+            reach[cid] = r
+            members_bits[cid] = own
+        down = bin(r).count("1")  # int.bit_count is 3.10+
+        own_release = bin(own & release_mask).count("1")
+        r_release = bool(r & release_mask)
+        for v in members:
+            others_release = own_release - (1 if bit[v] & release_mask else 0)
+            result[v] = (down + len(members) - 1, r_release or others_release > 0)
+    return result
+
+
+def _radius(count: int, blocks_release: bool) -> str:
+    if blocks_release:
+        return BLAST_RELEASE
+    if count == 0:
+        return BLAST_NONE
+    if count == 1:
+        return BLAST_ONE
+    return BLAST_MANY
+
+
+def is_blocked(item_id: str, items) -> bool:
+    """True if the item has at least one OPEN blocker (drives the Blocked flag).
+
+    O(1) against a prebuilt `DepGraph`; a bare items dict is scanned (one item
+    does not justify building the graph).
+    """
+    if isinstance(items, DepGraph):
+        return items.has_open_blocker(item_id)
     for blocker in (items.get(str(item_id), {}).get("blocked_by") or []):
         b = str(blocker)
         if b in items and items[b].get("state", "open") != "closed":
@@ -88,20 +286,12 @@ def signals_for(item_id: str, items: dict) -> dict:
     item_id = str(item_id)
     if item_id not in items:
         raise DagError(f"unknown item '{item_id}'", code=3)
-    blocks = _build_blocks(items)
-    down = _downstream(item_id, blocks)
+    graph = DepGraph(items)
+    down = graph.downstream(item_id)
     count = len(down)
-    blocks_release = any(items.get(d, {}).get("release_blocker") for d in down)
-    if blocks_release:
-        radius = BLAST_RELEASE
-    elif count == 0:
-        radius = BLAST_NONE
-    elif count == 1:
-        radius = BLAST_ONE
-    else:
-        radius = BLAST_MANY
+    radius = _radius(count, graph.blocks_release(down))
     return {
-        "blocked": is_blocked(item_id, items),
+        "blocked": graph.has_open_blocker(item_id),
         "blast_radius": radius,
         "blast_count": count,
     }
@@ -111,31 +301,224 @@ def compute(items: dict) -> dict:
     """Compute signals for EVERY item. Returns {item_id: signals}.
 
     `items` is {id: {"blocked_by": [...], "state": "open|closed",
-    "release_blocker": bool}}. Blocks is built once and reused across items.
+    "release_blocker": bool}}. The `DepGraph` is built once; blast
+    radius/count come from one SCC-condensed bottom-up pass (`_blast`),
+    identical to a per-item `_downstream` walk.
     """
-    blocks = _build_blocks(items)
+    graph = DepGraph(items)
+    blast = _blast(graph)
     out: dict[str, dict] = {}
-    for item_id in items:
-        item_id = str(item_id)
-        down = _downstream(item_id, blocks)
-        count = len(down)
-        blocks_release = any(items.get(d, {}).get("release_blocker") for d in down)
-        if blocks_release:
-            radius = BLAST_RELEASE
-        elif count == 0:
-            radius = BLAST_NONE
-        elif count == 1:
-            radius = BLAST_ONE
-        else:
-            radius = BLAST_MANY
+    for item_id in graph.ids:
+        count, blocks_release = blast.get(item_id, (0, False))
         out[item_id] = {
-            "blocked": is_blocked(item_id, items),
-            "blast_radius": radius,
+            "blocked": graph.has_open_blocker(item_id),
+            "blast_radius": _radius(count, blocks_release),
             "blast_count": count,
         }
     return out
 
 
+# --------------------------------------------------------------------------- #
+# Critical path — earliest finish over the condensed DAG, Size as duration
+# --------------------------------------------------------------------------- #
+# Size is the appetite in working days (S=1, M=2, L=3 — the weights the sprint
+# load uses); an unsized open item counts as M. Closed items are done (0 days).
+SIZE_DAYS = {"S": 1, "M": 2, "L": 3}
+UNSIZED_DAYS = SIZE_DAYS["M"]
+
+
+def _duration(meta: dict) -> int:
+    return SIZE_DAYS.get(str(meta.get("size") or "").upper(), UNSIZED_DAYS)
+
+
+def _add_working_days(start: date, n: int) -> date:
+    """The date of the n-th working day (Mon–Fri) counting `start` itself;
+    `start` when n <= 0. Constant time, whatever n is."""
+    if n <= 0:
+        return start
+    day = start
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    weeks, rest = divmod(n - 1, 5)
+    day += timedelta(weeks=weeks)
+    if day.weekday() + rest >= 5:
+        rest += 2  # step over the weekend
+    return day + timedelta(days=rest)
+
+
+def _parse_day(value) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def critical_path(items: dict, *, today: date, graph: DepGraph | None = None) -> dict:
+    """Earliest finish + projected slippage per item, and each release
+    blocker's critical chain. One pass over the SCC condensation: linear in
+    the graph, plus the length of the chains returned.
+
+    Work on an open item starts once its last open blocker finishes (today if
+    it has none) and takes its Size in working days. A dependency cycle can
+    only be finished together, so its members share one start and finish after
+    the sum of their durations. Returns:
+
+      {"items": {id: {"finish_days", "earliest_finish", "projected_slippage_days"}},
+       "chains": {release_id: {"days", "chain": [root, ..., release_id]}}}
+
+    `finish_days` counts working days from `today`; `earliest_finish` is None
+    and both counts 0 for a closed item. `projected_slippage_days` is the
+    calendar days the earliest finish lands past Target (0 if none / on time).
+    The chain follows, from the release blocker back, the blocker that finishes
+    last (ties: the first listed).
+    """
+    graph = graph or DepGraph(items)
+    metas = {str(k): meta for k, meta in items.items()}
+    comps = _sccs(graph.ids, graph.blocks)
+    comp_of: dict = {}
+    for cid, members in enumerate(comps):
+        for v in members:
+            comp_of[v] = cid
+    finish = [0] * len(comps)
+    via: list = [None] * len(comps)
+    for cid in range(len(comps) - 1, -1, -1):  # blockers before what they block
+        work = sum(_duration(metas[v]) for v in comps[cid] if v in graph.open)
+        if not work:
+            continue  # a closed item is done
+        start, best = 0, None
+        for v in comps[cid]:
+            for b in graph.open_blockers(v):
+                d = comp_of[b]
+                if d != cid and finish[d] > start:
+                    start, best = finish[d], d
+        finish[cid], via[cid] = start + work, best
+
+    out: dict = {}
+    for v in graph.ids:
+        days = finish[comp_of[v]]
+        eta = _add_working_days(today, days) if days else None
+        target = _parse_day(metas[v].get("target"))
+        slip = (eta - target).days if eta and target else 0
+        out[v] = {"finish_days": days,
+                  "earliest_finish": eta.isoformat() if eta else None,
+                  "projected_slippage_days": slip if slip > 0 else 0}
+    backwards: dict = {}  # cid -> its members, sorted descending (cycles only)
+    chains: dict = {}
+    for r in graph.ids:
+        if r not in graph.release or r not in graph.open:
+            continue
+        own = comps[comp_of[r]]
+        chain = [r] + sorted((v for v in own if v != r), reverse=True)
+        cid = via[comp_of[r]]
+        while cid is not None:  # built leaf-first, reversed once at the end
+            comp = comps[cid]
+            if len(comp) == 1:
+                chain.append(comp[0])
+            else:
+                if cid not in backwards:
+                    backwards[cid] = sorted(comp, reverse=True)
+                chain.extend(backwards[cid])
+            cid = via[cid]
+        chain.reverse()
+        chains[r] = {"days": out[r]["finish_days"], "chain": chain}
+    return {"items": out, "chains": chains}
+
+
+# --------------------------------------------------------------------------- #
+# Incremental recompute — one webhook-sized change, not a full sweep
+# --------------------------------------------------------------------------- #
+# A delta is one change dict (or a list of them):
+#   {"op": "add_edge" | "remove_edge", "item": A, "blocker": B}   B blocks A
+#   {"op": "close" | "reopen", "item": X}
+#   {"op": "set_target", "item": X, "target": "YYYY-MM-DD" | None}
+# Only items whose downstream can have changed are re-walked: a changed edge
+# out of B (or B opening/closing) can only move the blast of B and of what
+# reaches B; Blocked can only move on the edge's target / the closed item's
+# dependents (read off the after-graph's `dependents` index, not a scan).
+# Everything else keeps its previous signals.
+DELTA_OPS = ("add_edge", "remove_edge", "close", "reopen", "set_target")
+
+
+def apply_delta(items: dict, delta) -> tuple[dict, set, set]:
+    """Apply `delta` to a copy of `items`.
+
+    Returns (items_after, seeds, direct): `seeds` are the blockers whose
+    upstream must re-walk its blast (and whose dependents' Blocked may flip —
+    `affected_by` adds those from the after-graph); `direct` are the items whose
+    own Blocked (or schedule) may have changed. `items` is not mutated.
+    """
+    after = dict(items)
+    seeds: set = set()
+    direct: set = set()
+    for change in ([delta] if isinstance(delta, dict) else list(delta or [])):
+        op = change.get("op")
+        if op not in DELTA_OPS:
+            raise DagError(f"unknown delta op {op!r} (expected one of {', '.join(DELTA_OPS)})")
+        item_id = str(change.get("item", ""))
+        if item_id not in after:
+            raise DagError(f"unknown item '{item_id}'", code=3)
+        meta = after[item_id] = dict(after[item_id])
+        if op in ("add_edge", "remove_edge"):
+            blocker = str(change.get("blocker", ""))
+            if not blocker:
+                raise DagError(f"{op} needs a 'blocker'")
+            current = [str(b) for b in (meta.get("blocked_by") or [])]
+            if op == "add_edge" and blocker not in current:
+                current.append(blocker)
+            elif op == "remove_edge":
+                current = [b for b in current if b != blocker]
+            meta["blocked_by"] = current
+            direct.add(item_id)
+            if blocker in after:
+                seeds.add(blocker)
+        elif op in ("close", "reopen"):
+            meta["state"] = "closed" if op == "close" else "open"
+            seeds.add(item_id)
+            direct.add(item_id)
+        else:
+            meta["target"] = change.get("target")
+            direct.add(item_id)
+    return after, seeds, direct
+
+
+def affected_by(items_after, seeds: set, direct: set) -> set:
+    """The items whose DAG signals may differ after a delta (`items_after` may
+    be the items dict or its prebuilt `DepGraph`)."""
+    graph = items_after if isinstance(items_after, DepGraph) else DepGraph(items_after)
+    affected = set(direct)
+    for seed in seeds:
+        affected |= graph.upstream(seed)
+        affected |= graph.dependents.get(seed, set())
+    return affected
+
+
+def recompute(items: dict, previous: dict, delta) -> tuple[dict, dict]:
+    """Incrementally apply `delta` to a computed snapshot.
+
+    `previous` is `compute(items)`. Returns (items_after, changed) where
+    `changed` holds ONLY the items whose {blocked, blast_radius, blast_count}
+    differ from `previous` — identical to diffing two full `compute` runs.
+    """
+    after, seeds, direct = apply_delta(items, delta)
+    graph = DepGraph(after)
+    changed: dict[str, dict] = {}
+    for item_id in sorted(affected_by(graph, seeds, direct)):
+        down = graph.downstream(item_id)
+        count = len(down)
+        row = {
+            "blocked": graph.has_open_blocker(item_id),
+            "blast_radius": _radius(count, graph.blocks_release(down)),
+            "blast_count": count,
+        }
+        if row != previous.get(item_id):
+            changed[item_id] = row
+    return after, changed
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
 # --------------------------------------------------------------------------- #
 # CLI — reads the items graph as JSON on stdin or from a file
 # --------------------------------------------------------------------------- #
@@ -145,6 +528,13 @@ def main(argv=None) -> int:
     parser = argparse.ArgumentParser(prog="dag.py", description="gh-projects blocked-by signals")
     parser.add_argument("file", nargs="?", help="items graph JSON (default: stdin)")
     parser.add_argument("--item", help="compute signals for a single item id")
+    parser.add_argument("--delta", help="JSON change (or list): print only the items "
+                                        "whose signals it changes")
+    parser.add_argument("--critical-path", action="store_true",
+                        help="print earliest finish / projected slippage per item and "
+                             "the critical chain to each release blocker")
+    parser.add_argument("--today", help="YYYY-MM-DD the critical path starts from "
+                                        "(default: today, UTC)")
     try:
         args = parser.parse_args(argv)
     except SystemExit as e:
@@ -167,7 +557,20 @@ def main(argv=None) -> int:
         if not isinstance(items, dict):
             sys.stderr.write("error: items graph must be a JSON object {id: {...}}\n")
             return 2
-        if args.item:
+        if args.critical_path:
+            today = _parse_day(args.today) if args.today else _utc_today()
+            if today is None:
+                sys.stderr.write(f"error: --today must be YYYY-MM-DD, got {args.today!r}\n")
+                return 2
+            print(json.dumps(critical_path(items, today=today)))
+        elif args.delta:
+            delta = json.loads(args.delta)
+            if not isinstance(delta, (dict, list)):
+                sys.stderr.write("error: --delta must be a JSON object or list\n")
+                return 2
+            _, changed = recompute(items, compute(items), delta)
+            print(json.dumps(changed))
+        elif args.item:
             print(json.dumps(signals_for(args.item, items)))
         else:
             print(json.dumps(compute(items)))
@@ -13,7 +13,7 @@
 # Write verbs (gated by --force via the "*)" branch below — they mutate GitHub):
 #   open-pr | pr-checks | merge-pr | set-milestone | reorder-item | set-assignee
 #   | link-repo | link-team   (the two scaffold-completion links — same rail)
-#   | add-item | write-field | advance-status | create-linked-branch
+#   | add-item | write-field | write-fields | advance-status | create-linked-branch
 #       (the start-issue / plan-sprint projection verbs — same --force rail)
 # Anything not in the read whitelist falls to "*)" and requires --force.
 #
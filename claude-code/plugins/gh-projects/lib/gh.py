@@ -31,6 +31,11 @@ import os
 import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+import ratelimit
 
 # --------------------------------------------------------------------------- #
 # Injectable command runner
@@ -41,11 +46,23 @@ import sys
 
 
 class GhError(Exception):
-    """A gh/GraphQL invocation failed. Carries a code for the CLI exit map."""
+    """A gh/GraphQL invocation failed. Carries a code for the CLI exit map.
+
+    `stdout` is what the failed call printed, when anything: `gh api graphql`
+    exits non-zero whenever the response has `errors`, but still prints the
+    whole payload — partial `data` included — which is what lets a batched
+    write tell the aliases that landed from the ones that did not.
+
+    `stderr` is gh's own error text (or the HTTP status line): the only part
+    retries are classified from, since the message also carries the argv.
+    """
 
-    def __init__(self, msg: str, code: int = 1):
+    def __init__(self, msg: str, code: int = 1, stdout: str | None = None,
+                 stderr: str | None = None):
         super().__init__(msg)
         self.code = code
+        self.stdout = stdout
+        self.stderr = stderr
 
 
 def _default_run(args) -> str:
@@ -55,12 +72,256 @@ def _default_run(args) -> str:
     """
     proc = subprocess.run(["gh", *[str(a) for a in args]], capture_output=True, text=True)
     if proc.returncode != 0:
-        raise GhError(f"gh {_redact_args(args)} failed: {_scrub(proc.stderr.strip())}", code=1)
+        raise GhError(f"gh {_redact_args(args)} failed: {_scrub(proc.stderr.strip())}", code=1,
+                      stdout=proc.stdout, stderr=proc.stderr)
     return proc.stdout
 
 
+# --------------------------------------------------------------------------- #
+# Persistent in-process HTTPS transport — an opt-in RUN backend
+# --------------------------------------------------------------------------- #
+# `_default_run` forks a fresh `gh` per round-trip (Go startup + auth lookup +
+# TLS handshake every time). `HttpTransport` speaks the SAME `gh api` argv
+# contract in-process over pooled keep-alive connections, so a multi-call verb
+# pays the handshake once. It is a drop-in `RUN`: anything it does not
+# understand (non-`api` verbs, `--paginate`, `--jq`, `@file` fields, ...) is
+# delegated to the subprocess runner unchanged, and tests keep replacing `RUN`
+# with their fakes exactly as before.
+class HttpTransport:
+    """A `RUN(args) -> str` backend over pooled HTTPS keep-alive connections.
+
+    Token resolution (never `GITHUB_TOKEN` — constraint #2): an
+    `Authorization` header carried in the argv (the App-JWT exchange) wins;
+    else `GH_TOKEN` (what the vendored writers export per call); else
+    `GH_APP_TOKEN`; else `gh auth token`, asked ONCE and kept for the process.
+    Errors carry the same redacted argv + scrubbed body the subprocess runner
+    reports, so nothing printed can leak a token.
+
+    `base_url` targets a non-github.com API root (tests / the benchmark stub);
+    `GH_HOST` selects a GitHub Enterprise host. `connect(scheme, netloc)` is
+    the connection factory seam.
+    """
+
+    def __init__(self, *, base_url: str | None = None, max_idle: int = 4,
+                 timeout: float = 30.0, connect=None, fallback=None):
+        from urllib.parse import urlsplit
+
+        if base_url is None:
+            host = os.environ.get("GH_HOST") or "github.com"
+            if host == "github.com":
+                base_url = "https://api.github.com"
+            else:
+                base_url = f"https://{host}/api/v3"
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "https"
+        self.netloc = parts.netloc
+        self.rest_prefix = parts.path.rstrip("/")
+        # GHES serves GraphQL at /api/graphql, next to (not under) /api/v3.
+        if self.rest_prefix.endswith("/api/v3"):
+            self.graphql_path = self.rest_prefix[: -len("/v3")] + "/graphql"
+        else:
+            self.graphql_path = self.rest_prefix + "/graphql"
+        self.max_idle = int(max_idle)
+        self.timeout = timeout
+        self._connect = connect or self._open_connection
+        self._fallback = fallback
+        self._idle: list = []
+        self._cli_token = None
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "connections": 0, "fallbacks": 0}
+
+    # -- RUN contract ------------------------------------------------------- #
+    def __call__(self, args) -> str:
+        req = self._parse(args)
+        if req is None:
+            self._count("fallbacks")
+            return (self._fallback or _default_run)(args)
+        method, path, headers, body = req
+        status, text, retry_after = self._request(method, path, headers, body)
+        if status >= 400:
+            retry = f" (retry-after: {retry_after})" if retry_after else ""
+            line = f"HTTP {status}: {_scrub(_error_message(text))}" + retry
+            raise GhError(f"gh {_redact_args(args)} failed: {line}", code=1, stdout=text,
+                          stderr=line)
+        return text
+
+    def _count(self, stat: str) -> None:
+        with self._lock:  # fan_out workers share one transport
+            self.stats[stat] += 1
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    # -- argv -> HTTP request ----------------------------------------------- #
+    def _parse(self, args):
+        """Translate a `gh api` argv into (method, path, headers, body), or None
+        when the argv needs the real `gh` (the caller then falls back)."""
+        from urllib.parse import urlencode
+
+        argv = [str(a) for a in args]
+        if not argv or argv[0] != "api":
+            return None
+        method, endpoint, headers, fields = None, None, {}, []
+        i = 1
+        while i < len(argv):
+            a = argv[i]
+            if a in ("-X", "--method", "-H", "--header", "-f", "--raw-field", "-F", "--field"):
+                if i + 1 >= len(argv):
+                    return None
+                val = argv[i + 1]
+                if a in ("-X", "--method"):
+                    method = val.upper()
+                elif a in ("-H", "--header"):
+                    key, _, hval = val.partition(":")
+                    headers[key.strip()] = hval.strip()
+                elif a in ("-f", "--raw-field"):
+                    key, _, fval = val.partition("=")
+                    fields.append((key, fval))
+                else:
+                    key, _, fval = val.partition("=")
+                    if fval.startswith("@"):
+                        return None  # file/stdin field — leave it to gh
+                    fields.append((key, _typed_field(fval)))
+                i += 2
+                continue
+            if a.startswith("-") or endpoint is not None:
+                return None  # --paginate / --jq / -i / ... — not modeled here
+            endpoint = a
+            i += 1
+        if endpoint is None:
+            return None
+        if endpoint == "graphql":
+            payload, variables = {}, {}
+            for key, val in fields:
+                if key in ("query", "operationName"):
+                    payload[key] = val
+                else:
+                    variables[key] = val
+            payload["variables"] = variables
+            return "POST", self.graphql_path, headers, json.dumps(payload)
+        if "{" in endpoint:
+            return None  # gh's {owner}/{repo} placeholder expansion
+        path = self.rest_prefix + "/" + endpoint.lstrip("/")
+        method = method or ("POST" if fields else "GET")
+        if method == "GET":
+            if fields:
+                path += ("&" if "?" in path else "?") + urlencode(fields)
+            return method, path, headers, None
+        return method, path, headers, (json.dumps(dict(fields)) if fields else None)
+
+    # -- pooled keep-alive connections -------------------------------------- #
+    def _open_connection(self, scheme, netloc):
+        import http.client
+
+        if scheme == "http":
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.stats["connections"] += 1
+        return self._connect(self.scheme, self.netloc), False
+
+    def _release(self, conn, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def _request(self, method, path, headers, body):
+        import http.client
+
+        hdrs = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "gh-projects",
+            "Connection": "keep-alive",
+        }
+        if body is not None:
+            hdrs["Content-Type"] = "application/json; charset=utf-8"
+        if not any(k.lower() == "authorization" for k in headers):
+            token = self._token()
+            if token:
+                hdrs["Authorization"] = "token " + token
+        hdrs.update(headers)
+        data = body.encode("utf-8") if body is not None else None
+        # A pooled connection the server already closed fails on first use;
+        # retry exactly once on a fresh connection (the request never landed).
+        for attempt in (0, 1):
+            conn, reused = self._acquire()
+            try:
+                conn.request(method, path, body=data, headers=hdrs)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError,
+                    ConnectionResetError, http.client.CannotSendRequest):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise GhError(f"{method} {path}: connection lost", code=1,
+                              stderr="connection lost")
+            except OSError as e:
+                conn.close()
+                raise GhError(f"{method} {path}: {_scrub(e)}", code=1, stderr=_scrub(e))
+            self._count("requests")
+            keep = (resp.getheader("Connection") or "").lower() != "close"
+            self._release(conn, keep)
+            return resp.status, raw.decode("utf-8", "replace"), resp.getheader("Retry-After")
+        raise GhError(f"{method} {path}: connection lost", code=1, stderr="connection lost")
+
+    def _token(self):
+        for var in ("GH_TOKEN", "GH_APP_TOKEN"):
+            tok = os.environ.get(var)
+            if tok:
+                return tok
+        if self._cli_token is None:
+            try:
+                proc = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+                self._cli_token = proc.stdout.strip() if proc.returncode == 0 else ""
+            except OSError:
+                self._cli_token = ""
+        return self._cli_token or None
+
+
+def _typed_field(value: str):
+    """gh's `-F` coercion: true/false/null and integers become JSON literals."""
+    if value in ("true", "false"):
+        return value == "true"
+    if value == "null":
+        return None
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    return value
+
+
+def _error_message(text: str) -> str:
+    """The `message` of a GitHub error body, else the (truncated) raw text."""
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return text.strip()[:300]
+    if isinstance(payload, dict) and payload.get("message"):
+        return str(payload["message"])
+    return text.strip()[:300]
+
+
+def _select_runner():
+    """`GH_PROJECTS_TRANSPORT=http` opts into the in-process transport."""
+    if os.environ.get("GH_PROJECTS_TRANSPORT", "").lower() == "http":
+        return HttpTransport()
+    return _default_run
+
+
 # The single seam tests override. Signature: RUN(list[str]) -> str (stdout).
-RUN = _default_run
+# The real runner sits behind the rate-limit scheduler (lib/ratelimit.py):
+# paced against the GraphQL point budget, retried on secondary limits / 5xx.
+RUN = ratelimit.wrap(_select_runner())
 
 
 # --------------------------------------------------------------------------- #
@@ -100,6 +361,15 @@ def _redact_args(args) -> str:
 # --------------------------------------------------------------------------- #
 def graphql(query: str, variables: dict | None = None) -> dict:
     """Run a GraphQL operation via `gh api graphql`. Returns the `data` object."""
+    payload = _graphql_payload(query, variables)
+    if isinstance(payload, dict) and payload.get("errors"):
+        raise GhError(f"graphql errors: {_scrub(json.dumps(payload['errors']))}", code=1)
+    return payload.get("data", payload) if isinstance(payload, dict) else {}
+
+
+def _graphql_payload(query: str, variables: dict | None = None) -> dict:
+    """Like `graphql` but returns the whole payload, `errors` included, so a
+    caller can attribute partial failures (the aliased mutation batch)."""
     args = ["api", "graphql", "-f", f"query={query}"]
     for key, val in (variables or {}).items():
         # `-F` lets gh coerce numbers/booleans; strings go through `-f`.
@@ -109,11 +379,32 @@ def graphql(query: str, variables: dict | None = None) -> dict:
             args += ["-F", f"{key}={val}"]
         else:
             args += ["-f", f"{key}={val}"]
-    raw = RUN(args)
+    try:
+        if query.lstrip().startswith("mutation"):
+            with _WRITE_LANE:
+                raw = RUN(args)
+        else:
+            raw = RUN(args)
+    except GhError as e:
+        # gh exits non-zero on any GraphQL `errors`; the payload is on stdout.
+        payload = _error_payload(e.stdout)
+        if payload is None:
+            raise
+        return payload
     payload = json.loads(raw) if raw.strip() else {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _error_payload(stdout) -> dict | None:
+    """The GraphQL payload a failed `gh api graphql` printed, else None (the
+    call failed before GitHub answered: auth, network, HTTP 5xx, ...)."""
+    try:
+        payload = json.loads(stdout or "")
+    except ValueError:
+        return None
     if isinstance(payload, dict) and payload.get("errors"):
-        raise GhError(f"graphql errors: {_scrub(json.dumps(payload['errors']))}", code=1)
-    return payload.get("data", payload) if isinstance(payload, dict) else {}
+        return payload
+    return None
 
 
 def rest(method: str, path: str, fields: dict | None = None) -> dict:
@@ -126,10 +417,72 @@ def rest(method: str, path: str, fields: dict | None = None) -> dict:
             args += ["-F", f"{key}={val}"]
         else:
             args += ["-f", f"{key}={val}"]
-    raw = RUN(args)
+    if method.upper() == "GET":
+        raw = RUN(args)
+    else:
+        with _WRITE_LANE:
+            raw = RUN(args)
     return json.loads(raw) if raw.strip() else {}
 
 
+# --------------------------------------------------------------------------- #
+# Bounded fan-out — overlap independent round-trips through the same RUN seam
+# --------------------------------------------------------------------------- #
+# Several flows are runs of independent calls (resolve a project AND an issue's
+# node id; link a repo AND a team; one edge per blocker). `fan_out` runs them on
+# a small thread pool and returns results in INPUT order, whatever order they
+# finish in. GitHub's secondary-rate-limit guidance is to keep concurrency low
+# and never run mutations for one token concurrently, so the pool is capped
+# (`GH_PROJECTS_MAX_CONCURRENCY`, default 4; 1 = strictly serial) and every
+# mutation — GraphQL `mutation`, non-GET REST, or a native `gh` write wrapped in
+# `write_lane()` — holds `_WRITE_LANE`: reads overlap with each other and with a
+# write, writes go one at a time. Steps that must stay ordered belong in ONE
+# callable. Tests keep swapping `RUN`; `fan_out` never touches the network itself.
+MAX_CONCURRENCY_ENV = "GH_PROJECTS_MAX_CONCURRENCY"
+DEFAULT_MAX_CONCURRENCY = 4
+_WRITE_LANE = threading.RLock()
+
+
+def write_lane():
+    """Context manager serializing a mutation issued outside graphql()/rest()."""
+    return _WRITE_LANE
+
+
+def max_concurrency() -> int:
+    try:
+        return max(1, int(os.environ.get(MAX_CONCURRENCY_ENV) or DEFAULT_MAX_CONCURRENCY))
+    except ValueError:
+        raise GhError(f"{MAX_CONCURRENCY_ENV} must be an integer", code=2)
+
+
+def fan_out(calls, *, max_workers: int | None = None, return_exceptions: bool = False) -> list:
+    """Run independent zero-arg callables concurrently; results in input order.
+
+    Every call runs to completion even if another fails. Then the first failure
+    (in INPUT order) is raised — or, with `return_exceptions`, exceptions are
+    returned in place of results. One worker (or one call) runs inline, in order.
+    """
+    calls = list(calls)
+    workers = min(max_workers or max_concurrency(), len(calls))
+    if workers <= 1:
+        outcomes = [_outcome(call) for call in calls]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gh-fan-out") as pool:
+            outcomes = [f.result() for f in [pool.submit(_outcome, call) for call in calls]]
+    if not return_exceptions:
+        for ok, value in outcomes:
+            if not ok:
+                raise value
+    return [value for _, value in outcomes]
+
+
+def _outcome(call):
+    try:
+        return True, call()
+    except Exception as e:  # noqa: BLE001 — re-raised (or returned) by fan_out
+        return False, e
+
+
 # --------------------------------------------------------------------------- #
 # App installation token (constraint #2)
 # --------------------------------------------------------------------------- #
@@ -255,10 +608,14 @@ class Capabilities:
     We parse `--help` text rather than a version string so a backported flag is
     honored and a renamed flag fails closed to the GraphQL path. There is NO
     label-based dependency fallback — the only fallback is GraphQL.
+
+    Safe to share across `fan_out` workers: probes are serialized, so each key
+    is probed once however many threads ask at the same time.
     """
 
     def __init__(self):
         self._cache: dict[str, bool] = {}
+        self._lock = threading.Lock()
 
     def _help(self, args) -> str:
         try:
@@ -267,6 +624,10 @@ class Capabilities:
             return ""
 
     def has(self, key: str) -> bool:
+        with self._lock:
+            return self._probe(key)
+
+    def _probe(self, key: str) -> bool:
         if key in self._cache:
             return self._cache[key]
         if key == "add_blocked_by":
@@ -316,16 +677,55 @@ query($owner:String!, $number:Int!){
 """
 
 
+# Cross-process resolve cache. Every `engine.sh` verb is a fresh process, so an
+# in-memory resolve alone re-runs `_FIELDS_QUERY` per verb. `main()` installs the
+# user-level `cache.SnapshotCache` here (None when `GH_PROJECTS_CACHE=off`); a
+# `Project` built without an explicit cache picks it up. Field/option/iteration
+# ids change only when someone edits the board schema, so entries live
+# `GH_PROJECTS_RESOLVE_TTL` seconds (default 10 min) and are dropped early the
+# moment GitHub rejects an id they held.
+RESOLVE_TTL_ENV = "GH_PROJECTS_RESOLVE_TTL"
+DEFAULT_RESOLVE_TTL = 600
+RESOLVE_CACHE: "cache.SnapshotCache | None" = None
+
+# GraphQL error text meaning "an id we sent no longer exists on the board".
+_STALE_ID_RE = re.compile(
+    r"could not resolve to (?:a node|a? ?projectv2)|"
+    r"(?:option|iteration|field)[^.]*(?:not found|does not exist|does not belong)|"
+    r"not a valid (?:option|iteration|field)",
+    re.IGNORECASE,
+)
+
+
+def _stale_id_error(err: GhError) -> bool:
+    return bool(_STALE_ID_RE.search(str(err)))
+
+
+def resolve_cache() -> "cache.SnapshotCache | None":
+    """The user-level resolve cache with its own TTL (None when disabled)."""
+    ttl = float(os.environ.get(RESOLVE_TTL_ENV) or DEFAULT_RESOLVE_TTL)
+    return cache.SnapshotCache.default(max_age=ttl)
+
+
 class Project:
-    """A resolved org Project. One GraphQL resolve serves every later lookup."""
+    """A resolved org Project. One GraphQL resolve serves every later lookup.
 
-    def __init__(self, owner: str, number: int):
+    With a `cache` (or the module `RESOLVE_CACHE`), the resolved structure is
+    also kept on disk, so the NEXT process skips the resolve round-trip too. A
+    lookup miss or a stale-id write error on cached data invalidates the entry
+    and re-resolves once before giving up.
+    """
+
+    def __init__(self, owner: str, number: int, *, cache=None):
         self.owner = owner
         self.number = int(number)
+        self._cache = cache if cache is not None else RESOLVE_CACHE
         self._resolved = False
+        self._from_cache = False
         self.id = None
         self.title = None
         self._fields_by_name: dict[str, dict] = {}
+        self._items: dict[str, str] | None = None
 
     # -- resolution + cache ------------------------------------------------- #
     def resolve(self) -> "Project":
@@ -333,16 +733,26 @@ class Project:
 
         Idempotent: a second call is a no-op (no second round-trip). This is the
         resolve cache — every `field()/option_id()/iteration_id()` afterward reads
-        the cached structure and issues NO further GraphQL.
+        the cached structure and issues NO further GraphQL. A fresh on-disk entry
+        stands in for the query itself.
         """
         if self._resolved:
             return self
-        data = graphql(_FIELDS_QUERY, {"owner": self.owner, "number": self.number})
-        proj = (((data or {}).get("organization") or {}).get("projectV2")) or {}
-        if not proj.get("id"):
-            raise GhError(f"project {self.owner}#{self.number} not found", code=3)
+        entry = self._cache.load("resolve", self.owner, self.number, _FIELDS_QUERY) \
+            if self._cache is not None else None
+        proj = (entry or {}).get("project")
+        self._from_cache = bool(proj and proj.get("id"))
+        if not self._from_cache:
+            data = graphql(_FIELDS_QUERY, {"owner": self.owner, "number": self.number})
+            proj = (((data or {}).get("organization") or {}).get("projectV2")) or {}
+            if not proj.get("id"):
+                raise GhError(f"project {self.owner}#{self.number} not found", code=3)
+            if self._cache is not None:
+                self._cache.store("resolve", self.owner, self.number, _FIELDS_QUERY,
+                                  {"project": proj})
         self.id = proj["id"]
         self.title = proj.get("title")
+        self._fields_by_name = {}
         for node in (proj.get("fields") or {}).get("nodes") or []:
             name = node.get("name")
             if name:
@@ -350,11 +760,56 @@ class Project:
         self._resolved = True
         return self
 
+    def invalidate(self) -> "Project":
+        """Forget the resolved ids in memory AND on disk; the next lookup re-resolves."""
+        if self._cache is not None:
+            self._cache.discard("resolve", self.owner, self.number, _FIELDS_QUERY)
+        self._resolved = False
+        self._from_cache = False
+        self._fields_by_name = {}
+        return self
+
+    # -- content -> item id memo ---------------------------------------------- #
+    # An item id is stable for as long as the content stays on the board, so it
+    # is remembered (and persisted beside the resolve entry) to let
+    # `write_field` fuse its add + update into one document next time.
+    def known_item(self, content_id: str) -> str | None:
+        if self._items is None:
+            entry = self._cache.load("items", self.owner, self.number, _ADD_ITEM) \
+                if self._cache is not None else None
+            self._items = dict((entry or {}).get("items") or {})
+        return self._items.get(content_id)
+
+    def remember_item(self, content_id: str, item_id: str) -> str:
+        if self.known_item(content_id) != item_id:
+            self._items[content_id] = item_id
+            self._save_items()
+        return item_id
+
+    def forget_item(self, content_id: str) -> None:
+        if self.known_item(content_id) is not None:
+            del self._items[content_id]
+            self._save_items()
+
+    def _save_items(self) -> None:
+        if self._cache is not None:
+            self._cache.store("items", self.owner, self.number, _ADD_ITEM,
+                              {"items": self._items})
+
+    def _refresh(self) -> bool:
+        """Re-resolve from GitHub if the current ids came from disk (True if so)."""
+        if not self._from_cache:
+            return False
+        self.invalidate().resolve()
+        return True
+
     def field(self, name: str) -> dict:
         """Return the cached field node by name (resolves once if needed)."""
         if not self._resolved:
             self.resolve()
         node = self._fields_by_name.get(name)
+        if not node and self._refresh():
+            node = self._fields_by_name.get(name)
         if not node:
             raise GhError(f"field '{name}' not found on project", code=3)
         return node
@@ -364,19 +819,23 @@ class Project:
 
     def option_id(self, field_name: str, option_name: str) -> str:
         """Resolve a single-select option id by (case-insensitive) name."""
-        node = self.field(field_name)
-        for opt in node.get("options") or []:
-            if str(opt.get("name")).lower() == str(option_name).lower():
-                return opt["id"]
+        for _ in range(2):
+            for opt in self.field(field_name).get("options") or []:
+                if str(opt.get("name")).lower() == str(option_name).lower():
+                    return opt["id"]
+            if not self._refresh():
+                break
         raise GhError(f"option '{option_name}' not found on field '{field_name}'", code=3)
 
     def iteration_id(self, field_name: str, title: str) -> str:
         """Resolve an iteration id by title (active or completed)."""
-        node = self.field(field_name)
-        cfg = node.get("configuration") or {}
-        for it in (cfg.get("iterations") or []) + (cfg.get("completedIterations") or []):
-            if str(it.get("title")).lower() == str(title).lower():
-                return it["id"]
+        for _ in range(2):
+            cfg = self.field(field_name).get("configuration") or {}
+            for it in (cfg.get("iterations") or []) + (cfg.get("completedIterations") or []):
+                if str(it.get("title")).lower() == str(title).lower():
+                    return it["id"]
+            if not self._refresh():
+                break
         raise GhError(f"iteration '{title}' not found on field '{field_name}'", code=3)
 
 
@@ -391,25 +850,16 @@ mutation($project:ID!, $content:ID!){
 }
 """
 
-_READBACK = """
-query($item:ID!, $field:ID!){
-  node(id:$item){
-    ... on ProjectV2Item {
-      id
-      fieldValueByName: fieldValues(first:50){
-        nodes{
-          __typename
-          ... on ProjectV2ItemFieldSingleSelectValue { optionId field { ... on ProjectV2FieldCommon { id } } }
-          ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { id } } }
-          ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { id } } }
-          ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { id } } }
-          ... on ProjectV2ItemFieldIterationValue { iterationId field { ... on ProjectV2FieldCommon { id } } }
-        }
-      }
-    }
-  }
-}
-"""
+# The written value is read back from the mutation's OWN `projectV2Item`
+# selection — same round-trip, and only the one field instead of 50 values.
+_FIELD_VALUE_SELECTION = (
+    "fieldValueByName(name:$name){__typename"
+    " ... on ProjectV2ItemFieldSingleSelectValue{optionId}"
+    " ... on ProjectV2ItemFieldIterationValue{iterationId}"
+    " ... on ProjectV2ItemFieldNumberValue{number}"
+    " ... on ProjectV2ItemFieldDateValue{date}"
+    " ... on ProjectV2ItemFieldTextValue{text}}"
+)
 
 
 def add_item(project_id: str, content_id: str) -> str:
@@ -445,21 +895,33 @@ def _value_payload(field_node: dict, value):
     return ({"text": str(value)}, "text", str(value))
 
 
-def set_field(project: "Project", item_id: str, field_name: str, value) -> dict:
+def set_field(project: "Project", item_id: str, field_name: str, value,
+              *, batch: "MutationBatch | None" = None) -> dict:
     """Phase 2: updateProjectV2ItemFieldValue, then READ BACK identical.
 
     `value` is the resolved id (single-select option id) / number / text. Raises
-    GhError if the read-back does not match what we wrote.
+    GhError if the read-back does not match what we wrote. With `batch`, the
+    write is only queued (keyed `(item_id, field_name)`); its alias selects the
+    field's value back, so the flush verifies it exactly as the unbatched path
+    does and a mismatch lands in `batch.failures` instead of raising here.
     """
     node = project.field(field_name)
     field_id = node["id"]
     payload, kind, expected = _value_payload(node, value)
+    if batch is not None:
+        batch.add((item_id, field_name), item_id, field_id, payload, field_name=field_name)
+        return {"item": item_id, "field": field_name, "value": expected, "queued": True}
     # value is a GraphQL input object; gh's -f/-F can't nest it, so the value is
     # inlined as a typed literal built from the resolved id/number/text.
-    _update_field_value(project.id, item_id, field_id, payload)
+    data = _update_field_value(project.id, item_id, field_id, payload, field_name=field_name)
+    item = (data.get("updateProjectV2ItemFieldValue") or {}).get("projectV2Item") or {}
+    return _verified(item, item_id, field_name, kind, expected)
+
 
-    got = _read_field_value(item_id, field_id)
-    if got is None or not _values_equal(kind, got, expected):
+def _verified(item: dict, item_id: str, field_name: str, kind: str, expected) -> dict:
+    """Check the mutation's echoed `projectV2Item` carries exactly what we wrote."""
+    got = _field_value(item.get("fieldValueByName"))
+    if item.get("id") != item_id or got is None or not _values_equal(kind, got, expected):
         raise GhError(
             f"read-back mismatch for field '{field_name}': wrote {expected!r}, read {got!r}",
             code=1,
@@ -467,50 +929,168 @@ def set_field(project: "Project", item_id: str, field_name: str, value) -> dict:
     return {"item": item_id, "field": field_name, "value": expected, "verified": True}
 
 
-def _update_field_value(project_id, item_id, field_id, payload: dict) -> dict:
+_UPDATE_SELECTION = (
+    "updateProjectV2ItemFieldValue(input:{"
+    "projectId:$project,itemId:$item,fieldId:$field,value:%s}){"
+    "projectV2Item{id " + _FIELD_VALUE_SELECTION + "}}"
+)
+
+
+def _update_field_value(project_id, item_id, field_id, payload: dict, *,
+                        field_name: str) -> dict:
     """Send updateProjectV2ItemFieldValue with a typed `value` input object.
 
     gh's `-f`/`-F` can't express a nested input object, so we inline the value
     into the query as a typed literal built from the resolved id/number/text.
+    The echoed item selects the field's value by `field_name` (the read-back).
     """
+    query = ("mutation($project:ID!,$item:ID!,$field:ID!,$name:String!){"
+             + _UPDATE_SELECTION % _value_literal(payload) + "}")
+    return graphql(query, {"project": project_id, "item": item_id, "field": field_id,
+                           "name": field_name})
+
+
+def _value_literal(payload: dict) -> str:
+    """The `ProjectV2FieldValue` input literal for a `_value_payload` dict."""
     if "singleSelectOptionId" in payload:
-        lit = '{singleSelectOptionId:"%s"}' % payload["singleSelectOptionId"]
-    elif "iterationId" in payload:
-        lit = '{iterationId:"%s"}' % payload["iterationId"]
-    elif "number" in payload:
-        lit = "{number:%s}" % payload["number"]
-    elif "date" in payload:
-        lit = '{date:"%s"}' % payload["date"]
-    else:
-        text = str(payload.get("text", "")).replace("\\", "\\\\").replace('"', '\\"')
-        lit = '{text:"%s"}' % text
-    query = (
-        "mutation($project:ID!,$item:ID!,$field:ID!){"
-        "updateProjectV2ItemFieldValue(input:{"
-        "projectId:$project,itemId:$item,fieldId:$field,value:%s}){"
-        "projectV2Item{id}}}" % lit
-    )
-    return graphql(query, {"project": project_id, "item": item_id, "field": field_id})
-
-
-def _read_field_value(item_id: str, field_id: str):
-    """Read back the single field's value via the item's fieldValues."""
-    data = graphql(_READBACK, {"item": item_id, "field": field_id})
-    node = data.get("node") or {}
-    for fv in ((node.get("fieldValueByName") or {}).get("nodes")) or []:
-        f = (fv.get("field") or {}).get("id")
-        if f != field_id:
-            continue
-        if "optionId" in fv:
-            return ("optionId", fv["optionId"])
-        if "iterationId" in fv:
-            return ("iterationId", fv["iterationId"])
-        if "number" in fv:
-            return ("number", fv["number"])
-        if "date" in fv:
-            return ("date", fv["date"])
-        if "text" in fv:
-            return ("text", fv["text"])
+        return '{singleSelectOptionId:"%s"}' % payload["singleSelectOptionId"]
+    if "iterationId" in payload:
+        return '{iterationId:"%s"}' % payload["iterationId"]
+    if "number" in payload:
+        return "{number:%s}" % payload["number"]
+    if "date" in payload:
+        return '{date:"%s"}' % payload["date"]
+    text = str(payload.get("text", "")).replace("\\", "\\\\").replace('"', '\\"')
+    return '{text:"%s"}' % text
+
+
+# --------------------------------------------------------------------------- #
+# Batched field writes — many updateProjectV2ItemFieldValue, one round-trip
+# --------------------------------------------------------------------------- #
+# A board-wide write (signals, promote, deploy) is N independent value updates.
+# `MutationBatch` packs them into ONE aliased document per flush
+# (`w0: updateProjectV2ItemFieldValue(...) w1: ...`) with every id inlined, so
+# the round-trip count drops from N to ceil(N / max_ops). GraphQL reports a
+# failed alias in `errors[].path[0]`; that alias maps back to the caller's key,
+# so a partial failure names exactly which (item, field) did not land.
+BATCH_MAX_OPS = 50
+BATCH_MAX_BYTES = 60_000
+
+
+class MutationBatch:
+    """Queue field-value writes and flush them as aliased mutation documents.
+
+    `add(key, item_id, field_id, payload)` enqueues one write (`payload` is a
+    `_value_payload` dict; `key` is any caller label, e.g. `(item, field)`).
+    The queue flushes itself when it reaches `max_ops` writes or `max_bytes` of
+    document; `flush()` sends the rest. Used as a context manager it flushes on
+    a clean exit and raises GhError if any write failed.
+
+    A write counts as landed when its alias echoes the item id back — and, when
+    `add` got the `field_name`, the field's value reads back identical. Failures
+    accumulate in `failures` ({key: message}); `written` holds the keys that
+    landed, in order.
+    """
+
+    def __init__(self, project_id: str, *, max_ops: int = BATCH_MAX_OPS,
+                 max_bytes: int = BATCH_MAX_BYTES):
+        if max_ops < 1:
+            raise GhError("max_ops must be >= 1", code=2)
+        self.project_id = project_id
+        self.max_ops = int(max_ops)
+        self.max_bytes = int(max_bytes)
+        self._pending: list = []  # [(key, item_id, selection, expected)]
+        self._size = 0
+        self.written: list = []
+        self.failures: dict = {}
+        self.round_trips = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            return False
+        self.flush()
+        self.raise_for_failures()
+        return False
+
+    def add(self, key, item_id: str, field_id: str, payload: dict, *,
+            field_name: str | None = None) -> None:
+        echo, expected = "id", None
+        if field_name is not None:
+            echo += " " + _FIELD_VALUE_SELECTION.replace("$name", json.dumps(field_name))
+            expected = _expected_read_back(payload)
+        selection = (
+            "updateProjectV2ItemFieldValue(input:{projectId:%s,itemId:%s,fieldId:%s,value:%s})"
+            "{projectV2Item{%s}}" % (json.dumps(self.project_id), json.dumps(item_id),
+                                     json.dumps(field_id), _value_literal(payload), echo)
+        )
+        if self._pending and self._size + len(selection) > self.max_bytes:
+            self.flush()
+        self._pending.append((key, item_id, selection, expected))
+        self._size += len(selection) + 8
+        if len(self._pending) >= self.max_ops:
+            self.flush()
+
+    def flush(self) -> dict:
+        """Send everything queued. Returns {key: message} for THIS flush's failures."""
+        if not self._pending:
+            return {}
+        pending, self._pending, self._size = self._pending, [], 0
+        doc = "mutation{" + " ".join(
+            f"w{i}:{sel}" for i, (_, _, sel, _) in enumerate(pending)) + "}"
+        self.round_trips += 1
+        try:
+            payload = _graphql_payload(doc)
+        except GhError as e:
+            # No payload at all (auth, network, ...): nothing is known to have landed.
+            payload = {"errors": [{"message": str(e)}]}
+        data = payload.get("data") or {}
+        by_alias: dict = {}
+        unattributed = []
+        for err in payload.get("errors") or []:
+            path = err.get("path") or []
+            msg = _scrub(err.get("message") or json.dumps(err))
+            if path and str(path[0]).startswith("w"):
+                by_alias[str(path[0])] = msg
+            else:
+                unattributed.append(msg)
+        failed: dict = {}
+        for i, (key, item_id, _, expected) in enumerate(pending):
+            alias = f"w{i}"
+            item = (data.get(alias) or {}).get("projectV2Item") or {}
+            if alias in by_alias:
+                failed[key] = by_alias[alias]
+            elif item.get("id") != item_id:
+                failed[key] = "; ".join(unattributed) or "no item echoed back"
+            elif expected is not None and not _read_back_matches(item, *expected):
+                got = _field_value(item.get("fieldValueByName"))
+                failed[key] = f"read-back mismatch: wrote {expected[1]!r}, read {got!r}"
+            else:
+                self.written.append(key)
+        self.failures.update(failed)
+        return failed
+
+    def raise_for_failures(self) -> None:
+        if self.failures:
+            detail = "; ".join(f"{k}: {v}" for k, v in list(self.failures.items())[:5])
+            more = len(self.failures) - 5
+            raise GhError(
+                f"{len(self.failures)} batched field write(s) failed: {detail}"
+                + (f" (+{more} more)" if more > 0 else ""),
+                code=1,
+            )
+
+
+def _field_value(fv):
+    """(kind, value) of one `fieldValueByName` node, or None when unset."""
+    for kind in ("optionId", "iterationId", "number", "date", "text"):
+        if (fv or {}).get(kind) is not None:
+            return (kind, fv[kind])
     return None
 
 
@@ -523,6 +1103,20 @@ def _values_equal(kind: str, got, expected) -> bool:
     return str(gval) == str(expected)
 
 
+def _expected_read_back(payload: dict) -> tuple:
+    """(kind, value) a `_value_payload` dict must read back as."""
+    for key, kind in (("singleSelectOptionId", "optionId"), ("iterationId", "iterationId"),
+                      ("number", "number"), ("date", "date")):
+        if key in payload:
+            return (kind, payload[key])
+    return ("text", str(payload.get("text", "")))
+
+
+def _read_back_matches(item: dict, kind: str, expected) -> bool:
+    got = _field_value(item.get("fieldValueByName"))
+    return got is not None and _values_equal(kind, got, expected)
+
+
 def write_field(project: "Project", content_id: str, field_name: str, raw_value) -> dict:
     """Convenience: resolve the option (if single-select), two-phase add+set.
 
@@ -530,17 +1124,152 @@ def write_field(project: "Project", content_id: str, field_name: str, raw_value)
     cached option id first. For an iteration (Sprint) field, `raw_value` is the
     iteration TITLE and is resolved to its cached iteration id. Number / date /
     text values pass through unresolved. Returns the verified result dict.
+
+    Round-trips: once the content's item id is known (`Project.known_item`),
+    add + update + read-back are ONE mutation document. GraphQL cannot feed one
+    mutation's output into the next field's input, so a first-ever write still
+    needs the add alone to learn the item id — then the update + read-back.
     """
+    def attempt() -> dict:
+        value = _resolve_value(project, field_name, raw_value)
+        item_id = project.known_item(content_id)
+        if item_id:
+            try:
+                return _add_and_set(project, content_id, item_id, field_name, value)
+            except GhError as e:
+                if not _stale_id_error(e):
+                    raise
+                project.forget_item(content_id)  # removed from the board since
+        item_id = project.remember_item(content_id, add_item(project.id, content_id))
+        return set_field(project, item_id, field_name, value)
+
+    return _retry_stale(project, attempt)
+
+
+def _resolve_value(project: "Project", field_name: str, raw_value):
+    """Option name / iteration title -> its cached id; other kinds pass through."""
     node = project.field(field_name)
     dtype = (node.get("dataType") or "").upper()
     if "SINGLE_SELECT" in dtype or node.get("options"):
-        value = project.option_id(field_name, raw_value)
-    elif "ITERATION" in dtype or node.get("configuration"):
-        value = project.iteration_id(field_name, raw_value)
-    else:
-        value = raw_value
-    item_id = add_item(project.id, content_id)
-    return set_field(project, item_id, field_name, value)
+        return project.option_id(field_name, raw_value)
+    if "ITERATION" in dtype or node.get("configuration"):
+        return project.iteration_id(field_name, raw_value)
+    return raw_value
+
+
+def _retry_stale(project: "Project", attempt):
+    """Run `attempt()`; on an unknown-id error against cached ids, re-resolve once.
+
+    Ids read from the on-disk resolve cache can outlive a schema edit: drop the
+    entry, re-resolve, and retry exactly once.
+    """
+    try:
+        return attempt()
+    except GhError as e:
+        if not (project._from_cache and _stale_id_error(e)):
+            raise
+        project.invalidate().resolve()
+        return attempt()
+
+
+def _add_and_set(project: "Project", content_id: str, item_id: str, field_name: str,
+                 value) -> dict:
+    """Fused write: add (idempotent) + update + read-back in one document.
+
+    Top-level mutation fields run in document order, so the add lands before
+    the update; `a` must echo the known item id or the update hit a stale one.
+    """
+    node = project.field(field_name)
+    payload, kind, expected = _value_payload(node, value)
+    query = ("mutation($project:ID!,$content:ID!,$item:ID!,$field:ID!,$name:String!){"
+             "a:addProjectV2ItemById(input:{projectId:$project,contentId:$content}){item{id}} "
+             "u:" + _UPDATE_SELECTION % _value_literal(payload) + "}")
+    data = graphql(query, {"project": project.id, "content": content_id, "item": item_id,
+                           "field": node["id"], "name": field_name})
+    added = ((data.get("a") or {}).get("item") or {}).get("id")
+    if added and added != item_id:
+        # Re-added under a new id: write through the fresh id instead.
+        return set_field(project, project.remember_item(content_id, added), field_name, value)
+    item = (data.get("u") or {}).get("projectV2Item") or {}
+    return _verified(item, item_id, field_name, kind, expected)
+
+
+def write_fields(project: "Project", content_id: str, values: dict) -> dict:
+    """Write several board fields of one item, every value verified.
+
+    `values` maps field name -> raw value, resolved exactly as `write_field`
+    does (option name / iteration title / number / date / text). All updates go
+    out as ONE aliased mutation document, each alias selecting its own field's
+    value back, so one response verifies every write. A known item id also
+    folds the (idempotent) add into that document; otherwise the add goes first
+    to learn the id. Raises GhError naming every field that failed (and the ones
+    that landed alongside) or did not read back identical. Returns
+    {"item", "fields": {name: value}, "verified"}.
+    """
+    if not values:
+        raise GhError("write_fields needs at least one field", code=2)
+
+    def attempt() -> dict:
+        planned = []  # [(field_name, field_id, payload, kind, expected)]
+        for name, raw in values.items():
+            node = project.field(name)
+            payload, kind, expected = _value_payload(node, _resolve_value(project, name, raw))
+            planned.append((name, node["id"], payload, kind, expected))
+        item_id = project.known_item(content_id)
+        if item_id:
+            try:
+                return _send_fields(project, content_id, item_id, planned, with_add=True)
+            except GhError as e:
+                if not _stale_id_error(e):
+                    raise
+                project.forget_item(content_id)
+        item_id = project.remember_item(content_id, add_item(project.id, content_id))
+        return _send_fields(project, content_id, item_id, planned, with_add=False)
+
+    return _retry_stale(project, attempt)
+
+
+def _send_fields(project: "Project", content_id: str, item_id: str, planned: list, *,
+                 with_add: bool) -> dict:
+    """One aliased document: [a: add] + w<i>: update-and-read-back per field."""
+    sels = []
+    if with_add:
+        sels.append("a:addProjectV2ItemById(input:{projectId:%s,contentId:%s}){item{id}}"
+                    % (json.dumps(project.id), json.dumps(content_id)))
+    for i, (name, field_id, payload, _, _) in enumerate(planned):
+        sels.append(
+            "w%d:updateProjectV2ItemFieldValue(input:{projectId:%s,itemId:%s,fieldId:%s,value:%s})"
+            "{projectV2Item{id %s}}" % (
+                i, json.dumps(project.id), json.dumps(item_id), json.dumps(field_id),
+                _value_literal(payload),
+                _FIELD_VALUE_SELECTION.replace("$name", json.dumps(name))))
+    payload = _graphql_payload("mutation{" + " ".join(sels) + "}")
+    data = payload.get("data") or {}
+    if payload.get("errors"):
+        named = []
+        for err in payload["errors"]:
+            alias = str((err.get("path") or [""])[0])
+            label = planned[int(alias[1:])][0] if re.fullmatch(r"w\d+", alias) else alias or "-"
+            named.append(f"{label}: {err.get('message') or json.dumps(err)}")
+        landed = [name for i, (name, *_) in enumerate(planned)
+                  if ((data.get(f"w{i}") or {}).get("projectV2Item") or {}).get("id") == item_id]
+        raise GhError("field write failed: " + _scrub("; ".join(named))
+                      + (f" (landed: {', '.join(landed)})" if landed else ""), code=1)
+    added = ((data.get("a") or {}).get("item") or {}).get("id")
+    if with_add and added and added != item_id:
+        # Re-added under a new id: write through the fresh id instead.
+        item_id = project.remember_item(content_id, added)
+        return _send_fields(project, content_id, item_id, planned, with_add=False)
+    written, mismatched = {}, []
+    for i, (name, _, _, kind, expected) in enumerate(planned):
+        item = (data.get(f"w{i}") or {}).get("projectV2Item") or {}
+        got = _field_value(item.get("fieldValueByName"))
+        if item.get("id") != item_id or got is None or not _values_equal(kind, got, expected):
+            mismatched.append(f"{name}: wrote {expected!r}, read {got!r}")
+        written[name] = expected
+    if mismatched:
+        raise GhError("read-back mismatch: " + "; ".join(mismatched), code=1)
+    return {"item": item_id, "fields": written, "verified": True}
 
 
 # --------------------------------------------------------------------------- #
@@ -679,8 +1408,9 @@ def add_blocked_by(repo: str, issue_number, blocker_number, caps: "Capabilities"
     """
     caps = caps or Capabilities()
     if caps.has("add_blocked_by"):
-        RUN(["issue", "edit", str(issue_number), "--repo", repo,
-             "--add-blocked-by", str(blocker_number)])
+        with write_lane():
+            RUN(["issue", "edit", str(issue_number), "--repo", repo,
+                 "--add-blocked-by", str(blocker_number)])
         return {"via": "native", "issue": issue_number, "blocked_by": blocker_number}
     # GraphQL fallback (addIssueDependency-style mutation against the linked ids).
     data = graphql(
@@ -1204,12 +1934,17 @@ def _cmd_link_team(args) -> int:
 
 
 # -- start-issue / plan-sprint projection verbs (reuse core lib, idempotent) -- #
+def _project_and_content(args):
+    """Resolve the project and the issue's node id — independent reads, overlapped."""
+    return fan_out([lambda: Project(args.owner, args.number).resolve(),
+                    lambda: issue_node_id(args.repo, args.issue)])
+
+
 def _cmd_add_item(args) -> int:
     """Project an issue onto the board (add_item). Idempotent: a re-add returns
     the SAME item id (addProjectV2ItemById is server-side idempotent)."""
-    proj = Project(args.owner, args.number).resolve()
-    content_id = issue_node_id(args.repo, args.issue)
-    item_id = add_item(proj.id, content_id)
+    proj, content_id = _project_and_content(args)
+    item_id = proj.remember_item(content_id, add_item(proj.id, content_id))
     _print_json({"item": item_id, "issue": int(args.issue), "project": proj.id})
     return 0
 
@@ -1218,20 +1953,33 @@ def _cmd_write_field(args) -> int:
     """Write one board field for the issue's item (write_field — add_item + set +
     read-back-identical). Single-select=option name, iteration(Sprint)=iteration
     title, number/date/text=raw. Idempotent: the read-back verifies the value."""
-    proj = Project(args.owner, args.number).resolve()
-    content_id = issue_node_id(args.repo, args.issue)
+    proj, content_id = _project_and_content(args)
     res = write_field(proj, content_id, args.field, args.value)
     _print_json(res)
     return 0
 
 
+def _cmd_write_fields(args) -> int:
+    """Write several board fields of the issue's item at once (write_fields —
+    one aliased mutation, every value read back from its own alias)."""
+    values = {}
+    for pair in args.set:
+        name, sep, value = pair.partition("=")
+        if not sep or not name.strip():
+            raise GhError(f"--set expects FIELD=VALUE, got {pair!r}", code=2)
+        values[name.strip()] = value
+    proj, content_id = _project_and_content(args)
+    _print_json(write_fields(proj, content_id, values))
+    return 0
+
+
 def _cmd_advance_status(args) -> int:
     """Advance the issue's board Status MONOTONICALLY (advance_status). Ensures the
     item exists (add_item idempotent), reads the current Status, and writes only a
     forward move; an at/past-target re-run is a no-op (no write)."""
-    proj = Project(args.owner, args.number).resolve()
-    content_id = issue_node_id(args.repo, args.issue)
-    add_item(proj.id, content_id)  # idempotent: reuse existing item if present
+    proj, content_id = _project_and_content(args)
+    # idempotent: reuse existing item if present
+    proj.remember_item(content_id, add_item(proj.id, content_id))
     current = current_item_status(args.owner, args.number, content_id)
     to_write = advance_status(current, args.to)
     if to_write is None:
@@ -1266,21 +2014,27 @@ def build_parser():
     import argparse
 
     p = argparse.ArgumentParser(prog="gh.py", description="gh-projects GraphQL/REST core")
+    p.add_argument("--cost-report", action="store_true", help=ratelimit.COST_REPORT_HELP)
     sub = p.add_subparsers(dest="cmd", required=True)
+    cost = [ratelimit.cost_report_parent()]
 
-    sp = sub.add_parser("resolve", help="resolve & cache a project's field/option/iteration ids")
+    sp = sub.add_parser("resolve", parents=cost,
+                        help="resolve & cache a project's field/option/iteration ids")
     sp.add_argument("--owner", required=True)
     sp.add_argument("--number", type=int, required=True)
     sp.set_defaults(func=_cmd_resolve)
 
-    sp = sub.add_parser("capabilities", help="probe the installed gh for native flags")
+    sp = sub.add_parser("capabilities", parents=cost,
+                        help="probe the installed gh for native flags")
     sp.set_defaults(func=_cmd_capabilities)
 
-    sp = sub.add_parser("token", help="mint an App installation token (redacted output)")
+    sp = sub.add_parser("token", parents=cost,
+                        help="mint an App installation token (redacted output)")
     sp.set_defaults(func=_cmd_token)
 
     # -- write verbs (gated by engine.sh's --force rail) --------------------- #
-    sp = sub.add_parser("open-pr", help="open/update an issue-linked PR (non-closing)")
+    sp = sub.add_parser("open-pr", parents=cost,
+                        help="open/update an issue-linked PR (non-closing)")
     sp.add_argument("--repo", required=True, help="owner/repo")
     sp.add_argument("--head", required=True, help="head branch")
     sp.add_argument("--base", required=True, help="base branch")
@@ -1290,54 +2044,63 @@ def build_parser():
     sp.add_argument("--draft", action="store_true")
     sp.set_defaults(func=_cmd_open_pr)
 
-    sp = sub.add_parser("pr-checks", help="read a PR's aggregate check state (green/red/pending)")
+    sp = sub.add_parser("pr-checks", parents=cost,
+                        help="read a PR's aggregate check state (green/red/pending)")
     sp.add_argument("--repo", required=True)
     sp.add_argument("--pr", type=int, required=True)
     sp.set_defaults(func=_cmd_pr_checks)
 
-    sp = sub.add_parser("merge-pr", help="non-squash merge a PR (--merge/--rebase only)")
+    sp = sub.add_parser("merge-pr", parents=cost,
+                        help="non-squash merge a PR (--merge/--rebase only)")
     sp.add_argument("--repo", required=True)
     sp.add_argument("--pr", type=int, required=True)
     sp.add_argument("--method", default="merge", choices=["merge", "rebase"])
     sp.set_defaults(func=_cmd_merge_pr)
 
-    sp = sub.add_parser("set-milestone", help="assign a repo milestone number to an issue (idempotent)")
+    sp = sub.add_parser("set-milestone", parents=cost,
+                        help="assign a repo milestone number to an issue (idempotent)")
     sp.add_argument("--repo", required=True)
     sp.add_argument("--number", type=int, required=True, help="issue number")
     sp.add_argument("--milestone", type=int, required=True, help="repo-scoped milestone number")
     sp.set_defaults(func=_cmd_set_milestone)
 
-    sp = sub.add_parser("reorder-item", help="reorder a board item's manual rank (omit --after for top)")
+    sp = sub.add_parser("reorder-item", parents=cost,
+                        help="reorder a board item's manual rank (omit --after for top)")
     sp.add_argument("--project-id", required=True, dest="project_id")
     sp.add_argument("--item", required=True, help="board item id")
     sp.add_argument("--after", default=None, help="item id to place after; omit for top")
     sp.set_defaults(func=_cmd_reorder_item)
 
-    sp = sub.add_parser("set-assignee", help="add/remove an issue assignee (idempotent)")
+    sp = sub.add_parser("set-assignee", parents=cost,
+                        help="add/remove an issue assignee (idempotent)")
     sp.add_argument("--repo", required=True)
     sp.add_argument("--number", type=int, required=True, help="issue number")
     sp.add_argument("--login", required=True)
     sp.add_argument("--remove", action="store_true")
     sp.set_defaults(func=_cmd_set_assignee)
 
-    sp = sub.add_parser("link-repo", help="link a repo to a Project (idempotent, App-token)")
+    sp = sub.add_parser("link-repo", parents=cost,
+                        help="link a repo to a Project (idempotent, App-token)")
     sp.add_argument("--project-id", required=True, dest="project_id")
     sp.add_argument("--repo-id", required=True, dest="repo_id", help="repository node id")
     sp.set_defaults(func=_cmd_link_repo)
 
-    sp = sub.add_parser("link-team", help="link a Project to a team (write-to-team, App-token)")
+    sp = sub.add_parser("link-team", parents=cost,
+                        help="link a Project to a team (write-to-team, App-token)")
     sp.add_argument("--project-id", required=True, dest="project_id")
     sp.add_argument("--team-id", required=True, dest="team_id", help="team node id")
     sp.set_defaults(func=_cmd_link_team)
 
-    sp = sub.add_parser("add-item", help="project an issue onto the board (idempotent, same item id on re-add)")
+    sp = sub.add_parser("add-item", parents=cost,
+                        help="project an issue onto the board (idempotent, same item id on re-add)")
     sp.add_argument("--owner", required=True, help="org login")
     sp.add_argument("--number", type=int, required=True, help="project number")
     sp.add_argument("--repo", required=True, help="owner/name")
     sp.add_argument("--issue", type=int, required=True, help="issue number")
     sp.set_defaults(func=_cmd_add_item)
 
-    sp = sub.add_parser("write-field", help="write one board field for an issue's item (read-back-verified)")
+    sp = sub.add_parser("write-field", parents=cost,
+                        help="write one board field for an issue's item (read-back-verified)")
     sp.add_argument("--owner", required=True, help="org login")
     sp.add_argument("--number", type=int, required=True, help="project number")
     sp.add_argument("--repo", required=True, help="owner/name")
@@ -1347,7 +2110,18 @@ def build_parser():
                     help="option name (single-select) / iteration title (Sprint) / number / date / text")
     sp.set_defaults(func=_cmd_write_field)
 
-    sp = sub.add_parser("advance-status", help="advance an issue's board Status monotonically (no-op past target)")
+    sp = sub.add_parser("write-fields", parents=cost,
+                        help="write several board fields of an issue's item in one mutation (read-back-verified)")
+    sp.add_argument("--owner", required=True, help="org login")
+    sp.add_argument("--number", type=int, required=True, help="project number")
+    sp.add_argument("--repo", required=True, help="owner/name")
+    sp.add_argument("--issue", type=int, required=True, help="issue number")
+    sp.add_argument("--set", action="append", required=True, metavar="FIELD=VALUE",
+                    help="one field write (repeatable); values as for write-field")
+    sp.set_defaults(func=_cmd_write_fields)
+
+    sp = sub.add_parser("advance-status", parents=cost,
+                        help="advance an issue's board Status monotonically (no-op past target)")
     sp.add_argument("--owner", required=True, help="org login")
     sp.add_argument("--number", type=int, required=True, help="project number")
     sp.add_argument("--repo", required=True, help="owner/name")
@@ -1355,7 +2129,7 @@ def build_parser():
     sp.add_argument("--to", required=True, help="target Status (Backlog<Ready<In Progress<In Review<On Staging<Done)")
     sp.set_defaults(func=_cmd_advance_status)
 
-    sp = sub.add_parser("create-linked-branch",
+    sp = sub.add_parser("create-linked-branch", parents=cost,
                         help="create an issue's authoritative linked branch (idempotent: existing branch = no-op)")
     sp.add_argument("--repo", required=True, help="owner/name")
     sp.add_argument("--issue", type=int, required=True, help="issue number")
@@ -1371,7 +2145,10 @@ def main(argv=None) -> int:
     except SystemExit as e:
         # argparse exits 2 on usage error — keep our documented usage code.
         return 2 if e.code not in (0, None) else (e.code or 0)
+    global RESOLVE_CACHE
     try:
+        if RESOLVE_CACHE is None:
+            RESOLVE_CACHE = resolve_cache()
         return args.func(args)
     except GhError as e:
         sys.stderr.write("error: " + _scrub(str(e)) + "\n")
@@ -1379,6 +2156,8 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + _scrub(str(e)) + "\n")
         return 1
+    finally:
+        ratelimit.emit(RUN, pages=args.cost_report)
 
 
 if __name__ == "__main__":
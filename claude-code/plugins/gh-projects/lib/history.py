@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""gh-projects findings history (stdlib sqlite3, no network).
+
+`analysis.py` used to forget each result, so "what changed since yesterday"
+meant a second full run and an external diff. This keeps an APPEND-ONLY local
+record of every live analysis run:
+
+  * `runs`     — one row per run: project, time, the snapshot hash (order-free
+                 digest of the normalized rows) and the rollup counts;
+  * `findings` — that run's ranked findings, verbatim;
+  * `items`    — a content-addressed memo, row hash -> the findings that row
+                 raised. Every finding rule reads a single row, so a row whose
+                 hash was seen before needs no rule pass at all.
+
+Nothing is updated or deleted by the engine: runs only accumulate, and a memo
+row is immutable (its key is the hash of its input). `delta(previous, current)`
+compares two runs' findings — NEW, RESOLVED, and ESCALATED (the issue's most
+urgent finding got more severe).
+
+The database lives beside the snapshot cache (`cache.cache_dir()`, 0700 dir,
+0600 file) as `history.sqlite3`; `GH_PROJECTS_CACHE=off` disables it too.
+
+CLI:
+  runs --project OWNER#N [--limit K]   list recorded runs, newest first
+  path                                 print the database path
+
+Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import cache
+
+DB_NAME = "history.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    project       TEXT NOT NULL,
+    at            REAL NOT NULL,
+    snapshot_hash TEXT NOT NULL,
+    counts        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_project_at ON runs (project, at);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id  INTEGER NOT NULL REFERENCES runs (id),
+    rank    INTEGER NOT NULL,
+    finding TEXT NOT NULL,
+    PRIMARY KEY (run_id, rank)
+);
+CREATE TABLE IF NOT EXISTS items (
+    row_hash TEXT PRIMARY KEY,
+    findings TEXT NOT NULL
+);
+"""
+
+
+class HistoryError(Exception):
+    def __init__(self, msg: str, code: int = 2):
+        super().__init__(msg)
+        self.code = code
+
+
+def db_path() -> str:
+    return os.path.join(cache.cache_dir(), DB_NAME)
+
+
+def row_hash(row: dict, salt: str = "") -> str:
+    """Content hash of one normalized snapshot row."""
+    text = salt + json.dumps(row, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def snapshot_hash(row_hashes) -> str:
+    """Order-free digest of a board: the sorted row hashes, hashed."""
+    digest = hashlib.sha256()
+    for h in sorted(row_hashes):
+        digest.update(h.encode("ascii"))
+    return digest.hexdigest()
+
+
+class HistoryStore:
+    """The append-only run log + per-row findings memo (one sqlite file)."""
+
+    def __init__(self, path: str | None = None, *, clock=None):
+        self.path = path or db_path()
+        self.clock = clock or time.time
+        self._db = None
+
+    @classmethod
+    def default(cls, **kwargs) -> "HistoryStore | None":
+        """The user-level store, or None when `GH_PROJECTS_CACHE=off`."""
+        return cls(**kwargs) if cache.enabled() else None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+                if not os.path.exists(self.path):
+                    os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            try:
+                self._db = sqlite3.connect(self.path)
+                self._db.executescript(_SCHEMA)
+            except sqlite3.Error as e:
+                raise HistoryError(f"history store unusable ({self.path}): {e}", code=1)
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # -- runs ----------------------------------------------------------------- #
+    def record(self, project: str, snap_hash: str, counts: dict, findings: list) -> int:
+        """Append one run and its findings; returns the run id."""
+        with self.db:
+            cur = self.db.execute(
+                "INSERT INTO runs (project, at, snapshot_hash, counts) VALUES (?, ?, ?, ?)",
+                (project, float(self.clock()), snap_hash, json.dumps(counts)))
+            run_id = cur.lastrowid
+            self.db.executemany(
+                "INSERT INTO findings (run_id, rank, finding) VALUES (?, ?, ?)",
+                [(run_id, i, json.dumps(f)) for i, f in enumerate(findings)])
+        return run_id
+
+    def runs(self, project: str, limit: int | None = None) -> list:
+        """[{id, at, snapshot_hash, counts}] for `project`, newest first."""
+        sql = "SELECT id, at, snapshot_hash, counts FROM runs WHERE project = ? ORDER BY id DESC"
+        params: tuple = (project,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (int(limit),)
+        return [{"id": r[0], "at": r[1], "snapshot_hash": r[2], "counts": json.loads(r[3])}
+                for r in self.db.execute(sql, params)]
+
+    def latest(self, project: str) -> dict | None:
+        found = self.runs(project, limit=1)
+        return found[0] if found else None
+
+    def resolve(self, project: str, since) -> dict:
+        """The baseline run named by `since`: "last" (the most recent run), a run
+        id, or a date/time — the latest run at or before it (dates are 00:00
+        UTC), else the earliest run. Raises code 3 when there is none."""
+        text = str(since).strip()
+        if text.lower() == "last":
+            row = self.latest(project)
+        elif text.isdigit():
+            row = self._run(project, int(text))
+        else:
+            cutoff = _parse_when(text)
+            if cutoff is None:
+                raise HistoryError(f"--since must be 'last', a run id or a date, got {since!r}")
+            found = (self.db.execute(
+                "SELECT id FROM runs WHERE project = ? AND at <= ? ORDER BY at DESC, id DESC "
+                "LIMIT 1", (project, cutoff)).fetchone()
+                or self.db.execute("SELECT id FROM runs WHERE project = ? ORDER BY id LIMIT 1",
+                                   (project,)).fetchone())
+            row = self._run(project, found[0]) if found else None
+        if row is None:
+            raise HistoryError(f"no recorded run of {project} matches --since {since}", code=3)
+        return row
+
+    def _run(self, project: str, run_id: int) -> dict | None:
+        r = self.db.execute("SELECT id, at, snapshot_hash, counts FROM runs "
+                            "WHERE project = ? AND id = ?", (project, run_id)).fetchone()
+        return r and {"id": r[0], "at": r[1], "snapshot_hash": r[2], "counts": json.loads(r[3])}
+
+    def findings(self, run_id: int) -> list:
+        return [json.loads(r[0]) for r in self.db.execute(
+            "SELECT finding FROM findings WHERE run_id = ? ORDER BY rank", (int(run_id),))]
+
+    # -- per-row memo --------------------------------------------------------- #
+    def item_findings(self, hashes) -> dict:
+        """{row hash: [finding, ...]} for the hashes already memoized."""
+        hashes = list(dict.fromkeys(hashes))
+        out = {}
+        for i in range(0, len(hashes), 500):  # stay under sqlite's variable cap
+            chunk = hashes[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for h, text in self.db.execute(
+                    f"SELECT row_hash, findings FROM items WHERE row_hash IN ({marks})", chunk):
+                out[h] = json.loads(text)
+        return out
+
+    def remember_items(self, memo: dict) -> None:
+        """Memoize {row hash: findings}; an existing hash is left as it is."""
+        if not memo:
+            return
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO items (row_hash, findings) VALUES (?, ?)",
+                                [(h, json.dumps(f)) for h, f in memo.items()])
+
+
+def _parse_when(text: str) -> float | None:
+    try:
+        when = _dt.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=_dt.timezone.utc)
+    return when.timestamp()
+
+
+# --------------------------------------------------------------------------- #
+# Deltas between two runs (pure).
+# --------------------------------------------------------------------------- #
+def _issue(finding: dict) -> tuple:
+    return (finding.get("repo") or "", str(finding.get("number", "")))
+
+
+def _key(finding: dict) -> tuple:
+    return _issue(finding) + (finding.get("kind"),)
+
+
+def delta(previous: list, current: list) -> dict:
+    """NEW / RESOLVED / ESCALATED findings between two ranked findings lists.
+
+    A finding is identified by (repo, issue number, kind). ESCALATED lists the
+    issues whose most urgent finding is now more severe than before (a lower
+    `severity`) — issues with no finding before are NEW, not escalated.
+    """
+    before = {_key(f): f for f in previous}
+    after = {_key(f): f for f in current}
+    worst_before, worst_after = {}, {}
+    for worst, findings in ((worst_before, previous), (worst_after, current)):
+        for f in findings:
+            issue = _issue(f)
+            if issue not in worst or f["severity"] < worst[issue]["severity"]:
+                worst[issue] = f
+    escalated = []
+    for issue, now in worst_after.items():
+        was = worst_before.get(issue)
+        if was is not None and now["severity"] < was["severity"]:
+            escalated.append({"number": issue[1], "repo": issue[0] or None,
+                              "from": {"kind": was["kind"], "severity": was["severity"]},
+                              "to": {"kind": now["kind"], "severity": now["severity"]}})
+    return {
+        "new": [f for k, f in after.items() if k not in before],
+        "resolved": [f for k, f in before.items() if k not in after],
+        "escalated": escalated,
+    }
+
+
+# --------------------------------------------------------------------------- #
+# CLI
+# --------------------------------------------------------------------------- #
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="history.py", description="gh-projects findings history")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    runs = sub.add_parser("runs", help="list recorded analysis runs, newest first")
+    runs.add_argument("--project", required=True, help="OWNER#NUMBER (or OWNER#org)")
+    runs.add_argument("--limit", type=int, default=20)
+    sub.add_parser("path", help="print the history database path")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 2 if e.code not in (0, None) else (e.code or 0)
+    try:
+        if args.cmd == "path":
+            print(db_path())
+            return 0
+        if not os.path.isfile(db_path()):
+            raise HistoryError(f"no history recorded yet ({db_path()})", code=3)
+        store = HistoryStore()
+        try:
+            print(json.dumps({"project": args.project,
+                              "runs": store.runs(args.project, limit=args.limit)}))
+        finally:
+            store.close()
+        return 0
+    except HistoryError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return e.code
+    except Exception as e:  # noqa: BLE001
+        sys.stderr.write(f"error: unexpected: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""gh-projects static GraphQL cost estimator (stdlib only, no network).
+
+GitHub prices a GraphQL call BEFORE running it, from the `first:` / `last:`
+arguments alone (docs: "Rate limits and node limits for the GraphQL API"):
+
+  * node count — every connection may return its full page under every node
+    of every enclosing connection: `items(first:100){ assignees(first:20) }`
+    is 100 + 100*20 = 2,100 nodes. A call over 500,000 nodes is refused.
+  * points — one "request" per connection per enclosing node (1 for `items`,
+    100 for the assignee lists), summed, divided by 100 and rounded; never
+    less than 1. That is what `rateLimit { cost }` reports for the page.
+
+This walks a query document with the same rules so the page lengths of the
+engine's queries can be sized offline for boards with thousands of items.
+Non-connection fields (`fieldValueByName`, `issueType`, `content`) are free; a
+`first:$var` takes its value from `variables`, else GitHub's cap of 100 (and is
+listed under `unresolved`). Named fragments are expanded where spread.
+
+The live counterpart is `--cost-report` on the gh/analysis/scaffold/backlog
+CLIs (and the vendored CI scripts): it prints what GitHub actually charged per
+page, from the `rateLimit` block lib/ratelimit.py adds to every query.
+
+CLI:
+  querycost.py [--items N] [--var NAME=VALUE ...] [--file PATH|-]
+      estimate every query constant in lib/ and templates/github/ (or one
+      document from a file / stdin); with --items, also the pages and total
+      points a board of N items needs for each paginated query.
+
+Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import math
+import os
+import re
+import sys
+
+NODE_LIMIT = 500_000  # GitHub refuses a call whose worst case exceeds this
+MAX_PAGE = 100        # the cap GitHub applies to first:/last:
+
+_TOKEN_RE = re.compile(r'"""[\s\S]*?"""|"(?:\\.|[^"\\])*"|#[^\n]*|\.\.\.|\$?[A-Za-z_]\w*|-?\d+|[{}()\[\]:=!@]')
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_ROOT = os.path.dirname(HERE)
+# Modules whose query constants the CLI audits; templates are loaded by path
+# (they are vendored into consuming repos and never import lib/).
+LIB_MODULES = ("analysis", "gh", "scaffold", "setup_board")
+TEMPLATE_SCRIPTS = (
+    "templates/github/signals.py",
+    "templates/github/workflows/board_sync.py",
+    "templates/github/actions/board-status/board_status.py",
+)
+
+
+class QueryCostError(Exception):
+    def __init__(self, msg: str, code: int = 2):
+        super().__init__(msg)
+        self.code = code
+
+
+def _tokens(doc: str) -> list:
+    return [t for t in _TOKEN_RE.findall(doc) if not t.startswith("#")]
+
+
+def _skip_balanced(toks: list, i: int, open_: str, close: str) -> int:
+    """Index just past the `close` matching the `open_` at toks[i]."""
+    depth = 0
+    while i < len(toks):
+        if toks[i] == open_:
+            depth += 1
+        elif toks[i] == close:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise QueryCostError(f"unbalanced {open_!r} in query document")
+
+
+class _Walk:
+    def __init__(self, toks: list, fragments: dict, variables: dict):
+        self.toks = toks
+        self.fragments = fragments
+        self.variables = variables
+        self.nodes = 0
+        self.requests = 0
+        self.connections = []
+        self.unresolved = []
+        self.paged = None
+
+    def _args(self, i: int) -> tuple:
+        """Parse `( ... )` at toks[i]: (page size or None, paginates?, next index)."""
+        end = _skip_balanced(self.toks, i, "(", ")")
+        size, paginates, depth = None, False, 0
+        j = i
+        while j < end:
+            t = self.toks[j]
+            if t in "([{":
+                depth += 1
+            elif t in ")]}":
+                depth -= 1
+            elif depth == 1 and j + 2 < end and self.toks[j + 1] == ":":
+                if t in ("first", "last"):
+                    size = self._value(self.toks[j + 2])
+                elif t in ("after", "before"):
+                    paginates = True
+            j += 1
+        return size, paginates, end
+
+    def _value(self, tok: str) -> int:
+        if tok.startswith("$"):
+            name = tok[1:]
+            if name in self.variables:
+                return int(self.variables[name])
+            self.unresolved.append(name)
+            return MAX_PAGE
+        try:
+            return int(tok)
+        except ValueError:
+            return MAX_PAGE
+
+    def selection(self, i: int, mult: int, path: tuple, seen: frozenset = frozenset()) -> int:
+        """Walk the selection set opening at toks[i] ('{'); return the index past it."""
+        toks = self.toks
+        i += 1
+        while i < len(toks) and toks[i] != "}":
+            t = toks[i]
+            if t == "...":
+                if toks[i + 1] == "on":
+                    i += 3
+                    while toks[i] == "@":  # directives on an inline fragment
+                        i += 2
+                        if toks[i] == "(":
+                            i = _skip_balanced(toks, i, "(", ")")
+                    i = self.selection(i, mult, path, seen)
+                else:
+                    name = toks[i + 1]
+                    body = self.fragments.get(name)
+                    if body is not None and name not in seen:
+                        sub = _Walk(body, self.fragments, self.variables)
+                        sub.selection(0, mult, path, seen | {name})
+                        self._absorb(sub)
+                    i += 2
+                continue
+            name = t
+            if i + 2 < len(toks) and toks[i + 1] == ":" and toks[i + 2] not in "{(":
+                name, i = toks[i + 2], i + 2  # alias: name
+            i += 1
+            size, paginates = None, False
+            if i < len(toks) and toks[i] == "(":
+                size, paginates, i = self._args(i)
+            while i < len(toks) and toks[i] == "@":
+                i += 2
+                if toks[i] == "(":
+                    i = _skip_balanced(toks, i, "(", ")")
+            if i < len(toks) and toks[i] == "{":
+                if size is not None:
+                    here = path + (name,)
+                    self.requests += mult
+                    self.nodes += mult * size
+                    self.connections.append({"path": ".".join(here), "first": size,
+                                             "nodes": mult * size})
+                    if paginates and self.paged is None:
+                        self.paged = {"path": ".".join(here), "first": size}
+                    i = self.selection(i, mult * size, here, seen)
+                else:
+                    i = self.selection(i, mult, path + (name,), seen)
+        return i + 1
+
+    def _absorb(self, sub: "_Walk") -> None:
+        self.nodes += sub.nodes
+        self.requests += sub.requests
+        self.connections += sub.connections
+        self.unresolved += sub.unresolved
+        self.paged = self.paged or sub.paged
+
+
+def _definitions(toks: list) -> tuple:
+    """Split a document into ([(kind, body tokens)], {fragment name: body tokens})."""
+    operations, fragments = [], {}
+    i = 0
+    while i < len(toks):
+        t = toks[i]
+        if t == "fragment":
+            name = toks[i + 1]
+            start = toks.index("{", i)
+            end = _skip_balanced(toks, start, "{", "}")
+            fragments[name] = toks[start:end]
+            i = end
+        elif t in ("query", "mutation", "subscription", "{"):
+            kind = "query" if t == "{" else t
+            start = i if t == "{" else toks.index("{", i + 1)
+            if t != "{" and "(" in toks[i + 1:start]:
+                start = toks.index("{", _skip_balanced(toks, toks.index("(", i + 1), "(", ")"))
+            end = _skip_balanced(toks, start, "{", "}")
+            operations.append((kind, toks[start:end]))
+            i = end
+        else:
+            i += 1
+    return operations, fragments
+
+
+def points_for(requests: int) -> int:
+    """GitHub's rounding of summed connection requests into rate-limit points."""
+    return max(1, int(requests / 100 + 0.5))
+
+
+def estimate(doc: str, variables: dict | None = None) -> dict:
+    """Worst-case node count and point cost of one GraphQL document.
+
+    Returns {kind, nodes, requests, points, over_node_limit, paged, connections,
+    unresolved}; `paged` names the connection taking `after:` (what one page of
+    a paginated read is), `connections` lists every `first:` connection with
+    its worst-case node count.
+    """
+    operations, fragments = _definitions(_tokens(doc))
+    if not operations:
+        raise QueryCostError("no query or mutation operation in document")
+    walk = _Walk([], fragments, dict(variables or {}))
+    kind = operations[0][0]
+    for _, body in operations:
+        sub = _Walk(body, fragments, walk.variables)
+        sub.selection(0, 1, ())
+        walk._absorb(sub)
+    return {
+        "kind": kind,
+        "nodes": walk.nodes,
+        "requests": walk.requests,
+        "points": points_for(walk.requests),
+        "over_node_limit": walk.nodes > NODE_LIMIT,
+        "paged": walk.paged,
+        "connections": walk.connections,
+        "unresolved": sorted(set(walk.unresolved)),
+    }
+
+
+def pages_for(cost: dict, items: int) -> dict | None:
+    """Pages and total points/nodes to read `items` rows with a paginated query."""
+    if not cost.get("paged"):
+        return None
+    pages = max(1, math.ceil(int(items) / cost["paged"]["first"]))
+    return {"items": int(items), "pages": pages,
+            "points": pages * cost["points"], "nodes": pages * cost["nodes"]}
+
+
+def _is_operation(value) -> bool:
+    return isinstance(value, str) and re.match(r"\s*(query|mutation)\b", value) is not None
+
+
+def _load_template(rel: str):
+    path = os.path.join(PLUGIN_ROOT, rel)
+    if not os.path.isfile(path):
+        return None
+    name = "_querycost_" + os.path.splitext(os.path.basename(rel))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def catalogue() -> list:
+    """[(label, document)] for every module-level query/mutation constant."""
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    modules = [(name, importlib.import_module(name)) for name in LIB_MODULES]
+    for rel in TEMPLATE_SCRIPTS:
+        mod = _load_template(rel)
+        if mod is not None:
+            modules.append((os.path.basename(rel)[:-3], mod))
+    out = []
+    for label, mod in modules:
+        for attr, value in sorted(vars(mod).items()):
+            if attr.isupper() and _is_operation(value):
+                out.append((f"{label}.{attr}", value))
+    return out
+
+
+# --------------------------------------------------------------------------- #
+# CLI
+# --------------------------------------------------------------------------- #
+def _parse_vars(pairs) -> dict:
+    out = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition("=")
+        if not sep or not name.strip() or not value.strip().lstrip("-").isdigit():
+            raise QueryCostError(f"--var must be NAME=INT, got {pair!r}")
+        out[name.strip().lstrip("$")] = int(value)
+    return out
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="querycost.py",
+                                     description="gh-projects static GraphQL cost estimator")
+    parser.add_argument("--items", type=int, default=None,
+                        help="board size: also print pages / total points per paginated query")
+    parser.add_argument("--var", action="append", default=[], metavar="NAME=VALUE",
+                        help="value for a first:/last: variable (repeatable)")
+    parser.add_argument("--file", default=None,
+                        help="estimate one document from PATH (or - for stdin) instead")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 2 if e.code not in (0, None) else (e.code or 0)
+    try:
+        if args.items is not None and args.items < 0:
+            raise QueryCostError("--items must be >= 0")
+        variables = _parse_vars(args.var)
+        if args.file is not None:
+            if args.file == "-":
+                docs = [("-", sys.stdin.read())]
+            elif not os.path.isfile(args.file):
+                raise QueryCostError(f"no such file: {args.file}", code=3)
+            else:
+                with open(args.file, "r", encoding="utf-8") as fh:
+                    docs = [(args.file, fh.read())]
+        else:
+            docs = catalogue()
+        rows = []
+        for label, doc in docs:
+            cost = estimate(doc, variables)
+            row = {"query": label, **cost}
+            if args.items is not None:
+                row["board"] = pages_for(cost, args.items)
+            rows.append(row)
+        print(json.dumps({"node_limit": NODE_LIMIT, "queries": rows}, indent=2))
+        return 0
+    except QueryCostError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return e.code
+    except Exception as e:  # noqa: BLE001
+        sys.stderr.write(f"error: unexpected: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""gh-projects GitHub rate-limit scheduler (stdlib only, no network).
+
+Every lib module talks to GitHub through its own `RUN(args) -> str` seam. This
+wraps such a runner so a long run paces itself instead of dying with a 403
+partway through:
+
+  * Budget tracking — each GraphQL *query* is instrumented with
+    `ghpRateLimit: rateLimit { cost remaining resetAt limit }` (mutations
+    cannot select it), so every response reports what the call cost and what
+    is left. A GraphQL call that reports nothing (a mutation) debits one point
+    from the estimate; REST / `gh` verbs draw on a separate budget and are only
+    counted and retried.
+  * Pacing ahead of exhaustion — below `low_water` (10% of the limit) requests
+    are spread evenly over the time left until `resetAt`; when the next call
+    would dig into `reserve`, it waits for the reset instead of failing.
+  * Retries with jittered backoff — a secondary rate limit / 429 / abuse
+    response is retried after `Retry-After` when the error carries one, else
+    after at least a minute (GitHub's guidance), doubling per attempt; a 5xx /
+    timeout / dropped connection is retried after 1s, 2s, 4s... Both use
+    "equal jitter" (half fixed, half random). Server errors are retried for
+    READS only: a mutation that timed out may have landed. A failure is
+    classified from gh's stderr (or the HTTP status line) alone, never from
+    the argv, whose query and variables can hold any number.
+  * Reporting — `report()` returns requests, retries, seconds waited, points
+    used and the last observed budget, for the caller to print per run;
+    `pages` keeps what GitHub charged each query (cost + nodeCount), which a
+    CLI's `--cost-report` prints one `cost: {...}` line per page (compare
+    querycost.py's static estimate).
+
+The clock, sleep and random source are injectable, so tests never wait.
+`GH_PROJECTS_RATE_LIMIT=off` makes `wrap()` return the runner unchanged.
+
+The vendored CI scripts (templates/github/...) may not import lib/, so each
+carries a compact copy of this class (`_Scheduler`); tests/test_ratelimit.py
+runs the same scenarios against every copy.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+RATE_LIMIT_ENV = "GH_PROJECTS_RATE_LIMIT"
+RATE_LIMIT_ALIAS = "ghpRateLimit"
+_SELECTION = " %s: rateLimit { cost remaining resetAt limit nodeCount }" % RATE_LIMIT_ALIAS
+
+DEFAULT_LIMIT = 5000  # GraphQL points/hour until a response says otherwise
+RESERVE = 50          # points never spent by pacing (left for a human/other jobs)
+SECONDARY_WAIT = 60.0
+BASE_DELAY = 1.0
+MAX_DELAY = 300.0
+MAX_RETRIES = 4
+
+_RATE_RE = re.compile(r"secondary rate limit|abuse detection|rate limit exceeded|"
+                      r"HTTP 429|too many requests", re.IGNORECASE)
+_SERVER_RE = re.compile(r"HTTP 5\d\d|server error|bad gateway|service unavailable|"
+                        r"gateway time-?out|timed? ?out|connection (?:lost|reset)",
+                        re.IGNORECASE)
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after:?\s*(\d+)", re.IGNORECASE)
+_OPENS_RE = re.compile(r"([A-Za-z_]\w*)\s*(?:\([^()]*\))?\s*\{")
+
+
+def classify(message: str) -> str | None:
+    """"rate" (rate limited), "server" (transient 5xx/network) or None."""
+    if _RATE_RE.search(message):
+        return "rate"
+    if _SERVER_RE.search(message):
+        return "server"
+    return None
+
+
+def failure_text(exc) -> str:
+    """The text a failed call is classified from: gh's stderr (or the HTTP
+    status line) when the error carries it, never the argv or query — an
+    issue number like 502 there is not a server error."""
+    stderr = getattr(exc, "stderr", None)
+    return str(stderr) if stderr is not None else str(exc)
+
+
+def _query_index(argv: list) -> int | None:
+    for i in range(len(argv) - 1):
+        if argv[i] in ("-f", "--raw-field") and argv[i + 1].startswith("query="):
+            return i + 1
+    return None
+
+
+def instrument(args) -> list:
+    """Add the rateLimit selection to a `gh api graphql` query document.
+
+    Mutations, documents that already select rateLimit, and documents with
+    fragment definitions (the selection must land in the operation) are left
+    unchanged.
+    """
+    argv = [str(a) for a in args]
+    if argv[:2] != ["api", "graphql"]:
+        return argv
+    i = _query_index(argv)
+    if i is None:
+        return argv
+    query = argv[i][len("query="):]
+    head = query.lstrip()
+    if head.startswith("mutation") or "rateLimit" in query or "fragment " in query:
+        return argv
+    end = query.rfind("}")
+    if end < 0:
+        return argv
+    argv[i] = "query=" + query[:end] + _SELECTION + query[end:]
+    return argv
+
+
+def operation_label(query: str) -> str:
+    """A short name for a query in reports: its first three selection fields."""
+    names = [n for n in _OPENS_RE.findall(query) if n not in ("query", "mutation", "on", "rateLimit")]
+    return ".".join(names[:3]) or "graphql"
+
+
+def is_read(args) -> bool:
+    """True when replaying the call cannot apply a change twice."""
+    argv = [str(a) for a in args]
+    if "--help" in argv:
+        return True
+    if argv[:2] == ["api", "graphql"]:
+        i = _query_index(argv)
+        return i is not None and not argv[i][len("query="):].lstrip().startswith("mutation")
+    if argv[:1] == ["api"]:
+        for flag in ("-X", "--method"):
+            if flag in argv:
+                return argv[argv.index(flag) + 1].upper() == "GET"
+        return not any(a in ("-f", "-F", "--raw-field", "--field", "--input") for a in argv)
+    return len(argv) > 1 and argv[1] in ("list", "view", "checks", "status")
+
+
+def _reset_epoch(value) -> float | None:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class Scheduler:
+    """A `RUN`-compatible wrapper that paces, retries and accounts GitHub calls."""
+
+    def __init__(self, run, *, clock=None, sleep=None, rand=None,
+                 max_retries: int = MAX_RETRIES, base_delay: float = BASE_DELAY,
+                 max_delay: float = MAX_DELAY, secondary_wait: float = SECONDARY_WAIT,
+                 reserve: int = RESERVE):
+        self.run = run
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.rand = rand or random.random
+        self.max_retries = int(max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.secondary_wait = secondary_wait
+        self.reserve = reserve
+        self.remaining = None  # last observed/estimated points left
+        self.limit = DEFAULT_LIMIT
+        self.reset_at = None   # epoch seconds
+        self.cost = 1          # largest query cost seen — the pacing unit
+        self.stats = {"requests": 0, "retries": 0, "waited_s": 0.0, "points_used": 0}
+        self.pages = []        # per instrumented call: {op, cost, nodes, remaining}
+        # Callers may overlap calls (gh.fan_out, analysis's page prefetch):
+        # accounting is serialized; the calls and waits themselves are not.
+        self._lock = threading.Lock()
+
+    def __call__(self, args, **kwargs) -> str:
+        argv = instrument(args)
+        read = is_read(argv)
+        attempt = 0
+        while True:
+            self._pace()
+            with self._lock:
+                self.stats["requests"] += 1
+            try:
+                out = self.run(argv, **kwargs)
+            except Exception as e:  # noqa: BLE001 — re-raised unless retryable
+                message = failure_text(e)
+                kind = classify(message)
+                if kind is None or attempt >= self.max_retries or (kind == "server" and not read):
+                    raise
+                self._wait(self._backoff(attempt, kind, message))
+                with self._lock:
+                    self.stats["retries"] += 1
+                attempt += 1
+                continue
+            if argv[:2] == ["api", "graphql"]:
+                with self._lock:
+                    self._observe(out, argv)
+            return out
+
+    # -- budget --------------------------------------------------------------- #
+    def _observe(self, out, argv=()) -> None:
+        """Fold one GraphQL response's rateLimit (if any) into the budget."""
+        rl = None
+        if isinstance(out, str) and RATE_LIMIT_ALIAS in out:
+            try:
+                rl = ((json.loads(out).get("data") or {}).get(RATE_LIMIT_ALIAS))
+            except (ValueError, AttributeError):
+                rl = None
+        if not isinstance(rl, dict):
+            self.stats["points_used"] += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            return
+        cost = int(rl.get("cost") or 1)
+        self.stats["points_used"] += cost
+        self.cost = max(self.cost, cost)
+        self.remaining = int(rl.get("remaining", 0))
+        self.limit = int(rl.get("limit") or self.limit)
+        self.reset_at = _reset_epoch(rl.get("resetAt")) or self.reset_at
+        i = _query_index(list(argv))
+        self.pages.append({"op": operation_label(argv[i]) if i is not None else "graphql",
+                           "cost": cost, "nodes": rl.get("nodeCount"),
+                           "remaining": self.remaining})
+
+    def _pace(self) -> None:
+        if self.remaining is None or self.reset_at is None:
+            return
+        until = self.reset_at - self.clock()
+        if until <= 0:
+            self.remaining = None  # a new window: nothing known yet
+            return
+        if self.remaining - self.cost < self.reserve:
+            self._wait(until + 1)
+            self.remaining = None
+            return
+        low_water = max(self.reserve + self.cost, self.limit // 10)
+        if self.remaining < low_water:
+            calls_left = max(1, (self.remaining - self.reserve) // self.cost)
+            self._wait(until / calls_left)
+
+    def _backoff(self, attempt: int, kind: str, message: str) -> float:
+        hinted = _RETRY_AFTER_RE.search(message)
+        if hinted:
+            return float(hinted.group(1)) + self.rand()
+        base = self.secondary_wait if kind == "rate" else self.base_delay
+        if kind == "rate" and self.remaining is not None and self.remaining <= 0 \
+                and self.reset_at is not None:
+            return max(self.reset_at - self.clock(), 0.0) + 1 + self.rand()
+        cap = min(self.max_delay, base * (2 ** attempt))
+        return cap / 2 + self.rand() * cap / 2
+
+    def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            with self._lock:
+                self.stats["waited_s"] += seconds
+            self.sleep(seconds)
+
+    def report(self) -> dict:
+        """Budget consumption so far, for a per-run summary."""
+        return {
+            **self.stats,
+            "waited_s": round(self.stats["waited_s"], 3),
+            "remaining": self.remaining,
+            "limit": self.limit,
+            "reset_at": (datetime.fromtimestamp(self.reset_at, timezone.utc)
+                         .strftime("%Y-%m-%dT%H:%M:%SZ") if self.reset_at else None),
+        }
+
+
+def enabled() -> bool:
+    return os.environ.get(RATE_LIMIT_ENV, "").lower() not in ("off", "0", "false", "no")
+
+
+def wrap(run):
+    """`run` behind a Scheduler, or unchanged when `GH_PROJECTS_RATE_LIMIT=off`."""
+    return Scheduler(run) if enabled() else run
+
+
+def report(run) -> dict | None:
+    """The budget report of a (possibly) wrapped runner, else None."""
+    return run.report() if isinstance(run, Scheduler) else None
+
+
+COST_REPORT_HELP = "print the GraphQL points GitHub charged per query page (stderr)"
+
+
+def cost_report_parent():
+    """A parent parser carrying `--cost-report` for every subcommand of a CLI,
+    so the flag works after the verb as well as before it. Its default is
+    suppressed: a subcommand never clobbers the flag given before the verb."""
+    import argparse
+
+    p = argparse.ArgumentParser(add_help=False)
+    p.add_argument("--cost-report", action="store_true", default=argparse.SUPPRESS,
+                   help=COST_REPORT_HELP)
+    return p
+
+
+def emit(run, stream=None, *, pages: bool = False) -> None:
+    """Print a one-line `budget: {...}` summary (stderr) if `run` made calls;
+    with `pages`, first one `cost: {...}` line per charged query (`--cost-report`)."""
+    rep = report(run)
+    if not rep or not rep["requests"]:
+        return
+    out = stream or sys.stderr
+    if pages:
+        for page in run.pages:
+            out.write("cost: " + json.dumps(page) + "\n")
+    out.write("budget: " + json.dumps(rep) + "\n")
@@ -49,6 +49,7 @@ if str(_LIB) not in sys.path:
     sys.path.insert(0, str(_LIB))
 
 import gh  # noqa: E402  (the shared GraphQL/REST core; injectable RUN)
+import ratelimit  # noqa: E402
 
 
 # --------------------------------------------------------------------------- #
@@ -1210,25 +1211,32 @@ def apply_plan(plan: dict, *, repo_dir: str | None, force: bool) -> dict:
     # Repo→Project link — idempotent (gh.link_repo diffs the project's
     # linked repos and skips one already linked). Linked against the real COPY id
     # (the dry plan may have reported it against project_id=None).
-    rl = plan.get("repo_link")
-    if rl and plan["copy"].get("id"):
+    def repo_link():
+        rl = plan["repo_link"]
         try:
             repo_id = rl.get("repo_id") or resolve_repo_id(rl["repo"])
-            actions["repo_link"] = gh.link_repo(plan["copy"]["id"], repo_id)
+            return gh.link_repo(plan["copy"]["id"], repo_id)
         except (ScaffoldError, gh.GhError) as e:
-            actions["repo_link"] = {"deferred": True, "repo": rl["repo"],
-                                    "reason": gh._scrub(str(e))}
+            return {"deferred": True, "repo": rl["repo"], "reason": gh._scrub(str(e))}
 
     # Project→team link — a REAL linkProjectV2ToTeam write-to-team. The
     # org base-role stays a MANUAL step (UI-only, no API mutation).
-    tl = plan.get("team_link")
-    if tl and plan["copy"].get("id"):
+    def team_link():
+        tl = plan["team_link"]
         try:
             team_id = tl.get("team_id") or resolve_team_id(plan["org"], tl["team"])
-            actions["team_link"] = gh.link_team(plan["copy"]["id"], team_id)
+            return gh.link_team(plan["copy"]["id"], team_id)
         except (ScaffoldError, gh.GhError) as e:
-            actions["team_link"] = {"deferred": True, "team": tl["team"],
-                                    "reason": gh._scrub(str(e))}
+            return {"deferred": True, "team": tl["team"], "reason": gh._scrub(str(e))}
+
+    # The two links are independent: their id lookups overlap (gh.fan_out).
+    links = {}
+    if plan["copy"].get("id"):
+        if plan.get("repo_link"):
+            links["repo_link"] = repo_link
+        if plan.get("team_link"):
+            links["team_link"] = team_link
+    actions.update(zip(links, gh.fan_out(links.values())))
 
     # Confirm App project access (a confirmation touch — NOT a base-role grant).
     actions["app_access"] = grant_app_access(plan["copy"]["id"])
@@ -1364,9 +1372,12 @@ def cmd_scaffold(args) -> int:
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="scaffold.py", description="gh-projects scaffold engine")
+    p.add_argument("--cost-report", action="store_true", help=ratelimit.COST_REPORT_HELP)
     sub = p.add_subparsers(dest="cmd", required=True)
+    cost = [ratelimit.cost_report_parent()]
 
-    sp = sub.add_parser("scaffold", help="copy the golden template + install repo files (dry by default)")
+    sp = sub.add_parser("scaffold", parents=cost,
+                        help="copy the golden template + install repo files (dry by default)")
     sp.add_argument("--org", required=True, help="org login that owns the board + golden template")
     sp.add_argument("--template", required=True, help="NAME (title) of the golden-template Project")
     sp.add_argument("--title", required=True, help="title for the new copied Project")
@@ -1394,6 +1405,8 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + gh._scrub(str(e)) + "\n")
         return 1
+    finally:
+        ratelimit.emit(gh.RUN, pages=args.cost_report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,4 @@
+import os
+
+# Offline suite: never read or write the user's on-disk snapshot cache.
+os.environ.setdefault("GH_PROJECTS_CACHE", "off")
@@ -10,9 +10,17 @@ Covers:
   * each finding kind fires on a crafted fixture, carries machine-checkable
     evidence + a resolving-skill action
   * STABLE ordering — shuffling the input items yields the identical output order
+  * the columnar `Snapshot` — built in one batch or item by item, it ranks and
+    counts exactly like the plain list of dicts
+  * the rule registry — each rule visits only its indexed candidate rows, a new
+    rule is one registration, and per-rule counters are collected on request
   * the engine is read-only — the fetch path makes no write-shaped round-trip, and
     compute_findings/rollup_counts perform no I/O
+  * the board streams — page 1's rows yield while page 2 (prefetched) is in
+    flight, and the streamed `run` equals the pure core over the full snapshot
   * analyze-sprint capacity reuse produces the expected working-day numbers
+  * org-wide mode discovers the open projects, reads every board, analyses an
+    issue carried by several boards once, and keeps per-project rollups
   * CLI exit-code map 0/2/3/1 + no token printed
   * the two analyze SKILL.md files are model-invocable, pin model+effort, declare
     read-only allowed-tools, and analyze-board references both rules files
@@ -23,6 +31,8 @@ import io
 import json
 import os
 import sys
+import threading
+import time
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from datetime import date
@@ -237,6 +247,77 @@ class TestRollupCounts(unittest.TestCase):
         self.assertEqual(c["decisions_owed"], 1)  # #60
 
 
+# --------------------------------------------------------------------------- #
+# Columnar snapshot: same findings and counts as the list of dicts.
+# --------------------------------------------------------------------------- #
+class TestSnapshot(unittest.TestCase):
+    def test_snapshot_matches_the_item_list(self):
+        items = snapshot_fixture() + [None, {}, {"number": "x-1", "status": "Ready"}]
+        snap = analysis.Snapshot(items)
+        one_by_one = analysis.Snapshot()
+        for it in items:
+            one_by_one.append(it)
+        expected = analysis.compute_findings(items, today=TODAY)
+        self.assertEqual(len(snap), len(items))
+        self.assertEqual(analysis.compute_findings(snap, today=TODAY), expected)
+        self.assertEqual(analysis.compute_findings(one_by_one, today=TODAY), expected)
+        self.assertEqual(analysis.rollup_counts(snap), analysis.rollup_counts(items))
+
+    def test_options_are_interned_and_blockers_copied(self):
+        blockers = [7]
+        snap = analysis.Snapshot([
+            {"number": 1, "status": "".join(["Re", "ady"])},
+            {"number": 2, "status": "Ready", "blocked": "Blocked",
+             "impact": analysis.IMPACT_RELEASE, "blocked_by": blockers},
+        ])
+        self.assertIs(snap.status[0], snap.status[1])
+        chain = _by_kind(analysis.compute_findings(snap, today=TODAY))[
+            analysis.KIND_CRITICAL_CHAIN][0]
+        self.assertEqual(chain["evidence"]["blocked_by"], ["7"])
+        self.assertIsNot(chain["evidence"]["blocked_by"], blockers)
+
+
+class TestRuleRegistry(unittest.TestCase):
+    def test_rules_visit_only_their_candidates(self):
+        stats = {}
+        findings = analysis.compute_findings(snapshot_fixture(), today=TODAY, stats=stats)
+        visited = {kind: (e["candidates"], e["findings"]) for kind, e in stats.items()}
+        self.assertEqual(visited, {
+            analysis.KIND_CRITICAL_CHAIN: (1, 1),        # Blocked rows
+            analysis.KIND_OVERDUE_HIGH_BLAST: (1, 1),    # Overdue rows
+            analysis.KIND_STALLED_EPIC: (1, 1),          # Epic rows
+            analysis.KIND_INTAKE_HYGIENE: (1, 1),        # Ready rows
+            analysis.KIND_UNASSIGNED_IN_SPRINT: (6, 1),  # in-sprint statuses
+            analysis.KIND_DECISION_NEEDED: (1, 1),       # a decision owed
+        })
+        self.assertEqual(sum(e["findings"] for e in stats.values()), len(findings))
+        self.assertTrue(all(e["seconds"] >= 0 for e in stats.values()))
+
+    def test_a_new_rule_is_one_registration(self):
+        before = list(analysis.RULES)
+        self.addCleanup(lambda: analysis.RULES.__setitem__(slice(None), before))
+
+        @analysis.rule("epic_unsized", 9, reads=("number", "type", "size"),
+                       on=("type", ("Epic",)), match=lambda s, i: s.size[i] == "L")
+        def _epic_unsized(s, i):
+            return analysis._finding("epic_unsized", 9, s.number[i], title="t", summary="s",
+                                     evidence={}, action=analysis._action(None, None))
+
+        findings = analysis.compute_findings(snapshot_fixture(), today=TODAY)
+        self.assertEqual(findings[-1]["kind"], "epic_unsized")
+        self.assertEqual(findings[-1]["number"], "30")
+        with self.assertRaises(ValueError):
+            analysis.rule("bad", 9, reads=("nope",), on=("nope", ("x",)))
+        with self.assertRaises(ValueError):
+            analysis.rule("bad", 9, reads=("number",), on=("status", ("Ready",)))
+
+    def test_index_is_rebuilt_after_extend(self):
+        snap = analysis.Snapshot([{"number": 1, "status": "Ready"}])
+        self.assertEqual(snap.index("status"), {"Ready": [0]})
+        snap.append({"number": 2, "status": "Ready"})
+        self.assertEqual(snap.index("status"), {"Ready": [0, 1]})
+
+
 # --------------------------------------------------------------------------- #
 # READ-ONLY: the fetch path makes no write-shaped round-trip; the core has no I/O.
 # --------------------------------------------------------------------------- #
@@ -259,9 +340,23 @@ class FakeReadRunner:
         self.calls.append(list(args))
         body = " ".join(str(a) for a in args)
         if "items(first:100" in body:
-            return json.dumps(self._items_response())
+            return json.dumps(self._items_response(with_body=" body" in body))
+        if "nodes(ids:" in body:
+            ids = json.loads(body.split("nodes(ids:")[1].split(")")[0])
+            by_id = {n["id"]: n for n in self._items_response(with_body=True)
+                     ["data"]["organization"]["projectV2"]["items"]["nodes"]}
+            return json.dumps({"data": {"nodes": [by_id[i] for i in ids if i in by_id]}})
         return "{}"
 
+    def body_reads(self):
+        """Item ids whose bodies were requested by id (the second tier)."""
+        out = []
+        for c in self.calls:
+            body = " ".join(str(a) for a in c)
+            if "nodes(ids:" in body:
+                out += json.loads(body.split("nodes(ids:")[1].split(")")[0])
+        return out
+
     def writes(self):
         out = []
         for c in self.calls:
@@ -270,15 +365,19 @@ class FakeReadRunner:
                 out.append(low)
         return out
 
-    def _items_response(self):
+    def _items_response(self, with_body=False):
         nodes = []
         for it in self.snapshot:
+            body = ({"body": ("## Acceptance Criteria\n| AC | end-state |\n|--|--|\n| 1 | x |"
+                              if it.get("has_ac_table") else "some prose")}
+                    if with_body else {})
             nodes.append({
+                "id": f"PVTI_{it['number']}",
                 "content": {
                     "__typename": "Issue",
                     "number": int(it["number"]),
-                    "body": ("## Acceptance Criteria\n| AC | end-state |\n|--|--|\n| 1 | x |"
-                             if it.get("has_ac_table") else "some prose"),
+                    "updatedAt": it.get("updated_at", "t1"),
+                    **body,
                     "issueType": {"name": it.get("type", "")},
                     "assignees": {"nodes": [{"login": a} for a in it.get("assignees", [])]},
                     "subIssuesSummary": {"total": it.get("sub_issues_total", 0),
@@ -331,11 +430,24 @@ class TestReadOnly(unittest.TestCase):
         analysis.RUN = runner
         snap = analysis.load_board("acme", 7)
         by_num = {it["number"]: it for it in snap}
-        self.assertTrue(by_num["10"]["has_ac_table"])
-        self.assertFalse(by_num["40"]["has_ac_table"])  # prose-only body
+        self.assertFalse(by_num["40"]["has_ac_table"])  # Ready, prose-only body
+        self.assertIsNone(by_num["10"]["has_ac_table"])  # In Progress: body never read
         self.assertEqual(by_num["10"]["impact"], "Release blocker")
         self.assertEqual(by_num["60"]["decision_needed"], "Move date")
 
+    def test_bodies_are_read_only_for_ready_items(self):
+        snap = snapshot_fixture()
+        snap[3]["has_ac_table"] = True  # #40 (Ready) now has its AC table
+        runner = FakeReadRunner(snap)
+        analysis.RUN = runner
+        by_num = {it["number"]: it for it in analysis.load_board("acme", 7)}
+        self.assertNotIn(" body", " ".join(runner.calls[0]), "the page read is lean")
+        self.assertEqual(runner.body_reads(), ["PVTI_40"])
+        self.assertTrue(by_num["40"]["has_ac_table"])
+        hygiene = [f for f in analysis.run("acme", 7, today=TODAY)["findings"]
+                   if f["kind"] == analysis.KIND_INTAKE_HYGIENE]
+        self.assertEqual(hygiene[0]["evidence"]["missing"], ["Size", "Target date"])
+
     def test_missing_project_is_not_found(self):
         analysis.RUN = lambda args: json.dumps(
             {"data": {"organization": {"projectV2": None}}})
@@ -344,6 +456,184 @@ class TestReadOnly(unittest.TestCase):
         self.assertEqual(ctx.exception.code, 3)
 
 
+class PagedReadRunner(FakeReadRunner):
+    """Serves the board `per_page` items at a time (cursor = next offset).
+    `gate`, when set, holds every page after the first until it is released."""
+
+    def __init__(self, snapshot, per_page=2, gate=None):
+        super().__init__(snapshot)
+        self.per_page = per_page
+        self.gate = gate
+
+    def __call__(self, args):
+        self.calls.append(list(args))
+        after = next((a[len("after="):] for a in args if str(a).startswith("after=")), "None")
+        start = 0 if after == "None" else int(after)
+        if start and self.gate is not None:
+            self.gate.wait(timeout=5)
+        resp = self._items_response()
+        conn = resp["data"]["organization"]["projectV2"]["items"]
+        end = start + self.per_page
+        conn["nodes"] = conn["nodes"][start:end]
+        more = end < len(self.snapshot)
+        conn["pageInfo"] = {"hasNextPage": more, "endCursor": str(end) if more else None}
+        return json.dumps(resp)
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self._orig = analysis.RUN
+
+    def tearDown(self):
+        analysis.RUN = self._orig
+
+    def test_first_page_yields_while_next_is_in_flight(self):
+        gate = threading.Event()
+        runner = PagedReadRunner(snapshot_fixture(), per_page=3, gate=gate)
+        analysis.RUN = runner
+        rows = analysis.iter_board("acme", 7)
+        first = [next(rows) for _ in range(3)]
+        self.assertEqual([r["number"] for r in first], ["10", "20", "30"])
+        # Page 2 was requested (prefetch) before page 1 was consumed, and is
+        # still held at the gate: page 1 never waited on it.
+        deadline = time.monotonic() + 5
+        while len(runner.calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(runner.calls), 2)
+        gate.set()
+        rest = list(rows)
+        self.assertEqual(len(first) + len(rest), len(snapshot_fixture()))
+        pages = [c for c in runner.calls if "items(first:100" in " ".join(c)]
+        self.assertEqual(len(pages), 3)
+
+    def test_streamed_run_matches_the_pure_core(self):
+        analysis.RUN = PagedReadRunner(snapshot_fixture(), per_page=2)
+        result = analysis.run("acme", 7, today=TODAY)
+        self.assertEqual(result["findings"],
+                         analysis.compute_findings(snapshot_fixture(), today=TODAY))
+        self.assertEqual(result["counts"], analysis.rollup_counts(snapshot_fixture()))
+        self.assertEqual(analysis.rollup_counts(iter(snapshot_fixture())),
+                         analysis.rollup_counts(snapshot_fixture()))
+
+    def test_not_found_surfaces_from_the_stream(self):
+        analysis.RUN = lambda args: json.dumps({"data": {"organization": {"projectV2": None}}})
+        with self.assertRaises(analysis.AnalysisError) as ctx:
+            next(analysis.iter_board("acme", 99))
+        self.assertEqual(ctx.exception.code, 3)
+
+
+# --------------------------------------------------------------------------- #
+# Org-wide mode — every project of an owner merged into one deduped report.
+# --------------------------------------------------------------------------- #
+class OrgReadRunner:
+    """Serves an org: project discovery plus one FakeReadRunner board per
+    project number. Board items may name their `repo`."""
+
+    def __init__(self, boards, closed=()):
+        self.boards = {n: FakeReadRunner(items) for n, items in boards.items()}
+        self.closed = set(closed)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, args):
+        with self.lock:
+            self.calls.append(list(args))
+        body = " ".join(str(a) for a in args)
+        if "projectsV2(" in body:
+            nodes = [{"number": n, "title": f"Team {n}", "closed": n in self.closed}
+                     for n in self.boards]
+            return json.dumps({"data": {"organization": {"projectsV2": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes}}}})
+        if "nodes(ids:" in body:
+            ids = json.loads(body.split("nodes(ids:")[1].split(")")[0])
+            by_id = {n["id"]: n for number in self.boards
+                     for n in self._nodes(number, with_body=True)}
+            return json.dumps({"data": {"nodes": [by_id[i] for i in ids if i in by_id]}})
+        number = int(next(a for a in args if str(a).startswith("number="))[len("number="):])
+        if number not in self.boards:
+            return json.dumps({"data": {"organization": {"projectV2": None}}})
+        resp = self.boards[number]._items_response()
+        resp["data"]["organization"]["projectV2"]["items"]["nodes"] = self._nodes(number)
+        return json.dumps(resp)
+
+    def _nodes(self, number, with_body=False):
+        board = self.boards[number]
+        nodes = board._items_response(with_body)["data"]["organization"]["projectV2"]["items"]["nodes"]
+        for i, (node, item) in enumerate(zip(nodes, board.snapshot)):
+            node["id"] = f"PVTI_{number}_{i}"
+            repo = item.get("repo", "acme/app")
+            node["content"]["repository"] = {"nameWithOwner": repo}
+            node["content"]["id"] = f"I_{repo}#{item['number']}"
+        return nodes
+
+    def body_reads(self):
+        return FakeReadRunner.body_reads(self)
+
+
+class TestOrgWide(unittest.TestCase):
+    def setUp(self):
+        self._orig = analysis.RUN
+
+    def tearDown(self):
+        analysis.RUN = self._orig
+
+    def boards(self):
+        shared = {"number": 20, "status": "In Progress", "assignees": [],
+                  "schedule_health": "Overdue", "blast_radius": "Blocks many"}
+        return {
+            1: [shared, {"number": 5, "status": "Done", "assignees": ["a"]}],
+            2: [dict(shared), {"number": 20, "repo": "acme/api", "status": "Done",
+                               "decision_needed": "Cut scope", "assignees": ["b"]}],
+            3: [{"number": 9, "decision_needed": "Move date", "assignees": ["c"]}],
+        }
+
+    def test_merged_report_dedupes_issues_across_boards(self):
+        analysis.RUN = OrgReadRunner(self.boards(), closed={3})
+        result = analysis.run_org("acme", today=TODAY)
+        self.assertEqual([p["project"] for p in result["projects"]], ["acme#1", "acme#2"])
+        self.assertEqual([p["counts"]["items"] for p in result["projects"]], [2, 2])
+        self.assertEqual(result["counts"]["items"], 3)  # acme/app#20 counted once
+        overdue = [f for f in result["findings"]
+                   if f["kind"] == analysis.KIND_OVERDUE_HIGH_BLAST]
+        self.assertEqual([(f["repo"], f["number"], f["projects"]) for f in overdue],
+                         [("acme/app", "20", [1, 2])])
+        decision = [f for f in result["findings"] if f["kind"] == analysis.KIND_DECISION_NEEDED]
+        self.assertEqual([(f["repo"], f["projects"]) for f in decision], [("acme/api", [2])])
+        self.assertEqual(result["findings"],
+                         sorted(result["findings"], key=lambda f: f["severity"]))
+
+    def test_shared_issue_body_is_read_once(self):
+        ready = {"number": 30, "status": "Ready", "assignees": [], "has_ac_table": True}
+        boards = {n: [dict(ready), {"number": 40 + n, "status": "Ready", "assignees": []}]
+                  for n in (1, 2, 3)}
+        runner = OrgReadRunner(boards)
+        analysis.RUN = runner
+        result = analysis.run_org("acme", today=TODAY)
+        reads = runner.body_reads()
+        self.assertEqual(len(reads), 4, "acme/app#30 once, plus #41, #42, #43")
+        self.assertEqual(len([r for r in reads if r.endswith("_0")]), 1)
+        self.assertEqual(len(result["projects"]), 3)
+        # Every board's row carries the shared read's answer, not "unknown".
+        shared = analysis._SharedAC()
+        rows = [r for n in (1, 2, 3)
+                for r in analysis.iter_board("acme", n, shared_ac=shared) if r["number"] == "30"]
+        self.assertEqual([r["has_ac_table"] for r in rows], [True, True, True])
+        self.assertEqual(shared.reads, 4)
+
+    def test_include_closed_and_explicit_numbers(self):
+        analysis.RUN = OrgReadRunner(self.boards(), closed={3})
+        result = analysis.run_org("acme", today=TODAY, include_closed=True)
+        self.assertEqual(len(result["projects"]), 3)
+        result = analysis.run_org("acme", numbers=[3], today=TODAY)
+        self.assertEqual([f["number"] for f in result["findings"]], ["9"])
+
+    def test_missing_org_is_not_found(self):
+        analysis.RUN = lambda args: json.dumps({"data": {"organization": None}})
+        with self.assertRaises(analysis.AnalysisError) as ctx:
+            analysis.run_org("nobody")
+        self.assertEqual(ctx.exception.code, 3)
+
+
 # --------------------------------------------------------------------------- #
 # analyze-sprint capacity reuse — the working-day engine produces expected nums.
 # --------------------------------------------------------------------------- #
@@ -409,10 +699,31 @@ class TestCli(unittest.TestCase):
         self.assertEqual(code, 0)
         self.assertIn("findings", out)
 
+    def test_rule_stats_on_stderr(self):
+        code, _, err = self._run_main(["--snapshot", "-", "--rule-stats"],
+                                      stdin=json.dumps(snapshot_fixture()))
+        self.assertEqual(code, 0)
+        lines = [json.loads(l[len("rule: "):]) for l in err.splitlines()
+                 if l.startswith("rule: ")]
+        self.assertEqual([l["kind"] for l in lines], [r.kind for r in analysis.RULES])
+        self.assertEqual(lines[0]["findings"], 1)
+
     def test_missing_args_exit_2(self):
         code, _, _ = self._run_main([])  # no --owner/--number and no --snapshot
         self.assertEqual(code, 2)
 
+    def test_org_wide_exit_0_and_usage_2(self):
+        orig = analysis.RUN
+        analysis.RUN = OrgReadRunner({1: snapshot_fixture()})
+        try:
+            code, out, _ = self._run_main(["--owner", "acme", "--org-wide", "--no-cache"])
+            self.assertEqual(code, 0)
+            self.assertEqual(json.loads(out)["projects"][0]["counts"]["items"], 7)
+            code, _, _ = self._run_main(["--owner", "acme", "--number", "1", "--org-wide"])
+            self.assertEqual(code, 2)
+        finally:
+            analysis.RUN = orig
+
     def test_bad_snapshot_json_exit_2(self):
         code, _, _ = self._run_main(["--snapshot", "-"], stdin="{not json")
         self.assertEqual(code, 2)
@@ -26,6 +26,7 @@ from __future__ import annotations
 import io
 import json
 import os
+import re
 import subprocess
 import sys
 import tempfile
@@ -66,6 +67,11 @@ _SINGLE_SELECTS = {
 _TEXT_FIELDS = ["PM-ID", "Spec"]
 
 
+_ALIASED_WRITE = re.compile(
+    r'(w\d+):updateProjectV2ItemFieldValue\(input:\{[^}]*fieldId:"([^"]+)",'
+    r'value:\{(singleSelectOptionId|text):"([^"]*)"\}')
+
+
 class BoardRunner:
     """Fake gh runner for the promote path. Each `gh issue create` returns the
     next issue url/number; field writes read back identical via a per-item map."""
@@ -106,23 +112,25 @@ class BoardRunner:
             num = int(m.group(1)) if m else 0
             return json.dumps({"node_id": f"I_{num}", "assignees": []})
 
+        # ----- write_fields: one aliased document, each alias reads its value back
+        #       (`a:` = the fused add once the item id is known) -----
+        if "updateProjectV2ItemFieldValue" in body:
+            data = {}
+            if "a:addProjectV2ItemById" in body:
+                self.writes.append(("add-item", body))
+                data["a"] = {"item": {"id": "ITEM_x"}}
+            self.writes.append(("set-field", body))
+            for alias, fid, kind, val in _ALIASED_WRITE.findall(body):
+                kind = "optionId" if kind == "singleSelectOptionId" else kind
+                self._written[fid] = (kind, val)
+                data[alias] = {"projectV2Item": {"id": "ITEM_x", "fieldValueByName": {kind: val}}}
+            return json.dumps({"data": data})
+
         # ----- addProjectV2ItemById -----
         if "addProjectV2ItemById" in body:
             self.writes.append(("add-item", body))
             return json.dumps({"data": {"addProjectV2ItemById": {"item": {"id": "ITEM_x"}}}})
 
-        # ----- updateProjectV2ItemFieldValue (field write) -----
-        if "updateProjectV2ItemFieldValue" in body:
-            self.writes.append(("set-field", body))
-            self._record_written(body)
-            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {
-                "projectV2Item": {"id": "ITEM_x"}}}})
-
-        # ----- field read-back -----
-        if "fieldValues(first:50)" in body:
-            return json.dumps({"data": {"node": {"id": "ITEM_x",
-                "fieldValueByName": {"nodes": self._readback_nodes()}}}})
-
         # ----- addSubIssue -----
         if "addSubIssue" in body:
             self.writes.append(("add-sub-issue", body))
@@ -150,30 +158,6 @@ class BoardRunner:
                           "id": f"F_{fname}", "name": fname, "dataType": "TEXT"})
         return nodes
 
-    def _record_written(self, body):
-        fid = None
-        for c in self.calls[-1]:
-            c = str(c)
-            if c.startswith("field=F_"):
-                fid = c.split("=", 1)[1]
-        if not fid:
-            return
-        if "singleSelectOptionId:" in body:
-            val = body.split('singleSelectOptionId:"', 1)[1].split('"', 1)[0]
-            self._written[fid] = ("optionId", val)
-        elif "text:" in body:
-            val = body.split('text:"', 1)[1].split('"', 1)[0]
-            self._written[fid] = ("text", val)
-
-    def _readback_nodes(self):
-        nodes = []
-        for fid, (kind, val) in self._written.items():
-            if kind == "optionId":
-                nodes.append({"optionId": val, "field": {"id": fid}})
-            else:
-                nodes.append({"text": val, "field": {"id": fid}})
-        return nodes
-
     def count(self, predicate):
         return sum(1 for c in self.calls if predicate(_q(c)))
 
@@ -23,13 +23,17 @@ import importlib.util
 import io
 import json
 import os
+import re
+import threading
 import unittest
-from contextlib import redirect_stdout
+import urllib.request
+from contextlib import redirect_stderr, redirect_stdout
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 PLUGIN_ROOT = os.path.dirname(os.path.dirname(HERE))
 ACTION_DIR = os.path.join(PLUGIN_ROOT, "templates", "github", "actions", "board-status")
 BOARD_STATUS_PY = os.path.join(ACTION_DIR, "board_status.py")
+BOARD_SYNC_PY = os.path.join(PLUGIN_ROOT, "templates", "github", "workflows", "board_sync.py")
 
 
 def _load_module(name, path):
@@ -64,15 +68,31 @@ class FakeDeploy:
 
     `sha_issues`: {sha: [issue_number,...]} resolved via SHA -> merged PRs.
     `item_status`: {issue_number: current Status on the project}.
+    `commits`: [(sha, [pr_number, ...])] — the compare range, oldest first;
+    `pr_issues`: {pr_number: [issue_number, ...]}; `unmerged`: open PR numbers.
+    `already_closed` / `missing` / `off_project`: issue numbers in that state.
     Records writes, closes, and release-publish REST calls.
     """
 
-    def __init__(self, *, sha_issues=None, item_status=None, existing_release=None):
+    def __init__(self, *, sha_issues=None, item_status=None, existing_release=None,
+                 commits=None, pr_issues=None, unmerged=(), already_closed=(), missing=(),
+                 off_project=()):
+        self.already_closed = set(already_closed)
+        self.missing = set(missing)
+        self.off_project = set(off_project)
+        self.reads = 0
         self.sha_issues = sha_issues or {}
+        self.commits = commits or []
+        self.pr_issues = pr_issues or {}
+        self.unmerged = set(unmerged)
+        self.compares = []   # compare pages requested
+        self.pr_lookups = []  # PR numbers whose closing issues were read
         self.item_status = item_status or {}
         self.existing_release = existing_release  # None | {"id","draft"}
         self.calls = []
         self.writes = []     # option ids written
+        self.documents = []  # aliased Status-write documents
+        self.close_documents = []  # aliased closeIssue documents
         self.closed = []     # issue ids closed
         self.released = []   # ("POST"|"PATCH", path)
 
@@ -80,6 +100,49 @@ class FakeDeploy:
         self.calls.append(list(args))
         body = _q(args)
 
+        # --- deploy range: compare pages, then aliased commit / PR lookups ---
+        compare = next((str(a) for a in args if "/compare/" in str(a)), None)
+        if compare:
+            page = int(re.search(r"[?&]page=(\d+)", compare).group(1))
+            per = int(re.search(r"per_page=(\d+)", compare).group(1))
+            self.compares.append(page)
+            return json.dumps([sha for sha, _ in self.commits[(page - 1) * per:page * per]])
+        if "object(oid:" in body and "closingIssuesReferences" not in body:
+            prs = dict(self.commits)
+            return json.dumps({"data": {"repository": {
+                alias: {"associatedPullRequests": {"nodes": [
+                    {"number": n, "merged": n not in self.unmerged} for n in prs.get(sha, [])]}}
+                for alias, sha in re.findall(r'(c\d+): object\(oid:"([^"]+)"\)', body)}}})
+        if "pullRequest(number:" in body:
+            found = re.findall(r"(p\d+): pullRequest\(number:(\d+)\)", body)
+            self.pr_lookups += [int(n) for _, n in found]
+            return json.dumps({"data": {"repository": {
+                alias: {"closingIssuesReferences": {"nodes": [
+                    {"number": i, "id": f"I_{i}"} for i in self.pr_issues.get(int(n), [])]}}
+                for alias, n in found}}})
+
+        # --- the batched deploy read: project + every issue's item/Status ---
+        if "... on Issue { id number state" in body:
+            self.reads += 1
+            data = dict(_PROJECT["data"]) if "projectV2(number:" in body else {}
+            for alias, iid in re.findall(r'(i\d+): node\(id:"([^"]+)"\)', body):
+                data[alias] = self._issue(int(iid.split("_")[-1]))
+            found = re.findall(r"(n\d+): issue\(number:(\d+)\)", body)
+            if found:
+                data["repository"] = {alias: self._issue(int(n)) for alias, n in found}
+            # A missing issue is a null alias plus a NOT_FOUND error, and gh
+            # exits non-zero with the payload on stdout.
+            errors = [{"type": "NOT_FOUND", "path": [alias], "message": "not found"}
+                      for alias, _ in re.findall(r'(i\d+): node\(id:"([^"]+)"\)', body)
+                      if data[alias] is None]
+            errors += [{"type": "NOT_FOUND", "path": ["repository", alias],
+                        "message": f"Could not resolve to an Issue with the number of {n}."}
+                       for alias, n in found if data["repository"][alias] is None]
+            if errors:
+                raise bsx.GhError("gh api graphql failed",
+                                  stdout=json.dumps({"data": data, "errors": errors}))
+            return json.dumps({"data": data})
+
         # --- SHA -> merged PRs -> closing issues ---
         if "associatedPullRequests" in body and "closingIssuesReferences" in body:
             sha = self._fval(args, "sha")
@@ -112,11 +175,27 @@ class FakeDeploy:
 
         # --- Status write ---
         if "updateProjectV2ItemFieldValue" in body:
+            batched = re.findall(r'(w\d+):updateProjectV2ItemFieldValue\(input:\{projectId:"[^"]*",'
+                                 r'itemId:"([^"]*)",fieldId:"[^"]*",'
+                                 r'value:\{singleSelectOptionId:"([^"]*)"', body)
+            if batched:
+                # One aliased document: answer each alias, echo its item.
+                self.documents.append(body)
+                data = {}
+                for alias, item, opt in batched:
+                    self.writes.append(opt)
+                    data[alias] = {"projectV2Item": {"id": item}}
+                return json.dumps({"data": data})
             opt = self._fval(args, "opt")
             self.writes.append(opt)
             return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "x"}}}})
 
-        # --- close issue ---
+        # --- close issue: one aliased document, or a single mutation ---
+        batched = re.findall(r'(w\d+):closeIssue\(input:\{issueId:"([^"]*)"', body)
+        if batched:
+            self.close_documents.append(body)
+            self.closed += [iid for _, iid in batched]
+            return json.dumps({"data": {alias: {"issue": {"id": iid}} for alias, iid in batched}})
         if "closeIssue" in body:
             iid = self._fval(args, "issue")
             self.closed.append(iid)
@@ -134,6 +213,17 @@ class FakeDeploy:
 
         return "{}"
 
+    def _issue(self, num):
+        if num in self.missing:
+            return None
+        cur = self.item_status.get(num)
+        items = [] if num in self.off_project else [
+            {"id": f"ITEM_{num}", "project": {"id": "PVT_1", "number": 7},
+             "fieldValueByName": ({"name": cur} if cur else None)}]
+        return {"id": f"I_{num}", "number": num,
+                "state": "CLOSED" if num in self.already_closed else "OPEN",
+                "projectItems": {"nodes": items}}
+
     @staticmethod
     def _fval(args, key):
         for a in args:
@@ -188,11 +278,33 @@ class TestProd(BoardStatusBase):
             self.assertEqual(r["to"], "Done")
             self.assertTrue(r["closed"])
         self.assertEqual(fake.writes.count("OPT_done"), 2)
+        self.assertEqual(len(fake.documents), 1, "both Status writes share one aliased document")
         self.assertEqual(sorted(fake.closed), ["I_5", "I_6"])
         # Release for the tag was published.
         self.assertIn("release", out)
         self.assertTrue(fake.released, "prod must publish the tag's Release")
 
+    def test_failed_status_alias_names_issue_and_skips_close(self):
+        fake = FakeDeploy(sha_issues={"cafef00d": [5, 6]},
+                          item_status={5: "On Staging", 6: "On Staging"})
+
+        def runner(args):
+            out = fake(args)
+            if "w1:updateProjectV2ItemFieldValue" in " ".join(str(a) for a in args):
+                d = json.loads(out)
+                d["data"]["w1"] = None
+                d["errors"] = [{"path": ["w1"], "message": "item is archived"}]
+                # gh exits non-zero on `errors`; the payload rides on stdout.
+                raise bsx.GhError("gh api graphql failed", stdout=json.dumps(d))
+            return out
+
+        bsx.RUN = runner
+        with self.assertRaises(bsx.GhError) as ctx:
+            bsx.run_prod("acme", "web", 7, "cafef00d", token="ghs_tok")
+        self.assertIn("#6", str(ctx.exception))
+        self.assertIn("item is archived", str(ctx.exception))
+        self.assertEqual(fake.closed, [], "no issue closes while a Status write failed")
+
     def test_prod_resolves_shipped_issues_from_sha(self):
         # The shipped set comes from the DEPLOYED SHA -> merged PRs -> issues.
         fake = FakeDeploy(sha_issues={"sha123": [11]}, item_status={11: "On Staging"})
@@ -209,6 +321,269 @@ class TestProd(BoardStatusBase):
         self.assertIn(("PATCH", "release"), fake.released)
 
 
+# --------------------------------------------------------------------------- #
+# deploy range: every PR merged since the last deploy, in batched reads.
+# --------------------------------------------------------------------------- #
+def release_train(prs=40, commits_per_pr=6):
+    """A merge-commit train: each PR's commits, then its merge commit."""
+    commits, pr_issues = [], {}
+    for p in range(1, prs + 1):
+        pr = 100 + p
+        commits += [(f"s{p}_{c}", [pr]) for c in range(commits_per_pr)]
+        commits.append((f"m{p}", [pr]))
+        pr_issues[pr] = [p, p + 1]  # neighbours share an issue
+    return commits, pr_issues
+
+
+class TestDeployRange(BoardStatusBase):
+    def test_range_resolves_every_pr_once_in_a_handful_of_reads(self):
+        commits, pr_issues = release_train()
+        fake = FakeDeploy(commits=commits, pr_issues=pr_issues)
+        bsx.RUN = fake
+        issues = bsx.resolve_range_issues("acme", "web", "base", "head", token="ghs_tok")
+        self.assertEqual([i["number"] for i in issues], list(range(1, 42)))
+        self.assertEqual(len(commits), 280)
+        self.assertEqual(fake.compares, [1, 2, 3])
+        self.assertEqual(sorted(fake.pr_lookups), sorted(pr_issues), "each PR read once")
+        # 3 compare pages + 6 commit documents + 3 PR documents.
+        self.assertEqual(len(fake.calls), 12)
+
+    def test_unmerged_prs_ship_nothing(self):
+        fake = FakeDeploy(commits=[("a", [1]), ("b", [2])], pr_issues={1: [5], 2: [6]},
+                          unmerged={2})
+        bsx.RUN = fake
+        issues = bsx.resolve_range_issues("acme", "web", "base", "head")
+        self.assertEqual([i["number"] for i in issues], [5])
+
+    def test_prod_range_writes_the_whole_train(self):
+        commits, pr_issues = release_train(prs=10, commits_per_pr=2)
+        fake = FakeDeploy(commits=commits, pr_issues=pr_issues,
+                          item_status={n: "On Staging" for n in range(1, 12)})
+        bsx.RUN = fake
+        out = bsx.run_prod("acme", "web", 7, "head", tag="v3", token="ghs_tok",
+                           from_sha="base")
+        self.assertEqual((out["sha"], out["from_sha"]), ("head", "base"))
+        self.assertEqual(len(out["issues"]), 11)
+        self.assertEqual(fake.writes.count("OPT_done"), 11)
+        self.assertEqual(len(fake.documents), 1)
+
+    def test_cli_range(self):
+        fake = FakeDeploy(commits=[("a", [1])], pr_issues={1: [5]}, item_status={5: "In Review"})
+        bsx.RUN = fake
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = bsx.main(["--repo", "acme/web", "--project", "7", "--status", "staging",
+                             "--from-sha", "base", "--to-sha", "head", "--app-token", "ghs_tok"])
+        self.assertEqual(code, 0)
+        self.assertEqual([r["issue"] for r in json.loads(out.getvalue())["issues"]], [5])
+        with redirect_stdout(io.StringIO()):
+            code = bsx.main(["--repo", "acme/web", "--project", "7", "--status", "staging",
+                             "--from-sha", "base"])
+        self.assertEqual(code, 2, "a range needs its end")
+
+
+# --------------------------------------------------------------------------- #
+# batched pipeline: one read, the guard in memory, aliased writes + closes.
+# --------------------------------------------------------------------------- #
+class TestBatchedPipeline(BoardStatusBase):
+    def test_sixty_issue_release_is_a_handful_of_round_trips(self):
+        nums = list(range(1, 61))
+        fake = FakeDeploy(sha_issues={"rel": nums},
+                          item_status={n: ("Done" if n % 10 == 0 else "On Staging") for n in nums})
+        bsx.RUN = fake
+        out = bsx.run_prod("acme", "web", 7, "rel", tag="v4", token="ghs_tok")
+        self.assertEqual([r["issue"] for r in out["issues"]], nums)
+        self.assertEqual(sum(r["wrote"] for r in out["issues"]), 54)
+        self.assertEqual(fake.reads, 1, "project + all 60 issues in one read")
+        self.assertEqual((len(fake.documents), len(fake.close_documents)), (2, 2))
+        self.assertEqual(len(fake.closed), 60)
+        # sha read + deploy read + 2 write docs + 2 close docs + release GET/POST
+        self.assertEqual(len(fake.calls), 8)
+
+    def test_per_issue_results_and_states(self):
+        fake = FakeDeploy(item_status={1: "On Staging", 2: "On Staging", 3: "Done"},
+                          already_closed={3}, off_project={2})
+        bsx.RUN = fake
+        out = bsx.run_prod("acme", "web", 7, "", token="ghs_tok", explicit_issues=[3, 2, 1])
+        self.assertEqual(out["issues"], [
+            {"issue": 3, "from": "Done", "to": "Done", "wrote": False, "closed": True},
+            {"issue": 2, "skipped": "not-on-project"},
+            {"issue": 1, "from": "On Staging", "to": "Done", "wrote": True, "closed": True},
+        ])
+        self.assertEqual(fake.closed, ["I_1"], "an already-closed issue needs no close")
+
+    def test_missing_issue_fails_before_any_write(self):
+        fake = FakeDeploy(item_status={1: "On Staging"}, missing={9})
+        bsx.RUN = fake
+        with self.assertRaises(bsx.GhError) as ctx:
+            bsx.run_prod("acme", "web", 7, "", token="ghs_tok", explicit_issues=[1, 9])
+        self.assertEqual(ctx.exception.code, 3)
+        self.assertIn("#9", str(ctx.exception))
+        self.assertEqual((fake.writes, fake.closed), ([], []))
+
+    def test_read_failure_other_than_not_found_is_raised(self):
+        fake = FakeDeploy(item_status={1: "On Staging"})
+
+        def runner(args):
+            if "... on Issue { id number state" in _q(args):
+                raise bsx.GhError("gh api graphql failed", stdout=json.dumps(
+                    {"data": None, "errors": [{"type": "FORBIDDEN", "message": "no access"}]}))
+            return fake(args)
+
+        bsx.RUN = runner
+        with self.assertRaises(bsx.GhError) as ctx:
+            bsx.run_prod("acme", "web", 7, "", token="ghs_tok", explicit_issues=[1])
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertEqual(fake.writes, [])
+
+    def _locked(self, fake):
+        def runner(args):
+            out = fake(args)
+            if "w0:closeIssue" in _q(args):
+                d = json.loads(out)
+                d["data"]["w0"] = None
+                d["errors"] = [{"type": "FORBIDDEN", "path": ["w0"], "message": "locked"}]
+                # gh exits non-zero on `errors`; the payload rides on stdout.
+                raise bsx.GhError("gh api graphql failed", stdout=json.dumps(d))
+            return out
+        return runner
+
+    def test_failed_close_is_reported_on_its_issue(self):
+        fake = FakeDeploy(sha_issues={"s": [5, 6]}, item_status={5: "On Staging", 6: "On Staging"})
+        bsx.RUN = self._locked(fake)
+        out = bsx.run_prod("acme", "web", 7, "s", tag="v5", token="ghs_tok")
+        rows = {r["issue"]: r for r in out["issues"]}
+        self.assertEqual((rows[5]["closed"], rows[5]["error"]), (False, "close failed: locked"))
+        self.assertEqual((rows[6]["closed"], "error" in rows[6]), (True, False))
+        self.assertEqual((out["failed"], fake.closed), ([5], ["I_5", "I_6"]))
+        self.assertTrue(fake.released, "the Release still goes out")
+
+    def test_cli_prints_the_report_and_fails_on_a_failed_close(self):
+        fake = FakeDeploy(sha_issues={"s": [5, 6]}, item_status={5: "On Staging", 6: "On Staging"})
+        bsx.RUN = self._locked(fake)
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = bsx.main(["--repo", "acme/web", "--project", "7", "--status", "prod",
+                             "--sha", "s", "--tag", "v5", "--app-token", "ghs_tok"])
+        self.assertEqual(code, 1)
+        self.assertEqual([r["closed"] for r in json.loads(out.getvalue())["issues"]],
+                         [False, True])
+        self.assertIn("#5", err.getvalue())
+
+
+# --------------------------------------------------------------------------- #
+# long-lived worker: a burst of deploys coalesced into batched advances.
+# --------------------------------------------------------------------------- #
+def _deploy(status, sha, **kw):
+    return ("deploy", dict(status=status, sha=sha, **kw))
+
+
+def _deployment_status(env, sha, state="success", ref="refs/tags/v9", **extra):
+    return ("deployment_status", {"deployment_status": {"state": state},
+                                  "deployment": {"environment": env, "sha": sha,
+                                                 "ref": ref, "payload": extra}})
+
+
+class TestWorker(BoardStatusBase):
+    def test_burst_resolves_each_sha_once_and_moves_each_issue_once(self):
+        fake = FakeDeploy(sha_issues={"a": [5, 6], "b": [6, 7]},
+                          item_status={5: "In Review", 6: "In Review", 7: "On Staging"})
+        bsx.RUN = fake
+        worker = bsx.Worker("acme", "web", 7, token="ghs_tok")
+        results = worker.handle([_deploy("staging", "a"), _deploy("prod", "b", tag="v1"),
+                                 _deploy("staging", "a")])
+        rows = {r["issue"]: (r["target"], r["to"], r["closed"]) for r in results if "issue" in r}
+        self.assertEqual(rows, {5: ("On Staging", "On Staging", False),
+                                6: ("Done", "Done", True), 7: ("Done", "Done", True)})
+        sha_reads = [c for c in fake.calls if "associatedPullRequests" in _q(c)]
+        self.assertEqual(len(sha_reads), 2, "the repeated staging SHA is resolved once")
+        self.assertEqual((fake.reads, len(fake.documents)), (2, 2))
+        self.assertEqual(sorted(fake.closed), ["I_6", "I_7"])
+        self.assertEqual(len(fake.released), 1)
+
+    def test_deployment_status_webhooks_and_skips(self):
+        fake = FakeDeploy(sha_issues={"s": [5]}, item_status={5: "In Review"})
+        bsx.RUN = fake
+        worker = bsx.Worker("acme", "web", 7, token="ghs_tok")
+        results = worker.handle([
+            _deployment_status("staging", "s"),
+            _deployment_status("staging", "s", state="failure"),
+            _deployment_status("preview", "s"),
+            _deploy("prod", "s"),
+            ("push", {}),
+        ])
+        self.assertEqual([r.get("skipped") for r in results[:4]],
+                         ["event-ignored", "event-ignored", "prod-needs-tag", "event-ignored"])
+        self.assertEqual((results[4]["issue"], results[4]["to"]), (5, "On Staging"))
+
+    def test_untagged_prod_deployment_moves_issues_but_publishes_nothing(self):
+        fake = FakeDeploy(sha_issues={"s": [5]}, item_status={5: "On Staging"})
+        bsx.RUN = fake
+        results = bsx.Worker("acme", "web", 7, token="ghs_tok").handle(
+            [_deployment_status("production", "s", ref="main")])
+        self.assertEqual(results[0], {"release": None, "skipped": "no-tag", "sha": "s"})
+        self.assertEqual((results[1]["to"], results[1]["closed"]), ("Done", True))
+        self.assertEqual(fake.released, [])
+
+    def test_failed_write_keeps_the_bursts_earlier_results(self):
+        fake = FakeDeploy(sha_issues={"a": [5], "b": [6]},
+                          item_status={5: "In Review", 6: "On Staging"})
+
+        def runner(args):
+            if "updateProjectV2ItemFieldValue" in _q(args) and fake.documents:
+                raise bsx.GhError("gh api graphql failed: item is archived")
+            return fake(args)
+
+        bsx.RUN = runner
+        lines = [json.dumps({"event": n, "payload": p}) for n, p in
+                 (_deploy("staging", "a"), _deploy("prod", "b", tag="v1"))]
+        out = io.StringIO()
+        bsx.run_stream(bsx.Worker("acme", "web", 7), io.StringIO("\n".join(lines) + "\n"),
+                       out, window=5)
+        burst = json.loads(out.getvalue())
+        self.assertEqual([(r["issue"], r["to"]) for r in burst["results"]],
+                         [(5, "On Staging")])
+        self.assertEqual(burst["code"], 1)
+        self.assertIn("#6", burst["error"])
+        self.assertEqual((fake.closed, fake.released), ([], []))
+
+    def test_stdin_stream_and_http_endpoint(self):
+        fake = FakeDeploy(sha_issues={"s": [5]}, item_status={5: "In Review"})
+        bsx.RUN = fake
+        out = io.StringIO()
+        line = json.dumps({"event": "deploy", "payload": {"status": "staging", "sha": "s"}})
+        bsx.run_stream(bsx.Worker("acme", "web", 7), io.StringIO(line + "\n"), out, window=5)
+        self.assertEqual(json.loads(out.getvalue())["results"][0]["to"], "On Staging")
+
+        out = io.StringIO()
+        server = bsx.WorkerServer(bsx.Worker("acme", "web", 7), port=0, window=5, out=out)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        name, payload = _deployment_status("production", "s")
+        req = urllib.request.Request(f"http://127.0.0.1:{server.server_address[1]}/",
+                                     data=json.dumps(payload).encode(), method="POST",
+                                     headers={"X-GitHub-Event": name})
+        try:
+            with urllib.request.urlopen(req) as resp:
+                self.assertEqual(resp.status, 202)
+        finally:
+            server.shutdown()
+            server.close()
+        results = json.loads(out.getvalue())["results"]
+        self.assertEqual((results[0]["to"], results[0]["closed"]), ("Done", True))
+        self.assertEqual(results[1]["release"], "v9")
+
+    def test_worker_transport_matches_board_sync(self):
+        # Both scripts are vendored separately; their worker transport is one
+        # copied block and must not drift.
+        def block(path):
+            with open(path, encoding="utf-8") as fh:
+                src = fh.read()
+            start = src.index("# Transport: one JSON event per line")
+            return src[start:src.index("self._drainer.join()\n", start)]
+
+        self.assertEqual(block(BOARD_SYNC_PY), block(BOARD_STATUS_PY))
+
+
 # --------------------------------------------------------------------------- #
 # a replayed/stale deploy event does NOT regress Status.
 # --------------------------------------------------------------------------- #
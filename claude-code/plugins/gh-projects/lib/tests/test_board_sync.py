@@ -17,11 +17,20 @@ Coverage:
 """
 from __future__ import annotations
 
+import hashlib
+import hmac
+import http.client
 import importlib.util
+import io
 import json
 import os
 import sys
+import tempfile
+import threading
 import unittest
+import urllib.error
+import urllib.request
+from contextlib import redirect_stderr, redirect_stdout
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 PLUGIN_ROOT = os.path.dirname(os.path.dirname(HERE))
@@ -65,12 +74,23 @@ class FakeBoard:
 
     `linked_branches`: {branch_name: issue_number} — the authoritative link.
     `item_status`: {issue_number: current Status name on the project}.
+    `recent`: issue numbers a link-index delta returns (updated since a sync);
+    `closed`: issue numbers that are closed; `page_size` pages the index build.
     Records every updateProjectV2ItemFieldValue write so tests assert on it.
     """
 
-    def __init__(self, *, linked_branches=None, item_status=None):
+    def __init__(self, *, linked_branches=None, item_status=None, off_project=(),
+                 missing=(), project_found=True, recent=(), closed=(), page_size=100):
         self.linked_branches = linked_branches or {}
+        self.recent = set(recent)
+        self.closed = set(closed)
+        self.page_size = page_size
+        self.index_reads = 0
         self.item_status = item_status or {}
+        self.off_project = set(off_project)
+        self.missing = set(missing)
+        self.project_found = project_found
+        self.reads = 0
         self.calls = []
         self.writes = []  # (issue_number_guess, option_id)
         self.saw_github_token_env = False
@@ -89,16 +109,34 @@ class FakeBoard:
             self.writes.append(opt)
             return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "ITEM_x"}}}})
 
-        # --- linked-branch lookup (issue.linkedBranches) ---
-        if "linkedBranches(first:10)" in body:
-            name = self._fval(args, "name")
-            nodes = []
-            for branch, issue_num in self.linked_branches.items():
-                nodes.append({
-                    "number": issue_num, "id": f"I_{issue_num}",
-                    "linkedBranches": {"nodes": [{"ref": {"name": branch}}]},
-                })
-            return json.dumps({"data": {"repository": {"issues": {"nodes": nodes}}}})
+        # --- the combined event read (link + item/Status + Status field) ---
+        if "fragment EventIssue" in body:
+            self.reads += 1
+            repo = {}
+            for alias, flag, var in (("linked", "byLinked", "linked"),
+                                     ("issue", "byNumber", "number")):
+                if self._fval(args, flag) == "true":
+                    num = int(self._fval(args, var))
+                    repo[alias] = None if num in self.missing else self._node(num)
+            data = {"repository": repo}
+            if self.project_found:
+                data.update(_PROJECT["data"])
+            return json.dumps({"data": data})
+
+        # --- link-index build (open issues, paged) / delta (updated since) ---
+        if "fragment LinkIssue" in body:
+            self.index_reads += 1
+            if "filterBy:{since" in body:
+                nums, more = sorted(self.recent), None
+            else:
+                opened = sorted({n for n in self.linked_branches.values()} - self.closed)
+                at = int(self._fval(args, "cursor") or 0)
+                nums = opened[at:at + self.page_size]
+                more = at + self.page_size if at + self.page_size < len(opened) else None
+            return json.dumps({"data": {"repository": {"issues": {
+                "pageInfo": {"hasNextPage": more is not None,
+                             "endCursor": str(more) if more else None},
+                "nodes": [self._node(n) for n in nums]}}}})
 
         # --- project + Status field resolve ---
         if 'field(name:"Status")' in body and "projectV2(number:" in body:
@@ -121,6 +159,18 @@ class FakeBoard:
 
         return "{}"
 
+    def _issue(self, num):
+        cur = self.item_status.get(num)
+        items = [] if num in self.off_project else [
+            {"id": f"ITEM_{num}", "project": {"id": "PVT_1", "number": 7},
+             "fieldValueByName": ({"name": cur} if cur else None)}]
+        return {"number": num, "id": f"I_{num}", "projectItems": {"nodes": items}}
+
+    def _node(self, num):
+        branches = [b for b, n in self.linked_branches.items() if n == num]
+        return dict(self._issue(num), state="CLOSED" if num in self.closed else "OPEN",
+                    linkedBranches={"nodes": [{"ref": {"name": b}} for b in branches]})
+
     @staticmethod
     def _fval(args, key):
         for a in args:
@@ -255,6 +305,320 @@ class TestMonotonic(BoardSyncBase):
         self.assertEqual(bs.advance_status("Done", "In Progress", reopen=True), "In Progress")
 
 
+# --------------------------------------------------------------------------- #
+# one combined read per event, plus at most one write.
+# --------------------------------------------------------------------------- #
+class TestSingleRead(BoardSyncBase):
+    def _push(self, board, branch="refs/heads/feature/login"):
+        bs.RUN = board
+        links = bs.LinkIndex("acme", "web", token="ghs_tok")
+        links.ensure()  # a warm (persisted) index, as the workflow restores it
+        board.calls.clear()
+        board.index_reads = 0
+        return bs.apply_event("acme", "web", 7, event_name="push", action=None,
+                              branch=branch, draft=False, links=links, token="ghs_tok")
+
+    def test_hot_push_is_one_read_and_one_write(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Ready"})
+        out = self._push(board)
+        self.assertTrue(out["wrote"])
+        self.assertEqual((board.reads, len(board.writes), len(board.calls)), (1, 1, 2))
+
+    def test_branch_name_fallback_rides_the_same_read(self):
+        board = FakeBoard(item_status={123: "Ready"})
+        out = self._push(board, "refs/heads/123-foo")
+        self.assertEqual((out["issue"], out["via"]), (123, "branch-name"))
+        # An unindexed branch costs one lean index sync before the event read.
+        self.assertEqual((board.index_reads, board.reads, len(board.calls)), (1, 1, 3))
+
+    def test_stale_event_is_one_read_and_no_write(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Done"})
+        self.assertFalse(self._push(board)["wrote"])
+        self.assertEqual(len(board.calls), 1)
+
+    def test_not_on_project_and_no_link(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, off_project={42})
+        self.assertEqual(self._push(board)["skipped"], "not-on-project")
+        board = FakeBoard()
+        self.assertEqual(self._push(board, "refs/heads/just-words")["skipped"], "no-issue-link")
+        self.assertEqual((board.index_reads, board.reads), (1, 1))
+
+    def test_missing_issue_and_project_are_not_found(self):
+        for board in (FakeBoard(missing={123}), FakeBoard(project_found=False)):
+            with self.assertRaises(bs.GhError) as ctx:
+                self._push(board, "refs/heads/123-foo")
+            self.assertEqual(ctx.exception.code, 3)
+
+
+# --------------------------------------------------------------------------- #
+# the linked-branch index: exact at any repo size, synced on a miss.
+# --------------------------------------------------------------------------- #
+class Clock:
+    def __init__(self, now=1_800_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestLinkIndex(BoardSyncBase):
+    def setUp(self):
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "links.json")
+        self.clock = Clock()
+
+    def _links(self):
+        return bs.LinkIndex("acme", "web", self.path, token="ghs_tok", clock=self.clock)
+
+    def _push(self, board, branch, links=None):
+        bs.RUN = board
+        return bs.apply_event("acme", "web", 7, event_name="push", action=None,
+                              branch=branch, draft=False, links=links or self._links(),
+                              token="ghs_tok")
+
+    def test_link_past_the_first_page_of_issues_is_found(self):
+        # 250 linked issues: the oldest is far outside any fixed-size window.
+        linked = {f"feat/{n}": n for n in range(1, 251)}
+        board = FakeBoard(linked_branches=linked, item_status={1: "Ready"})
+        out = self._push(board, "refs/heads/feat/1")
+        self.assertEqual((out["issue"], out["via"], out["wrote"]), (1, "linked-branch", True))
+        self.assertEqual(board.index_reads, 3, "the build pages every open issue")
+
+    def test_persisted_index_makes_the_next_event_one_read(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Ready"})
+        self._push(board, "feature/login")
+        with open(self.path, encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["branches"], {"feature/login": 42})
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "In Progress"})
+        out = self._push(board, "feature/login")
+        self.assertEqual((out["issue"], out["wrote"]), (42, False))
+        self.assertEqual((board.index_reads, len(board.calls)), (0, 1))
+
+    def test_unknown_branch_syncs_the_index_before_the_read(self):
+        board = FakeBoard(linked_branches={"feature/login": 42})
+        bs.RUN = board
+        links = self._links()
+        links.ensure()
+        links.save()
+        board.calls.clear()
+        board.index_reads = 0
+        board.linked_branches["fix/typo"] = 77
+        board.recent = {77}
+        board.item_status[77] = "Ready"
+        out = self._push(board, "fix/typo", links)
+        self.assertEqual((out["issue"], out["via"], out["wrote"]), (77, "linked-branch", True))
+        self.assertEqual((board.index_reads, board.reads, len(board.calls)), (1, 1, 3))
+        self.assertEqual(self._links().get("fix/typo"), 77)
+
+    def test_event_read_carries_no_issue_scan(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Ready"})
+        self._push(board, "feature/login")
+        event = [c for c in board.calls if "fragment EventIssue" in _q(c)]
+        self.assertEqual(len(event), 1)
+        self.assertNotIn("issues(first:", _q(event[0]))
+
+    def test_stale_entry_is_verified_and_dropped(self):
+        board = FakeBoard(linked_branches={"feature/login": 42})
+        bs.RUN = board
+        links = self._links()
+        links.ensure()
+        del board.linked_branches["feature/login"]  # unlinked, delta missed it
+        out = self._push(board, "feature/login", links)
+        self.assertEqual(out["skipped"], "no-issue-link")
+        self.assertIsNone(links.get("feature/login"))
+        # A closed issue's branches leave the index through the delta.
+        board = FakeBoard(linked_branches={"feature/x": 5}, closed={5}, recent={5})
+        bs.RUN = board
+        links = bs.LinkIndex("acme", "web", clock=self.clock)
+        links.branches, links.built_at, links.synced_at = {"feature/x": 5}, self.clock(), self.clock()
+        self.assertFalse(links.refresh())
+        self.assertEqual(links.branches, {})
+
+    def test_old_or_foreign_index_is_rebuilt(self):
+        board = FakeBoard(linked_branches={"feature/login": 42})
+        bs.RUN = board
+        links = self._links()
+        self.assertTrue(links.refresh())
+        links.save()
+        self.assertFalse(self._links().refresh())
+        self.clock.now += bs.LINK_INDEX_MAX_AGE + 1
+        self.assertTrue(self._links().refresh())
+        other = bs.LinkIndex("acme", "api", self.path, clock=self.clock)
+        self.assertIsNone(other.built_at)
+
+    def test_refresh_links_cli(self):
+        bs.RUN = FakeBoard(linked_branches={"a": 1, "b": 2})
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = bs.main(["--repo", "acme/web", "--project", "7", "--refresh-links",
+                            "--link-index", self.path])
+        self.assertEqual((code, json.loads(out.getvalue())), (0, {"links": 2, "rebuilt": True}))
+        with open(self.path, encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["branches"], {"a": 1, "b": 2})
+
+
+# --------------------------------------------------------------------------- #
+# long-lived worker: warm state, bursts coalesced per issue, same guard.
+# --------------------------------------------------------------------------- #
+def _push_event(branch, default="main"):
+    return ("push", {"ref": f"refs/heads/{branch}", "repository": {"default_branch": default}})
+
+
+def _pr_event(branch, action="opened", draft=False):
+    return ("pull_request", {"action": action,
+                             "pull_request": {"head": {"ref": branch}, "draft": draft}})
+
+
+class TestWorker(BoardSyncBase):
+    def _worker(self, board, **kw):
+        bs.RUN = board
+        return bs.Worker("acme", "web", 7, token="ghs_tok", **kw)
+
+    def test_burst_is_one_read_per_branch_and_one_write_per_issue(self):
+        board = FakeBoard(linked_branches={"feature/login": 42, "feature/login-2": 42},
+                          item_status={42: "Ready"})
+        worker = self._worker(board)
+        worker.links.ensure()
+        burst = [_push_event("feature/login")] * 3 + [
+            _pr_event("feature/login"), _push_event("feature/login-2")]
+        results = worker.handle(burst)
+        self.assertEqual(results, [{"issue": 42, "from": "Ready", "to": "In Review",
+                                    "wrote": True, "via": "linked-branch",
+                                    "target": "In Review", "events": 5}])
+        self.assertEqual((board.reads, board.writes), (2, ["OPT_inreview"]))
+        # The next burst is warm: no index rebuild, and the guard still holds.
+        board.item_status[42] = "In Review"
+        index_reads = board.index_reads
+        self.assertFalse(worker.handle([_push_event("feature/login")])[0]["wrote"])
+        self.assertEqual(board.index_reads, index_reads)
+
+    def test_skips_mirror_the_workflow_filters(self):
+        worker = self._worker(FakeBoard())
+        results = worker.handle([_push_event("main"), _pr_event("x", action="closed"),
+                                 ("issues", {"action": "labeled"}),
+                                 _push_event("just-words")])
+        self.assertEqual([r["skipped"] for r in results],
+                         ["default-branch", "event-ignored", "event-ignored", "no-issue-link"])
+
+    def test_one_bad_branch_does_not_fail_the_burst(self):
+        board = FakeBoard(item_status={5: "Ready"}, missing={9})
+        worker = self._worker(board)
+        results = worker.handle([_push_event("9-gone"), _push_event("5-real")])
+        self.assertEqual((results[0]["code"], results[1]["issue"]), (3, 5))
+
+    def test_token_file_is_reread_when_it_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "token")
+            with open(path, "w") as fh:
+                fh.write("ghs_first\n")
+            worker = self._worker(FakeBoard(), token_file=path)
+            self.assertEqual(worker.token, "ghs_first")
+            with open(path, "w") as fh:
+                fh.write("ghs_second")
+            os.utime(path, (1, 1))
+            self.assertEqual((worker.token, worker.links.token), ("ghs_second", "ghs_second"))
+
+    def test_stdin_stream(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Ready"})
+        worker = self._worker(board)
+        lines = [json.dumps({"event": n, "payload": p}) for n, p in
+                 (_push_event("feature/login"), _pr_event("feature/login", draft=True))]
+        out = io.StringIO()
+        with redirect_stderr(io.StringIO()):
+            bs.run_stream(worker, io.StringIO("\n".join(lines + ["not json"]) + "\n"), out,
+                          window=5)
+        burst = json.loads(out.getvalue())
+        self.assertEqual(burst["events"], 2)
+        self.assertEqual([(r["issue"], r["to"], r["events"]) for r in burst["results"]],
+                         [(42, "In Progress", 2)])
+
+    def test_http_endpoint_verifies_and_feeds_the_worker(self):
+        board = FakeBoard(linked_branches={"feature/login": 42}, item_status={42: "Ready"})
+        out = io.StringIO()
+        server = bs.WorkerServer(self._worker(board), port=0, secret="s3cret", window=5, out=out)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        def post(name, payload, secret="s3cret"):
+            body = json.dumps(payload).encode()
+            sig = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            req = urllib.request.Request(url, data=body, method="POST", headers={
+                "X-GitHub-Event": name, "X-Hub-Signature-256": sig})
+            try:
+                with urllib.request.urlopen(req) as resp:
+                    return resp.status
+            except urllib.error.HTTPError as e:
+                return e.code
+
+        try:
+            self.assertEqual(post(*_push_event("feature/login"), secret="wrong"), 401)
+            self.assertEqual(post(*_push_event("feature/login")), 202)
+            self.assertEqual(post(*_pr_event("feature/login")), 202)
+        finally:
+            server.shutdown()
+            server.close()
+        results = [r for line in out.getvalue().splitlines()
+                   for r in json.loads(line)["results"]]
+        self.assertEqual([(r["issue"], r["to"]) for r in results if r["wrote"]],
+                         [(42, "In Review")])
+
+    def test_http_endpoint_answers_a_bad_length_unread(self):
+        server = bs.WorkerServer(self._worker(FakeBoard()), port=0, window=5, out=io.StringIO())
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        def post(length):
+            conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+            try:
+                conn.putrequest("POST", "/")
+                conn.putheader("Content-Length", length)
+                conn.endheaders()  # no body is ever sent
+                return conn.getresponse().status
+            finally:
+                conn.close()
+
+        try:
+            self.assertEqual(post("lots"), 400)
+            self.assertEqual(post("-1"), 400)
+            self.assertEqual(post(str(bs.MAX_BODY + 1)), 413)
+        finally:
+            server.shutdown()
+            server.close()
+
+    def test_serving_off_loopback_needs_a_secret(self):
+        with self.assertRaises(ValueError):
+            bs.WorkerServer(self._worker(FakeBoard()), host="0.0.0.0", port=0)
+        prev = os.environ.pop("BOARD_SYNC_WEBHOOK_SECRET", None)
+        self.addCleanup(lambda: prev is None or os.environ.update(BOARD_SYNC_WEBHOOK_SECRET=prev))
+        with redirect_stderr(io.StringIO()) as err:
+            code = bs.main(["--repo", "acme/web", "--project", "7", "--serve", "0",
+                            "--host", "0.0.0.0"])
+        self.assertEqual(code, 2)
+        self.assertIn("secret", err.getvalue())
+
+    def test_failed_write_keeps_the_bursts_earlier_results(self):
+        board = FakeBoard(linked_branches={"feat/a": 1, "feat/b": 2},
+                          item_status={1: "Ready", 2: "Ready"})
+
+        def runner(args):
+            if "updateProjectV2ItemFieldValue" in _q(args) and board.writes:
+                raise bs.GhError("gh api graphql failed: item is archived")
+            return board(args)
+
+        worker = self._worker(board)
+        bs.RUN = runner
+        lines = [json.dumps({"event": n, "payload": p}) for n, p in
+                 (_push_event("feat/a"), _push_event("feat/b"))]
+        out = io.StringIO()
+        bs.run_stream(worker, io.StringIO("\n".join(lines) + "\n"), out, window=5)
+        burst = json.loads(out.getvalue())
+        self.assertEqual([(r["issue"], r["wrote"]) for r in burst["results"]], [(1, True)])
+        self.assertEqual((burst["code"], board.writes), (1, ["OPT_inprog"]))
+        self.assertIn("item is archived", burst["error"])
+
+
 # --------------------------------------------------------------------------- #
 # boundary greps over the SOURCE — no `Closes #N` dependence.
 # --------------------------------------------------------------------------- #
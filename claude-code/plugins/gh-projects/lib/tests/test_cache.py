@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Offline tests for lib/cache.py — NO network; a temp dir stands in for ~/.cache.
+
+Covers the file contract (0600 entries, atomic store, expiry, corrupt = miss,
+scoped clear) and revalidation: a cold read pages the full query once; a warm
+read pages only the stamps probe and re-reads just the changed/new items by id,
+dropping items that left the board — and `analysis.load_board` returns the same
+snapshot either way.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.dirname(HERE)
+sys.path.insert(0, LIB)
+
+import analysis  # noqa: E402
+import cache  # noqa: E402
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class CacheTestBase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._tmp.name, "gh-projects")
+        self.clock = Clock()
+        self.cache = cache.SnapshotCache(self.root, max_age=3600, clock=self.clock)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class TestEntryFiles(CacheTestBase):
+    def test_store_load_round_trip_is_private(self):
+        self.cache.store("board", "acme", 7, "Q", {"items": {"a": ["s", {"id": "a"}]}})
+        path = self.cache.path("board", "acme", 7, "Q")
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(self.root).st_mode), 0o700)
+        self.assertEqual(self.cache.load("board", "acme", 7, "Q")["items"],
+                         {"a": ["s", {"id": "a"}]})
+        self.assertEqual([n for n in os.listdir(self.root) if n.startswith(".tmp-")], [])
+
+    def test_query_shape_is_part_of_the_key(self):
+        self.cache.store("board", "acme", 7, "Q1", {"items": {}})
+        self.assertIsNone(self.cache.load("board", "acme", 7, "Q2"))
+
+    def test_expired_and_corrupt_entries_are_misses(self):
+        self.cache.store("board", "acme", 7, "Q", {"items": {}})
+        self.clock.now += 3601
+        self.assertIsNone(self.cache.load("board", "acme", 7, "Q"))
+        with open(self.cache.path("board", "acme", 8, "Q"), "w") as fh:
+            fh.write("{not json")
+        self.assertIsNone(self.cache.load("board", "acme", 8, "Q"))
+
+    def test_clear_scopes_to_board(self):
+        self.cache.store("board", "my-org", 7, "Q", {"items": {}})
+        self.cache.store("board", "my-org", 8, "Q", {"items": {}})
+        self.cache.store("board", "other", 7, "Q", {"items": {}})
+        self.assertEqual(self.cache.clear("my-org", 7), 1)
+        self.assertEqual(self.cache.clear("my-org"), 1)
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertEqual(os.listdir(self.root), [])
+
+    def test_env_switch(self):
+        saved = os.environ.get(cache.CACHE_ENV)
+        try:
+            os.environ[cache.CACHE_ENV] = "off"
+            self.assertIsNone(cache.SnapshotCache.default())
+            os.environ[cache.CACHE_ENV] = "on"
+            self.assertIsInstance(cache.SnapshotCache.default(), cache.SnapshotCache)
+        finally:
+            os.environ[cache.CACHE_ENV] = saved if saved is not None else "off"
+
+    def test_cli_clear(self):
+        saved = os.environ.get(cache.CACHE_DIR_ENV)
+        os.environ[cache.CACHE_DIR_ENV] = self.root
+        try:
+            self.cache.store("board", "acme", 7, "Q", {"items": {}})
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(cache.main(["clear", "--owner", "acme"]), 0)
+            self.assertEqual(json.loads(out.getvalue()), {"removed": 1})
+            self.assertEqual(cache.main(["clear", "--number", "7"]), 2)
+        finally:
+            if saved is None:
+                os.environ.pop(cache.CACHE_DIR_ENV, None)
+            else:
+                os.environ[cache.CACHE_DIR_ENV] = saved
+
+
+# --------------------------------------------------------------------------- #
+# Revalidation through analysis.load_board over a fake board.
+# --------------------------------------------------------------------------- #
+class FakeBoard:
+    """Serves the full items query, the stamps probe and `nodes(ids:)` — the
+    latter both as the item re-read ("nodes") and the body read ("bodies")."""
+
+    def __init__(self, issues):
+        self.issues = issues  # {item_id: {"number", "stamp", "status"}}
+        self.calls = []
+
+    def node(self, item_id, with_body=False):
+        it = self.issues[item_id]
+        content = {"__typename": "Issue", "number": it["number"], "updatedAt": it["stamp"],
+                   "assignees": {"nodes": []}, "blockedBy": {"blockedBy": []}}
+        if with_body:
+            content["body"] = it.get("body", "")
+        return {"id": item_id, "updatedAt": it["stamp"], "content": content,
+                "status": {"name": it["status"]}}
+
+    def __call__(self, args):
+        body = " ".join(str(a) for a in args)
+        if "nodes(ids:" in body:
+            with_body = " body" in body
+            self.calls.append("bodies" if with_body else "nodes")
+            ids = json.loads(body.split("nodes(ids:")[1].split(")")[0])
+            return json.dumps({"data": {"nodes": [self.node(i, with_body)
+                                                  for i in ids if i in self.issues]}})
+        kind = "full" if "issueType" in body else "probe"
+        self.calls.append(kind)
+        nodes = [self.node(i) if kind == "full" else
+                 {"id": i, "updatedAt": it["stamp"], "content": {"updatedAt": it["stamp"]}}
+                 for i, it in self.issues.items()]
+        return json.dumps({"data": {"organization": {"projectV2": {
+            "id": "PVT_1", "items": {"pageInfo": {"hasNextPage": False}, "nodes": nodes}}}}})
+
+
+class TestRevalidation(CacheTestBase):
+    def setUp(self):
+        super().setUp()
+        self.board = FakeBoard({
+            "PVTI_1": {"number": 1, "stamp": "t1", "status": "Ready"},
+            "PVTI_2": {"number": 2, "stamp": "t1", "status": "Backlog"},
+            "PVTI_3": {"number": 3, "stamp": "t1", "status": "Done"},
+        })
+        self._orig = analysis.RUN
+        analysis.RUN = self.board
+
+    def tearDown(self):
+        analysis.RUN = self._orig
+        super().tearDown()
+
+    def _load(self):
+        return {r["number"]: r["status"]
+                for r in analysis.load_board("acme", 7, board_cache=self.cache)}
+
+    def test_cold_then_warm_unchanged(self):
+        first = self._load()
+        self.assertEqual(self.board.calls, ["full", "bodies"], "the Ready item's body")
+        self.assertEqual(self.cache.last["mode"], "cold")
+        self.board.calls.clear()
+        self.assertEqual(self._load(), first)
+        self.assertEqual(self.board.calls, ["probe"], "unchanged board: probe only")
+        self.assertEqual(self.cache.last["refetched"], 0)
+
+    def test_only_changed_and_new_items_refetched(self):
+        self._load()
+        self.board.issues["PVTI_2"].update(stamp="t2", status="In Progress")
+        self.board.issues["PVTI_4"] = {"number": 4, "stamp": "t2", "status": "Ready"}
+        del self.board.issues["PVTI_3"]
+        self.board.calls.clear()
+        got = self._load()
+        # Only the new Ready item's body is read; #1's AC result is still current.
+        self.assertEqual(self.board.calls, ["probe", "nodes", "bodies"])
+        self.assertEqual(self.cache.last["refetched"], 2)
+        self.assertEqual(got, {"1": "Ready", "2": "In Progress", "4": "Ready"})
+        # Same answer as an uncached read.
+        uncached = {r["number"]: r["status"] for r in analysis.load_board("acme", 7)}
+        self.assertEqual(got, uncached)
+
+    def test_expired_entry_rereads_in_full(self):
+        self._load()
+        self.clock.now += 3601
+        self.board.calls.clear()
+        self._load()
+        self.assertEqual(self.board.calls, ["full"], "AC results outlive the board entry")
+
+    def test_warm_reads_do_not_postpone_the_full_reread(self):
+        self._load()
+        for _ in range(3):  # a warm read every 20 minutes
+            self.clock.now += 1200
+            self.board.calls.clear()
+            self._load()
+            self.assertEqual(self.cache.last["mode"], "warm")
+        self.clock.now += 1200  # 80 minutes since the cold read
+        self.board.calls.clear()
+        self._load()
+        self.assertEqual((self.cache.last["mode"], self.board.calls[0]), ("cold", "full"))
+
+    def test_ac_result_follows_the_issue_stamp(self):
+        self.board.issues["PVTI_1"]["body"] = "## Acceptance Criteria\n| AC | x |"
+
+        def ac():
+            return {r["number"]: r["has_ac_table"]
+                    for r in analysis.load_board("acme", 7, board_cache=self.cache)}
+
+        self.assertEqual(ac(), {"1": True, "2": None, "3": None})
+        self.board.issues["PVTI_1"].update(stamp="t2", body="prose only")
+        self.board.calls.clear()
+        self.assertEqual(ac()["1"], False)
+        self.assertEqual(self.board.calls, ["probe", "nodes", "bodies"])
+
+    def test_missing_project_still_not_found(self):
+        self._load()
+        analysis.RUN = lambda args: json.dumps({"data": {"organization": {"projectV2": None}}})
+        with self.assertRaises(analysis.AnalysisError) as ctx:
+            analysis.load_board("acme", 7, board_cache=self.cache)
+        self.assertEqual(ctx.exception.code, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
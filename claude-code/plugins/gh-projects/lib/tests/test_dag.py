@@ -34,8 +34,10 @@ from __future__ import annotations
 
 import json
 import os
+import random
 import sys
 import unittest
+from datetime import date
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 LIB = os.path.dirname(HERE)
@@ -127,6 +129,236 @@ class TestDagFixture(unittest.TestCase):
                              f"dag.py must not derive dependencies from labels (found {needle!r})")
 
 
+def random_graph(rng, n, edges, *, cycles=True):
+    """A random blocked-by graph: some closed items, release blockers, unknown
+    ids, and (optionally) back-edges that create dependency cycles."""
+    ids = [f"n{i}" for i in range(n)]
+    g = {i: {"blocked_by": [], "state": "closed" if rng.random() < 0.15 else "open",
+             "release_blocker": rng.random() < 0.05} for i in ids}
+    for _ in range(edges):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if not cycles and a <= b:
+            a, b = max(a, b) + 1, min(a, b)
+            if a >= n:
+                continue
+        g[ids[a]]["blocked_by"].append(ids[b])
+    g[ids[0]]["blocked_by"].append("GHOST")
+    return g
+
+
+def brute_force(items):
+    """The per-node DFS engine `compute` replaced — the reference answer."""
+    blocks = dag._build_blocks(items)
+    out = {}
+    for k in items:
+        down = dag._downstream(k, blocks)
+        out[k] = {"blocked": dag.is_blocked(k, items),
+                  "blast_radius": dag._radius(
+                      len(down), any(items[d].get("release_blocker") for d in down)),
+                  "blast_count": len(down)}
+    return out
+
+
+class TestCondensedEngine(unittest.TestCase):
+    def test_matches_per_node_dfs_on_random_graphs(self):
+        rng = random.Random(20261017)
+        for trial in range(60):
+            n = rng.randrange(1, 80)
+            g = random_graph(rng, n, rng.randrange(0, n * 3), cycles=trial % 2 == 0)
+            self.assertEqual(dag.compute(g), brute_force(g), f"trial {trial}")
+
+    def test_release_blocker_inside_own_cycle(self):
+        # R is a release blocker in a 3-cycle: the OTHER members block release,
+        # R itself only does if something downstream of it is one.
+        g = {"R": {"blocked_by": ["B"], "state": "open", "release_blocker": True},
+             "A": {"blocked_by": ["R"], "state": "open"},
+             "B": {"blocked_by": ["A"], "state": "open"},
+             "X": {"blocked_by": ["A"], "state": "open"}}
+        out = dag.compute(g)
+        self.assertEqual(out["A"]["blast_radius"], "Blocks release")
+        self.assertEqual(out["B"]["blast_radius"], "Blocks release")
+        self.assertEqual(out["R"]["blast_radius"], "Blocks many")
+        self.assertEqual(out["R"]["blast_count"], 3)  # A, B, X
+        self.assertEqual(out["X"]["blast_count"], 0)
+
+    def test_self_loop_does_not_count_itself(self):
+        g = {"A": {"blocked_by": ["A"], "state": "open"}}
+        self.assertEqual(dag.compute(g)["A"],
+                         {"blocked": True, "blast_radius": "Blocks none", "blast_count": 0})
+
+    def test_long_chain_is_not_recursive(self):
+        n = 5000  # far past the default recursion limit
+        g = {f"c{i}": {"blocked_by": [f"c{i - 1}"] if i else [], "state": "open"}
+             for i in range(n)}
+        g[f"c{n - 1}"]["release_blocker"] = True
+        out = dag.compute(g)
+        self.assertEqual(out["c0"]["blast_count"], n - 1)
+        self.assertEqual(out["c0"]["blast_radius"], "Blocks release")
+        self.assertEqual(out[f"c{n - 1}"]["blast_count"], 0)
+
+
+class TestDepGraph(unittest.TestCase):
+    def test_fixture_adjacency_and_state_sets(self):
+        g = dag.DepGraph(FIXTURE)
+        self.assertEqual(g.blockers["A"], ["B", "C"])
+        self.assertEqual(g.blocks["A"], {"REL"})
+        self.assertEqual(g.blocks["F"], set(), "a closed blocker blocks nothing")
+        self.assertEqual(g.dependents["F"], {"E"}, "but is still listed by E")
+        self.assertFalse(g.is_open("F"))
+        self.assertEqual(g.release, {"REL"})
+        self.assertEqual({k for k in g.ids if g.has_open_blocker(k)}, {"A", "REL"})
+        self.assertEqual(g.upstream("REL"), {"REL", "A", "B", "C"})
+        self.assertEqual(g.downstream("B"), {"A", "REL"})
+
+    def test_unknown_and_repeated_blockers_are_dropped(self):
+        g = dag.DepGraph({"a": {"blocked_by": ["b", "b", "GHOST"]}, "b": {}})
+        self.assertEqual(g.blockers["a"], ["b"])
+        self.assertTrue(g.has_open_blocker("a"))
+        self.assertFalse(g.has_open_blocker("GHOST"))
+        self.assertNotIn("GHOST", g)
+
+    def test_open_blocker_queries_match_a_scan(self):
+        rng = random.Random(19)
+        for trial in range(40):
+            n = rng.randrange(1, 60)
+            items = random_graph(rng, n, rng.randrange(0, n * 3))
+            g = dag.DepGraph(items)
+            self.assertEqual(g.blocks, dag._build_blocks(items))
+            for k in items:
+                self.assertEqual(g.has_open_blocker(k), dag.is_blocked(k, items),
+                                 f"trial {trial} @{k}")
+                self.assertEqual(dag.is_blocked(k, g), dag.is_blocked(k, items))
+
+
+def longest_path(items):
+    """Earliest-finish days by memoized recursion — the reference for an
+    ACYCLIC graph (open item: own Size + its latest open blocker's finish)."""
+    memo = {}
+
+    def finish(k):
+        if k not in memo:
+            meta = items[k]
+            if meta.get("state", "open") == "closed":
+                memo[k] = 0
+            else:
+                blockers = [str(b) for b in meta.get("blocked_by") or []
+                            if str(b) in items and items[str(b)].get("state", "open") != "closed"]
+                memo[k] = dag._duration(meta) + max([finish(b) for b in blockers] or [0])
+        return memo[k]
+    return {k: finish(k) for k in items}
+
+
+class TestCriticalPath(unittest.TestCase):
+    MONDAY = date(2026, 6, 15)
+
+    def _fixture(self):
+        g = {k: dict(v) for k, v in FIXTURE.items()}
+        sizes = {"REL": "S", "A": "L", "B": "M", "C": "S", "D": None, "E": "S", "F": "L"}
+        for k, size in sizes.items():
+            g[k]["size"] = size
+        g["REL"]["target"] = "2026-06-17"
+        return g
+
+    def test_fixture_earliest_finish_and_chain(self):
+        out = dag.critical_path(self._fixture(), today=self.MONDAY)
+        days = {k: v["finish_days"] for k, v in out["items"].items()}
+        # B (M) ends Tue; A (L) after its later blocker B: Fri; REL (S): Mon.
+        self.assertEqual(days, {"REL": 6, "A": 5, "B": 2, "C": 1, "D": 2, "E": 1, "F": 0})
+        self.assertEqual(out["items"]["A"]["earliest_finish"], "2026-06-19")
+        self.assertEqual(out["items"]["REL"]["earliest_finish"], "2026-06-22")
+        self.assertEqual(out["items"]["REL"]["projected_slippage_days"], 5)
+        self.assertIsNone(out["items"]["F"]["earliest_finish"], "closed is done")
+        self.assertEqual(out["chains"], {"REL": {"days": 6, "chain": ["B", "A", "REL"]}})
+
+    def test_cycle_members_finish_together(self):
+        g = {"A": {"blocked_by": ["B"], "size": "S"},
+             "B": {"blocked_by": ["A"], "size": "L"},
+             "R": {"blocked_by": ["A"], "size": "S", "release_blocker": True}}
+        out = dag.critical_path(g, today=self.MONDAY)
+        self.assertEqual([out["items"][k]["finish_days"] for k in "ABR"], [4, 4, 5])
+        self.assertEqual(out["chains"]["R"]["chain"], ["A", "B", "R"])
+
+    def test_working_days_skip_the_weekend(self):
+        friday = date(2026, 6, 19)
+        self.assertEqual(dag._add_working_days(friday, 1), friday)
+        self.assertEqual(dag._add_working_days(friday, 2), date(2026, 6, 22))
+        self.assertEqual(dag._add_working_days(date(2026, 6, 20), 1), date(2026, 6, 22))
+        self.assertEqual(dag._add_working_days(self.MONDAY, 11), date(2026, 6, 29))
+
+    def test_matches_longest_path_on_random_dags(self):
+        rng = random.Random(20)
+        for trial in range(40):
+            n = rng.randrange(1, 70)
+            g = random_graph(rng, n, rng.randrange(0, n * 2), cycles=False)
+            for meta in g.values():
+                meta["size"] = rng.choice(["S", "M", "L", None])
+            out = dag.critical_path(g, today=self.MONDAY)["items"]
+            self.assertEqual({k: v["finish_days"] for k, v in out.items()},
+                             longest_path(g), f"trial {trial}")
+
+
+def random_delta(rng, g):
+    ids = list(g)
+    op = rng.choice(dag.DELTA_OPS)
+    item = rng.choice(ids)
+    if op in ("add_edge", "remove_edge"):
+        pool = g[item]["blocked_by"] if op == "remove_edge" and g[item]["blocked_by"] else ids
+        return {"op": op, "item": item, "blocker": rng.choice(pool)}
+    if op == "set_target":
+        return {"op": op, "item": item, "target": "2026-07-01"}
+    return {"op": op, "item": item}
+
+
+class TestIncrementalRecompute(unittest.TestCase):
+    def test_matches_full_recompute_diff(self):
+        rng = random.Random(5)
+        for trial in range(200):
+            n = rng.randrange(1, 40)
+            g = random_graph(rng, n, rng.randrange(0, n * 2), cycles=trial % 3 == 0)
+            before = dag.compute(g)
+            delta = [random_delta(rng, g) for _ in range(rng.randrange(1, 3))]
+            after, changed = dag.recompute(g, before, delta)
+            full = dag.compute(after)
+            expected = {k: v for k, v in full.items() if before.get(k) != v}
+            self.assertEqual(changed, expected, f"trial {trial}: {delta}")
+
+    def test_add_edge_touches_only_upstream(self):
+        before = dag.compute(FIXTURE)
+        after, changed = dag.recompute(FIXTURE, before,
+                                       {"op": "add_edge", "item": "D", "blocker": "REL"})
+        # REL now blocks D; A, B, C reach REL so their counts grow; D is blocked.
+        self.assertEqual(set(changed), {"REL", "A", "B", "C", "D"})
+        self.assertEqual(changed["B"]["blast_count"], 3)
+        self.assertTrue(changed["D"]["blocked"])
+        self.assertEqual(FIXTURE["D"]["blocked_by"], [], "input graph must not be mutated")
+        self.assertEqual(after["D"]["blocked_by"], ["REL"])
+
+    def test_closing_blocker_unblocks_dependents(self):
+        before = dag.compute(FIXTURE)
+        _, changed = dag.recompute(FIXTURE, before, {"op": "close", "item": "A"})
+        self.assertFalse(changed["REL"]["blocked"])
+        self.assertEqual(changed["A"]["blast_count"], 0)
+        # B and C still block A, but no longer reach REL through it.
+        self.assertEqual(changed["B"], {"blocked": False, "blast_radius": "Blocks 1",
+                                        "blast_count": 1})
+        self.assertNotIn("D", changed)
+
+    def test_dependents_come_from_the_graph_index(self):
+        after, seeds, direct = dag.apply_delta(FIXTURE, {"op": "close", "item": "A"})
+        self.assertEqual((seeds, direct), ({"A"}, {"A"}), "no board scan in apply_delta")
+        graph = dag.DepGraph(after)
+        self.assertIn("REL", graph.dependents["A"])
+        self.assertIn("REL", dag.affected_by(graph, seeds, direct))
+
+    def test_bad_delta(self):
+        with self.assertRaises(dag.DagError) as ctx:
+            dag.recompute(FIXTURE, {}, {"op": "rename", "item": "A"})
+        self.assertEqual(ctx.exception.code, 2)
+        with self.assertRaises(dag.DagError) as ctx:
+            dag.recompute(FIXTURE, {}, {"op": "close", "item": "NOPE"})
+        self.assertEqual(ctx.exception.code, 3)
+
+
 class TestDagCli(unittest.TestCase):
     def _run(self, argv, stdin=None):
         import io
@@ -152,6 +384,15 @@ class TestDagCli(unittest.TestCase):
         self.assertEqual(code, 0)
         self.assertEqual(json.loads(out), EXPECTED["B"])
 
+    def test_delta_prints_only_changed(self):
+        code, out, _ = self._run(["--delta", '{"op": "reopen", "item": "F"}'],
+                                 stdin=json.dumps(FIXTURE))
+        self.assertEqual(code, 0)
+        changed = json.loads(out)
+        self.assertEqual(set(changed), {"E", "F"})
+        self.assertTrue(changed["E"]["blocked"])
+        self.assertEqual(changed["F"]["blast_radius"], "Blocks 1")
+
     def test_empty_input_exit_2(self):
         code, _, _ = self._run([], stdin="")
         self.assertEqual(code, 2)
@@ -168,6 +409,14 @@ class TestDagCli(unittest.TestCase):
         code, _, _ = self._run(["--item", "NOPE"], stdin=json.dumps(FIXTURE))
         self.assertEqual(code, 3)
 
+    def test_critical_path(self):
+        code, out, _ = self._run(["--critical-path", "--today", "2026-06-15"],
+                                 stdin=json.dumps(FIXTURE))
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out)["chains"]["REL"]["chain"], ["B", "A", "REL"])
+        code, _, _ = self._run(["--critical-path", "--today", "soon"], stdin=json.dumps(FIXTURE))
+        self.assertEqual(code, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,14 +12,22 @@ from __future__ import annotations
 import io
 import json
 import os
+import re
+import stat
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 LIB = os.path.dirname(HERE)
 sys.path.insert(0, LIB)
 
+import cache  # noqa: E402
 import gh  # noqa: E402
 
 
@@ -77,10 +85,7 @@ class CountingRunner:
         # --- resolve (the fields query) ---
         if "projectV2(number:" in body or "fields(first:100)" in body:
             return json.dumps(PROJECT_RESOLVE)
-        # --- addProjectV2ItemById ---
-        if "addProjectV2ItemById" in body:
-            return json.dumps({"data": {"addProjectV2ItemById": {"item": {"id": "ITEM_1"}}}})
-        # --- updateProjectV2ItemFieldValue ---
+        # --- updateProjectV2ItemFieldValue (+ folded read-back; fused add) ---
         if "updateProjectV2ItemFieldValue" in body:
             # capture the written option/number/text for read-back fidelity
             if "singleSelectOptionId:" in body:
@@ -89,26 +94,17 @@ class CountingRunner:
                 self.item_value = ("number", float(body.split("number:")[1].split("}")[0]))
             elif "text:" in body:
                 self.item_value = ("text", body.split('text:"')[1].split('"}')[0])
-            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "ITEM_1"}}}})
-        # --- read-back ---
-        if "fieldValueByName" in body or "ProjectV2ItemFieldSingleSelectValue" in body:
             kind, val = self.item_value
-            node = {"id": "ITEM_1", "fieldValueByName": {"nodes": [
-                {"__typename": "x",
-                 ("optionId" if kind == "optionId" else kind): val,
-                 "field": {"id": self._last_field_id()}},
-            ]}}
-            return json.dumps({"data": {"node": node}})
+            item = {"id": "ITEM_1", "fieldValueByName": {"__typename": "x", kind: val}}
+            if "a:addProjectV2ItemById" in body:
+                return json.dumps({"data": {"a": {"item": {"id": "ITEM_1"}},
+                                            "u": {"projectV2Item": item}}})
+            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": item}}})
+        # --- addProjectV2ItemById ---
+        if "addProjectV2ItemById" in body:
+            return json.dumps({"data": {"addProjectV2ItemById": {"item": {"id": "ITEM_1"}}}})
         return "{}"
 
-    def _last_field_id(self):
-        # the field id is carried in the readback variables (-F field=...)
-        for c in reversed(self.calls):
-            for a in c:
-                if str(a).startswith("field=F_"):
-                    return str(a).split("=", 1)[1]
-        return "F_status"
-
     def count(self, predicate):
         return sum(1 for c in self.calls if predicate(_q(c)))
 
@@ -179,6 +175,90 @@ class TestResolveCache(GhTestBase):
         self.assertEqual(ctx.exception.code, 3)
 
 
+class TestPersistentResolveCache(GhTestBase):
+    """The on-disk resolve cache: a second process skips `_FIELDS_QUERY`."""
+
+    def setUp(self):
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = cache.SnapshotCache(os.path.join(self._tmp.name, "c"), max_age=600)
+        self.runner = CountingRunner()
+        gh.RUN = self.runner
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        super().tearDown()
+
+    def resolves(self):
+        return self.runner.count(lambda q: "fields(first:100)" in q)
+
+    def test_second_process_skips_resolve(self):
+        gh.Project("acme", 7, cache=self.cache).resolve()
+        path = self.cache.path("resolve", "acme", 7, gh._FIELDS_QUERY)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        fresh = gh.Project("acme", 7, cache=self.cache)  # a "new process"
+        self.assertEqual(fresh.option_id("Status", "Done"), "OPT_done")
+        self.assertEqual(fresh.id, "PVT_proj1")
+        self.assertEqual(self.resolves(), 1)
+
+    def test_expired_entry_resolves_again(self):
+        gh.Project("acme", 7, cache=self.cache).resolve()
+        self.cache.max_age = -1
+        gh.Project("acme", 7, cache=self.cache).resolve()
+        self.assertEqual(self.resolves(), 2)
+
+    def test_lookup_miss_on_cached_ids_re_resolves_once(self):
+        stale = json.loads(json.dumps(PROJECT_RESOLVE["data"]["organization"]["projectV2"]))
+        stale["fields"]["nodes"][0]["options"] = stale["fields"]["nodes"][0]["options"][:1]
+        self.cache.store("resolve", "acme", 7, gh._FIELDS_QUERY, {"project": stale})
+        proj = gh.Project("acme", 7, cache=self.cache)
+        self.assertEqual(proj.option_id("Status", "Done"), "OPT_done")
+        self.assertEqual(self.resolves(), 1)
+        with self.assertRaises(gh.GhError) as ctx:
+            proj.option_id("Status", "Nope")  # live ids: no further retry
+        self.assertEqual(ctx.exception.code, 3)
+        self.assertEqual(self.resolves(), 1)
+
+    def test_stale_id_write_error_invalidates_and_retries(self):
+        stale = json.loads(json.dumps(PROJECT_RESOLVE["data"]["organization"]["projectV2"]))
+        stale["fields"]["nodes"][0]["options"][0]["id"] = "OPT_gone"
+        self.cache.store("resolve", "acme", 7, gh._FIELDS_QUERY, {"project": stale})
+        runner = self.runner
+
+        def rejecting(args):
+            if "OPT_gone" in _q(args):
+                raise gh.GhError("GraphQL: Could not resolve to a node with the global id of 'OPT_gone'")
+            return runner(args)
+
+        gh.RUN = rejecting
+        proj = gh.Project("acme", 7, cache=self.cache)
+        result = gh.write_field(proj, "content", "Status", "In Progress")
+        self.assertTrue(result["verified"])
+        self.assertEqual(result["value"], "OPT_inprog")
+        self.assertEqual(self.resolves(), 1)
+        entry = self.cache.load("resolve", "acme", 7, gh._FIELDS_QUERY)
+        self.assertNotIn("OPT_gone", json.dumps(entry))
+
+    def test_item_ids_persist_for_a_fused_write(self):
+        gh.write_field(gh.Project("acme", 7, cache=self.cache), "content", "PM-ID", "a")
+        before = len(self.runner.calls)
+        gh.write_field(gh.Project("acme", 7, cache=self.cache), "content", "PM-ID", "b")
+        self.assertEqual(len(self.runner.calls) - before, 1, "no resolve, no separate add")
+
+    def test_other_write_errors_are_not_retried(self):
+        gh.Project("acme", 7, cache=self.cache).resolve()
+
+        def failing(args):
+            if "addProjectV2ItemById" in _q(args):
+                raise gh.GhError("GraphQL: Resource not accessible by integration")
+            return self.runner(args)
+
+        gh.RUN = failing
+        with self.assertRaises(gh.GhError):
+            gh.write_field(gh.Project("acme", 7, cache=self.cache), "c", "PM-ID", "x")
+        self.assertEqual(self.resolves(), 1)
+
+
 # --------------------------------------------------------------------------- #
 # two-phase add -> update -> read-back identical
 # --------------------------------------------------------------------------- #
@@ -190,13 +270,42 @@ class TestTwoPhaseWrite(GhTestBase):
         result = gh.write_field(proj, "I_kj…content", "Status", "In Progress")
         self.assertTrue(result["verified"])
         self.assertEqual(result["value"], "OPT_inprog")
-        # Sequence: add -> update -> readback (in that order).
-        seq = [_q(c) for c in runner.calls]
-        add_i = next(i for i, q in enumerate(seq) if "addProjectV2ItemById" in q)
-        upd_i = next(i for i, q in enumerate(seq) if "updateProjectV2ItemFieldValue" in q)
-        rb_i = next(i for i, q in enumerate(seq) if "ProjectV2ItemFieldSingleSelectValue" in q)
-        self.assertLess(add_i, upd_i)
-        self.assertLess(upd_i, rb_i)
+        # Sequence: add -> update, the read-back riding the update's own selection.
+        seq = [_q(c) for c in runner.calls][1:]
+        self.assertEqual(len(seq), 2)
+        self.assertIn("addProjectV2ItemById", seq[0])
+        self.assertIn("updateProjectV2ItemFieldValue", seq[1])
+        self.assertIn("ProjectV2ItemFieldSingleSelectValue", seq[1])
+        self.assertEqual(runner.count(lambda q: "fieldValues(first:50)" in q), 0)
+
+    def test_known_item_fuses_add_update_readback(self):
+        runner = CountingRunner()
+        gh.RUN = runner
+        proj = gh.Project("acme", 7).resolve()
+        gh.write_field(proj, "content", "Status", "In Progress")
+        before = len(runner.calls)
+        result = gh.write_field(proj, "content", "Status", "Done")
+        self.assertTrue(result["verified"])
+        self.assertEqual(len(runner.calls) - before, 1, "one document per field once the item is known")
+        fused = _q(runner.calls[-1])
+        self.assertLess(fused.index("addProjectV2ItemById"), fused.index("updateProjectV2ItemFieldValue"))
+
+    def test_known_item_gone_falls_back_to_add(self):
+        runner = CountingRunner()
+        gh.RUN = runner
+        proj = gh.Project("acme", 7).resolve()
+        proj.remember_item("content", "ITEM_deleted")
+
+        def rejecting(args):
+            if "ITEM_deleted" in _q(args):
+                raise gh.GhError("Could not resolve to a node with the global id of 'ITEM_deleted'")
+            return runner(args)
+
+        gh.RUN = rejecting
+        result = gh.write_field(proj, "content", "PM-ID", "PM-0001")
+        self.assertTrue(result["verified"])
+        self.assertEqual(result["item"], "ITEM_1")
+        self.assertEqual(proj.known_item("content"), "ITEM_1")
 
     def test_number_round_trip(self):
         runner = CountingRunner()
@@ -226,9 +335,9 @@ class TestTwoPhaseWrite(GhTestBase):
 
         def tamper(args):
             out = orig(args)
-            if "ProjectV2ItemFieldTextValue" in _q(args):
+            if "updateProjectV2ItemFieldValue" in _q(args):
                 d = json.loads(out)
-                d["data"]["node"]["fieldValueByName"]["nodes"][0]["text"] = "WRONG"
+                d["data"]["updateProjectV2ItemFieldValue"]["projectV2Item"]["fieldValueByName"]["text"] = "WRONG"
                 return json.dumps(d)
             return out
 
@@ -237,6 +346,346 @@ class TestTwoPhaseWrite(GhTestBase):
             gh.set_field(proj, item, "PM-ID", "PM-0042")
 
 
+# --------------------------------------------------------------------------- #
+# batched field writes: N updates -> ceil(N / max_ops) aliased documents
+# --------------------------------------------------------------------------- #
+def _gh_answer(out: dict) -> str:
+    """Answer like `gh api graphql` does: any `errors` exits non-zero, and the
+    whole payload (partial `data` included) rides along on stdout."""
+    body = json.dumps(out)
+    if out.get("errors"):
+        raise gh.GhError("gh api graphql failed: GraphQL: " + out["errors"][0]["message"],
+                         code=1, stdout=body)
+    return body
+
+
+def _gh_subprocess(runner):
+    """A `subprocess.run` stand-in that drives the real `gh._default_run` from
+    `runner`: a raised answer becomes exit 1 with the payload on stdout."""
+    def run(argv, **kwargs):
+        try:
+            return subprocess.CompletedProcess(argv, 0, runner(argv[1:]), "")
+        except gh.GhError as e:
+            return subprocess.CompletedProcess(argv, 1, e.stdout or "", "GraphQL: failed")
+    return run
+
+
+class BatchRunner:
+    """Answers aliased mutation documents; `fail` = {alias: message}; `skew` =
+    {alias: value} read back instead of what was written."""
+
+    WRITE = re.compile(r'(w\d+):updateProjectV2ItemFieldValue\(input:\{projectId:"[^"]*",'
+                       r'itemId:"([^"]*)",fieldId:"[^"]*",value:\{(\w+):"?((?:[^"\\]|\\.)*?)"?\}\}\)'
+                       r'\{projectV2Item\{id( fieldValueByName)?')
+
+    def __init__(self, fail=None, echo=True, skew=None):
+        self.docs = []
+        self.fail = fail or {}
+        self.echo = echo
+        self.skew = skew or {}
+
+    def __call__(self, args):
+        body = _q(args)
+        self.docs.append(body)
+        data, errors = {}, []
+        for alias, item, kind, val, reads in self.WRITE.findall(body):
+            if alias in self.fail:
+                data[alias] = None
+                errors.append({"path": [alias], "message": self.fail[alias]})
+                continue
+            node = {"id": item if self.echo else "OTHER"}
+            if reads:
+                kind = "optionId" if kind == "singleSelectOptionId" else kind
+                val = float(val) if kind == "number" else val.replace('\\"', '"')
+                node["fieldValueByName"] = {kind: self.skew.get(alias, val)}
+            data[alias] = {"projectV2Item": node}
+        out = {"data": data}
+        if errors:
+            out["errors"] = errors
+        return _gh_answer(out)
+
+
+class TestMutationBatch(GhTestBase):
+    def test_writes_coalesce_into_bounded_documents(self):
+        runner = BatchRunner()
+        gh.RUN = runner
+        batch = gh.MutationBatch("PVT_proj1", max_ops=4)
+        for i in range(10):
+            batch.add(("ITEM_%d" % i, "Blast count"), "ITEM_%d" % i, "F_blast", {"number": float(i)})
+        self.assertEqual(len(runner.docs), 2)  # auto-flushed at 4 and 8
+        batch.flush()
+        self.assertEqual(len(runner.docs), 3)
+        self.assertEqual(batch.round_trips, 3)
+        self.assertEqual(len(batch.written), 10)
+        self.assertEqual(batch.failures, {})
+        self.assertIn('w3:updateProjectV2ItemFieldValue(input:{projectId:"PVT_proj1"', runner.docs[0])
+        self.assertIn("value:{number:3.0}", runner.docs[0])
+
+    def test_byte_bound_flushes_early(self):
+        runner = BatchRunner()
+        gh.RUN = runner
+        batch = gh.MutationBatch("PVT_proj1", max_ops=50, max_bytes=400)
+        for i in range(6):
+            batch.add(i, "ITEM_%d" % i, "F_pmid", {"text": "x" * 100})
+        batch.flush()
+        self.assertGreater(len(runner.docs), 1)
+        self.assertEqual(len(batch.written), 6)
+
+    def test_per_alias_errors_map_back_to_keys(self):
+        gh.RUN = BatchRunner(fail={"w1": "option not found"})
+        batch = gh.MutationBatch("PVT_proj1")
+        batch.add(("ITEM_a", "Status"), "ITEM_a", "F_status", {"singleSelectOptionId": "OPT_done"})
+        batch.add(("ITEM_b", "Status"), "ITEM_b", "F_status", {"singleSelectOptionId": "OPT_bad"})
+        failed = batch.flush()
+        self.assertEqual(failed, {("ITEM_b", "Status"): "option not found"})
+        self.assertEqual(batch.written, [("ITEM_a", "Status")])
+        with self.assertRaises(gh.GhError) as ctx:
+            batch.raise_for_failures()
+        self.assertIn("ITEM_b", str(ctx.exception))
+
+    def test_partial_failure_through_the_gh_subprocess(self):
+        # The real runner: gh exits 1 on any `errors`; the landed alias still counts.
+        gh.RUN = gh._default_run
+        runner = BatchRunner(fail={"w1": "option not found"})
+        with mock.patch.object(gh.subprocess, "run", _gh_subprocess(runner)):
+            batch = gh.MutationBatch("PVT_proj1")
+            batch.add("a", "ITEM_a", "F_status", {"singleSelectOptionId": "OPT_done"})
+            batch.add("b", "ITEM_b", "F_status", {"singleSelectOptionId": "OPT_bad"})
+            batch.add("c", "ITEM_c", "F_status", {"singleSelectOptionId": "OPT_done"})
+            failed = batch.flush()
+        self.assertEqual(failed, {"b": "option not found"})
+        self.assertEqual(batch.written, ["a", "c"])
+
+    def test_transport_failure_fails_every_key(self):
+        gh.RUN = gh._default_run
+        down = lambda argv, **kw: subprocess.CompletedProcess(argv, 1, "", "HTTP 502")  # noqa: E731
+        with mock.patch.object(gh.subprocess, "run", down):
+            batch = gh.MutationBatch("PVT_proj1")
+            batch.add("a", "ITEM_a", "F_pmid", {"text": "PM-1"})
+            failed = batch.flush()
+        self.assertIn("HTTP 502", failed["a"])
+        self.assertEqual(batch.written, [])
+
+    def test_missing_echo_is_a_failure(self):
+        gh.RUN = BatchRunner(echo=False)
+        with self.assertRaises(gh.GhError):
+            with gh.MutationBatch("PVT_proj1") as batch:
+                batch.add("k", "ITEM_a", "F_pmid", {"text": "PM-1"})
+
+    def test_set_field_enqueues_into_batch(self):
+        runner = CountingRunner()
+        gh.RUN = runner
+        proj = gh.Project("acme", 7).resolve()
+        gh.RUN = batch_runner = BatchRunner()
+        with gh.MutationBatch(proj.id) as batch:
+            res = gh.set_field(proj, "ITEM_1", "Status", "OPT_done", batch=batch)
+            gh.set_field(proj, "ITEM_1", "PM-ID", 'say "hi"', batch=batch)
+            self.assertTrue(res["queued"])
+            self.assertEqual(batch_runner.docs, [])
+        self.assertEqual(len(batch_runner.docs), 1)
+        self.assertIn('value:{text:"say \\"hi\\""}', batch_runner.docs[0])
+        self.assertEqual(batch.written, [("ITEM_1", "Status"), ("ITEM_1", "PM-ID")])
+        self.assertIn('fieldValueByName(name:"PM-ID")', batch_runner.docs[0])
+
+    def test_batched_set_field_verifies_the_read_back(self):
+        gh.RUN = CountingRunner()
+        proj = gh.Project("acme", 7).resolve()
+        gh.RUN = BatchRunner(skew={"w1": "PM-9999"})
+        batch = gh.MutationBatch(proj.id)
+        gh.set_field(proj, "ITEM_1", "Status", "OPT_done", batch=batch)
+        gh.set_field(proj, "ITEM_1", "PM-ID", "PM-0042", batch=batch)
+        failed = batch.flush()
+        self.assertEqual(list(failed), [("ITEM_1", "PM-ID")])
+        self.assertIn("read-back mismatch", failed[("ITEM_1", "PM-ID")])
+        self.assertEqual(batch.written, [("ITEM_1", "Status")])
+
+
+# --------------------------------------------------------------------------- #
+# write_fields: every field of one item in one aliased, self-verifying document
+# --------------------------------------------------------------------------- #
+class FieldsRunner(CountingRunner):
+    """CountingRunner + aliased multi-field documents. `fail` = {alias: message};
+    `skew` = {alias: value} read back instead of what was written."""
+
+    WRITE = re.compile(r'(w\d+):updateProjectV2ItemFieldValue\(input:\{[^}]*'
+                       r'value:\{(singleSelectOptionId|iterationId|number|date|text):"?([^"}]*)"?\}')
+
+    def __init__(self, fail=None, skew=None):
+        super().__init__()
+        self.fail = fail or {}
+        self.skew = skew or {}
+
+    def __call__(self, args):
+        body = _q(args)
+        if "w0:updateProjectV2ItemFieldValue" not in body:
+            return super().__call__(args)
+        self.calls.append(list(args))
+        data, errors = {}, []
+        if "a:addProjectV2ItemById" in body:
+            data["a"] = {"item": {"id": "ITEM_1"}}
+        for alias, kind, val in self.WRITE.findall(body):
+            if alias in self.fail:
+                data[alias] = None
+                errors.append({"path": [alias], "message": self.fail[alias]})
+                continue
+            kind = "optionId" if kind == "singleSelectOptionId" else kind
+            val = self.skew.get(alias, float(val) if kind == "number" else val)
+            data[alias] = {"projectV2Item": {"id": "ITEM_1", "fieldValueByName": {kind: val}}}
+        return _gh_answer({"data": data, **({"errors": errors} if errors else {})})
+
+
+class TestWriteFields(GhTestBase):
+    VALUES = {"Status": "Done", "PM-ID": "PM-0042", "Blast count": 3, "Sprint": "Sprint 1"}
+
+    def test_cold_item_is_add_then_one_document(self):
+        runner = FieldsRunner()
+        gh.RUN = runner
+        proj = gh.Project("acme", 7).resolve()
+        res = gh.write_fields(proj, "content", self.VALUES)
+        self.assertTrue(res["verified"])
+        self.assertEqual(res["fields"], {"Status": "OPT_done", "PM-ID": "PM-0042",
+                                         "Blast count": 3.0, "Sprint": "IT_1"})
+        seq = [_q(c) for c in runner.calls][1:]
+        self.assertEqual(len(seq), 2)
+        self.assertIn("addProjectV2ItemById", seq[0])
+        self.assertEqual(seq[1].count("updateProjectV2ItemFieldValue"), 4)
+        self.assertIn('fieldValueByName(name:"PM-ID")', seq[1])
+
+    def test_known_item_is_one_round_trip(self):
+        runner = FieldsRunner()
+        gh.RUN = runner
+        proj = gh.Project("acme", 7).resolve()
+        proj.remember_item("content", "ITEM_1")
+        before = len(runner.calls)
+        gh.write_fields(proj, "content", self.VALUES)
+        self.assertEqual(len(runner.calls) - before, 1)
+        self.assertIn("a:addProjectV2ItemById", _q(runner.calls[-1]))
+
+    def test_failures_and_mismatches_name_the_fields(self):
+        gh.RUN = FieldsRunner(fail={"w1": "Resource not accessible"})
+        proj = gh.Project("acme", 7).resolve()
+        with self.assertRaises(gh.GhError) as ctx:
+            gh.write_fields(proj, "content", self.VALUES)
+        self.assertIn("PM-ID: Resource not accessible", str(ctx.exception))
+        gh.RUN = FieldsRunner(skew={"w2": 4.0})
+        with self.assertRaises(gh.GhError) as ctx:
+            gh.write_fields(proj, "content", self.VALUES)
+        self.assertIn("Blast count", str(ctx.exception))
+        self.assertNotIn("Status", str(ctx.exception))
+
+    def test_one_bad_field_through_the_gh_subprocess(self):
+        # The real runner exits 1 on `errors`; only the bad field is named.
+        proj = gh.Project("acme", 7)
+        gh.RUN = FieldsRunner()
+        proj.resolve()
+        proj.remember_item("content", "ITEM_1")
+        gh.RUN = gh._default_run
+        runner = FieldsRunner(fail={"w2": "Number out of range"})
+        with mock.patch.object(gh.subprocess, "run", _gh_subprocess(runner)):
+            with self.assertRaises(gh.GhError) as ctx:
+                gh.write_fields(proj, "content", self.VALUES)
+        msg = str(ctx.exception)
+        self.assertIn("Blast count: Number out of range", msg)
+        self.assertIn("landed: Status, PM-ID, Sprint", msg)
+        self.assertNotIn("Status:", msg)
+
+    def test_cli_write_fields(self):
+        runner = FieldsRunner()
+        gh.RUN = lambda args: (json.dumps({"node_id": "I_7"}) if "/issues/" in _q(args)
+                               else runner(args))
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            code = gh.main(["write-fields", "--owner", "acme", "--number", "7", "--repo", "acme/web",
+                            "--issue", "7", "--set", "Status=In Progress", "--set", "PM-ID=a=b"])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out.getvalue())["fields"],
+                         {"Status": "OPT_inprog", "PM-ID": "a=b"})
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            code = gh.main(["write-fields", "--owner", "acme", "--number", "7", "--repo", "acme/web",
+                            "--issue", "7", "--set", "Status"])
+        self.assertEqual(code, 2)
+
+
+# --------------------------------------------------------------------------- #
+# fan_out: bounded concurrency, input-ordered results, one mutation at a time
+# --------------------------------------------------------------------------- #
+class ConcurrencyRunner:
+    """Sleeps per call and records the peak number of reads / writes in flight."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.inflight = {"read": 0, "write": 0}
+        self.peak = {"read": 0, "write": 0}
+
+    def __call__(self, args):
+        kind = "write" if "mutation" in _q(args) else "read"
+        with self.lock:
+            self.inflight[kind] += 1
+            self.peak[kind] = max(self.peak[kind], self.inflight[kind])
+        time.sleep(self.delay)
+        with self.lock:
+            self.inflight[kind] -= 1
+        return json.dumps({"data": {"ok": _q(args).split("#")[-1]}})
+
+
+class TestFanOut(GhTestBase):
+    def test_results_keep_input_order(self):
+        delays = [0.03, 0.0, 0.02, 0.01]
+
+        def job(i):
+            time.sleep(delays[i])
+            return i
+
+        self.assertEqual(gh.fan_out([lambda i=i: job(i) for i in range(4)]), [0, 1, 2, 3])
+
+    def test_concurrency_is_capped_and_writes_serialize(self):
+        runner = ConcurrencyRunner()
+        gh.RUN = runner
+        reads = [lambda i=i: gh.graphql("query{viewer{login}} #r%d" % i) for i in range(6)]
+        writes = [lambda i=i: gh.graphql("mutation{x} #w%d" % i) for i in range(4)]
+        out = gh.fan_out(reads + writes, max_workers=3)
+        self.assertEqual([o["ok"] for o in out], ["r%d" % i for i in range(6)] + ["w%d" % i for i in range(4)])
+        self.assertLessEqual(runner.peak["read"] + runner.peak["write"], 3 + 1)
+        self.assertGreater(runner.peak["read"], 1, "independent reads overlap")
+        self.assertEqual(runner.peak["write"], 1, "never two mutations in flight")
+
+    def test_first_failure_in_input_order_is_raised_after_all_ran(self):
+        ran = []
+
+        def ok(i):
+            ran.append(i)
+            return i
+
+        def boom(msg):
+            raise gh.GhError(msg, code=3)
+
+        calls = [lambda: ok(0), lambda: boom("first"), lambda: ok(2), lambda: boom("second")]
+        with self.assertRaises(gh.GhError) as ctx:
+            gh.fan_out(calls)
+        self.assertEqual(str(ctx.exception), "first")
+        self.assertEqual(sorted(ran), [0, 2])
+        got = gh.fan_out(calls, return_exceptions=True)
+        self.assertEqual(got[0], 0)
+        self.assertIsInstance(got[3], gh.GhError)
+
+    def test_env_cap_of_one_runs_inline(self):
+        saved = os.environ.get(gh.MAX_CONCURRENCY_ENV)
+        try:
+            os.environ[gh.MAX_CONCURRENCY_ENV] = "1"
+            threads = gh.fan_out([lambda: threading.current_thread()] * 3)
+            self.assertEqual(set(threads), {threading.current_thread()})
+            os.environ[gh.MAX_CONCURRENCY_ENV] = "many"
+            with self.assertRaises(gh.GhError) as ctx:
+                gh.fan_out([lambda: 1, lambda: 2])
+            self.assertEqual(ctx.exception.code, 2)
+        finally:
+            if saved is None:
+                os.environ.pop(gh.MAX_CONCURRENCY_ENV, None)
+            else:
+                os.environ[gh.MAX_CONCURRENCY_ENV] = saved
+
+
 # --------------------------------------------------------------------------- #
 # monotonic status advance
 # --------------------------------------------------------------------------- #
@@ -337,6 +786,22 @@ class TestCapabilityProbe(GhTestBase):
         caps.has("add_blocked_by")
         self.assertEqual(n["c"], 1, "capability probe must cache (one --help)")
 
+    def test_shared_across_fan_out_workers_probes_once(self):
+        runner = HelpRunner(blocked_by=True)
+        probes = []
+
+        def slow(args):
+            if "--help" in _q(args):
+                probes.append(_q(args))
+                time.sleep(0.01)
+            return runner(args)
+
+        gh.RUN = slow
+        caps = gh.Capabilities()
+        got = gh.fan_out([lambda: caps.has("add_blocked_by") for _ in range(8)], max_workers=8)
+        self.assertEqual(got, [True] * 8)
+        self.assertEqual(len(probes), 1)
+
 
 # --------------------------------------------------------------------------- #
 # NO label-based dependency fallback exists anywhere in gh.py
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Offline tests for lib/history.py — NO network; a temp dir holds the sqlite file.
+
+Covers the store contract (0600 file, append-only runs, baseline resolution by
+'last' / id / date), the pure delta (new / resolved / escalated), and the
+analysis wiring: a remembered run ranks exactly like a fresh one, an unchanged
+board reuses the last run without a rule pass, only changed rows are re-ruled,
+and `--since` reports the delta on the CLI.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import date
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.dirname(HERE)
+sys.path.insert(0, LIB)
+
+import analysis  # noqa: E402
+import history  # noqa: E402
+
+DAY = 24 * 3600
+TODAY = date(2026, 6, 17)
+
+
+def board_fixture():
+    """Six issues raising every finding kind (#10 raises two)."""
+    return [
+        {"number": 10, "status": "In Progress", "assignees": [], "blocked": "Blocked",
+         "impact": "Release blocker", "blocked_by": [20]},
+        {"number": 20, "status": "In Progress", "assignees": ["a"],
+         "schedule_health": "Overdue", "blast_radius": "Blocks many"},
+        {"number": 30, "type": "Epic", "schedule_health": "At risk",
+         "sub_issues_total": 4, "sub_issues_done": 1},
+        {"number": 40, "status": "Ready", "assignees": ["b"], "size": "M"},
+        {"number": 50, "status": "Done"},
+        {"number": 60, "decision_needed": "Move date"},
+    ]
+
+
+class BoardMixin:
+    """Serves `self.board` as the live read (no RUN seam involved)."""
+
+    def serve(self, board):
+        self.board = board
+        patcher = mock.patch.object(
+            analysis, "iter_board",
+            lambda owner, number, board_cache=None: iter(json.loads(json.dumps(self.board))))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class Clock:
+    def __init__(self, now=1_800_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _f(number, kind, severity, repo=None):
+    out = {"number": str(number), "kind": kind, "severity": severity}
+    if repo:
+        out["repo"] = repo
+    return out
+
+
+class StoreTestBase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "gh-projects", history.DB_NAME)
+        self.clock = Clock()
+        self.store = history.HistoryStore(self.path, clock=self.clock)
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+
+class TestStore(StoreTestBase):
+    def test_runs_append_and_file_is_private(self):
+        first = self.store.record("acme#7", "h1", {"items": 1}, [_f(1, "k", 3)])
+        self.clock.now += DAY
+        second = self.store.record("acme#7", "h2", {"items": 2}, [])
+        self.store.record("acme#8", "h3", {}, [])
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual([r["id"] for r in self.store.runs("acme#7")], [second, first])
+        self.assertEqual(self.store.findings(first), [_f(1, "k", 3)])
+        self.assertEqual(self.store.latest("acme#7")["counts"], {"items": 2})
+
+    def test_resolve_since(self):
+        first = self.store.record("acme#7", "h1", {}, [])
+        self.clock.now += DAY
+        second = self.store.record("acme#7", "h2", {}, [])
+        self.assertEqual(self.store.resolve("acme#7", "last")["id"], second)
+        self.assertEqual(self.store.resolve("acme#7", str(first))["id"], first)
+        # A date picks the latest run at or before it, else the earliest run.
+        self.assertEqual(self.store.resolve("acme#7", "2030-01-01")["id"], second)
+        self.assertEqual(self.store.resolve("acme#7", "2000-01-01")["id"], first)
+        with self.assertRaises(history.HistoryError) as ctx:
+            self.store.resolve("acme#9", "last")
+        self.assertEqual(ctx.exception.code, 3)
+        with self.assertRaises(history.HistoryError) as ctx:
+            self.store.resolve("acme#7", "yesterday-ish")
+        self.assertEqual(ctx.exception.code, 2)
+
+    def test_item_memo_is_content_addressed(self):
+        self.store.remember_items({"a": [_f(1, "k", 3)], "b": []})
+        self.store.remember_items({"a": [_f(9, "other", 0)]})  # never overwritten
+        self.assertEqual(self.store.item_findings(["a", "b", "c"]),
+                         {"a": [_f(1, "k", 3)], "b": []})
+
+    def test_hashes(self):
+        row = {"number": "1", "status": "Ready"}
+        self.assertEqual(history.row_hash(row), history.row_hash(dict(reversed(row.items()))))
+        self.assertNotEqual(history.row_hash(row), history.row_hash(row, "salt"))
+        self.assertEqual(history.snapshot_hash(["a", "b"]), history.snapshot_hash(["b", "a"]))
+
+
+class TestDelta(unittest.TestCase):
+    def test_new_resolved_escalated(self):
+        before = [_f(1, "intake_hygiene", 4), _f(2, "decision_needed", 3),
+                  _f(3, "stalled_epic", 2)]
+        after = [_f(1, "critical_chain", 0), _f(1, "intake_hygiene", 4),
+                 _f(3, "stalled_epic", 2), _f(4, "decision_needed", 3, repo="acme/api")]
+        d = history.delta(before, after)
+        self.assertEqual([(f["number"], f["kind"]) for f in d["new"]],
+                         [("1", "critical_chain"), ("4", "decision_needed")])
+        self.assertEqual([(f["number"], f["kind"]) for f in d["resolved"]],
+                         [("2", "decision_needed")])
+        self.assertEqual(d["escalated"], [{
+            "number": "1", "repo": None,
+            "from": {"kind": "intake_hygiene", "severity": 4},
+            "to": {"kind": "critical_chain", "severity": 0}}])
+
+    def test_same_issue_number_in_two_repos_is_two_issues(self):
+        d = history.delta([_f(5, "k", 3, repo="acme/app")], [_f(5, "k", 3, repo="acme/api")])
+        self.assertEqual((len(d["new"]), len(d["resolved"]), d["escalated"]), (1, 1, []))
+
+
+class TestRememberedRuns(BoardMixin, StoreTestBase):
+    def test_remembered_run_matches_a_fresh_one(self):
+        self.serve(board_fixture())
+        fresh = analysis.run("acme", 7, today=TODAY)
+        first = analysis.run("acme", 7, today=TODAY, history=self.store)
+        self.assertEqual((first["counts"], first["findings"]),
+                         (fresh["counts"], fresh["findings"]))
+        # Unchanged board: the last run is reused, no rule runs at all.
+        with mock.patch.object(analysis, "_ranked", side_effect=AssertionError("re-ruled")):
+            second = analysis.run("acme", 7, today=TODAY, history=self.store)
+        self.assertEqual(second["findings"], fresh["findings"])
+        self.assertEqual(second["run_id"], first["run_id"] + 1)
+
+    def test_only_changed_rows_are_re_ruled(self):
+        snap = board_fixture()
+        self.serve(snap)
+        analysis.run("acme", 7, today=TODAY, history=self.store)
+        snap[5]["decision_needed"] = "No decision"  # #60's decision is made
+        seen = []
+        real = analysis._ranked
+
+        def spy(s, stats=None):
+            seen.append(list(s.number))
+            return real(s, stats)
+
+        with mock.patch.object(analysis, "_ranked", side_effect=spy):
+            again = analysis.run("acme", 7, today=TODAY, history=self.store)
+        self.assertEqual(seen, [["60"]])
+        self.assertEqual(again["findings"], analysis.compute_findings(snap, today=TODAY))
+
+
+class TestSinceCli(BoardMixin, StoreTestBase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(history.HistoryStore, "default",
+                                    classmethod(lambda cls: history.HistoryStore(
+                                        self.path, clock=self.clock)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _main(self, argv):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = analysis.main(argv)
+        return code, out.getvalue()
+
+    def test_since_last_reports_the_delta(self):
+        snap = board_fixture()
+        self.serve(snap)
+        argv = ["--owner", "acme", "--number", "7", "--no-cache", "--today", "2026-06-17"]
+        code, _ = self._main(argv + ["--since", "last"])
+        self.assertEqual(code, 3, "no baseline recorded yet")
+        self.assertEqual(self._main(argv)[0], 0)
+        snap[5]["decision_needed"] = "No decision"
+        self.clock.now += DAY
+        code, out = self._main(argv + ["--since", "last"])
+        self.assertEqual(code, 0)
+        result = json.loads(out)
+        self.assertEqual([f["kind"] for f in result["delta"]["resolved"]],
+                         [analysis.KIND_DECISION_NEEDED])
+        self.assertEqual((result["delta"]["new"], result["delta"]["escalated"]), ([], []))
+        self.assertEqual(result["since"]["run_id"], result["run_id"] - 1)
+
+    def test_since_usage_errors(self):
+        self.assertEqual(self._main(["--snapshot", "-", "--since", "last"])[0], 2)
+        self.assertEqual(self._main(["--owner", "acme", "--number", "7", "--no-history",
+                                     "--since", "last"])[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
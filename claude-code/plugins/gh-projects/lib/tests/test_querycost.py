@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Offline tests for lib/querycost.py — the static GraphQL cost estimator.
+
+Pins GitHub's documented worked example (nodes + points), the rules the walk
+applies (aliases, inline/named fragments, `first:$var`, free non-connection
+fields, the paginated connection), board sizing, and an audit of every query
+constant in lib/ and templates/github/ against the 500,000-node limit.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.dirname(HERE)
+sys.path.insert(0, LIB)
+
+import analysis  # noqa: E402
+import querycost  # noqa: E402
+import scaffold  # noqa: E402
+
+# GitHub docs, "Rate limits and node limits for the GraphQL API".
+_DOCS_EXAMPLE = """
+query {
+  viewer {
+    login
+    repositories(first: 100) {
+      edges { node { id
+        issues(first: 50) {
+          edges { node { id
+            labels(first: 60) { edges { node { name } } }
+          } }
+        }
+      } }
+    }
+  }
+}
+"""
+
+
+class TestEstimate(unittest.TestCase):
+    def test_docs_example(self):
+        cost = querycost.estimate(_DOCS_EXAMPLE)
+        self.assertEqual(cost["nodes"], 100 + 100 * 50 + 100 * 50 * 60)
+        self.assertEqual(cost["requests"], 1 + 100 + 5000)
+        self.assertEqual(cost["points"], 51)
+        self.assertFalse(cost["over_node_limit"])
+        self.assertEqual([c["path"] for c in cost["connections"]],
+                         ["viewer.repositories", "viewer.repositories.edges.node.issues",
+                          "viewer.repositories.edges.node.issues.edges.node.labels"])
+
+    def test_board_items_query(self):
+        cost = querycost.estimate(analysis._ITEMS_QUERY)
+        # 100 items + 20 assignees each; fieldValueByName / content are free.
+        self.assertEqual((cost["nodes"], cost["points"]), (2100, 1))
+        self.assertEqual(cost["paged"], {"path": "organization.projectV2.items", "first": 100})
+        self.assertEqual(querycost.estimate(analysis._PROBE_QUERY)["nodes"], 100)
+
+    def test_views_detail_query(self):
+        cost = querycost.estimate(scaffold._VIEWS_DETAIL_QUERY)
+        self.assertEqual((cost["nodes"], cost["requests"], cost["points"]), (4100, 201, 2))
+        self.assertIsNone(cost["paged"])
+
+    def test_aliases_fragments_and_variables(self):
+        doc = """
+        query($n:Int!, $after:String){
+          a: search(query:"x", type:ISSUE, first:$n, after:$after){
+            nodes { ...Labels ... on Issue { assignees(last:5){ nodes { login } } } }
+          }
+          b: search(query:"y", type:ISSUE, first:2){ nodes { ...Labels } }
+        }
+        fragment Labels on Issue { labels(first:10){ nodes { name } } }
+        """
+        cost = querycost.estimate(doc, {"n": 30})
+        self.assertEqual(cost["nodes"], 30 + 30 * 10 + 30 * 5 + 2 + 2 * 10)
+        self.assertEqual(cost["paged"], {"path": "search", "first": 30})
+        self.assertEqual(cost["unresolved"], [])
+        unresolved = querycost.estimate(doc)
+        self.assertEqual(unresolved["unresolved"], ["n"])
+        self.assertEqual(unresolved["paged"]["first"], querycost.MAX_PAGE)
+
+    def test_mutations_and_errors(self):
+        cost = querycost.estimate("mutation($i:ID!){ deleteIssue(input:{issueId:$i}){ clientMutationId } }")
+        self.assertEqual((cost["kind"], cost["nodes"], cost["points"]), ("mutation", 0, 1))
+        with self.assertRaises(querycost.QueryCostError):
+            querycost.estimate("not graphql")
+        with self.assertRaises(querycost.QueryCostError):
+            querycost.estimate("query{ a(first:1){ b ")
+
+    def test_pages_for_a_large_board(self):
+        cost = querycost.estimate(analysis._ITEMS_QUERY)
+        self.assertEqual(querycost.pages_for(cost, 2501),
+                         {"items": 2501, "pages": 26, "points": 26, "nodes": 26 * 2100})
+        self.assertIsNone(querycost.pages_for(querycost.estimate(scaffold._VIEWS_QUERY), 10))
+
+
+class TestCatalogue(unittest.TestCase):
+    def test_every_query_constant_fits_the_node_limit(self):
+        found = dict(querycost.catalogue())
+        for name in ("analysis._ITEMS_QUERY", "gh._FIELDS_QUERY", "scaffold._VIEWS_DETAIL_QUERY",
+                     "signals._ITEMS_QUERY", "board_sync._ITEM_FOR_ISSUE",
+                     "board_sync._EVENT_READ",
+                     "board_status._SHA_PRS"):
+            self.assertIn(name, found)
+        self.assertNotIn("analysis._ITEM_SELECTION", found, "selections are not operations")
+        for name, doc in found.items():
+            with self.subTest(query=name):
+                cost = querycost.estimate(doc)
+                self.assertFalse(cost["over_node_limit"])
+                self.assertEqual(cost["unresolved"], [])
+
+    def test_cli(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(querycost.main(["--items", "1000"]), 0)
+        rows = {r["query"]: r for r in json.loads(out.getvalue())["queries"]}
+        self.assertEqual(rows["analysis._ITEMS_QUERY"]["board"]["pages"], 10)
+        with tempfile.NamedTemporaryFile("w", suffix=".graphql", delete=False) as fh:
+            fh.write("query($k:Int!){ viewer { repositories(first:$k){ nodes { id } } } }")
+        try:
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(querycost.main(["--file", fh.name, "--var", "k=7"]), 0)
+            self.assertEqual(json.loads(out.getvalue())["queries"][0]["nodes"], 7)
+        finally:
+            os.unlink(fh.name)
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(querycost.main(["--var", "k"]), 2)
+            self.assertEqual(querycost.main(["--file", "/nonexistent.graphql"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Offline tests for lib/ratelimit.py and its vendored `_Scheduler` copies.
+
+NO network, NO real sleeping: every scheduler gets a fake clock, a recording
+`sleep` and a fixed `rand`. The same scenarios run against the lib Scheduler
+and the copies in signals.py / board_sync.py / board_status.py:
+
+  * queries are instrumented with the rateLimit selection, mutations are not;
+    the reported cost/remaining feed `report()`
+  * below the low-water mark calls are spread over the time left; a call that
+    would dig into the reserve waits for the reset
+  * secondary limits retry after Retry-After (or >= 30s of jittered backoff);
+    5xx retries reads only; other errors raise at once; a failure is
+    classified from gh's stderr, never from the argv
+"""
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.dirname(HERE)
+PLUGIN_ROOT = os.path.dirname(LIB)
+sys.path.insert(0, LIB)
+
+import ratelimit  # noqa: E402
+
+TEMPLATES = os.path.join(PLUGIN_ROOT, "templates", "github")
+VENDORED = {
+    "signals": os.path.join(TEMPLATES, "signals.py"),
+    "board_sync": os.path.join(TEMPLATES, "workflows", "board_sync.py"),
+    "board_status": os.path.join(TEMPLATES, "actions", "board-status", "board_status.py"),
+}
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(f"_rl_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _factories():
+    out = {"lib": ratelimit.Scheduler}
+    for name, path in VENDORED.items():
+        out[name] = _load(name, path)._Scheduler
+    return out
+
+
+FACTORIES = _factories()
+NOW = 1_800_000_000.0
+RESET = datetime.fromtimestamp(NOW + 3600, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Clock:
+    def __init__(self):
+        self.now = NOW
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakeGitHub:
+    """Answers queries with a rateLimit block; `errors` is a queue of exceptions."""
+
+    def __init__(self, remaining=4000, cost=1, errors=()):
+        self.remaining = remaining
+        self.cost = cost
+        self.errors = list(errors)
+        self.calls = []
+
+    def __call__(self, args):
+        self.calls.append(list(args))
+        if self.errors:
+            raise self.errors.pop(0)
+        body = " ".join(args)
+        data = {"ok": True}
+        if "ghpRateLimit: rateLimit" in body:
+            self.remaining -= self.cost
+            data["ghpRateLimit"] = {"cost": self.cost, "remaining": self.remaining,
+                                    "resetAt": RESET, "limit": 5000, "nodeCount": 3 * self.cost}
+        return json.dumps({"data": data})
+
+
+QUERY = ["api", "graphql", "-f", "query=query{ viewer { login } }"]
+MUTATION = ["api", "graphql", "-f", "query=mutation{ x(input:{}){ y } }"]
+
+
+class SchedulerCase(unittest.TestCase):
+    def each(self, check, gh=FakeGitHub, **kw):
+        """Run `check(scheduler, fake, clock)` once per implementation."""
+        for name, factory in FACTORIES.items():
+            with self.subTest(impl=name):
+                fake, clock = gh(), Clock()
+                check(factory(fake, clock=clock, sleep=clock.sleep, rand=lambda: 0.5, **kw),
+                      fake, clock)
+
+
+class TestBudget(SchedulerCase):
+    def test_queries_instrumented_mutations_not(self):
+        def check(sched, fake, _):
+            sched(QUERY)
+            sched(MUTATION)
+            self.assertIn("ghpRateLimit: rateLimit { cost remaining resetAt limit nodeCount }}",
+                          fake.calls[0][3])
+            self.assertEqual(fake.calls[1], MUTATION)
+            rep = sched.report()
+            self.assertEqual(rep["requests"], 2)
+            self.assertEqual(rep["points_used"], 2)  # 1 reported + 1 debited
+            self.assertEqual(rep["remaining"], 3998)
+            self.assertEqual(rep["reset_at"], RESET)
+        self.each(check)
+
+    def test_pages_record_what_each_query_was_charged(self):
+        def check(sched, _, __):
+            sched(QUERY)
+            sched(MUTATION)
+            sched(["api", "graphql", "-f",
+                   "query=query($o:String!){ organization(login:$o){ projectV2(number:1){ "
+                   "items(first:100){ nodes { id } } } } }"])
+            self.assertEqual(sched.pages, [
+                {"op": "viewer", "cost": 10, "nodes": 30, "remaining": 3990},
+                {"op": "organization.projectV2.items", "cost": 10, "nodes": 30,
+                 "remaining": 3980},
+            ])
+        self.each(check, lambda: FakeGitHub(cost=10))
+
+    def test_rest_calls_do_not_touch_the_point_budget(self):
+        def check(sched, _, __):
+            sched(QUERY)
+            sched(["api", "-X", "GET", "/repos/a/b/issues/1"])
+            self.assertEqual(sched.report()["points_used"], 1)
+            self.assertEqual(sched.report()["remaining"], 3999)
+        self.each(check)
+
+    def test_healthy_budget_never_waits(self):
+        def check(sched, _, clock):
+            for _ in range(20):
+                sched(QUERY)
+            self.assertEqual(clock.slept, [])
+        self.each(check)
+
+    def test_low_water_spreads_calls_over_the_window(self):
+        def check(sched, _, clock):
+            sched(QUERY)  # learn: remaining 290, cost 10, reset in 3600s
+            sched(QUERY)
+            # (290 - 50 reserve) // 10 = 24 calls left over 3600s -> 150s apart
+            self.assertEqual(clock.slept, [150.0])
+        self.each(check, lambda: FakeGitHub(remaining=300, cost=10))
+
+    def test_reserve_waits_for_the_reset(self):
+        def check(sched, _, clock):
+            sched(QUERY)  # remaining 53: the next call would dig into the reserve
+            sched(QUERY)
+            self.assertEqual(clock.slept, [3601.0])
+            self.assertEqual(sched.report()["waited_s"], 3601.0)
+        self.each(check, lambda: FakeGitHub(remaining=58, cost=5))
+
+
+class TestRetries(SchedulerCase):
+    @staticmethod
+    def failing(*messages):
+        return lambda: FakeGitHub(errors=[RuntimeError(m) for m in messages])
+
+    def test_secondary_limit_backs_off_then_succeeds(self):
+        def check(sched, fake, clock):
+            self.assertIn('"ok": true', sched(MUTATION))  # rate limits are safe to retry
+            self.assertEqual(len(fake.calls), 2)
+            self.assertEqual(clock.slept, [45.0])  # 60s cap, equal jitter at rand=0.5
+            self.assertEqual(sched.report()["retries"], 1)
+        self.each(check, self.failing("HTTP 403: You have exceeded a secondary rate limit"))
+
+    def test_retry_after_is_honored(self):
+        def check(sched, _, clock):
+            sched(QUERY)
+            self.assertEqual(clock.slept, [7.5])
+        self.each(check, self.failing("HTTP 429: slow down (retry-after: 7)"))
+
+    def test_server_errors_retry_reads_with_growing_backoff(self):
+        def check(sched, fake, clock):
+            sched(QUERY)
+            self.assertEqual(len(fake.calls), 4)
+            self.assertEqual(clock.slept, [0.75, 1.5, 3.0])
+        self.each(check, self.failing(*["HTTP 502: Bad Gateway"] * 3))
+
+    def test_server_error_on_a_mutation_is_not_replayed(self):
+        def check(sched, fake, _):
+            with self.assertRaises(RuntimeError):
+                sched(MUTATION)
+            self.assertEqual(len(fake.calls), 1)
+        self.each(check, self.failing("HTTP 502: Bad Gateway"))
+
+    def test_retries_are_bounded(self):
+        def check(sched, fake, _):
+            with self.assertRaises(RuntimeError):
+                sched(QUERY)
+            self.assertEqual(len(fake.calls), 3)
+        self.each(check, self.failing(*["HTTP 503"] * 10), max_retries=2)
+
+    def test_only_gh_stderr_classifies_a_failure(self):
+        # The message carries the argv, so a variable like n=502 or a SHA
+        # fragment must not read as a 5xx; gh's stderr decides.
+        class GhFailure(Exception):
+            def __init__(self, msg, stderr):
+                super().__init__(msg)
+                self.stderr = stderr
+
+        argv = "gh api graphql -f query=query($n:Int!){ timeout } -F n=502 failed"
+        not_found = GhFailure(f"{argv}: Could not resolve to an Issue with the number of 502.",
+                              "GraphQL: Could not resolve to an Issue with the number of 502.")
+
+        def check(sched, fake, clock):
+            with self.assertRaises(GhFailure):
+                sched(QUERY)
+            self.assertEqual((len(fake.calls), clock.slept), (1, []))
+        self.each(check, lambda: FakeGitHub(errors=[not_found]))
+
+        def check(sched, fake, _):
+            sched(QUERY)
+            self.assertEqual(len(fake.calls), 2)
+        self.each(check, lambda: FakeGitHub(errors=[GhFailure("gh api graphql failed",
+                                                              "HTTP 502: Bad Gateway")]))
+
+    def test_lib_default_run_classifies_from_stderr(self):
+        import subprocess
+        from unittest import mock
+
+        import gh
+
+        def run(argv, **kwargs):
+            return subprocess.CompletedProcess(
+                argv, 1, "", "GraphQL: Could not resolve to an Issue with the number of 502.")
+
+        clock = Clock()
+        sched = ratelimit.Scheduler(gh._default_run, clock=clock, sleep=clock.sleep,
+                                    rand=lambda: 0.5)
+        with mock.patch.object(gh.subprocess, "run", run):
+            with self.assertRaises(gh.GhError):
+                sched(QUERY + ["-F", "n=502"])
+        self.assertEqual((sched.report()["retries"], clock.slept), (0, []))
+
+    def test_other_errors_raise_at_once(self):
+        def check(sched, fake, clock):
+            with self.assertRaises(RuntimeError):
+                sched(QUERY)
+            self.assertEqual((len(fake.calls), clock.slept), (1, []))
+        self.each(check, self.failing("HTTP 404: Not Found"))
+
+
+class TestWiring(unittest.TestCase):
+    def test_env_switch_and_emit(self):
+        saved = os.environ.get(ratelimit.RATE_LIMIT_ENV)
+        try:
+            os.environ[ratelimit.RATE_LIMIT_ENV] = "off"
+            run = FakeGitHub()
+            self.assertIs(ratelimit.wrap(run), run)
+            os.environ[ratelimit.RATE_LIMIT_ENV] = "on"
+            wrapped = ratelimit.wrap(run)
+            self.assertIsInstance(wrapped, ratelimit.Scheduler)
+            out = io.StringIO()
+            ratelimit.emit(wrapped, out)
+            self.assertEqual(out.getvalue(), "", "no calls, no report")
+            wrapped(QUERY)
+            ratelimit.emit(wrapped, out)
+            self.assertTrue(out.getvalue().startswith("budget: "))
+            self.assertEqual(json.loads(out.getvalue()[8:])["points_used"], 1)
+            out = io.StringIO()
+            ratelimit.emit(wrapped, out, pages=True)
+            cost, budget = out.getvalue().splitlines()
+            self.assertEqual(json.loads(cost[len("cost: "):])["op"], "viewer")
+            self.assertTrue(budget.startswith("budget: "))
+        finally:
+            if saved is None:
+                os.environ.pop(ratelimit.RATE_LIMIT_ENV, None)
+            else:
+                os.environ[ratelimit.RATE_LIMIT_ENV] = saved
+
+    def test_cost_report_after_the_verb(self):
+        # engine.sh passes `<verb> ... --cost-report`; before the verb works too.
+        import backlog
+        import gh
+        import scaffold
+
+        for build, verb in ((gh.build_parser, ["capabilities"]),
+                            (backlog.build_parser, ["list"]),
+                            (scaffold.build_parser, ["scaffold", "--org", "acme", "--template", "T",
+                                                     "--title", "New"])):
+            parse = build().parse_args
+            self.assertTrue(parse(verb + ["--cost-report"]).cost_report)
+            self.assertTrue(parse(["--cost-report"] + verb).cost_report)
+            self.assertFalse(parse(verb).cost_report)
+
+    def test_setup_board_style_kwargs_pass_through(self):
+        seen = {}
+
+        def run(args, stdin=None):
+            seen["stdin"] = stdin
+            return "{}"
+
+        ratelimit.Scheduler(run)(["api", "--method", "POST", "/x", "--input", "-"], stdin="{}")
+        self.assertEqual(seen["stdin"], "{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -118,6 +118,20 @@ class TestSignalValues(unittest.TestCase):
         self.assertEqual(self.sig["2"]["slippage_days"], 0)
         self.assertEqual(self.sig["2"]["slippage"], "Not late")
 
+    def test_projected_slippage_from_the_critical_path(self):
+        # Unsized items take M (2 working days) from Wed 06-17: #1 finishes Thu,
+        # #2 after #1 on Mon 06-22, #3 after #2 on Wed 06-24 — 5 days past Target.
+        self.assertEqual(self.sig["1"]["projected_finish"], "2026-06-18")
+        self.assertEqual(self.sig["1"]["projected_slippage_days"], 8)
+        self.assertEqual(self.sig["3"]["projected_finish"], "2026-06-24")
+        self.assertEqual(self.sig["3"]["projected_slippage"], "3-5d")
+        self.assertEqual(self.sig["3"]["slippage"], "Not late", "own date not yet past")
+        self.assertEqual(self.sig["4"]["projected_slippage"], "Not late")
+        self.assertIsNone(self.sig["5"]["projected_finish"])
+        chains = {}
+        signals.compute_signals(board_fixture(), today=TODAY, chains=chains)
+        self.assertEqual(chains, {"4": {"days": 4, "chain": ["1", "4"]}})
+
     def test_slippage_buckets_exhaustive(self):
         self.assertEqual(signals.slippage_bucket(0), "Not late")
         self.assertEqual(signals.slippage_bucket(1), "1-2d")
@@ -157,6 +171,77 @@ class TestDagCrossCheck(unittest.TestCase):
             self.assertEqual(vendored[k]["blast_radius"], lib[k]["blast_radius"], f"radius@{k}")
             self.assertEqual(vendored[k]["blast_count"], lib[k]["blast_count"], f"count@{k}")
 
+    def test_cross_check_on_random_graphs(self):
+        import random
+        rng = random.Random(7)
+        for trial in range(30):
+            n = rng.randrange(1, 60)
+            ids = [str(i) for i in range(n)]
+            board = {i: {"blocked_by": [rng.choice(ids) for _ in range(rng.randrange(0, 4))],
+                         "state": "closed" if rng.random() < 0.2 else "open",
+                         "release_blocker": rng.random() < 0.1} for i in ids}
+            self.assertEqual(signals.dag_signals(board), dag.compute(board), f"trial {trial}")
+
+    def test_vendored_graph_matches_lib_graph(self):
+        import random
+        rng = random.Random(19)
+        for trial in range(30):
+            n = rng.randrange(1, 60)
+            ids = [str(i) for i in range(n)]
+            board = {i: {"blocked_by": [rng.choice(ids + ["ghost"])
+                                        for _ in range(rng.randrange(0, 4))],
+                         "state": "closed" if rng.random() < 0.2 else "open",
+                         "release_blocker": rng.random() < 0.1} for i in ids}
+            vendored, lib = signals._DepGraph(board), dag.DepGraph(board)
+            for attr in lib.__slots__:
+                self.assertEqual(getattr(vendored, attr), getattr(lib, attr),
+                                 f"trial {trial}: {attr}")
+
+    def test_vendored_critical_path_matches_lib(self):
+        import random
+        rng = random.Random(20)
+        for trial in range(30):
+            n = rng.randrange(1, 60)
+            ids = [str(i) for i in range(n)]
+            board = {i: {"blocked_by": [rng.choice(ids) for _ in range(rng.randrange(0, 4))],
+                         "state": "closed" if rng.random() < 0.2 else "open",
+                         "release_blocker": rng.random() < 0.1,
+                         "size": rng.choice(["S", "M", "L", None]),
+                         "target": rng.choice([None, "2026-06-10", "2026-06-30"])} for i in ids}
+            self.assertEqual(signals.critical_path(board, today=TODAY),
+                             dag.critical_path(board, today=TODAY), f"trial {trial}")
+
+    def test_incremental_matches_full_recompute(self):
+        import random
+        rng = random.Random(11)
+        for trial in range(120):
+            n = rng.randrange(1, 30)
+            ids = [str(i) for i in range(n)]
+            board = {i: {"blocked_by": [rng.choice(ids) for _ in range(rng.randrange(0, 3))],
+                         "state": "closed" if rng.random() < 0.2 else "open",
+                         "release_blocker": rng.random() < 0.1,
+                         "target": rng.choice([None, "2026-06-10", "2026-06-18", "2026-08-01"]),
+                         "size": rng.choice(["S", "M", "L", None])}
+                     for i in ids}
+            item = rng.choice(ids)
+            delta = rng.choice([
+                {"op": "add_edge", "item": item, "blocker": rng.choice(ids)},
+                {"op": "remove_edge", "item": item,
+                 "blocker": (board[item]["blocked_by"] or ids)[0]},
+                {"op": "close", "item": item},
+                {"op": "reopen", "item": item},
+                {"op": "set_target", "item": item, "target": "2026-06-16"},
+            ])
+            before = signals.compute_signals(board, today=TODAY)
+            after, changed = signals.recompute_signals(board, before, delta, today=TODAY)
+            full = signals.compute_signals(after, today=TODAY)
+            self.assertEqual(changed, {k: v for k, v in full.items() if before[k] != v},
+                             f"trial {trial}: {delta}")
+            # lib/dag agrees on the DAG part of the same delta.
+            _, dag_changed = dag.recompute(board, dag.compute(board), delta)
+            for k, row in dag_changed.items():
+                self.assertEqual(row["blast_count"], full[k]["blast_count"])
+
     def test_cross_check_on_cycle(self):
         # A dependency cycle must not hang either implementation (cycle-safe).
         board = {
@@ -337,6 +422,7 @@ class FakeRunner:
         self.board = board
         self.calls = []
         self.writes = []
+        self.documents = []
         self.status_updates = []
 
     def __call__(self, args):
@@ -347,8 +433,15 @@ class FakeRunner:
         if "fields(first:100" in body:
             return json.dumps(self._schema_response())
         if "updateProjectV2ItemFieldValue" in body:
-            self.writes.append(body)
-            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "x"}}}})
+            # One aliased document per flush: answer every alias, echo its item.
+            self.documents.append(body)
+            data = {}
+            for alias, item in re.findall(
+                    r'(w\d+):updateProjectV2ItemFieldValue\(input:\{projectId:"[^"]*",'
+                    r'itemId:"([^"]*)"', body):
+                self.writes.append((item, alias))
+                data[alias] = {"projectV2Item": {"id": item}}
+            return json.dumps({"data": data})
         if "createProjectV2StatusUpdate" in body:
             self.status_updates.append(body)
             return json.dumps({"data": {"createProjectV2StatusUpdate": {"statusUpdate": {"id": "SU_1"}}}})
@@ -370,12 +463,22 @@ class FakeRunner:
                 },
                 "targetVal": {"date": meta["target"]},
                 "impact": {"name": "Release blocker" if meta.get("release_blocker") else "Low"},
+                **self._current_values(meta.get("current") or {}),
             })
         return {"data": {"organization": {"projectV2": {
             "id": "PVT_proj1",
             "items": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes},
         }}}}
 
+    @staticmethod
+    def _current_values(cur):
+        """The `cur*` aliases for signal values already on the board."""
+        out = {}
+        for key, alias, attr in signals._CURRENT_ALIASES:
+            if key in cur:
+                out[alias] = {attr: cur[key]}
+        return out
+
     def _schema_response(self):
         def ss(name, opts):
             return {"__typename": "ProjectV2SingleSelectField", "id": f"F_{name}",
@@ -426,13 +529,126 @@ class TestVendoredOffline(unittest.TestCase):
     def test_apply_writes_fields_and_posts_status(self):
         plan, runner = self._drive(apply=True)
         self.assertTrue(plan["applied"])
-        # 5 items x 6 signal fields = 30 field-value writes.
+        # 5 items x 6 signal fields = 30 field-value writes, in ONE document.
         self.assertEqual(plan["field_writes"], 30)
         self.assertEqual(len(runner.writes), 30)
+        self.assertEqual(len(runner.documents), 1)
         # Exactly one Status update posted, carrying the rolled-up enum.
         self.assertEqual(len(runner.status_updates), 1)
         self.assertIn("OFF_TRACK", runner.status_updates[0])
 
+    def test_apply_skips_cells_already_current(self):
+        board = board_fixture()
+        steady = signals.compute_signals(board_fixture(), today=TODAY)
+        for num in ("1", "2", "3", "4"):
+            cur = dict(steady[num])
+            cur["blast_count"] = float(cur["blast_count"])  # the API returns floats
+            board[num]["current"] = cur
+        board["5"]["current"] = {"blocked": "Unblocked", "slippage": "1+wk"}  # 1 stale cell
+        plan, runner = self._drive(apply=True, board=board)
+        # 4 fully-current items + #5's one matching cell are skipped.
+        self.assertEqual(plan["field_skips"], 25)
+        self.assertEqual(plan["field_writes"], 5)
+        self.assertEqual({item for item, _ in runner.writes}, {"PVTI_5"})
+        self.assertEqual(len(runner.status_updates), 1)
+
+    def test_steady_state_board_writes_nothing(self):
+        board = board_fixture()
+        steady = signals.compute_signals(board_fixture(), today=TODAY)
+        for num in board:
+            board[num]["current"] = steady[num]
+        plan, runner = self._drive(apply=True, board=board)
+        self.assertEqual((plan["field_writes"], plan["field_skips"]), (0, 30))
+        self.assertEqual(runner.documents, [])
+
+    def test_load_board_carries_current_values(self):
+        board = board_fixture()
+        board["2"]["current"] = {"blocked": "Blocked", "blast_count": 1.0}
+        orig = signals.RUN
+        signals.RUN = FakeRunner(board)
+        try:
+            _, items, _ = signals.load_board("acme", 7)
+        finally:
+            signals.RUN = orig
+        self.assertEqual(items["2"]["current"], {"blocked": "Blocked", "blast_count": 1.0})
+        self.assertEqual(items["1"]["current"], {})
+
+    def test_load_board_pages_with_prefetch(self):
+        board = board_fixture()
+        full = FakeRunner(board)._items_response()
+        nodes = full["data"]["organization"]["projectV2"]["items"]["nodes"]
+        calls = []
+
+        def paged(args):
+            after = next((a[len("after="):] for a in args if str(a).startswith("after=")), "None")
+            start = 0 if after == "None" else int(after)
+            calls.append(start)
+            more = start + 2 < len(nodes)
+            return json.dumps({"data": {"organization": {"projectV2": {
+                "id": "PVT_proj1",
+                "items": {"pageInfo": {"hasNextPage": more,
+                                       "endCursor": str(start + 2) if more else None},
+                          "nodes": nodes[start:start + 2]}}}}})
+
+        orig = signals.RUN
+        signals.RUN = paged
+        try:
+            project_id, items, item_ids = signals.load_board("acme", 7)
+        finally:
+            signals.RUN = orig
+        self.assertEqual(calls, [0, 2, 4])
+        self.assertEqual(project_id, "PVT_proj1")
+        self.assertEqual(sorted(items), sorted(board))
+        self.assertEqual(item_ids["5"], "PVTI_5")
+
+    def test_batch_bound_and_per_alias_failure(self):
+        fields = FakeRunner(board_fixture())._schema_response()
+        fields = {n["name"]: {"id": n["id"], "dataType": n["dataType"],
+                              "options": {o["name"]: o["id"] for o in n.get("options", [])}}
+                  for n in fields["data"]["organization"]["projectV2"]["fields"]["nodes"]}
+        sigs = signals.compute_signals(board_fixture(), today=TODAY)
+        item_ids = {num: f"PVTI_{num}" for num in sigs}
+
+        def failing(args):
+            body = " ".join(str(a) for a in args)
+            docs.append(body)
+            data, errors = {}, []
+            for alias, item in re.findall(r'(w\d+):\S*?itemId:"([^"]*)"', body):
+                if item == "PVTI_3" and alias == "w0":
+                    errors.append({"path": [alias], "message": "boom"})
+                    data[alias] = None
+                else:
+                    data[alias] = {"projectV2Item": {"id": item}}
+            out = json.dumps({"data": data, "errors": errors})
+            if errors:  # gh exits non-zero on `errors`; the payload rides on stdout
+                raise signals.SignalsError("gh call failed", stdout=out)
+            return out
+
+        docs = []
+        orig = signals.RUN
+        signals.RUN = failing
+        try:
+            # Bounded: 6-write documents -> one per item; #3's first alias fails.
+            batch = signals._MutationBatch("PVT_proj1", max_ops=6)
+            for num in sigs:
+                for name, key in signals._FIELD_MAP:
+                    batch.add((num, name), item_ids[num], fields[name], sigs[num][key])
+            batch.flush()
+            self.assertEqual(batch.round_trips, 5)
+            self.assertEqual(list(batch.failures), [("3", "Blocked")])
+            self.assertEqual(len(batch.written), 29)
+            # write_signals surfaces a failed alias by (issue, field), never silently.
+            def all_fail(args):
+                raise signals.SignalsError("gh call failed", stdout=json.dumps(
+                    {"data": {}, "errors": [{"path": ["w0"], "message": "boom"}]}))
+
+            signals.RUN = all_fail
+            with self.assertRaises(signals.SignalsError) as ctx:
+                signals.write_signals("PVT_proj1", fields, item_ids, sigs)
+            self.assertIn("#1 Blocked: boom", str(ctx.exception))
+        finally:
+            signals.RUN = orig
+
     def test_apply_refuses_without_app_token(self):
         # constraint #2: a write must NEVER fall back to GITHUB_TOKEN; with no
         # GH_APP_TOKEN the orchestration refuses with the usage code (2).
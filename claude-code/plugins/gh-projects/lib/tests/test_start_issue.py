@@ -130,22 +130,23 @@ class RouteRunner:
                 "id": PROJECT_ID, "number": 7, "title": "Board",
                 "fields": {"nodes": self._field_nodes()}}}}})
 
-        # ----- GraphQL: addProjectV2ItemById (REUSE a stable item id) -----
-        if "addProjectV2ItemById" in body:
-            self.writes.append(("add-item", body))
-            return json.dumps({"data": {"addProjectV2ItemById": {"item": {"id": ITEM_ID}}}})
-
-        # ----- GraphQL: updateProjectV2ItemFieldValue (field write) -----
+        # ----- GraphQL: updateProjectV2ItemFieldValue (write + folded read-back;
+        #       fused with addProjectV2ItemById once the item id is known) -----
         if "updateProjectV2ItemFieldValue" in body:
+            if "addProjectV2ItemById" in body:
+                self.writes.append(("add-item", body))
             self.writes.append(("set-field", body))
             self._record_written(body)
-            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {
-                "projectV2Item": {"id": ITEM_ID}}}})
+            item = {"id": ITEM_ID, "fieldValueByName": self._written_value()}
+            if "a:addProjectV2ItemById" in body:
+                return json.dumps({"data": {"a": {"item": {"id": ITEM_ID}},
+                                            "u": {"projectV2Item": item}}})
+            return json.dumps({"data": {"updateProjectV2ItemFieldValue": {"projectV2Item": item}}})
 
-        # ----- GraphQL: field read-back (the two-phase verify) -----
-        if "fieldValues(first:50)" in body:
-            return json.dumps({"data": {"node": {"id": ITEM_ID,
-                "fieldValueByName": {"nodes": self._readback_nodes()}}}})
+        # ----- GraphQL: addProjectV2ItemById (REUSE a stable item id) -----
+        if "addProjectV2ItemById" in body:
+            self.writes.append(("add-item", body))
+            return json.dumps({"data": {"addProjectV2ItemById": {"item": {"id": ITEM_ID}}}})
 
         # ----- GraphQL: createLinkedBranch fallback -----
         if "createLinkedBranch" in body:
@@ -195,14 +196,14 @@ class RouteRunner:
             val = body.split('text:"', 1)[1].split('"', 1)[0]
             self._written[fid] = ("text", val)
 
-    def _readback_nodes(self):
-        nodes = []
-        for fid, (kind, val) in self._written.items():
-            if kind == "optionId":
-                nodes.append({"optionId": val, "field": {"id": fid}})
-            else:
-                nodes.append({"text": val, "field": {"id": fid}})
-        return nodes
+    def _written_value(self):
+        """The value last written to the mutation's field, as `fieldValueByName`."""
+        fid = next((str(c).split("=", 1)[1] for c in self.calls[-1]
+                    if str(c).startswith("field=F_")), None)
+        if fid not in self._written:
+            return None
+        kind, val = self._written[fid]
+        return {kind: val}
 
     def count(self, predicate):
         return sum(1 for c in self.calls if predicate(_q(c)))
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Offline tests for gh.HttpTransport — NO network, NO sockets.
+
+A fake connection factory records every request, so these verify the `gh api`
+argv -> HTTP translation (GraphQL payload + `-F` typing, REST query/body), the
+keep-alive pool (one connection reused across calls, one retry on a stale
+one), token precedence (never GITHUB_TOKEN), scrubbed errors, and that argv the
+transport does not model falls back to the subprocess runner.
+"""
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import sys
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.dirname(HERE)
+sys.path.insert(0, LIB)
+
+import gh  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self._body = body.encode("utf-8")
+        self._headers = headers or {}
+
+    def read(self):
+        return self._body
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+
+class FakeConnection:
+    """Answers from a shared script; `stale=True` drops the first request."""
+
+    def __init__(self, server, stale=False):
+        self.server = server
+        self.stale = stale
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        if self.stale:
+            self.stale = False
+            raise http.client.RemoteDisconnected("closed by peer")
+        self.server.requests.append({
+            "method": method, "path": path, "headers": dict(headers or {}),
+            "body": json.loads(body.decode("utf-8")) if body else None,
+            "conn": id(self),
+        })
+
+    def getresponse(self):
+        status, body, headers = self.server.responses.pop(0) if self.server.responses \
+            else (200, '{"data": {}}', {})
+        return FakeResponse(status, body, headers)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeServer:
+    def __init__(self, responses=None):
+        self.requests = []
+        self.responses = list(responses or [])
+        self.opened = []
+
+    def connect(self, scheme, netloc):
+        conn = FakeConnection(self)
+        self.opened.append((scheme, netloc, conn))
+        return conn
+
+
+class TransportTestBase(unittest.TestCase):
+    ENV = ("GH_TOKEN", "GH_APP_TOKEN", "GITHUB_TOKEN", "GH_HOST")
+
+    def setUp(self):
+        self._saved = {k: os.environ.pop(k, None) for k in self.ENV}
+        os.environ["GH_APP_TOKEN"] = "ghs_apptoken1234567890abcdef"
+        self.server = FakeServer()
+        self.t = gh.HttpTransport(connect=self.server.connect)
+
+    def tearDown(self):
+        for k, v in self._saved.items():
+            os.environ.pop(k, None)
+            if v is not None:
+                os.environ[k] = v
+
+
+class TestArgvTranslation(TransportTestBase):
+    def test_graphql_payload_and_typed_fields(self):
+        self.server.responses = [(200, '{"data": {"ok": 1}}', {})]
+        out = self.t(["api", "graphql", "-f", "query=query($n:Int!){x}",
+                      "-F", "n=7", "-F", "draft=true", "-f", "owner=acme"])
+        self.assertEqual(json.loads(out), {"data": {"ok": 1}})
+        req = self.server.requests[0]
+        self.assertEqual((req["method"], req["path"]), ("POST", "/graphql"))
+        self.assertEqual(req["body"], {"query": "query($n:Int!){x}",
+                                       "variables": {"n": 7, "draft": True, "owner": "acme"}})
+
+    def test_rest_get_puts_fields_in_query_string(self):
+        self.t(["api", "repos/acme/web/issues/3"])
+        self.t(["api", "-X", "GET", "search/issues", "-f", "q=is:open"])
+        self.assertEqual(self.server.requests[0]["path"], "/repos/acme/web/issues/3")
+        self.assertEqual(self.server.requests[0]["body"], None)
+        self.assertEqual(self.server.requests[1]["path"], "/search/issues?q=is%3Aopen")
+
+    def test_rest_write_sends_json_body(self):
+        self.t(["api", "-X", "PATCH", "repos/acme/web", "-F", "allow_squash_merge=false"])
+        self.t(["api", "repos/acme/web/issues/3/sub_issues", "-F", "sub_issue_id=99"])
+        self.assertEqual(self.server.requests[0]["method"], "PATCH")
+        self.assertEqual(self.server.requests[0]["body"], {"allow_squash_merge": False})
+        # gh's rule: fields without -X default the method to POST.
+        self.assertEqual(self.server.requests[1]["method"], "POST")
+        self.assertEqual(self.server.requests[1]["body"], {"sub_issue_id": 99})
+
+    def test_ghes_host_routes_graphql_beside_v3(self):
+        os.environ["GH_HOST"] = "ghe.example.com"
+        t = gh.HttpTransport(connect=self.server.connect)
+        t(["api", "graphql", "-f", "query={viewer{login}}"])
+        t(["api", "user"])
+        self.assertEqual(self.server.opened[0][1], "ghe.example.com")
+        self.assertEqual(self.server.requests[0]["path"], "/api/graphql")
+        self.assertEqual(self.server.requests[1]["path"], "/api/v3/user")
+
+    def test_unmodeled_argv_falls_back(self):
+        seen = []
+        t = gh.HttpTransport(connect=self.server.connect,
+                             fallback=lambda args: seen.append(args) or "fallback")
+        for argv in (["pr", "view", "3"],
+                     ["api", "--paginate", "repos/acme/web/issues"],
+                     ["api", "repos/{owner}/{repo}"],
+                     ["api", "graphql", "-F", "query=@q.graphql"]):
+            self.assertEqual(t(argv), "fallback")
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(t.stats["fallbacks"], 4)
+
+
+class TestConnectionPool(TransportTestBase):
+    def test_one_connection_reused_across_calls(self):
+        for _ in range(5):
+            self.t(["api", "graphql", "-f", "query={viewer{login}}"])
+        self.assertEqual(len(self.server.opened), 1)
+        self.assertEqual(len({r["conn"] for r in self.server.requests}), 1)
+        self.assertEqual(self.t.stats, {"requests": 5, "connections": 1, "fallbacks": 0})
+
+    def test_server_close_is_not_pooled(self):
+        self.server.responses = [(200, "{}", {"Connection": "close"}), (200, "{}", {})]
+        self.t(["api", "user"])
+        self.t(["api", "user"])
+        self.assertEqual(len(self.server.opened), 2)
+        self.assertTrue(self.server.opened[0][2].closed)
+
+    def test_stale_pooled_connection_retried_once(self):
+        self.t(["api", "user"])
+        self.server.opened[0][2].stale = True
+        self.t(["api", "user"])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(len(self.server.opened), 2)
+
+    def test_stats_stay_exact_across_fan_out_workers(self):
+        calls = [lambda: self.t(["api", "user"]) for _ in range(40)]
+        calls += [lambda: self.t(["pr", "view", "3"]) for _ in range(10)]
+        t = self.t
+        t._fallback = lambda args: "fallback"
+        gh.fan_out(calls, max_workers=8)
+        self.assertEqual(t.stats["requests"], 40)
+        self.assertEqual(t.stats["fallbacks"], 10)
+        self.assertEqual(t.stats["connections"], len(self.server.opened))
+
+    def test_close_drains_pool(self):
+        self.t(["api", "user"])
+        self.t.close()
+        self.assertTrue(self.server.opened[0][2].closed)
+
+
+class TestAuthAndErrors(TransportTestBase):
+    def test_app_token_sent_and_github_token_ignored(self):
+        os.environ["GITHUB_TOKEN"] = "ghp_forbiddenworkflowtoken123456"
+        self.t(["api", "user"])
+        auth = self.server.requests[0]["headers"]["Authorization"]
+        self.assertEqual(auth, "token ghs_apptoken1234567890abcdef")
+
+    def test_gh_token_wins_over_app_token(self):
+        os.environ["GH_TOKEN"] = "ghs_perCallToken0987654321"
+        self.t(["api", "user"])
+        self.assertIn("ghs_perCallToken0987654321",
+                      self.server.requests[0]["headers"]["Authorization"])
+
+    def test_argv_authorization_header_wins(self):
+        self.t(["api", "-H", "Authorization: Bearer jwt.part.sig", "/app/installations"])
+        req = self.server.requests[0]
+        self.assertEqual(req["headers"]["Authorization"], "Bearer jwt.part.sig")
+        self.assertEqual(req["path"], "/app/installations")
+
+    def test_http_error_is_scrubbed_gherror(self):
+        self.server.responses = [(401, json.dumps(
+            {"message": "Bad credentials ghs_apptoken1234567890abcdef"}), {})]
+        with self.assertRaises(gh.GhError) as ctx:
+            self.t(["api", "user"])
+        msg = str(ctx.exception)
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertIn("HTTP 401", msg)
+        self.assertNotIn("ghs_apptoken1234567890abcdef", msg)
+
+    def test_graphql_errors_returned_for_caller(self):
+        # GraphQL-level errors come back 200; gh.graphql() raises on them.
+        self.server.responses = [(200, '{"errors": [{"message": "nope"}]}', {})]
+        saved = gh.RUN
+        gh.RUN = self.t
+        try:
+            with self.assertRaises(gh.GhError):
+                gh.graphql("query{viewer{login}}", {})
+        finally:
+            gh.RUN = saved
+
+
+class TestRunnerSelection(unittest.TestCase):
+    def test_opt_in_env(self):
+        saved = os.environ.pop("GH_PROJECTS_TRANSPORT", None)
+        try:
+            self.assertIs(gh._select_runner(), gh._default_run)
+            os.environ["GH_PROJECTS_TRANSPORT"] = "http"
+            self.assertIsInstance(gh._select_runner(), gh.HttpTransport)
+        finally:
+            os.environ.pop("GH_PROJECTS_TRANSPORT", None)
+            if saved is not None:
+                os.environ["GH_PROJECTS_TRANSPORT"] = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
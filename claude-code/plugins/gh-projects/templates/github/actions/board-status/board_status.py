@@ -11,7 +11,11 @@ What it does (one step added to an existing deploy job):
     (the item stays OPEN — staging is not a terminal state).
   * prod success    -> set Status to `Done`, CLOSE the issue, and PUBLISH the
     tag's Release. Shipped issues are resolved from the DEPLOYED SHA
-    (SHA -> merged PRs -> their linked/referenced issues).
+    (SHA -> merged PRs -> their linked/referenced issues), or from the whole
+    deploy range with `--from-sha` (every commit since the last deploy).
+  * Or run it as a long-lived WORKER (`--stdin` / `--serve PORT`) fed deploy
+    events by a local sender: the token stays warm, and a burst is coalesced
+    into one batched advance per target.
 
 Hard rules baked in:
   * Deterministic & free — NO metered AI/model call anywhere.
@@ -29,32 +33,180 @@ Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
 """
 from __future__ import annotations
 
+import hashlib
+import hmac
+import ipaddress
 import json
 import os
+import queue
+import random
 import re
 import subprocess
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
 # --------------------------------------------------------------------------- #
 # Injectable command runner (the single offline seam) — vendored, no import.
 # --------------------------------------------------------------------------- #
 class GhError(Exception):
-    def __init__(self, msg: str, code: int = 1):
+    def __init__(self, msg: str, code: int = 1, stdout: str | None = None,
+                 stderr: str | None = None):
         super().__init__(msg)
         self.code = code
+        self.stdout = stdout  # a failed `gh api graphql` still prints its payload
+        self.stderr = stderr  # gh's own error text; retries classify from it
 
 
 def _default_run(args) -> str:
     """Shell out to `gh <args>`; return stdout. Never echoes argv (token-safe)."""
     proc = subprocess.run(["gh", *[str(a) for a in args]], capture_output=True, text=True)
     if proc.returncode != 0:
-        raise GhError(f"gh {_redact(args)} failed: {_scrub(proc.stderr.strip())}", code=1)
+        raise GhError(f"gh {_redact(args)} failed: {_scrub(proc.stderr.strip())}", code=1,
+                      stdout=proc.stdout, stderr=proc.stderr)
     return proc.stdout
 
 
+# --------------------------------------------------------------------------- #
+# Rate-limit scheduler — a compact copy of lib/ratelimit.py's Scheduler
+# (vendored: this file imports nothing from the plugin). GraphQL queries get a
+# `ghpRateLimit: rateLimit{...}` selection; the budget it reports paces calls
+# ahead of exhaustion, and secondary-limit / 5xx failures retry with jittered
+# backoff (5xx for reads only). `GH_PROJECTS_RATE_LIMIT=off` disables it.
+# --------------------------------------------------------------------------- #
+_RL_ALIAS = "ghpRateLimit"
+_RL_RATE = re.compile(r"secondary rate limit|abuse detection|rate limit exceeded|"
+                      r"HTTP 429|too many requests", re.IGNORECASE)
+_RL_SERVER = re.compile(r"HTTP 5\d\d|server error|bad gateway|service unavailable|"
+                        r"gateway time-?out|timed? ?out|connection (?:lost|reset)", re.IGNORECASE)
+_RL_RETRY_AFTER = re.compile(r"retry[- ]after:?\s*(\d+)", re.IGNORECASE)
+_RL_OPENS = re.compile(r"([A-Za-z_]\w*)\s*(?:\([^()]*\))?\s*\{")
+
+
+class _Scheduler:
+    def __init__(self, run, *, clock=None, sleep=None, rand=None, max_retries=4,
+                 base_delay=1.0, max_delay=300.0, secondary_wait=60.0, reserve=50):
+        self.run = run
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.rand = rand or random.random
+        self.max_retries, self.base_delay, self.max_delay = max_retries, base_delay, max_delay
+        self.secondary_wait, self.reserve = secondary_wait, reserve
+        self.remaining, self.limit, self.reset_at, self.cost = None, 5000, None, 1
+        self.stats = {"requests": 0, "retries": 0, "waited_s": 0.0, "points_used": 0}
+        self.pages = []
+
+    def __call__(self, args):
+        argv = [str(a) for a in args]
+        gql = argv[:2] == ["api", "graphql"]
+        qi = next((i + 1 for i in range(len(argv) - 1)
+                   if argv[i] == "-f" and argv[i + 1].startswith("query=")), None)
+        mutation = qi is not None and argv[qi][6:].lstrip().startswith("mutation")
+        if gql and qi is not None and not mutation and "rateLimit" not in argv[qi] \
+                and "fragment " not in argv[qi] and "}" in argv[qi]:
+            end = argv[qi].rfind("}")
+            argv[qi] = (argv[qi][:end] + f" {_RL_ALIAS}: rateLimit {{ cost remaining resetAt limit nodeCount }}"
+                        + argv[qi][end:])
+        read = (gql and qi is not None and not mutation) or "--help" in argv
+        attempt = 0
+        while True:
+            self._pace()
+            self.stats["requests"] += 1
+            try:
+                out = self.run(argv)
+            except Exception as e:  # noqa: BLE001 — re-raised unless retryable
+                # gh's stderr only: the message also carries the argv.
+                msg = str(e.stderr) if getattr(e, "stderr", None) is not None else str(e)
+                kind = "rate" if _RL_RATE.search(msg) else "server" if _RL_SERVER.search(msg) else None
+                if kind is None or attempt >= self.max_retries or (kind == "server" and not read):
+                    raise
+                self._wait(self._backoff(attempt, kind, msg))
+                self.stats["retries"] += 1
+                attempt += 1
+                continue
+            if gql:
+                self._observe(out, argv[qi] if qi is not None else "")
+            return out
+
+    def _observe(self, out, query=""):
+        rl = None
+        if isinstance(out, str) and _RL_ALIAS in out:
+            try:
+                rl = (json.loads(out).get("data") or {}).get(_RL_ALIAS)
+            except (ValueError, AttributeError):
+                rl = None
+        if not isinstance(rl, dict):
+            self.stats["points_used"] += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            return
+        cost = int(rl.get("cost") or 1)
+        self.stats["points_used"] += cost
+        self.cost = max(self.cost, cost)
+        self.remaining = int(rl.get("remaining", 0))
+        self.limit = int(rl.get("limit") or self.limit)
+        try:
+            self.reset_at = datetime.fromisoformat(
+                str(rl.get("resetAt")).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+        names = [n for n in _RL_OPENS.findall(query) if n not in ("query", "mutation", "on", "rateLimit")]
+        self.pages.append({"op": ".".join(names[:3]) or "graphql", "cost": cost,
+                           "nodes": rl.get("nodeCount"), "remaining": self.remaining})
+
+    def _pace(self):
+        if self.remaining is None or self.reset_at is None:
+            return
+        until = self.reset_at - self.clock()
+        if until <= 0:
+            self.remaining = None
+            return
+        if self.remaining - self.cost < self.reserve:
+            self._wait(until + 1)
+            self.remaining = None
+            return
+        if self.remaining < max(self.reserve + self.cost, self.limit // 10):
+            self._wait(until / max(1, (self.remaining - self.reserve) // self.cost))
+
+    def _backoff(self, attempt, kind, msg):
+        hinted = _RL_RETRY_AFTER.search(msg)
+        if hinted:
+            return float(hinted.group(1)) + self.rand()
+        if kind == "rate" and self.remaining is not None and self.remaining <= 0 \
+                and self.reset_at is not None:
+            return max(self.reset_at - self.clock(), 0.0) + 1 + self.rand()
+        cap = min(self.max_delay, (self.secondary_wait if kind == "rate" else self.base_delay)
+                  * (2 ** attempt))
+        return cap / 2 + self.rand() * cap / 2
+
+    def _wait(self, seconds):
+        if seconds > 0:
+            self.stats["waited_s"] += seconds
+            self.sleep(seconds)
+
+    def report(self):
+        return {**self.stats, "waited_s": round(self.stats["waited_s"], 3),
+                "remaining": self.remaining, "limit": self.limit,
+                "reset_at": (datetime.fromtimestamp(self.reset_at, timezone.utc)
+                             .strftime("%Y-%m-%dT%H:%M:%SZ") if self.reset_at else None)}
+
+
+def _emit_budget(pages=False):
+    """One `budget: {...}` line on stderr when the scheduler made calls; with
+    `pages` (`--cost-report`), first one `cost: {...}` line per charged query."""
+    if isinstance(RUN, _Scheduler) and RUN.stats["requests"]:
+        for page in RUN.pages if pages else ():
+            sys.stderr.write("cost: " + json.dumps(page) + "\n")
+        sys.stderr.write("budget: " + json.dumps(RUN.report()) + "\n")
+
+
 # Tests replace this with a fake. Signature: RUN(list[str]) -> str (stdout).
-RUN = _default_run
+RUN = (_Scheduler(_default_run)
+       if os.environ.get("GH_PROJECTS_RATE_LIMIT", "").lower() not in ("off", "0", "false", "no")
+       else _default_run)
 
 
 # --------------------------------------------------------------------------- #
@@ -100,10 +252,25 @@ def graphql(query: str, variables: dict | None = None, *, token: str | None = No
     raw = _run_with_token(args, token)
     payload = json.loads(raw) if raw.strip() else {}
     if isinstance(payload, dict) and payload.get("errors"):
-        raise GhError(f"graphql errors: {_scrub(json.dumps(payload['errors']))}", code=1)
+        raise GhError(f"graphql errors: {_scrub(json.dumps(payload['errors']))}", code=1,
+                      stdout=raw)
     return payload.get("data", payload) if isinstance(payload, dict) else {}
 
 
+def _not_found_data(err: GhError) -> dict:
+    """The `data` of a read whose only errors are NOT_FOUND (GitHub answers an
+    issue that does not exist with a null alias plus an error, and gh exits
+    non-zero); any other failure is re-raised."""
+    try:
+        payload = json.loads(err.stdout or "")
+    except ValueError:
+        raise err from None
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    if not errors or any(e.get("type") != "NOT_FOUND" for e in errors):
+        raise err
+    return payload.get("data") or {}
+
+
 def _run_with_token(args, token):
     """Invoke RUN with the App token exported as GH_TOKEN for this call only.
 
@@ -204,6 +371,88 @@ def resolve_shipped_issues(owner: str, repo: str, sha: str, *, token: str | None
     return issues
 
 
+# --------------------------------------------------------------------------- #
+# Deploy-RANGE resolution: every commit a multi-commit deploy shipped.
+# --------------------------------------------------------------------------- #
+# A prod deploy usually ships a release train, not one commit: the deployed
+# SHA's own associated PRs miss every other PR merged since the last deploy.
+# `--from-sha A --to-sha B` walks the compare range A...B (the commits
+# reachable from B but not A — exact, unlike a date-ordered history walk),
+# one REST page at a time, and streams each page through two batched reads:
+#   1. commits -> their merged PRs (one aliased `object(oid:)` per commit);
+#   2. PRs seen for the FIRST time -> their closing issues (one aliased
+#      `pullRequest(number:)` per PR) — a PR's many commits cost one lookup.
+# A 40-PR train over a few hundred commits is a handful of round-trips.
+RANGE_PAGE = 100      # commits per compare page (GitHub's per_page cap)
+RANGE_BATCH = 50      # aliases per batched lookup document
+
+
+def range_commit_pages(owner: str, repo: str, from_sha: str, to_sha: str, *,
+                       token: str | None = None):
+    """Yield the compare range's commit SHAs page by page (oldest first)."""
+    page = 1
+    while True:
+        raw = _run_with_token(
+            ["api", f"/repos/{owner}/{repo}/compare/{from_sha}...{to_sha}"
+                    f"?per_page={RANGE_PAGE}&page={page}",
+             "--jq", "[.commits[].sha]"], token)
+        shas = json.loads(raw) if raw.strip() else []
+        if shas:
+            yield shas
+        if len(shas) < RANGE_PAGE:
+            return
+        page += 1
+
+
+def _batched(owner: str, repo: str, selections: list, *, token: str | None = None) -> dict:
+    """Run aliased `repository{...}` selections, RANGE_BATCH per document;
+    returns the merged {alias: node}."""
+    out = {}
+    for i in range(0, len(selections), RANGE_BATCH):
+        doc = ("query($owner:String!, $repo:String!){ repository(owner:$owner, name:$repo){ "
+               + " ".join(selections[i:i + RANGE_BATCH]) + " } }")
+        data = graphql(doc, {"owner": owner, "repo": repo}, token=token)
+        out.update((data.get("repository") or {}))
+    return out
+
+
+def resolve_range_issues(owner: str, repo: str, from_sha: str, to_sha: str, *,
+                         token: str | None = None) -> list:
+    """Return the de-duplicated issue dicts ({number,id}) shipped by the range.
+
+    from_sha...to_sha -> every commit -> its merged PRs -> the issues each PR
+    closed. Order-stable (first appearance in the range), de-duplicated by PR
+    and by issue number.
+    """
+    seen_prs, seen, issues = set(), set(), []
+    for shas in range_commit_pages(owner, repo, from_sha, to_sha, token=token):
+        commits = _batched(owner, repo, [
+            f'c{i}: object(oid:{json.dumps(sha)}){{ ... on Commit {{ '
+            f'associatedPullRequests(first:5){{ nodes{{ number merged }} }} }} }}'
+            for i, sha in enumerate(shas)], token=token)
+        prs = []
+        for i in range(len(shas)):
+            for pr in (((commits.get(f"c{i}") or {}).get("associatedPullRequests") or {})
+                       .get("nodes")) or []:
+                num = pr.get("number")
+                if pr.get("merged") is False or num is None or num in seen_prs:
+                    continue
+                seen_prs.add(num)
+                prs.append(int(num))
+        closing = _batched(owner, repo, [
+            f"p{i}: pullRequest(number:{num}){{ "
+            f"closingIssuesReferences(first:50){{ nodes{{ number id }} }} }}"
+            for i, num in enumerate(prs)], token=token)
+        for i in range(len(prs)):
+            for iss in (((closing.get(f"p{i}") or {}).get("closingIssuesReferences") or {})
+                        .get("nodes")) or []:
+                num = iss.get("number")
+                if num is not None and num not in seen:
+                    seen.add(num)
+                    issues.append({"number": num, "id": iss.get("id")})
+    return issues
+
+
 # --------------------------------------------------------------------------- #
 # Project item resolution + current-Status read (for the monotonic guard).
 # --------------------------------------------------------------------------- #
@@ -271,6 +520,11 @@ class ProjectStatus:
 
     def resolve(self) -> "ProjectStatus":
         data = graphql(_PROJECT_FIELDS, {"owner": self.owner, "number": self.number}, token=self.token)
+        return self.load(data)
+
+    def load(self, data: dict) -> "ProjectStatus":
+        """Fill the project id + Status field/options from a read that selected
+        `organization.projectV2 { id field(name:"Status") }`."""
         proj = (((data.get("organization") or {}).get("projectV2")) or {})
         if not proj.get("id"):
             raise GhError(f"project {self.owner}#{self.number} not found", code=3)
@@ -299,7 +553,11 @@ def issue_id_by_number(owner: str, repo: str, number: int, *, token: str | None
 def current_status_for_issue(issue_id: str, project_number: int, *, token: str | None = None):
     """Return (item_id, current_status_name) for this issue on the project."""
     data = graphql(_ITEM_FOR_ISSUE, {"issue": issue_id}, token=token)
-    node = data.get("node") or {}
+    return _project_item(data.get("node") or {}, project_number)
+
+
+def _project_item(node: dict, project_number: int):
+    """(item id, current Status) of an issue node on the project, or (None, None)."""
     for it in ((node.get("projectItems") or {}).get("nodes")) or []:
         if (it.get("project") or {}).get("number") == int(project_number):
             cur = (it.get("fieldValueByName") or {}).get("name")
@@ -307,8 +565,62 @@ def current_status_for_issue(issue_id: str, project_number: int, *, token: str |
     return None, None
 
 
-def set_status(project: "ProjectStatus", item_id: str, target_status: str) -> dict:
+# Every shipped issue's id, state and project item + current Status, read as
+# aliases of ONE document (`i0: node(id:...) i1: ...`; `n0: issue(number:)`
+# for explicit refs) that also selects the project's Status field — a release
+# of up to READ_BATCH issues is a single read, not two per issue.
+READ_BATCH = 100
+
+_ISSUE_FIELDS = (
+    '{ ... on Issue { id number state projectItems(first:20){ nodes{ id project{ id number } '
+    'fieldValueByName(name:"Status"){ ... on ProjectV2ItemFieldSingleSelectValue { name } } '
+    '} } } }'
+)
+
+
+def read_deploy(owner: str, repo: str, project_number: int, issues: list, *,
+                token: str | None = None):
+    """Resolve the project and every shipped issue in batched aliased reads.
+
+    Returns (ProjectStatus, [issue node or None, aligned with `issues`]). An
+    issue with a known node id is read by id (a closing reference may live in
+    another repo); one without, by number in `owner/repo`.
+    """
+    project = ProjectStatus(owner, project_number, token=token)
+    nodes: list = []
+    for start in range(0, max(len(issues), 1), READ_BATCH):
+        chunk = issues[start:start + READ_BATCH]
+        by_number = [f'n{i}: issue(number:{int(iss["number"])}){_ISSUE_FIELDS}'
+                     for i, iss in enumerate(chunk) if not iss.get("id")]
+        parts = [f'i{i}: node(id:{json.dumps(iss["id"])}){_ISSUE_FIELDS}'
+                 for i, iss in enumerate(chunk) if iss.get("id")]
+        if by_number:
+            parts.append(f"repository(owner:{json.dumps(owner)}, name:{json.dumps(repo)}){{ "
+                         + " ".join(by_number) + " }")
+        if start == 0:
+            parts.append(f"organization(login:{json.dumps(owner)}){{ "
+                         f"projectV2(number:{int(project_number)}){{ id field(name:\"Status\"){{ "
+                         "... on ProjectV2SingleSelectField { id name options{ id name } } } } }")
+        try:
+            data = graphql("query{ " + " ".join(parts) + " }", token=token)
+        except GhError as e:
+            data = _not_found_data(e)  # a missing issue reads as None below
+        if start == 0:
+            project.load(data)
+        in_repo = data.get("repository") or {}
+        nodes += [data.get(f"i{i}") if iss.get("id") else in_repo.get(f"n{i}")
+                  for i, iss in enumerate(chunk)]
+    return project, nodes
+
+
+def set_status(project: "ProjectStatus", item_id: str, target_status: str,
+               *, batch: "_MutationBatch | None" = None) -> dict:
+    """Write the item's Status. With `batch`, the write is only queued (keyed by
+    `item_id`) and lands when the batch flushes."""
     opt = project.option_id(target_status)
+    if batch is not None:
+        batch.add(item_id, item_id, project.status_field_id, opt)
+        return {"item": item_id, "status": target_status, "queued": True}
     graphql(
         _UPDATE_STATUS,
         {"project": project.id, "item": item_id, "field": project.status_field_id, "opt": opt},
@@ -317,6 +629,95 @@ def set_status(project: "ProjectStatus", item_id: str, target_status: str) -> di
     return {"item": item_id, "status": target_status}
 
 
+# A deploy that ships N issues packs its Status writes — and, separately, its
+# closes — into aliased documents (`w0: updateProjectV2ItemFieldValue(...)
+# w1: ...`): ceil(N / BATCH_MAX_OPS) round-trips each instead of N. A failed
+# alias (`errors[].path[0]`) maps back to the item/issue that did not land.
+BATCH_MAX_OPS = 50
+BATCH_MAX_BYTES = 60_000
+
+
+class _MutationBatch:
+    """Queue single-select writes (or issue closes); flush as bounded aliased
+    mutation documents.
+
+    `failures` collects {key: message}; `written` the keys whose alias echoed
+    the item (issue) id back.
+    """
+
+    def __init__(self, project_id: str, *, token: str | None = None,
+                 max_ops: int = BATCH_MAX_OPS, max_bytes: int = BATCH_MAX_BYTES):
+        self.project_id = project_id
+        self.token = token
+        self.max_ops = max(1, int(max_ops))
+        self.max_bytes = int(max_bytes)
+        self._pending: list = []
+        self._size = 0
+        self.written: list = []
+        self.failures: dict = {}
+        self.round_trips = 0
+
+    def add(self, key, item_id: str, field_id: str, option_id: str) -> None:
+        selection = (
+            "updateProjectV2ItemFieldValue(input:{projectId:%s,itemId:%s,fieldId:%s,"
+            "value:{singleSelectOptionId:%s}}){projectV2Item{id}}"
+            % (json.dumps(self.project_id), json.dumps(item_id),
+               json.dumps(field_id), json.dumps(option_id))
+        )
+        self._queue(key, item_id, selection, "projectV2Item")
+
+    def close(self, key, issue_id: str) -> None:
+        selection = ("closeIssue(input:{issueId:%s,stateReason:COMPLETED}){issue{id}}"
+                     % json.dumps(issue_id))
+        self._queue(key, issue_id, selection, "issue")
+
+    def _queue(self, key, node_id: str, selection: str, echo: str) -> None:
+        if self._pending and self._size + len(selection) > self.max_bytes:
+            self.flush()
+        self._pending.append((key, node_id, selection, echo))
+        self._size += len(selection) + 8
+        if len(self._pending) >= self.max_ops:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending, self._size = self._pending, [], 0
+        doc = "mutation{" + " ".join(
+            f"w{i}:{sel}" for i, (_, _, sel, _) in enumerate(pending)) + "}"
+        self.round_trips += 1
+        try:
+            raw = _run_with_token(["api", "graphql", "-f", f"query={doc}"], self.token)
+        except GhError as e:
+            # gh exits non-zero on any `errors`; the partial payload is on stdout.
+            raw = e.stdout or ""
+            if '"errors"' not in raw:
+                raw = json.dumps({"errors": [{"message": str(e)}]})
+        try:
+            payload = json.loads(raw) if raw.strip() else {}
+        except ValueError:
+            payload = {}
+        payload = payload if isinstance(payload, dict) else {}
+        data = payload.get("data") or {}
+        by_alias, other = {}, []
+        for err in payload.get("errors") or []:
+            path = err.get("path") or []
+            msg = _scrub(err.get("message") or json.dumps(err))
+            if path and str(path[0]).startswith("w"):
+                by_alias[str(path[0])] = msg
+            else:
+                other.append(msg)
+        for i, (key, node_id, _, echo) in enumerate(pending):
+            alias = f"w{i}"
+            echoed = ((data.get(alias) or {}).get(echo) or {}).get("id")
+            if alias in by_alias:
+                self.failures[key] = by_alias[alias]
+            elif echoed != node_id:
+                self.failures[key] = "; ".join(other) or "no item echoed back"
+            else:
+                self.written.append(key)
+
+
 def close_issue(issue_id: str, *, token: str | None = None) -> dict:
     data = graphql(_CLOSE_ISSUE, {"issue": issue_id}, token=token)
     return (data.get("closeIssue") or {}).get("issue") or {}
@@ -352,69 +753,381 @@ def publish_release(repo: str, tag: str, *, token: str | None = None) -> dict:
 # The two operations the action invokes.
 # --------------------------------------------------------------------------- #
 def run_staging(owner: str, repo: str, project_number: int, sha: str, *, token: str | None = None,
-                explicit_issues: list | None = None) -> dict:
+                explicit_issues: list | None = None, from_sha: str | None = None) -> dict:
     """Staging success -> advance shipped issues to `On Staging` (item stays OPEN).
 
     NOTE: the item is NOT closed and NOT moved to Done on staging — staging is a
     non-terminal stage. This mirrors the native 'PR merged -> On Staging'
     built-in target (also non-terminal, item stays open); see action.yml notes.
+    With `from_sha`, everything in the range `from_sha...sha` shipped.
     """
     return _apply_status(
         owner, repo, project_number, sha, "On Staging",
         close=False, release_tag=None, token=token, explicit_issues=explicit_issues,
+        from_sha=from_sha,
     )
 
 
 def run_prod(owner: str, repo: str, project_number: int, sha: str, *, tag: str | None = None,
-             token: str | None = None, explicit_issues: list | None = None) -> dict:
-    """Prod success -> Done + close the issue + publish the tag's Release."""
+             token: str | None = None, explicit_issues: list | None = None,
+             from_sha: str | None = None) -> dict:
+    """Prod success -> Done + close the issue + publish the tag's Release.
+    With `from_sha`, everything in the range `from_sha...sha` shipped."""
     return _apply_status(
         owner, repo, project_number, sha, "Done",
         close=True, release_tag=tag, token=token, explicit_issues=explicit_issues,
+        from_sha=from_sha,
     )
 
 
 def _apply_status(owner, repo, project_number, sha, target_status, *, close, release_tag,
-                  token, explicit_issues):
-    project = ProjectStatus(owner, project_number, token=token).resolve()
-
+                  token, explicit_issues, from_sha=None):
     if explicit_issues:
-        issues = []
-        for num in explicit_issues:
-            iss = issue_id_by_number(owner, repo, int(num), token=token)
-            issues.append({"number": int(num), "id": iss["id"]})
+        issues = [{"number": int(num), "id": None} for num in explicit_issues]
+    elif from_sha:
+        issues = resolve_range_issues(owner, repo, from_sha, sha, token=token)
     else:
         issues = resolve_shipped_issues(owner, repo, sha, token=token)
+    out = {"target": target_status, "sha": sha,
+           "issues": _advance(owner, repo, project_number, issues, target_status,
+                              close=close, token=token)}
+    if from_sha and not explicit_issues:
+        out["from_sha"] = from_sha
+    failed = [r["issue"] for r in out["issues"] if "error" in r]
+    if failed:
+        out["failed"] = failed
+    if release_tag:
+        out["release"] = publish_release(f"{owner}/{repo}", release_tag, token=token)
+    return out
 
-    results = []
-    for iss in issues:
-        issue_id = iss.get("id")
-        if not issue_id:
-            issue_id = issue_id_by_number(owner, repo, iss["number"], token=token)["id"]
-        item_id, current = current_status_for_issue(issue_id, project_number, token=token)
+
+def _advance(owner, repo, project_number, issues, target_status, *, close, token) -> list:
+    """Advance `issues` ([{number, id}]) toward `target_status`; per-issue results."""
+    # One batched read resolves the project and every issue's item + current
+    # Status; the MONOTONIC decision is made in memory, then the Status writes
+    # go out as one aliased document and — only after they all landed, so an
+    # issue is never closed while its Status write failed — the closes as a
+    # second.
+    project, nodes = read_deploy(owner, repo, project_number, issues, token=token)
+    missing = [iss["number"] for iss, node in zip(issues, nodes) if not (node or {}).get("id")]
+    if missing:
+        raise GhError("issue " + ", ".join(f"{owner}/{repo}#{n}" for n in missing)
+                      + " not found", code=3)
+    batch = _MutationBatch(project.id, token=token)
+    planned = []
+    for iss, node in zip(issues, nodes):
+        item_id, current = _project_item(node, project_number)
         if item_id is None:
-            results.append({"issue": iss["number"], "skipped": "not-on-project"})
+            planned.append(({"issue": iss["number"], "skipped": "not-on-project"}, node, None))
             continue
         # MONOTONIC guard: only advance; a replayed/stale event is a no-op.
         to_write = advance_status(current, target_status)
-        wrote = False
         if to_write is not None:
-            set_status(project, item_id, to_write)
-            wrote = True
-        closed = False
-        if close:
-            # Issue is closed at PROD only (never by board-sync / Closes #N).
-            close_issue(issue_id, token=token)
-            closed = True
-        results.append({
-            "issue": iss["number"], "from": current, "to": (to_write or current),
-            "wrote": wrote, "closed": closed,
-        })
-
-    out = {"target": target_status, "sha": sha, "issues": results}
-    if release_tag:
-        out["release"] = publish_release(f"{owner}/{repo}", release_tag, token=token)
-    return out
+            set_status(project, item_id, to_write, batch=batch)
+        planned.append(({"issue": iss["number"], "from": current, "to": (to_write or current),
+                         "wrote": to_write is not None}, node, item_id))
+    batch.flush()
+    if batch.failures:
+        failed = set(batch.failures)
+        nums = [r["issue"] for r, _, item in planned if item in failed]
+        detail = "; ".join(f"#{n}" for n in nums)
+        raise GhError(f"Status write failed for {detail}: "
+                      f"{'; '.join(sorted(set(batch.failures.values())))}", code=1)
+
+    # Issues are closed at PROD only (never by board-sync / Closes #N); one
+    # already closed needs no mutation. A close that fails is reported on its
+    # issue's row — the others still closed, and the report lists them.
+    closes = _MutationBatch(project.id, token=token)
+    if close:
+        for _, node, item_id in planned:
+            if item_id is not None and node.get("state") != "CLOSED":
+                closes.close(node["id"], node["id"])
+        closes.flush()
+
+    results = []
+    for result, node, item_id in planned:
+        if item_id is not None:
+            result["closed"] = bool(close) and node["id"] not in closes.failures
+            if node["id"] in closes.failures:
+                result["error"] = "close failed: " + closes.failures[node["id"]]
+        results.append(result)
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# Long-lived WORKER mode (`--stdin` / `--serve PORT`).
+# --------------------------------------------------------------------------- #
+# A deploy pipeline that reports many deploys (per-service staging rollouts, a
+# train of prod promotions) can feed them to one long-running worker from a
+# local sender instead of a job step each: the token stays warm, and a burst
+# is COALESCED — each shipped SHA / range is resolved once, each issue moves
+# once toward the most advanced target in the burst (Done beats On Staging)
+# through the same MONOTONIC guard, and the writes + closes go out batched.
+# An event is either a GitHub `deployment_status` webhook (state success, the
+# environment named by --staging-env / --prod-env; `from_sha` / `tag` may ride
+# in the deployment's payload, else a `refs/tags/` ref is the tag; untagged, a
+# prod deploy moves its issues but publishes nothing) or a `deploy` event whose
+# payload carries the CLI's fields: {status: staging|prod, sha, from_sha, tag,
+# issues}.
+class Worker:
+    """Applies bursts of (event name, payload) for one repo + project.
+
+    `token_file` is re-read whenever it changes, so an external refresher can
+    rotate the hour-long App installation token under a running worker.
+    """
+
+    def __init__(self, owner: str, repo: str, project_number: int, *,
+                 token: str | None = None, token_file: str | None = None,
+                 staging_env: str = "staging", prod_env: str = "production"):
+        self.owner = owner
+        self.repo = repo
+        self.project_number = int(project_number)
+        self.token_file = token_file
+        self.staging_env = staging_env
+        self.prod_env = prod_env
+        self._token = token
+        self._token_mtime = None
+
+    @property
+    def token(self) -> str | None:
+        if self.token_file:
+            try:
+                mtime = os.stat(self.token_file).st_mtime
+                if mtime != self._token_mtime:
+                    with open(self.token_file, "r", encoding="utf-8") as fh:
+                        self._token = fh.read().strip() or None
+                    self._token_mtime = mtime
+            except OSError:
+                pass  # keep the last good token
+        return self._token
+
+    def _deploy(self, name: str, payload: dict):
+        """The event as a deploy dict, or a skip result."""
+        untagged = False
+        if name == "deployment_status":
+            state = (payload.get("deployment_status") or {}).get("state")
+            dep = payload.get("deployment") or {}
+            env = dep.get("environment")
+            status = {self.staging_env: "staging", self.prod_env: "prod"}.get(env)
+            if state != "success" or status is None:
+                return {"skipped": "event-ignored", "environment": env, "state": state}
+            extra = dep.get("payload") if isinstance(dep.get("payload"), dict) else {}
+            # Only a tag ref names a Release; a branch or SHA ref publishes none.
+            ref = str(dep.get("ref") or "")
+            tag = extra.get("tag") or (ref[len("refs/tags/"):] if ref.startswith("refs/tags/")
+                                       else None)
+            payload = {"status": status, "sha": dep.get("sha"),
+                       "from_sha": extra.get("from_sha"), "tag": tag}
+            untagged = not tag
+        elif name != "deploy":
+            return {"skipped": "event-ignored", "event": name}
+        deploy = {"status": payload.get("status"), "sha": payload.get("sha") or "",
+                  "from_sha": payload.get("from_sha") or None, "tag": payload.get("tag") or None,
+                  "issues": _split_issue_refs(" ".join(str(i) for i in payload.get("issues") or []))}
+        if deploy["status"] not in ("staging", "prod"):
+            return {"skipped": "event-ignored", "status": deploy["status"]}
+        if not deploy["sha"] and not deploy["issues"]:
+            return {"skipped": "no-sha-or-issues"}
+        if deploy["status"] == "prod" and not deploy["tag"] and not untagged:
+            return {"skipped": "prod-needs-tag", "sha": deploy["sha"]}
+        return deploy
+
+    def handle(self, events, results: list | None = None) -> list:
+        """Apply one burst; returns the skips, the per-issue results and each
+        published Release. Rows go into `results` as they land, so a caller
+        keeps them if a write raises."""
+        token = self.token
+        results = [] if results is None else results
+        shipped, tags, resolved = {}, [], {}
+        for name, payload in events:
+            deploy = self._deploy(name, payload or {})
+            if "skipped" in deploy:
+                results.append(deploy)
+                continue
+            source = (deploy["sha"], deploy["from_sha"], tuple(deploy["issues"]))
+            if source not in resolved:
+                try:
+                    if deploy["issues"]:
+                        resolved[source] = [{"number": n, "id": None} for n in deploy["issues"]]
+                    elif deploy["from_sha"]:
+                        resolved[source] = resolve_range_issues(
+                            self.owner, self.repo, deploy["from_sha"], deploy["sha"], token=token)
+                    else:
+                        resolved[source] = resolve_shipped_issues(
+                            self.owner, self.repo, deploy["sha"], token=token)
+                except GhError as e:
+                    resolved[source] = []
+                    results.append({"sha": deploy["sha"], "error": _scrub(str(e)), "code": e.code})
+            target = "Done" if deploy["status"] == "prod" else "On Staging"
+            for iss in resolved[source]:
+                have = shipped.get(iss["number"])
+                if have is None or status_rank(target) > status_rank(have[1]):
+                    shipped[iss["number"]] = (iss, target)
+            if deploy["status"] == "prod" and not deploy["tag"]:
+                results.append({"release": None, "skipped": "no-tag", "sha": deploy["sha"]})
+            elif deploy["status"] == "prod" and deploy["tag"] not in tags:
+                tags.append(deploy["tag"])
+        for target in ("On Staging", "Done"):
+            issues = [iss for iss, t in shipped.values() if t == target]
+            if issues:
+                for row in _advance(self.owner, self.repo, self.project_number, issues, target,
+                                    close=target == "Done", token=token):
+                    results.append(dict(row, target=target))
+        for tag in tags:
+            results.append(publish_release(f"{self.owner}/{self.repo}", tag, token=token))
+        return results
+
+
+# Transport: one JSON event per line on stdin, or `POST /` on a LOCAL HTTP
+# endpoint (body = the event payload; `X-GitHub-Event` names it; with a
+# webhook secret, `X-Hub-Signature-256` must verify). Both feed one queue; a
+# single drain thread hands the worker a burst at a time — the first event,
+# plus whatever arrives within COALESCE_WINDOW of the last (up to MAX_BURST).
+# A body over MAX_BODY is refused unread; off loopback, a secret is required.
+COALESCE_WINDOW = 0.25
+MAX_BURST = 200
+MAX_BODY = 5 * 1024 * 1024
+_STOP = object()
+
+
+def _bursts(q, window: float = COALESCE_WINDOW):
+    """Yield lists of queued events until `_STOP` is queued."""
+    while True:
+        first = q.get()
+        if first is _STOP:
+            return
+        burst = [first]
+        while len(burst) < MAX_BURST:
+            try:
+                nxt = q.get(timeout=window)
+            except queue.Empty:
+                break
+            if nxt is _STOP:
+                yield burst
+                return
+            burst.append(nxt)
+        yield burst
+
+
+def _drain(worker, q, out, window: float) -> None:
+    """Apply each burst; one JSON line per burst. An error is reported with
+    the results the burst had before it, and the worker keeps serving."""
+    for burst in _bursts(q, window):
+        results: list = []
+        line = {"events": len(burst), "results": results}
+        try:
+            worker.handle(burst, results)
+        except GhError as e:
+            line.update(error=_scrub(str(e)), code=e.code)
+        except Exception as e:  # noqa: BLE001
+            line.update(error="unexpected: " + _scrub(str(e)), code=1)
+        out.write(_scrub(json.dumps(line)) + "\n")
+        out.flush()
+
+
+def _event_from_line(line):
+    """`{"event": NAME, "payload": {...}}` (also `event_name`) -> (NAME, payload)."""
+    obj = json.loads(line)
+    if not isinstance(obj, dict):
+        raise ValueError("an event line must be a JSON object")
+    name = obj.get("event") or obj.get("event_name") or ""
+    return str(name), obj.get("payload") or {}
+
+
+def run_stream(worker, stream, out=None, *, window: float = COALESCE_WINDOW) -> None:
+    """Feed `worker` from a line stream (stdin) until EOF."""
+    out = out or sys.stdout
+    q: queue.Queue = queue.Queue()
+    drainer = threading.Thread(target=_drain, args=(worker, q, out, window), daemon=True)
+    drainer.start()
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            q.put(_event_from_line(line))
+        except ValueError as e:
+            sys.stderr.write(f"error: bad event line: {_scrub(str(e))}\n")
+    q.put(_STOP)
+    drainer.join()
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _signature_ok(secret: str, body: bytes, header: str | None) -> bool:
+    digest = "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return bool(header) and hmac.compare_digest(digest, header)
+
+
+class _WorkerHandler(BaseHTTPRequestHandler):
+    def _reply(self, code: int, obj: dict) -> None:
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802 — liveness probe
+        self._reply(200, {"ok": True})
+
+    def do_POST(self):  # noqa: N802
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY:
+            self.close_connection = True  # the body is never read
+            if length < 0:
+                return self._reply(400, {"error": "bad Content-Length"})
+            return self._reply(413, {"error": f"body over {MAX_BODY} bytes"})
+        body = self.rfile.read(length)
+        secret = self.server.secret
+        if secret and not _signature_ok(secret, body, self.headers.get("X-Hub-Signature-256")):
+            return self._reply(401, {"error": "bad signature"})
+        name = self.headers.get("X-GitHub-Event")
+        try:
+            event = (name, json.loads(body or b"{}")) if name else _event_from_line(body or b"{}")
+        except ValueError:
+            return self._reply(400, {"error": "body is not a JSON event"})
+        self.server.feed.put(event)
+        self._reply(202, {"queued": event[0]})
+
+    def log_message(self, *args):  # requests are not logged (no payload echo)
+        pass
+
+
+class WorkerServer(ThreadingHTTPServer):
+    """The local HTTP endpoint feeding a worker; its drain thread starts here.
+
+    Run `serve_forever()`; after `shutdown()`, `close()` waits for the events
+    already queued. Binding off loopback without a `secret` raises ValueError.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, worker, host: str = "127.0.0.1", port: int = 0, *,
+                 secret: str | None = None, window: float = COALESCE_WINDOW, out=None):
+        if not secret and not _is_loopback(host):
+            raise ValueError(f"--host {host} is not loopback: set a webhook secret")
+        super().__init__((host, port), _WorkerHandler)
+        self.secret = secret
+        self.feed: queue.Queue = queue.Queue()
+        self._drainer = threading.Thread(target=_drain,
+                                         args=(worker, self.feed, out or sys.stdout, window),
+                                         daemon=True)
+        self._drainer.start()
+
+    def close(self) -> None:
+        self.server_close()
+        self.feed.put(_STOP)
+        self._drainer.join()
 
 
 # --------------------------------------------------------------------------- #
@@ -442,12 +1155,31 @@ def build_parser():
                                 description="self-contained deploy-accurate board status reporter")
     p.add_argument("--repo", required=True, help="owner/name of the consuming repo")
     p.add_argument("--project", type=int, required=True, help="org Project number")
-    p.add_argument("--status", required=True, choices=["staging", "prod"],
+    p.add_argument("--status", choices=["staging", "prod"],
                    help="deploy stage that just succeeded")
     p.add_argument("--sha", default="", help="deployed commit SHA (resolves shipped issues)")
+    p.add_argument("--from-sha", default="",
+                   help="previously deployed SHA: resolve every issue shipped in from...to")
+    p.add_argument("--to-sha", default="", help="end of the deploy range (defaults to --sha)")
     p.add_argument("--issues", default="", help="explicit issue refs (overrides SHA resolution)")
     p.add_argument("--tag", default="", help="release tag (prod: published on success)")
     p.add_argument("--app-token", default="", help="App INSTALLATION token (never GITHUB_TOKEN)")
+    p.add_argument("--stdin", action="store_true",
+                   help="worker mode: apply JSON events ({event, payload}) read line by line")
+    p.add_argument("--serve", type=int, default=None, metavar="PORT",
+                   help="worker mode: accept webhook events on a local HTTP endpoint")
+    p.add_argument("--host", default="127.0.0.1",
+                   help="--serve bind address (off loopback, the webhook secret is required)")
+    p.add_argument("--app-token-file", default="",
+                   help="worker mode: file holding the App token (re-read when it changes)")
+    p.add_argument("--staging-env", default="staging",
+                   help="worker mode: deployment environment reported as staging")
+    p.add_argument("--prod-env", default="production",
+                   help="worker mode: deployment environment reported as prod")
+    p.add_argument("--coalesce-ms", type=int, default=int(COALESCE_WINDOW * 1000),
+                   help="worker mode: how long a burst may take to arrive")
+    p.add_argument("--cost-report", action="store_true",
+                   help="print the GraphQL points GitHub charged per query page (stderr)")
     return p
 
 
@@ -465,31 +1197,77 @@ def main(argv=None) -> int:
     # to the repo owner (org-owned repos), overridable via PROJECT_OWNER env.
     project_owner = os.environ.get("PROJECT_OWNER", owner_login)
     token = args.app_token or os.environ.get("GH_APP_TOKEN") or None
+    if args.stdin or args.serve is not None:
+        return _run_worker(args, project_owner, repo_name, token)
+    if not args.status:
+        sys.stderr.write("error: --status is required (staging or prod)\n")
+        return 2
     explicit = _split_issue_refs(args.issues)
-    if not args.sha and not explicit:
+    sha = args.to_sha or args.sha
+    from_sha = args.from_sha or None
+    if from_sha and not sha:
+        sys.stderr.write("error: --from-sha needs --to-sha (or --sha) to end the range\n")
+        return 2
+    if not sha and not explicit:
         sys.stderr.write("error: need --sha or --issues to resolve shipped issues\n")
         return 2
 
     try:
         if args.status == "staging":
-            out = run_staging(project_owner, repo_name, args.project, args.sha,
-                              token=token, explicit_issues=explicit)
+            out = run_staging(project_owner, repo_name, args.project, sha,
+                              token=token, explicit_issues=explicit, from_sha=from_sha)
         else:
             if not args.tag:
                 sys.stderr.write("error: --tag is required for prod (publishes the Release)\n")
                 return 2
-            out = run_prod(project_owner, repo_name, args.project, args.sha,
-                           tag=args.tag, token=token, explicit_issues=explicit)
+            out = run_prod(project_owner, repo_name, args.project, sha,
+                           tag=args.tag, token=token, explicit_issues=explicit,
+                           from_sha=from_sha)
     except GhError as e:
         sys.stderr.write("error: " + _scrub(str(e)) + "\n")
         return e.code
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + _scrub(str(e)) + "\n")
         return 1
+    finally:
+        _emit_budget(args.cost_report)
 
     _print_json(out)
+    if out.get("failed"):
+        sys.stderr.write("error: close failed for "
+                         + ", ".join(f"#{n}" for n in out["failed"]) + "\n")
+        return 1
     return 0
 
 
+def _run_worker(args, owner, repo, token) -> int:
+    worker = Worker(owner, repo, args.project, token=token,
+                    token_file=args.app_token_file or None,
+                    staging_env=args.staging_env, prod_env=args.prod_env)
+    window = max(0, args.coalesce_ms) / 1000
+    try:
+        if args.stdin:
+            run_stream(worker, sys.stdin, window=window)
+            return 0
+        try:
+            server = WorkerServer(worker, args.host, args.serve, window=window,
+                                  secret=os.environ.get("BOARD_STATUS_WEBHOOK_SECRET") or None)
+        except ValueError as e:  # off loopback without a secret
+            sys.stderr.write("error: " + _scrub(str(e)) + "\n")
+            return 2
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+        return 0
+    except OSError as e:
+        sys.stderr.write("error: " + _scrub(str(e)) + "\n")
+        return 1
+    finally:
+        _emit_budget(args.cost_report)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -35,9 +35,13 @@ from __future__ import annotations
 
 import json
 import os
+import random
+import re
 import subprocess
 import sys
-from datetime import date, datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
 # --------------------------------------------------------------------------- #
 # Schedule-health / Slippage enums (must match the data-model option names).
@@ -73,11 +77,19 @@ ROLLUP_COMPLETE = "COMPLETE"
 # env so the workflow can tune it without touching code.
 AT_RISK_WINDOW_DAYS = int(os.environ.get("SIGNALS_AT_RISK_WINDOW_DAYS", "3"))
 
+# Size as a duration estimate for the critical path, in working days (the
+# sprint-load weights); an unsized open item counts as M.
+SIZE_DAYS = {"S": 1, "M": 2, "L": 3}
+UNSIZED_DAYS = SIZE_DAYS["M"]
+
 
 class SignalsError(Exception):
-    def __init__(self, msg: str, code: int = 1):
+    def __init__(self, msg: str, code: int = 1, stdout: str | None = None,
+                 stderr: str | None = None):
         super().__init__(msg)
         self.code = code
+        self.stdout = stdout  # a failed `gh api graphql` still prints its payload
+        self.stderr = stderr  # gh's own error text; retries classify from it
 
 
 # --------------------------------------------------------------------------- #
@@ -86,11 +98,147 @@ class SignalsError(Exception):
 def _default_run(args) -> str:
     proc = subprocess.run(["gh", *[str(a) for a in args]], capture_output=True, text=True)
     if proc.returncode != 0:
-        raise SignalsError(f"gh call failed: {_scrub(proc.stderr.strip())}", code=1)
+        raise SignalsError(f"gh call failed: {_scrub(proc.stderr.strip())}", code=1,
+                           stdout=proc.stdout, stderr=proc.stderr)
     return proc.stdout
 
 
-RUN = _default_run
+# --------------------------------------------------------------------------- #
+# Rate-limit scheduler — a compact copy of lib/ratelimit.py's Scheduler
+# (vendored: this file imports nothing from the plugin). GraphQL queries get a
+# `ghpRateLimit: rateLimit{...}` selection; the budget it reports paces calls
+# ahead of exhaustion, and secondary-limit / 5xx failures retry with jittered
+# backoff (5xx for reads only). `GH_PROJECTS_RATE_LIMIT=off` disables it.
+# --------------------------------------------------------------------------- #
+_RL_ALIAS = "ghpRateLimit"
+_RL_RATE = re.compile(r"secondary rate limit|abuse detection|rate limit exceeded|"
+                      r"HTTP 429|too many requests", re.IGNORECASE)
+_RL_SERVER = re.compile(r"HTTP 5\d\d|server error|bad gateway|service unavailable|"
+                        r"gateway time-?out|timed? ?out|connection (?:lost|reset)", re.IGNORECASE)
+_RL_RETRY_AFTER = re.compile(r"retry[- ]after:?\s*(\d+)", re.IGNORECASE)
+_RL_OPENS = re.compile(r"([A-Za-z_]\w*)\s*(?:\([^()]*\))?\s*\{")
+
+
+class _Scheduler:
+    def __init__(self, run, *, clock=None, sleep=None, rand=None, max_retries=4,
+                 base_delay=1.0, max_delay=300.0, secondary_wait=60.0, reserve=50):
+        self.run = run
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.rand = rand or random.random
+        self.max_retries, self.base_delay, self.max_delay = max_retries, base_delay, max_delay
+        self.secondary_wait, self.reserve = secondary_wait, reserve
+        self.remaining, self.limit, self.reset_at, self.cost = None, 5000, None, 1
+        self.stats = {"requests": 0, "retries": 0, "waited_s": 0.0, "points_used": 0}
+        self.pages = []
+
+    def __call__(self, args):
+        argv = [str(a) for a in args]
+        gql = argv[:2] == ["api", "graphql"]
+        qi = next((i + 1 for i in range(len(argv) - 1)
+                   if argv[i] == "-f" and argv[i + 1].startswith("query=")), None)
+        mutation = qi is not None and argv[qi][6:].lstrip().startswith("mutation")
+        if gql and qi is not None and not mutation and "rateLimit" not in argv[qi] \
+                and "fragment " not in argv[qi] and "}" in argv[qi]:
+            end = argv[qi].rfind("}")
+            argv[qi] = (argv[qi][:end] + f" {_RL_ALIAS}: rateLimit {{ cost remaining resetAt limit nodeCount }}"
+                        + argv[qi][end:])
+        read = (gql and qi is not None and not mutation) or "--help" in argv
+        attempt = 0
+        while True:
+            self._pace()
+            self.stats["requests"] += 1
+            try:
+                out = self.run(argv)
+            except Exception as e:  # noqa: BLE001 — re-raised unless retryable
+                # gh's stderr only: the message also carries the argv.
+                msg = str(e.stderr) if getattr(e, "stderr", None) is not None else str(e)
+                kind = "rate" if _RL_RATE.search(msg) else "server" if _RL_SERVER.search(msg) else None
+                if kind is None or attempt >= self.max_retries or (kind == "server" and not read):
+                    raise
+                self._wait(self._backoff(attempt, kind, msg))
+                self.stats["retries"] += 1
+                attempt += 1
+                continue
+            if gql:
+                self._observe(out, argv[qi] if qi is not None else "")
+            return out
+
+    def _observe(self, out, query=""):
+        rl = None
+        if isinstance(out, str) and _RL_ALIAS in out:
+            try:
+                rl = (json.loads(out).get("data") or {}).get(_RL_ALIAS)
+            except (ValueError, AttributeError):
+                rl = None
+        if not isinstance(rl, dict):
+            self.stats["points_used"] += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            return
+        cost = int(rl.get("cost") or 1)
+        self.stats["points_used"] += cost
+        self.cost = max(self.cost, cost)
+        self.remaining = int(rl.get("remaining", 0))
+        self.limit = int(rl.get("limit") or self.limit)
+        try:
+            self.reset_at = datetime.fromisoformat(
+                str(rl.get("resetAt")).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+        names = [n for n in _RL_OPENS.findall(query) if n not in ("query", "mutation", "on", "rateLimit")]
+        self.pages.append({"op": ".".join(names[:3]) or "graphql", "cost": cost,
+                           "nodes": rl.get("nodeCount"), "remaining": self.remaining})
+
+    def _pace(self):
+        if self.remaining is None or self.reset_at is None:
+            return
+        until = self.reset_at - self.clock()
+        if until <= 0:
+            self.remaining = None
+            return
+        if self.remaining - self.cost < self.reserve:
+            self._wait(until + 1)
+            self.remaining = None
+            return
+        if self.remaining < max(self.reserve + self.cost, self.limit // 10):
+            self._wait(until / max(1, (self.remaining - self.reserve) // self.cost))
+
+    def _backoff(self, attempt, kind, msg):
+        hinted = _RL_RETRY_AFTER.search(msg)
+        if hinted:
+            return float(hinted.group(1)) + self.rand()
+        if kind == "rate" and self.remaining is not None and self.remaining <= 0 \
+                and self.reset_at is not None:
+            return max(self.reset_at - self.clock(), 0.0) + 1 + self.rand()
+        cap = min(self.max_delay, (self.secondary_wait if kind == "rate" else self.base_delay)
+                  * (2 ** attempt))
+        return cap / 2 + self.rand() * cap / 2
+
+    def _wait(self, seconds):
+        if seconds > 0:
+            self.stats["waited_s"] += seconds
+            self.sleep(seconds)
+
+    def report(self):
+        return {**self.stats, "waited_s": round(self.stats["waited_s"], 3),
+                "remaining": self.remaining, "limit": self.limit,
+                "reset_at": (datetime.fromtimestamp(self.reset_at, timezone.utc)
+                             .strftime("%Y-%m-%dT%H:%M:%SZ") if self.reset_at else None)}
+
+
+def _emit_budget(pages=False):
+    """One `budget: {...}` line on stderr when the scheduler made calls; with
+    `pages` (`--cost-report`), first one `cost: {...}` line per charged query."""
+    if isinstance(RUN, _Scheduler) and RUN.stats["requests"]:
+        for page in RUN.pages if pages else ():
+            sys.stderr.write("cost: " + json.dumps(page) + "\n")
+        sys.stderr.write("budget: " + json.dumps(RUN.report()) + "\n")
+
+
+RUN = (_Scheduler(_default_run)
+       if os.environ.get("GH_PROJECTS_RATE_LIMIT", "").lower() not in ("off", "0", "false", "no")
+       else _default_run)
 
 
 _TOKENISH = ("ghp_", "ghs_", "gho_", "ghu_", "ghr_", "github_pat_")
@@ -127,6 +275,25 @@ def graphql(query: str, variables: dict | None = None) -> dict:
     return payload.get("data", payload) if isinstance(payload, dict) else {}
 
 
+def _graphql_payload(query: str) -> dict:
+    """One variable-less document; the whole payload, `errors` included.
+
+    gh exits non-zero whenever the response carries `errors`, so a partial
+    failure arrives as a raised SignalsError whose stdout holds the payload.
+    """
+    try:
+        raw = RUN(["api", "graphql", "-f", f"query={query}"])
+    except SignalsError as e:
+        raw = e.stdout or ""
+        if '"errors"' not in raw:
+            raise
+    try:
+        payload = json.loads(raw) if raw.strip() else {}
+    except ValueError:
+        payload = {}
+    return payload if isinstance(payload, dict) else {}
+
+
 # --------------------------------------------------------------------------- #
 # DAG math — a faithful re-implementation of lib/dag.py (cross-checked in tests).
 #
@@ -134,65 +301,261 @@ def graphql(query: str, variables: dict | None = None) -> dict:
 # means "A is blocked by B and C"; so the downstream of B (what B blocks) is
 # everything reachable along reversed edges. A closed blocker no longer blocks.
 # --------------------------------------------------------------------------- #
-def _build_blocks(items: dict) -> dict:
-    blocks: dict[str, set] = {k: set() for k in items}
-    for item_id, meta in items.items():
-        for blocker in (meta.get("blocked_by") or []):
-            b = str(blocker)
-            if b not in items:
-                continue
-            if items[b].get("state", "open") == "closed":
-                continue
-            blocks[b].add(str(item_id))
-    return blocks
-
-
-def _downstream(start: str, blocks: dict) -> set:
-    seen: set = set()
-    stack = list(blocks.get(start, ()))
-    while stack:
-        node = stack.pop()
-        if node in seen:
+class _DepGraph:
+    """The blocked-by graph of one board, built once (mirrors lib/dag.DepGraph):
+    forward `blockers`, reverse `blocks` (open blockers only), `dependents` and
+    the `open` / `release` / `blocked` state sets."""
+
+    __slots__ = ("ids", "index", "blockers", "blocks", "dependents", "open", "release",
+                 "blocked")
+
+    def __init__(self, items: dict):
+        self.ids = [str(k) for k in items]
+        self.index = {k: i for i, k in enumerate(self.ids)}
+        self.open = {str(k) for k, meta in items.items()
+                     if meta.get("state", "open") != "closed"}
+        self.release = {str(k) for k, meta in items.items() if meta.get("release_blocker")}
+        self.blockers: dict[str, list] = {}
+        self.blocks: dict[str, set] = {k: set() for k in self.ids}
+        self.dependents: dict[str, set] = {k: set() for k in self.ids}
+        self.blocked: set = set()
+        for item_id, meta in items.items():
+            k = str(item_id)
+            known = []
+            for blocker in (meta.get("blocked_by") or []):
+                b = str(blocker)
+                if b not in self.index or b in known:
+                    continue
+                known.append(b)
+                self.dependents[b].add(k)
+                if b in self.open:
+                    self.blocks[b].add(k)
+                    self.blocked.add(k)
+            self.blockers[k] = known
+
+    def has_open_blocker(self, item_id: str) -> bool:
+        return str(item_id) in self.blocked
+
+    def open_blockers(self, item_id: str) -> list:
+        return [b for b in self.blockers.get(str(item_id), ()) if b in self.open]
+
+    def downstream(self, item_id: str) -> set:
+        return _downstream(str(item_id), self.blocks)
+
+    def upstream(self, item_id: str) -> set:
+        start = str(item_id)
+        seen = {start}
+        stack = [start]
+        while stack:
+            for b in self.open_blockers(stack.pop()):
+                if b not in seen:
+                    seen.add(b)
+                    stack.append(b)
+        return seen
+
+    def blocks_release(self, nodes) -> bool:
+        return not self.release.isdisjoint(nodes)
+
+
+def _sccs(nodes, succ: dict) -> list:
+    """SCCs of `succ` (iterative Tarjan), in reverse topological order."""
+    index: dict = {}
+    low: dict = {}
+    on_stack: set = set()
+    stack: list = []
+    out: list = []
+    counter = 0
+    for root in nodes:
+        if root in index:
             continue
-        seen.add(node)
-        stack.extend(blocks.get(node, ()))
-    seen.discard(start)
-    return seen
-
-
-def _is_blocked(item_id: str, items: dict) -> bool:
-    for blocker in (items.get(str(item_id), {}).get("blocked_by") or []):
-        b = str(blocker)
-        if b in items and items[b].get("state", "open") != "closed":
-            return True
-    return False
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(succ.get(root, ())))]
+        while work:
+            v, it = work[-1]
+            descended = False
+            for w in it:
+                if w not in index:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(succ.get(w, ()))))
+                    descended = True
+                    break
+                if w in on_stack and index[w] < low[v]:
+                    low[v] = index[w]
+            if descended:
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+            if low[v] == index[v]:
+                comp = []
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    comp.append(w)
+                    if w == v:
+                        break
+                out.append(comp)
+    return out
 
 
-def dag_signals(items: dict) -> dict:
+def _blast(graph: _DepGraph) -> dict:
+    """{item_id: (blast_count, blocks_release)} — one SCC-condensed bottom-up
+    pass over the blocks-graph, identical to a downstream walk from every node
+    (see lib/dag.py `_blast` for the derivation).
+    """
+    blocks = graph.blocks
+    comps = _sccs(graph.ids, blocks)
+    comp_of: dict = {}
+    for cid, members in enumerate(comps):
+        for v in members:
+            comp_of[v] = cid
+    # Bits follow component order, so a reach set only spans the (lower) bits
+    # of what is downstream of it.
+    bit = {v: 1 << i for i, v in enumerate(comp_of)}
+    release_mask = 0
+    for v in graph.release:
+        release_mask |= bit[v]
+
+    succs: list = []
+    pending_preds = [0] * len(comps)
+    for cid, members in enumerate(comps):
+        out = {comp_of[w] for v in members for w in blocks.get(v, ())} - {cid}
+        succs.append(out)
+        for d in out:
+            pending_preds[d] += 1
+
+    reach: dict = {}    # cid -> downstream bitset (live until consumed)
+    members_bits: dict = {}
+    result: dict = {}
+    for cid, members in enumerate(comps):  # reverse-topological: successors first
+        r = 0
+        for d in succs[cid]:
+            r |= reach[d] | members_bits[d]
+            pending_preds[d] -= 1
+            if pending_preds[d] == 0:
+                del reach[d], members_bits[d]
+        own = 0
+        for v in members:
+            own |= bit[v]
+        if pending_preds[cid]:
+            reach[cid] = r
+            members_bits[cid] = own
+        down = bin(r).count("1")  # int.bit_count is 3.10+
+        own_release = bin(own & release_mask).count("1")
+        r_release = bool(r & release_mask)
+        for v in members:
+            others_release = own_release - (1 if bit[v] & release_mask else 0)
+            result[v] = (down + len(members) - 1, r_release or others_release > 0)
+    return result
+
+
+def _radius(count: int, blocks_release: bool) -> str:
+    if blocks_release:
+        return BLAST_RELEASE
+    if count == 0:
+        return BLAST_NONE
+    if count == 1:
+        return BLAST_ONE
+    return BLAST_MANY
+
+
+def dag_signals(items: dict, graph: _DepGraph | None = None) -> dict:
     """Per-item {blocked, blast_radius, blast_count} — matches lib/dag.compute."""
-    blocks = _build_blocks(items)
+    graph = graph or _DepGraph(items)
+    blast = _blast(graph)
     out: dict[str, dict] = {}
-    for item_id in items:
-        item_id = str(item_id)
-        down = _downstream(item_id, blocks)
-        count = len(down)
-        blocks_release = any(items.get(d, {}).get("release_blocker") for d in down)
-        if blocks_release:
-            radius = BLAST_RELEASE
-        elif count == 0:
-            radius = BLAST_NONE
-        elif count == 1:
-            radius = BLAST_ONE
-        else:
-            radius = BLAST_MANY
+    for item_id in graph.ids:
+        count, blocks_release = blast.get(item_id, (0, False))
         out[item_id] = {
-            "blocked": _is_blocked(item_id, items),
-            "blast_radius": radius,
+            "blocked": graph.has_open_blocker(item_id),
+            "blast_radius": _radius(count, blocks_release),
             "blast_count": count,
         }
     return out
 
 
+def _duration(meta: dict) -> int:
+    return SIZE_DAYS.get(str(meta.get("size") or "").upper(), UNSIZED_DAYS)
+
+
+def _add_working_days(start: date, n: int) -> date:
+    """The n-th working day (Mon–Fri) counting `start`; `start` when n <= 0."""
+    if n <= 0:
+        return start
+    day = start
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    weeks, rest = divmod(n - 1, 5)
+    day += timedelta(weeks=weeks)
+    if day.weekday() + rest >= 5:
+        rest += 2
+    return day + timedelta(days=rest)
+
+
+def critical_path(items: dict, *, today: date, graph: _DepGraph | None = None) -> dict:
+    """Earliest finish + projected slippage per item and the critical chain to
+    each open release blocker — matches lib/dag.critical_path (one pass over
+    the SCC condensation; a cycle's members finish together)."""
+    graph = graph or _DepGraph(items)
+    metas = {str(k): meta for k, meta in items.items()}
+    comps = _sccs(graph.ids, graph.blocks)
+    comp_of: dict = {}
+    for cid, members in enumerate(comps):
+        for v in members:
+            comp_of[v] = cid
+    finish = [0] * len(comps)
+    via: list = [None] * len(comps)
+    for cid in range(len(comps) - 1, -1, -1):  # blockers before what they block
+        work = sum(_duration(metas[v]) for v in comps[cid] if v in graph.open)
+        if not work:
+            continue
+        start, best = 0, None
+        for v in comps[cid]:
+            for b in graph.open_blockers(v):
+                d = comp_of[b]
+                if d != cid and finish[d] > start:
+                    start, best = finish[d], d
+        finish[cid], via[cid] = start + work, best
+
+    out: dict = {}
+    for v in graph.ids:
+        days = finish[comp_of[v]]
+        eta = _add_working_days(today, days) if days else None
+        target = _parse_date(metas[v].get("target"))
+        slip = (eta - target).days if eta and target else 0
+        out[v] = {"finish_days": days,
+                  "earliest_finish": eta.isoformat() if eta else None,
+                  "projected_slippage_days": slip if slip > 0 else 0}
+    backwards: dict = {}  # cid -> its members, sorted descending (cycles only)
+    chains: dict = {}
+    for r in graph.ids:
+        if r not in graph.release or r not in graph.open:
+            continue
+        own = comps[comp_of[r]]
+        chain = [r] + sorted((v for v in own if v != r), reverse=True)
+        cid = via[comp_of[r]]
+        while cid is not None:  # built leaf-first, reversed once at the end
+            comp = comps[cid]
+            if len(comp) == 1:
+                chain.append(comp[0])
+            else:
+                if cid not in backwards:
+                    backwards[cid] = sorted(comp, reverse=True)
+                chain.extend(backwards[cid])
+            cid = via[cid]
+        chain.reverse()
+        chains[r] = {"days": out[r]["finish_days"], "chain": chain}
+    return {"items": out, "chains": chains}
+
+
 # --------------------------------------------------------------------------- #
 # Schedule signals — pure date arithmetic (no AI).
 # --------------------------------------------------------------------------- #
@@ -247,15 +610,26 @@ def schedule_health(item: dict, *, blocked: bool, today: date) -> str:
     return HEALTH_ON_TRACK
 
 
-def compute_signals(items: dict, *, today: date | None = None) -> dict:
+def compute_signals(items: dict, *, today: date | None = None,
+                    chains: dict | None = None) -> dict:
     """Full per-item signal set: the DAG signals + schedule signals.
 
     `items` is {id: {state, target, release_blocker, blocked_by[...]}}.
     Returns {id: {blocked, blast_radius, blast_count, schedule_health,
-    slippage, slippage_days}}.
+    slippage, slippage_days, projected_finish, projected_slippage,
+    projected_slippage_days}} — the projected trio comes from the critical
+    path (`critical_path`): when the item can finish at the earliest given its
+    open blockers, and how far past Target that lands. The graph is built once
+    for both passes. `chains`, a dict, collects each open release blocker's
+    critical chain ({id: {days, chain}}).
     """
     today = today or _utc_today()
-    dag = dag_signals(items)
+    graph = _DepGraph(items)
+    dag = dag_signals(items, graph)
+    path = critical_path(items, today=today, graph=graph)
+    plan = path["items"]
+    if chains is not None:
+        chains.update(path["chains"])
     out: dict[str, dict] = {}
     for item_id, meta in items.items():
         item_id = str(item_id)
@@ -269,10 +643,120 @@ def compute_signals(items: dict, *, today: date | None = None) -> dict:
             "schedule_health": health,
             "slippage": slippage_bucket(days),
             "slippage_days": days,
+            **_projected(plan[item_id]),
         }
     return out
 
 
+def _projected(entry: dict) -> dict:
+    """The projected-slippage columns of a signals row, from a critical-path entry."""
+    days = entry["projected_slippage_days"]
+    return {"projected_finish": entry["earliest_finish"],
+            "projected_slippage": slippage_bucket(days),
+            "projected_slippage_days": days}
+
+
+# --------------------------------------------------------------------------- #
+# Incremental recompute — mirrors lib/dag.recompute, plus the schedule signals.
+# A delta is one change dict or a list: add_edge / remove_edge {item, blocker},
+# close / reopen {item}, set_target {item, target}.
+# --------------------------------------------------------------------------- #
+DELTA_OPS = ("add_edge", "remove_edge", "close", "reopen", "set_target")
+
+
+def _downstream(start: str, blocks: dict) -> set:
+    seen: set = set()
+    stack = list(blocks.get(start, ()))
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.extend(blocks.get(node, ()))
+    seen.discard(start)
+    return seen
+
+
+def _apply_delta(items: dict, delta) -> tuple[dict, set, _DepGraph]:
+    """Apply `delta` to a copy of `items`; return (items_after, affected, the
+    after-graph)."""
+    after = dict(items)
+    seeds: set = set()
+    affected: set = set()
+    for change in ([delta] if isinstance(delta, dict) else list(delta or [])):
+        op = change.get("op")
+        if op not in DELTA_OPS:
+            raise SignalsError(f"unknown delta op {op!r}", code=2)
+        item_id = str(change.get("item", ""))
+        if item_id not in after:
+            raise SignalsError(f"unknown item '{item_id}'", code=3)
+        meta = after[item_id] = dict(after[item_id])
+        affected.add(item_id)
+        if op in ("add_edge", "remove_edge"):
+            blocker = str(change.get("blocker", ""))
+            if not blocker:
+                raise SignalsError(f"{op} needs a 'blocker'", code=2)
+            current = [str(b) for b in (meta.get("blocked_by") or [])]
+            if op == "add_edge" and blocker not in current:
+                current.append(blocker)
+            elif op == "remove_edge":
+                current = [b for b in current if b != blocker]
+            meta["blocked_by"] = current
+            if blocker in after:
+                seeds.add(blocker)
+        elif op in ("close", "reopen"):
+            meta["state"] = "closed" if op == "close" else "open"
+            seeds.add(item_id)
+        else:
+            meta["target"] = change.get("target")
+    graph = _DepGraph(after)
+    for seed in seeds:  # everything that reaches a changed blocker, and its dependents
+        affected |= graph.upstream(seed)
+        affected |= graph.dependents.get(seed, set())
+    return after, affected, graph
+
+
+def recompute_signals(items: dict, previous: dict, delta, *,
+                      today: date | None = None) -> tuple[dict, dict]:
+    """Incrementally apply `delta` to a computed board.
+
+    `previous` is `compute_signals(items, today=today)`. Returns
+    (items_after, changed): `changed` holds ONLY the rows that differ — the
+    same answer as diffing two full runs — so a webhook can write a handful of
+    cells instead of re-sweeping the board.
+    """
+    today = today or _utc_today()
+    after, affected, graph = _apply_delta(items, delta)
+    plan = critical_path(after, today=today, graph=graph)["items"]
+    changed: dict[str, dict] = {}
+    for item_id in sorted(affected):
+        meta = after[item_id]
+        down = graph.downstream(item_id)
+        blocked = graph.has_open_blocker(item_id)
+        days = slippage_days(meta.get("target"), today=today)
+        row = {
+            "blocked": BLOCKED_YES if blocked else BLOCKED_NO,
+            "blast_radius": _radius(len(down), graph.blocks_release(down)),
+            "blast_count": len(down),
+            "schedule_health": schedule_health(meta, blocked=blocked, today=today),
+            "slippage": slippage_bucket(days),
+            "slippage_days": days,
+            **_projected(plan[item_id]),
+        }
+        if row != previous.get(item_id):
+            changed[item_id] = row
+    # A finish date moves along the whole chain downstream of a change; the
+    # schedule pass is linear, so re-check every other row's projection.
+    for item_id, entry in plan.items():
+        prev = previous.get(item_id)
+        if item_id in affected or prev is None:
+            continue
+        projected = _projected(entry)
+        if any(prev.get(k) != v for k, v in projected.items()):
+            changed[item_id] = {**prev, **projected}
+    return after, changed
+
+
 def _utc_today() -> date:
     return datetime.now(timezone.utc).date()
 
@@ -342,9 +826,30 @@ query($owner:String!, $number:Int!, $after:String){
           targetVal: fieldValueByName(name:"Target date"){
             ... on ProjectV2ItemFieldDateValue { date }
           }
+          sizeVal: fieldValueByName(name:"Size"){
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
           impact: fieldValueByName(name:"Impact level"){
             ... on ProjectV2ItemFieldSingleSelectValue { name }
           }
+          curBlocked: fieldValueByName(name:"Blocked"){
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          curBlastRadius: fieldValueByName(name:"Blast radius"){
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          curBlastCount: fieldValueByName(name:"Blast count"){
+            ... on ProjectV2ItemFieldNumberValue { number }
+          }
+          curScheduleHealth: fieldValueByName(name:"Schedule health"){
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          curSlippage: fieldValueByName(name:"Slippage"){
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          curSlippageDays: fieldValueByName(name:"Slippage days"){
+            ... on ProjectV2ItemFieldNumberValue { number }
+          }
         }
       }
     }
@@ -353,26 +858,49 @@ query($owner:String!, $number:Int!, $after:String){
 """
 
 
+def _prefetched(fetch):
+    """Yield the pages `fetch(cursor) -> (page, next_cursor | None)` returns,
+    requesting page N+1 on a worker thread while the caller folds page N
+    (requests stay sequential — each needs the previous cursor)."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(fetch, None)
+        try:
+            while pending is not None:
+                page, cursor = pending.result()
+                pending = pool.submit(fetch, cursor) if cursor else None
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
 def load_board(owner: str, number: int) -> tuple[str, dict, dict]:
     """Page the project items into (project_id, items-graph, item->projectItemId).
 
-    The items-graph is the {id: {state, target, release_blocker, blocked_by}}
+    The items-graph is the {id: {state, target, size, release_blocker, blocked_by}}
     structure `compute_signals` consumes; the keys are issue NUMBERS (the same
     space `blocked_by` references). `item_ids` maps issue number -> project item
-    node id so the writer can address each item.
+    node id so the writer can address each item. Each item also carries
+    `current` — the signal values already on the board, keyed like a signals
+    row — so `write_signals` can skip cells that would not change. Each page is
+    folded while the next one is already being fetched.
     """
     project_id = None
     items: dict[str, dict] = {}
     item_ids: dict[str, str] = {}
-    after = None
-    while True:
+
+    def fetch(after):
         data = graphql(_ITEMS_QUERY, {"owner": owner, "number": int(number), "after": after})
         proj = (((data or {}).get("organization") or {}).get("projectV2")) or {}
         if not proj.get("id"):
             raise SignalsError(f"project {owner}#{number} not found", code=3)
-        project_id = proj["id"]
         conn = proj.get("items") or {}
-        for node in (conn.get("nodes") or []):
+        page = conn.get("pageInfo") or {}
+        return (proj["id"], conn.get("nodes") or []), \
+            (page.get("endCursor") if page.get("hasNextPage") else None)
+
+    for project_id, nodes in _prefetched(fetch):
+        for node in nodes:
             content = node.get("content") or {}
             if content.get("__typename") != "Issue":
                 continue  # draft issues / PRs carry no dependency graph
@@ -387,19 +915,37 @@ def load_board(owner: str, number: int) -> tuple[str, dict, dict]:
             items[num] = {
                 "state": content.get("state", "OPEN").lower(),
                 "target": ((node.get("targetVal") or {}).get("date")),
+                "size": ((node.get("sizeVal") or {}).get("name")),
                 "release_blocker": release_blocker,
                 "blocked_by": [str(b) for b in blocked_by],
                 "milestone_state": (milestone.get("state") or "").lower(),
+                "current": _current_signals(node),
             }
             item_ids[num] = node["id"]
-        page = conn.get("pageInfo") or {}
-        if page.get("hasNextPage"):
-            after = page.get("endCursor")
-            continue
-        break
     return project_id, items, item_ids
 
 
+# (signals-row key, items-query alias, value key) for the six written fields.
+_CURRENT_ALIASES = [
+    ("blocked", "curBlocked", "name"),
+    ("blast_radius", "curBlastRadius", "name"),
+    ("blast_count", "curBlastCount", "number"),
+    ("schedule_health", "curScheduleHealth", "name"),
+    ("slippage", "curSlippage", "name"),
+    ("slippage_days", "curSlippageDays", "number"),
+]
+
+
+def _current_signals(node: dict) -> dict:
+    """The signal values already written on this item (unset fields omitted)."""
+    current = {}
+    for key, alias, attr in _CURRENT_ALIASES:
+        val = (node.get(alias) or {}).get(attr)
+        if val is not None:
+            current[key] = val
+    return current
+
+
 def _has_label(content: dict, name: str) -> bool:
     for lbl in ((content.get("labels") or {}).get("nodes") or []):
         if str(lbl.get("name", "")).lower() == name.lower():
@@ -458,25 +1004,83 @@ def resolve_fields(owner: str, number: int) -> dict:
     return fields
 
 
-def _write_value(project_id: str, item_id: str, field: dict, value) -> None:
-    """updateProjectV2ItemFieldValue with a typed literal (single-select/number)."""
+def _value_literal(field: dict, value) -> str:
+    """The typed `value:` literal for a single-select / number / text field."""
     if field["options"]:
         opt_id = field["options"].get(value)
         if not opt_id:
             raise SignalsError(f"option '{value}' missing on field", code=3)
-        lit = '{singleSelectOptionId:"%s"}' % opt_id
-    elif "NUMBER" in field["dataType"]:
-        lit = "{number:%s}" % float(value)
-    else:
-        text = str(value).replace("\\", "\\\\").replace('"', '\\"')
-        lit = '{text:"%s"}' % text
-    query = (
-        "mutation($project:ID!,$item:ID!,$field:ID!){"
-        "updateProjectV2ItemFieldValue(input:{"
-        "projectId:$project,itemId:$item,fieldId:$field,value:%s}){"
-        "projectV2Item{id}}}" % lit
-    )
-    graphql(query, {"project": project_id, "item": item_id, "field": field["id"]})
+        return '{singleSelectOptionId:"%s"}' % opt_id
+    if "NUMBER" in field["dataType"]:
+        return "{number:%s}" % float(value)
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return '{text:"%s"}' % text
+
+
+# Field writes are packed into aliased documents (`w0: update... w1: ...`), so a
+# board costs ceil(writes / BATCH_MAX_OPS) round-trips instead of one per
+# (item, field). A failed alias (`errors[].path[0]`) maps back to its key.
+BATCH_MAX_OPS = int(os.environ.get("SIGNALS_BATCH_MAX_OPS", "50"))
+BATCH_MAX_BYTES = 60_000
+
+
+class _MutationBatch:
+    """Queue field-value writes; flush as bounded aliased mutation documents.
+
+    `failures` collects {key: message}; `written` the keys whose alias echoed
+    the item id back.
+    """
+
+    def __init__(self, project_id: str, *, max_ops: int = BATCH_MAX_OPS,
+                 max_bytes: int = BATCH_MAX_BYTES):
+        self.project_id = project_id
+        self.max_ops = max(1, int(max_ops))
+        self.max_bytes = int(max_bytes)
+        self._pending: list = []
+        self._size = 0
+        self.written: list = []
+        self.failures: dict = {}
+        self.round_trips = 0
+
+    def add(self, key, item_id: str, field: dict, value) -> None:
+        selection = (
+            "updateProjectV2ItemFieldValue(input:{projectId:%s,itemId:%s,fieldId:%s,value:%s})"
+            "{projectV2Item{id}}" % (json.dumps(self.project_id), json.dumps(item_id),
+                                     json.dumps(field["id"]), _value_literal(field, value))
+        )
+        if self._pending and self._size + len(selection) > self.max_bytes:
+            self.flush()
+        self._pending.append((key, item_id, selection))
+        self._size += len(selection) + 8
+        if len(self._pending) >= self.max_ops:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending, self._size = self._pending, [], 0
+        doc = "mutation{" + " ".join(
+            f"w{i}:{sel}" for i, (_, _, sel) in enumerate(pending)) + "}"
+        self.round_trips += 1
+        payload = _graphql_payload(doc)
+        data = payload.get("data") or {}
+        by_alias, other = {}, []
+        for err in payload.get("errors") or []:
+            path = err.get("path") or []
+            msg = _scrub(err.get("message") or json.dumps(err))
+            if path and str(path[0]).startswith("w"):
+                by_alias[str(path[0])] = msg
+            else:
+                other.append(msg)
+        for i, (key, item_id, _) in enumerate(pending):
+            alias = f"w{i}"
+            echoed = ((data.get(alias) or {}).get("projectV2Item") or {}).get("id")
+            if alias in by_alias:
+                self.failures[key] = by_alias[alias]
+            elif echoed != item_id:
+                self.failures[key] = "; ".join(other) or "no item echoed back"
+            else:
+                self.written.append(key)
 
 
 _FIELD_MAP = [
@@ -489,20 +1093,51 @@ _FIELD_MAP = [
 ]
 
 
-def write_signals(project_id: str, fields: dict, item_ids: dict, signals: dict) -> int:
-    """Write each item's six signal fields. Returns the number of writes."""
-    writes = 0
+def _unchanged(field: dict, current, value) -> bool:
+    """True when the board already holds `value` (numbers compare as floats)."""
+    if current is None:
+        return False
+    if "NUMBER" in field["dataType"] and not field["options"]:
+        try:
+            return float(current) == float(value)
+        except (TypeError, ValueError):
+            return False
+    return str(current) == str(value)
+
+
+def write_signals(project_id: str, fields: dict, item_ids: dict, signals: dict,
+                  current: dict | None = None) -> tuple[int, int]:
+    """Write each item's changed signal fields (batched). Returns (written, skipped).
+
+    `current` is {issue: {signal key: value already on the board}}; a cell whose
+    value already matches is skipped, so a steady-state board writes almost
+    nothing. Raises SignalsError naming every (issue, field) whose alias failed;
+    the writes that did land stay landed (each is an idempotent value set).
+    """
+    batch = _MutationBatch(project_id)
+    skipped = 0
     for num, sig in signals.items():
         item_id = item_ids.get(num)
         if not item_id:
             continue
+        have = (current or {}).get(num) or {}
         for field_name, key in _FIELD_MAP:
             field = fields.get(field_name)
             if not field:
                 continue  # field absent on this project — skip, don't crash
-            _write_value(project_id, item_id, field, sig[key])
-            writes += 1
-    return writes
+            if _unchanged(field, have.get(key), sig[key]):
+                skipped += 1
+                continue
+            batch.add((num, field_name), item_id, field, sig[key])
+    batch.flush()
+    if batch.failures:
+        detail = "; ".join(f"#{n} {f}: {msg}" for (n, f), msg in list(batch.failures.items())[:5])
+        raise SignalsError(
+            f"{len(batch.failures)} signal write(s) failed "
+            f"({len(batch.written)} landed): {detail}",
+            code=1,
+        )
+    return len(batch.written), skipped
 
 
 _STATUS_UPDATE = """
@@ -529,7 +1164,8 @@ def run(owner: str, number: int, *, apply: bool, start=None, target=None,
         today: date | None = None) -> dict:
     """Compute (and optionally write) all signals + the rollup status update."""
     project_id, items, item_ids = load_board(owner, number)
-    signals = compute_signals(items, today=today)
+    chains: dict = {}
+    signals = compute_signals(items, today=today, chains=chains)
     rel_closed = release_milestone_closed(items)
     health = rollup_health(signals, items, release_milestone_closed=rel_closed)
     body = rollup_body(health, signals)
@@ -537,6 +1173,7 @@ def run(owner: str, number: int, *, apply: bool, start=None, target=None,
         "project": f"{owner}#{number}",
         "items": len(items),
         "signals": signals,
+        "critical_chains": chains,
         "rollup": {"status": health, "body": body},
         "applied": False,
     }
@@ -549,10 +1186,12 @@ def run(owner: str, number: int, *, apply: bool, start=None, target=None,
             code=2,
         )
     fields = resolve_fields(owner, number)
-    writes = write_signals(project_id, fields, item_ids, signals)
+    current = {num: meta.get("current") or {} for num, meta in items.items()}
+    writes, skips = write_signals(project_id, fields, item_ids, signals, current)
     post_status_update(project_id, health, body, start=start, target=target)
     plan["applied"] = True
     plan["field_writes"] = writes
+    plan["field_skips"] = skips
     return plan
 
 
@@ -580,6 +1219,8 @@ def main(argv=None) -> int:
     g.add_argument("--plan", action="store_true", help="dry run: compute + print, write nothing (default)")
     p.add_argument("--start", help="status-update start date (YYYY-MM-DD)")
     p.add_argument("--target", help="status-update target date (YYYY-MM-DD)")
+    p.add_argument("--cost-report", action="store_true",
+                   help="print the GraphQL points GitHub charged per query page (stderr)")
     try:
         args = p.parse_args(argv)
     except SystemExit as e:
@@ -595,6 +1236,8 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + _scrub(str(e)) + "\n")
         return 1
+    finally:
+        _emit_budget(args.cost_report)
 
 
 if __name__ == "__main__":
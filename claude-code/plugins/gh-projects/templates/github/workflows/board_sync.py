@@ -15,7 +15,12 @@ trigger — `projects_v2_item` can't trigger a repo workflow, constraint #1):
     holds `In Progress` until `ready_for_review`.
   * Resolve the PR<->issue link from the LINKED BRANCH first, then a branch-name
     `123-foo` parse fallback. It NEVER depends on `Closes #N` / any closing
-    keyword.
+    keyword. Linked branches are looked up in a persisted branch -> issue
+    index (`--link-index`), exact however many issues the repo has;
+    `--refresh-links` only syncs that index.
+  * Or run it as a long-lived WORKER (`--stdin` / `--serve PORT`) fed events
+    by a local sender: token + link index stay warm, and a burst is coalesced
+    into at most one write per issue.
 
 Hard rules baked in:
   * Deterministic & free — NO metered AI/model call anywhere.
@@ -32,30 +37,176 @@ Exit codes: 0 ok · 2 usage/validation · 3 not found · 1 unexpected.
 """
 from __future__ import annotations
 
+import hashlib
+import hmac
+import ipaddress
 import json
 import os
+import queue
+import random
 import re
 import subprocess
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
 # --------------------------------------------------------------------------- #
 # Injectable command runner (the single offline seam) — vendored, no import.
 # --------------------------------------------------------------------------- #
 class GhError(Exception):
-    def __init__(self, msg: str, code: int = 1):
+    def __init__(self, msg: str, code: int = 1, stderr: str | None = None):
         super().__init__(msg)
         self.code = code
+        self.stderr = stderr  # gh's own error text; retries classify from it
 
 
 def _default_run(args) -> str:
     proc = subprocess.run(["gh", *[str(a) for a in args]], capture_output=True, text=True)
     if proc.returncode != 0:
-        raise GhError(f"gh {_redact(args)} failed: {_scrub(proc.stderr.strip())}", code=1)
+        raise GhError(f"gh {_redact(args)} failed: {_scrub(proc.stderr.strip())}", code=1,
+                      stderr=proc.stderr)
     return proc.stdout
 
 
-RUN = _default_run
+# --------------------------------------------------------------------------- #
+# Rate-limit scheduler — a compact copy of lib/ratelimit.py's Scheduler
+# (vendored: this file imports nothing from the plugin). GraphQL queries get a
+# `ghpRateLimit: rateLimit{...}` selection; the budget it reports paces calls
+# ahead of exhaustion, and secondary-limit / 5xx failures retry with jittered
+# backoff (5xx for reads only). `GH_PROJECTS_RATE_LIMIT=off` disables it.
+# --------------------------------------------------------------------------- #
+_RL_ALIAS = "ghpRateLimit"
+_RL_RATE = re.compile(r"secondary rate limit|abuse detection|rate limit exceeded|"
+                      r"HTTP 429|too many requests", re.IGNORECASE)
+_RL_SERVER = re.compile(r"HTTP 5\d\d|server error|bad gateway|service unavailable|"
+                        r"gateway time-?out|timed? ?out|connection (?:lost|reset)", re.IGNORECASE)
+_RL_RETRY_AFTER = re.compile(r"retry[- ]after:?\s*(\d+)", re.IGNORECASE)
+_RL_OPENS = re.compile(r"([A-Za-z_]\w*)\s*(?:\([^()]*\))?\s*\{")
+
+
+class _Scheduler:
+    def __init__(self, run, *, clock=None, sleep=None, rand=None, max_retries=4,
+                 base_delay=1.0, max_delay=300.0, secondary_wait=60.0, reserve=50):
+        self.run = run
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.rand = rand or random.random
+        self.max_retries, self.base_delay, self.max_delay = max_retries, base_delay, max_delay
+        self.secondary_wait, self.reserve = secondary_wait, reserve
+        self.remaining, self.limit, self.reset_at, self.cost = None, 5000, None, 1
+        self.stats = {"requests": 0, "retries": 0, "waited_s": 0.0, "points_used": 0}
+        self.pages = []
+
+    def __call__(self, args):
+        argv = [str(a) for a in args]
+        gql = argv[:2] == ["api", "graphql"]
+        qi = next((i + 1 for i in range(len(argv) - 1)
+                   if argv[i] == "-f" and argv[i + 1].startswith("query=")), None)
+        mutation = qi is not None and argv[qi][6:].lstrip().startswith("mutation")
+        if gql and qi is not None and not mutation and "rateLimit" not in argv[qi] \
+                and "fragment " not in argv[qi] and "}" in argv[qi]:
+            end = argv[qi].rfind("}")
+            argv[qi] = (argv[qi][:end] + f" {_RL_ALIAS}: rateLimit {{ cost remaining resetAt limit nodeCount }}"
+                        + argv[qi][end:])
+        read = (gql and qi is not None and not mutation) or "--help" in argv
+        attempt = 0
+        while True:
+            self._pace()
+            self.stats["requests"] += 1
+            try:
+                out = self.run(argv)
+            except Exception as e:  # noqa: BLE001 — re-raised unless retryable
+                # gh's stderr only: the message also carries the argv.
+                msg = str(e.stderr) if getattr(e, "stderr", None) is not None else str(e)
+                kind = "rate" if _RL_RATE.search(msg) else "server" if _RL_SERVER.search(msg) else None
+                if kind is None or attempt >= self.max_retries or (kind == "server" and not read):
+                    raise
+                self._wait(self._backoff(attempt, kind, msg))
+                self.stats["retries"] += 1
+                attempt += 1
+                continue
+            if gql:
+                self._observe(out, argv[qi] if qi is not None else "")
+            return out
+
+    def _observe(self, out, query=""):
+        rl = None
+        if isinstance(out, str) and _RL_ALIAS in out:
+            try:
+                rl = (json.loads(out).get("data") or {}).get(_RL_ALIAS)
+            except (ValueError, AttributeError):
+                rl = None
+        if not isinstance(rl, dict):
+            self.stats["points_used"] += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            return
+        cost = int(rl.get("cost") or 1)
+        self.stats["points_used"] += cost
+        self.cost = max(self.cost, cost)
+        self.remaining = int(rl.get("remaining", 0))
+        self.limit = int(rl.get("limit") or self.limit)
+        try:
+            self.reset_at = datetime.fromisoformat(
+                str(rl.get("resetAt")).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+        names = [n for n in _RL_OPENS.findall(query) if n not in ("query", "mutation", "on", "rateLimit")]
+        self.pages.append({"op": ".".join(names[:3]) or "graphql", "cost": cost,
+                           "nodes": rl.get("nodeCount"), "remaining": self.remaining})
+
+    def _pace(self):
+        if self.remaining is None or self.reset_at is None:
+            return
+        until = self.reset_at - self.clock()
+        if until <= 0:
+            self.remaining = None
+            return
+        if self.remaining - self.cost < self.reserve:
+            self._wait(until + 1)
+            self.remaining = None
+            return
+        if self.remaining < max(self.reserve + self.cost, self.limit // 10):
+            self._wait(until / max(1, (self.remaining - self.reserve) // self.cost))
+
+    def _backoff(self, attempt, kind, msg):
+        hinted = _RL_RETRY_AFTER.search(msg)
+        if hinted:
+            return float(hinted.group(1)) + self.rand()
+        if kind == "rate" and self.remaining is not None and self.remaining <= 0 \
+                and self.reset_at is not None:
+            return max(self.reset_at - self.clock(), 0.0) + 1 + self.rand()
+        cap = min(self.max_delay, (self.secondary_wait if kind == "rate" else self.base_delay)
+                  * (2 ** attempt))
+        return cap / 2 + self.rand() * cap / 2
+
+    def _wait(self, seconds):
+        if seconds > 0:
+            self.stats["waited_s"] += seconds
+            self.sleep(seconds)
+
+    def report(self):
+        return {**self.stats, "waited_s": round(self.stats["waited_s"], 3),
+                "remaining": self.remaining, "limit": self.limit,
+                "reset_at": (datetime.fromtimestamp(self.reset_at, timezone.utc)
+                             .strftime("%Y-%m-%dT%H:%M:%SZ") if self.reset_at else None)}
+
+
+def _emit_budget(pages=False):
+    """One `budget: {...}` line on stderr when the scheduler made calls; with
+    `pages` (`--cost-report`), first one `cost: {...}` line per charged query."""
+    if isinstance(RUN, _Scheduler) and RUN.stats["requests"]:
+        for page in RUN.pages if pages else ():
+            sys.stderr.write("cost: " + json.dumps(page) + "\n")
+        sys.stderr.write("budget: " + json.dumps(RUN.report()) + "\n")
+
+
+RUN = (_Scheduler(_default_run)
+       if os.environ.get("GH_PROJECTS_RATE_LIMIT", "").lower() not in ("off", "0", "false", "no")
+       else _default_run)
 
 
 # --------------------------------------------------------------------------- #
@@ -150,24 +301,6 @@ def advance_status(current, target, *, reopen: bool = False):
 # `Closes`-style keyword to find the issue.
 _BRANCH_NAME_RE = re.compile(r"^(\d+)[-_/]")
 
-# Authoritative linked-branch -> issue mapping. GitHub exposes the linked branch
-# on the ISSUE (issue.linkedBranches). We search by branch name across the
-# repo's open issues' linked branches — that is the authoritative link a
-# `gh issue develop` / dev-panel branch records, independent of any PR body.
-_LINKED_BRANCH_LOOKUP = """
-query($owner:String!, $repo:String!, $name:String!){
-  repository(owner:$owner, name:$repo){
-    issues(first:50, states:OPEN, orderBy:{field:UPDATED_AT, direction:DESC}){
-      nodes{
-        number id
-        linkedBranches(first:10){ nodes{ ref{ name } } }
-      }
-    }
-  }
-}
-"""
-
-
 def short_branch(ref: str) -> str:
     """Strip refs/heads/ and a leading origin/ from a branch ref."""
     name = ref
@@ -177,20 +310,208 @@ def short_branch(ref: str) -> str:
     return name
 
 
-def issue_from_linked_branch(owner: str, repo: str, branch: str, *, token: str | None = None):
+# --------------------------------------------------------------------------- #
+# Linked-branch INDEX: branch name -> issue, exact at any repo size.
+# --------------------------------------------------------------------------- #
+# GitHub records the authoritative link on the ISSUE only
+# (`issue.linkedBranches`); a `Ref` has no edge back to the issue that links
+# it. Scanning the 50 most-recently-updated open issues per event both costs a
+# large read and silently misses the link once the repo outgrows that window.
+# Instead we keep a branch -> issue INDEX of every open issue's linked
+# branches, persisted between runs (`--link-index`, an actions/cache file):
+#   * BUILT by paging every open issue (100 per request) when missing, or once
+#     it is older than LINK_INDEX_MAX_AGE;
+#   * SYNCED only when an event's branch is NOT in the index, from the issues
+#     updated since the last sync (linking a branch touches the issue) — a lean
+#     read of link fields only; a branch the index knows costs no sync at all;
+#   * VERIFIED: a hit is checked against the issue's own linkedBranches in the
+#     event read, so a stale entry never attributes a push to the wrong issue.
+LINK_INDEX_VERSION = 1
+LINK_INDEX_MAX_AGE = 24 * 3600
+LINK_INDEX_SKEW = 300  # seconds each delta overlaps the last (runner/API clock skew)
+
+_LINK_ISSUE = """
+fragment LinkIssue on Issue {
+  number id state
+  linkedBranches(first:10){ nodes{ ref{ name } } }
+}
+"""
+
+_LINK_INDEX_OPEN = """
+query($owner:String!, $repo:String!, $cursor:String){
+  repository(owner:$owner, name:$repo){
+    issues(first:100, after:$cursor, states:OPEN){
+      pageInfo{ hasNextPage endCursor }
+      nodes{ ...LinkIssue }
+    }
+  }
+}
+""" + _LINK_ISSUE
+
+_LINK_INDEX_SINCE = """
+query($owner:String!, $repo:String!, $since:DateTime!, $cursor:String){
+  repository(owner:$owner, name:$repo){
+    issues(first:100, after:$cursor, filterBy:{since:$since},
+           orderBy:{field:UPDATED_AT, direction:ASC}){
+      pageInfo{ hasNextPage endCursor }
+      nodes{ ...LinkIssue }
+    }
+  }
+}
+""" + _LINK_ISSUE
+
+
+def _linked_names(issue: dict) -> list:
+    return [short_branch((lb.get("ref") or {}).get("name") or "")
+            for lb in ((issue.get("linkedBranches") or {}).get("nodes")) or []]
+
+
+class LinkIndex:
+    """Branch -> issue number over the repo's OPEN issues' linked branches.
+
+    `path` persists it as JSON between runs (None keeps it in memory, so it is
+    rebuilt per process). `clock` is injectable for tests.
+    """
+
+    def __init__(self, owner: str, repo: str, path: str | None = None, *,
+                 token: str | None = None, clock=None):
+        self.owner = owner
+        self.repo = repo
+        self.path = path
+        self.token = token
+        self.clock = clock or time.time
+        self.branches: dict[str, int] = {}
+        self.built_at = None
+        self.synced_at = None
+        self.dirty = False
+        if path:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if (not isinstance(data, dict) or data.get("version") != LINK_INDEX_VERSION
+                or data.get("repo") != f"{self.owner}/{self.repo}"):
+            return  # another repo's / an older index: rebuild
+        self.branches = {str(k): int(v) for k, v in (data.get("branches") or {}).items()}
+        self.built_at = data.get("built_at")
+        self.synced_at = data.get("synced_at")
+
+    def save(self) -> None:
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"version": LINK_INDEX_VERSION, "repo": f"{self.owner}/{self.repo}",
+                       "built_at": self.built_at, "synced_at": self.synced_at,
+                       "branches": self.branches}, fh, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def get(self, name: str):
+        return self.branches.get(short_branch(name))
+
+    def forget(self, name: str) -> None:
+        if self.branches.pop(short_branch(name), None) is not None:
+            self.dirty = True
+
+    @property
+    def stale(self) -> bool:
+        return self.built_at is None or self.clock() - self.built_at > LINK_INDEX_MAX_AGE
+
+    def since(self) -> str:
+        """The delta cursor: the last sync, less the clock-skew overlap."""
+        when = datetime.fromtimestamp(float(self.synced_at) - LINK_INDEX_SKEW, timezone.utc)
+        return when.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _page(self, query: str, cursor, **variables) -> dict:
+        variables.update(owner=self.owner, repo=self.repo)
+        if cursor:
+            variables["cursor"] = cursor
+        data = graphql(query, variables, token=self.token)
+        return ((data.get("repository") or {}).get("issues")) or {}
+
+    def ensure(self) -> bool:
+        """(Re)build from every open issue when missing or stale; True if built."""
+        if not self.stale:
+            return False
+        started = self.clock()
+        branches: dict[str, int] = {}
+        cursor = None
+        while True:
+            conn = self._page(_LINK_INDEX_OPEN, cursor)
+            for node in conn.get("nodes") or []:
+                for name in _linked_names(node):
+                    branches[name] = int(node["number"])
+            page = conn.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                break
+            cursor = page.get("endCursor")
+        self.branches = branches
+        self.built_at = self.synced_at = started
+        self.dirty = True
+        return True
+
+    def absorb(self, nodes) -> None:
+        """Fold updated issues in: each one's entries are replaced by its
+        current linked branches (none once it is closed)."""
+        nodes = [n for n in nodes or [] if n.get("number") is not None]
+        if not nodes:
+            return
+        by_issue: dict[int, list] = {}
+        for name, num in self.branches.items():
+            by_issue.setdefault(num, []).append(name)
+        for node in nodes:
+            num = int(node["number"])
+            for name in by_issue.pop(num, []):
+                if self.branches.get(name) == num:
+                    del self.branches[name]
+            if (node.get("state") or "OPEN") == "OPEN":
+                for name in _linked_names(node):
+                    self.branches[name] = num
+        self.dirty = True
+
+    def catch_up(self, conn: dict, started: float) -> None:
+        """Absorb a delta page, then page the rest of the delta; the index is
+        then synced as of `started`."""
+        since = self.since()
+        while True:
+            self.absorb(conn.get("nodes"))
+            page = conn.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                break
+            conn = self._page(_LINK_INDEX_SINCE, page.get("endCursor"), since=since)
+        self.synced_at = started
+        self.dirty = True
+
+    def refresh(self) -> bool:
+        """Bring the index up to date on its own; True if it was rebuilt."""
+        started = self.clock()
+        if self.ensure():
+            return True
+        self.catch_up(self._page(_LINK_INDEX_SINCE, None, since=self.since()), started)
+        return False
+
+
+def issue_from_linked_branch(owner: str, repo: str, branch: str, *,
+                             links: "LinkIndex | None" = None, token: str | None = None):
     """Return the issue number whose AUTHORITATIVE linked branch == `branch`.
 
-    This is the FIRST resolution path. Returns None if no issue has this
-    branch as a linked branch (caller then tries the branch-name parse).
+    This is the FIRST resolution path, answered from the (refreshed)
+    `LinkIndex`. Returns None if no open issue has this branch as a linked
+    branch (caller then tries the branch-name parse).
     """
-    name = short_branch(branch)
-    data = graphql(_LINKED_BRANCH_LOOKUP, {"owner": owner, "repo": repo, "name": name}, token=token)
-    issues = (((data.get("repository") or {}).get("issues")) or {}).get("nodes") or []
-    for iss in issues:
-        for lb in ((iss.get("linkedBranches") or {}).get("nodes")) or []:
-            if short_branch((lb.get("ref") or {}).get("name") or "") == name:
-                return {"number": iss.get("number"), "id": iss.get("id"), "via": "linked-branch"}
-    return None
+    links = links or LinkIndex(owner, repo, token=token)
+    links.refresh()
+    links.save()
+    number = links.get(branch)
+    if number is None:
+        return None
+    return {"number": number, "id": None, "via": "linked-branch"}
 
 
 def issue_from_branch_name(branch: str):
@@ -204,9 +525,10 @@ def issue_from_branch_name(branch: str):
     return {"number": int(m.group(1)), "id": None, "via": "branch-name"}
 
 
-def resolve_issue_for_branch(owner: str, repo: str, branch: str, *, token: str | None = None):
+def resolve_issue_for_branch(owner: str, repo: str, branch: str, *,
+                             links: "LinkIndex | None" = None, token: str | None = None):
     """LINKED BRANCH first, branch-name parse fallback. No `Closes #N`."""
-    linked = issue_from_linked_branch(owner, repo, branch, token=token)
+    linked = issue_from_linked_branch(owner, repo, branch, links=links, token=token)
     if linked and linked.get("number"):
         return linked
     return issue_from_branch_name(branch)
@@ -271,6 +593,11 @@ class ProjectStatus:
 
     def resolve(self) -> "ProjectStatus":
         data = graphql(_PROJECT_FIELDS, {"owner": self.owner, "number": self.number}, token=self.token)
+        return self.load(data)
+
+    def load(self, data: dict) -> "ProjectStatus":
+        """Fill the project id + Status field/options from a read that selected
+        `organization.projectV2 { id field(name:"Status") }`."""
         proj = (((data.get("organization") or {}).get("projectV2")) or {})
         if not proj.get("id"):
             raise GhError(f"project {self.owner}#{self.number} not found", code=3)
@@ -298,14 +625,112 @@ def issue_id_by_number(owner: str, repo: str, number: int, *, token: str | None
 
 def current_status_for_issue(issue_id: str, project_number: int, *, token: str | None = None):
     data = graphql(_ITEM_FOR_ISSUE, {"issue": issue_id}, token=token)
-    node = data.get("node") or {}
-    for it in ((node.get("projectItems") or {}).get("nodes")) or []:
+    return _project_item(data.get("node") or {}, project_number)
+
+
+def _project_item(issue: dict, project_number: int):
+    """(item id, current Status) of `issue` on the project, or (None, None)."""
+    for it in ((issue.get("projectItems") or {}).get("nodes")) or []:
         if (it.get("project") or {}).get("number") == int(project_number):
             cur = (it.get("fieldValueByName") or {}).get("name")
             return it.get("id"), cur
     return None, None
 
 
+# --------------------------------------------------------------------------- #
+# The one read a hot event needs: the indexed issue to verify, the branch-name
+# / known issue by number, each with its project items + current Status, and
+# the project's Status field + options — one round-trip instead of four
+# sequential ones (each a fresh `gh` fork on a cold runner).
+# --------------------------------------------------------------------------- #
+_EVENT_READ = """
+query($owner:String!, $repo:String!, $project:Int!, $linked:Int!, $byLinked:Boolean!,
+      $number:Int!, $byNumber:Boolean!){
+  repository(owner:$owner, name:$repo){
+    linked: issue(number:$linked) @include(if:$byLinked){ ...LinkIssue ...EventIssue }
+    issue(number:$number) @include(if:$byNumber){ ...EventIssue }
+  }
+  organization(login:$owner){
+    projectV2(number:$project){
+      id
+      field(name:"Status"){
+        ... on ProjectV2SingleSelectField { id name options{ id name } }
+      }
+    }
+  }
+}
+fragment EventIssue on Issue {
+  number id
+  projectItems(first:20){
+    nodes{
+      id
+      project{ id number }
+      fieldValueByName(name:"Status"){
+        ... on ProjectV2ItemFieldSingleSelectValue { name }
+      }
+    }
+  }
+}
+""" + _LINK_ISSUE
+
+
+def _event_read(owner, repo, project_number, *, linked=None, number=None,
+                token=None) -> dict:
+    variables = {"owner": owner, "repo": repo, "project": int(project_number),
+                 "linked": int(linked or 0), "byLinked": linked is not None,
+                 "number": int(number or 0), "byNumber": number is not None}
+    return graphql(_EVENT_READ, variables, token=token)
+
+
+def read_event(owner: str, repo: str, project_number: int, branch: str, *,
+               pr_issue_number: int | None = None, links: "LinkIndex | None" = None,
+               token: str | None = None) -> dict:
+    """Resolve everything `apply_event` needs in ONE GraphQL read.
+
+    Returns {link, issue, project}: `link` is the issue link (LINKED BRANCH
+    via the `LinkIndex` first, then the branch-name parse, or the caller's
+    known `pr_issue_number`) or None; `issue` is that issue's node with its
+    project items; `project` is the resolved `ProjectStatus` (None without a
+    link). The index is consulted only without a known `pr_issue_number`: a
+    missing or stale one is (re)built first, and a branch it does not know
+    syncs it from the issues updated since (link fields only) before the read.
+    Raises code 3 when the fallback number is no issue, or the project is not
+    found.
+    """
+    if pr_issue_number is not None:
+        fallback = {"number": int(pr_issue_number), "id": None, "via": "linked-branch"}
+    else:
+        fallback = issue_from_branch_name(branch)
+    name = short_branch(branch)
+    hit = None
+    if pr_issue_number is None:
+        links = links or LinkIndex(owner, repo, token=token)
+        if not links.ensure() and links.get(name) is None:
+            links.refresh()  # an unknown branch: sync the index before giving up on it
+        hit = links.get(name)
+    data = _event_read(owner, repo, project_number, linked=hit,
+                       number=fallback["number"] if fallback else None, token=token)
+    repository = data.get("repository") or {}
+    link, issue = None, None
+    if pr_issue_number is None:
+        if hit is not None:
+            issue = repository.get("linked")
+            # VERIFY against the issue itself: a stale entry is dropped.
+            if (not issue or (issue.get("state") or "OPEN") != "OPEN"
+                    or name not in _linked_names(issue)):
+                links.forget(name)
+                issue = None
+            else:
+                link = {"number": hit, "id": issue.get("id"), "via": "linked-branch"}
+        links.save()
+    if link is None and fallback is not None:
+        link, issue = fallback, repository.get("issue")
+        if not (issue or {}).get("id"):
+            raise GhError(f"issue {owner}/{repo}#{link['number']} not found", code=3)
+    project = ProjectStatus(owner, project_number, token=token).load(data) if link else None
+    return {"link": link, "issue": issue, "project": project}
+
+
 def set_status(project: "ProjectStatus", item_id: str, target_status: str) -> dict:
     opt = project.option_id(target_status)
     graphql(
@@ -338,27 +763,30 @@ def target_for_event(event_name: str, action: str | None, *, draft: bool) -> str
 
 def apply_event(owner: str, repo: str, project_number: int, *, event_name: str,
                 action: str | None, branch: str, draft: bool,
-                pr_issue_number: int | None = None, token: str | None = None) -> dict:
+                pr_issue_number: int | None = None, links: "LinkIndex | None" = None,
+                token: str | None = None) -> dict:
     """Resolve the issue + advance its Status for this event (idempotent/monotonic).
 
     `branch` is the head ref (the pushed branch or the PR head branch). The issue
     is resolved LINKED-BRANCH-FIRST then by branch name unless a caller
     passes an already-known `pr_issue_number` (still never from `Closes #N`).
+    `links` is the persisted `LinkIndex` (an in-memory one is built if None).
+    A hot event costs one read (`read_event`) plus at most one write; a branch
+    the link index does not know adds one lean index sync.
     """
     target = target_for_event(event_name, action, draft=draft)
     if target is None:
         return {"skipped": "event-ignored", "event": event_name, "action": action}
 
-    if pr_issue_number is not None:
-        link = {"number": int(pr_issue_number), "id": None, "via": "linked-branch"}
-    else:
-        link = resolve_issue_for_branch(owner, repo, branch, token=token)
+    # One read resolves the link, the issue's item + current Status and the
+    # project's Status field; the only other request is the write (if any).
+    found = read_event(owner, repo, project_number, branch,
+                       pr_issue_number=pr_issue_number, links=links, token=token)
+    link = found["link"]
     if not link or not link.get("number"):
         return {"skipped": "no-issue-link", "branch": short_branch(branch)}
-
-    issue_id = link.get("id") or issue_id_by_number(owner, repo, link["number"], token=token)
-    project = ProjectStatus(owner, project_number, token=token).resolve()
-    item_id, current = current_status_for_issue(issue_id, project_number, token=token)
+    project = found["project"]
+    item_id, current = _project_item(found["issue"], project_number)
     if item_id is None:
         return {"skipped": "not-on-project", "issue": link["number"]}
 
@@ -401,6 +829,275 @@ def _params_from_event(event_name: str, event: dict, ref_env: str | None):
     return None, ref, False, None
 
 
+# --------------------------------------------------------------------------- #
+# Long-lived WORKER mode (`--stdin` / `--serve PORT`).
+# --------------------------------------------------------------------------- #
+# An Actions job per push pays for a runner, a token mint and a cold resolve
+# before its one write. A high-push-rate repo can instead feed events to one
+# long-running worker from a local sender (a webhook relay, a queue consumer):
+# the token, the link index and the project stay warm across events, and a
+# burst is COALESCED — each branch is read once, and each issue gets at most
+# one write toward the most advanced target in the burst, through the same
+# MONOTONIC guard as a single event.
+WORKER_PR_ACTIONS = ("opened", "ready_for_review", "converted_to_draft", "reopened")
+
+
+class Worker:
+    """Applies bursts of (event name, payload) for one repo + project.
+
+    `token_file` is re-read whenever it changes, so an external refresher can
+    rotate the hour-long App installation token under a running worker.
+    """
+
+    def __init__(self, owner: str, repo: str, project_number: int, *,
+                 project_owner: str | None = None, links: "LinkIndex | None" = None,
+                 token: str | None = None, token_file: str | None = None):
+        self.owner = owner
+        self.repo = repo
+        self.project_owner = project_owner or owner
+        self.project_number = int(project_number)
+        self.token_file = token_file
+        self._token = token
+        self._token_mtime = None
+        self.links = links or LinkIndex(owner, repo, token=token)
+
+    @property
+    def token(self) -> str | None:
+        if self.token_file:
+            try:
+                mtime = os.stat(self.token_file).st_mtime
+                if mtime != self._token_mtime:
+                    with open(self.token_file, "r", encoding="utf-8") as fh:
+                        self._token = fh.read().strip() or None
+                    self._token_mtime = mtime
+            except OSError:
+                pass  # keep the last good token
+        self.links.token = self._token
+        return self._token
+
+    def _target(self, name: str, payload: dict):
+        """(target, branch, pr issue) for an event, or a skip result."""
+        action, branch, draft, pr_issue = _params_from_event(name, payload, None)
+        if name == "pull_request" and action not in WORKER_PR_ACTIONS:
+            return {"skipped": "event-ignored", "event": name, "action": action}
+        if name == "push":
+            default = (payload.get("repository") or {}).get("default_branch")
+            if payload.get("deleted") or (default and short_branch(branch) == default):
+                return {"skipped": "default-branch" if not payload.get("deleted") else "deleted",
+                        "branch": short_branch(branch)}
+        target = target_for_event(name, action, draft=draft)
+        if target is None:
+            return {"skipped": "event-ignored", "event": name, "action": action}
+        return target, short_branch(branch), pr_issue
+
+    def handle(self, events, results: list | None = None) -> list:
+        """Apply one burst; returns the skips plus one result per issue. Rows go
+        into `results` as they land, so a caller keeps them if a write raises."""
+        token = self.token
+        results = [] if results is None else results
+        by_branch = {}
+        for name, payload in events:
+            got = self._target(name, payload or {})
+            if isinstance(got, dict):
+                results.append(got)
+                continue
+            target, branch, pr_issue = got
+            best, count = by_branch.get((branch, pr_issue), (None, 0))
+            if best is None or status_rank(target) > status_rank(best):
+                best = target
+            by_branch[(branch, pr_issue)] = (best, count + 1)
+        by_issue, project = {}, None
+        for (branch, pr_issue), (target, count) in by_branch.items():
+            try:
+                found = read_event(self.project_owner, self.repo, self.project_number, branch,
+                                   pr_issue_number=pr_issue, links=self.links, token=token)
+            except GhError as e:
+                results.append({"branch": branch, "error": _scrub(str(e)), "code": e.code,
+                                "events": count})
+                continue
+            link = found["link"]
+            if not link or not link.get("number"):
+                results.append({"skipped": "no-issue-link", "branch": branch, "events": count})
+                continue
+            project = found["project"]
+            item_id, current = _project_item(found["issue"], self.project_number)
+            if item_id is None:
+                results.append({"skipped": "not-on-project", "issue": link["number"],
+                                "events": count})
+                continue
+            have = by_issue.get(link["number"])
+            if have is None or status_rank(target) > status_rank(have["target"]):
+                by_issue[link["number"]] = {"target": target, "item": item_id, "from": current,
+                                            "via": link["via"],
+                                            "events": count + (have or {}).get("events", 0)}
+            else:
+                have["events"] += count
+        try:
+            for number, e in by_issue.items():
+                # MONOTONIC guard: only advance; a stale/replayed event is a no-op.
+                to_write = advance_status(e["from"], e["target"])
+                if to_write is not None:
+                    set_status(project, e["item"], to_write)
+                results.append({"issue": number, "from": e["from"], "to": to_write or e["from"],
+                                "wrote": to_write is not None, "via": e["via"],
+                                "target": e["target"], "events": e["events"]})
+        finally:
+            self.links.save()
+        return results
+
+
+# Transport: one JSON event per line on stdin, or `POST /` on a LOCAL HTTP
+# endpoint (body = the event payload; `X-GitHub-Event` names it; with a
+# webhook secret, `X-Hub-Signature-256` must verify). Both feed one queue; a
+# single drain thread hands the worker a burst at a time — the first event,
+# plus whatever arrives within COALESCE_WINDOW of the last (up to MAX_BURST).
+# A body over MAX_BODY is refused unread; off loopback, a secret is required.
+COALESCE_WINDOW = 0.25
+MAX_BURST = 200
+MAX_BODY = 5 * 1024 * 1024
+_STOP = object()
+
+
+def _bursts(q, window: float = COALESCE_WINDOW):
+    """Yield lists of queued events until `_STOP` is queued."""
+    while True:
+        first = q.get()
+        if first is _STOP:
+            return
+        burst = [first]
+        while len(burst) < MAX_BURST:
+            try:
+                nxt = q.get(timeout=window)
+            except queue.Empty:
+                break
+            if nxt is _STOP:
+                yield burst
+                return
+            burst.append(nxt)
+        yield burst
+
+
+def _drain(worker, q, out, window: float) -> None:
+    """Apply each burst; one JSON line per burst. An error is reported with
+    the results the burst had before it, and the worker keeps serving."""
+    for burst in _bursts(q, window):
+        results: list = []
+        line = {"events": len(burst), "results": results}
+        try:
+            worker.handle(burst, results)
+        except GhError as e:
+            line.update(error=_scrub(str(e)), code=e.code)
+        except Exception as e:  # noqa: BLE001
+            line.update(error="unexpected: " + _scrub(str(e)), code=1)
+        out.write(_scrub(json.dumps(line)) + "\n")
+        out.flush()
+
+
+def _event_from_line(line):
+    """`{"event": NAME, "payload": {...}}` (also `event_name`) -> (NAME, payload)."""
+    obj = json.loads(line)
+    if not isinstance(obj, dict):
+        raise ValueError("an event line must be a JSON object")
+    name = obj.get("event") or obj.get("event_name") or ""
+    return str(name), obj.get("payload") or {}
+
+
+def run_stream(worker, stream, out=None, *, window: float = COALESCE_WINDOW) -> None:
+    """Feed `worker` from a line stream (stdin) until EOF."""
+    out = out or sys.stdout
+    q: queue.Queue = queue.Queue()
+    drainer = threading.Thread(target=_drain, args=(worker, q, out, window), daemon=True)
+    drainer.start()
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            q.put(_event_from_line(line))
+        except ValueError as e:
+            sys.stderr.write(f"error: bad event line: {_scrub(str(e))}\n")
+    q.put(_STOP)
+    drainer.join()
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _signature_ok(secret: str, body: bytes, header: str | None) -> bool:
+    digest = "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return bool(header) and hmac.compare_digest(digest, header)
+
+
+class _WorkerHandler(BaseHTTPRequestHandler):
+    def _reply(self, code: int, obj: dict) -> None:
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802 — liveness probe
+        self._reply(200, {"ok": True})
+
+    def do_POST(self):  # noqa: N802
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY:
+            self.close_connection = True  # the body is never read
+            if length < 0:
+                return self._reply(400, {"error": "bad Content-Length"})
+            return self._reply(413, {"error": f"body over {MAX_BODY} bytes"})
+        body = self.rfile.read(length)
+        secret = self.server.secret
+        if secret and not _signature_ok(secret, body, self.headers.get("X-Hub-Signature-256")):
+            return self._reply(401, {"error": "bad signature"})
+        name = self.headers.get("X-GitHub-Event")
+        try:
+            event = (name, json.loads(body or b"{}")) if name else _event_from_line(body or b"{}")
+        except ValueError:
+            return self._reply(400, {"error": "body is not a JSON event"})
+        self.server.feed.put(event)
+        self._reply(202, {"queued": event[0]})
+
+    def log_message(self, *args):  # requests are not logged (no payload echo)
+        pass
+
+
+class WorkerServer(ThreadingHTTPServer):
+    """The local HTTP endpoint feeding a worker; its drain thread starts here.
+
+    Run `serve_forever()`; after `shutdown()`, `close()` waits for the events
+    already queued. Binding off loopback without a `secret` raises ValueError.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, worker, host: str = "127.0.0.1", port: int = 0, *,
+                 secret: str | None = None, window: float = COALESCE_WINDOW, out=None):
+        if not secret and not _is_loopback(host):
+            raise ValueError(f"--host {host} is not loopback: set a webhook secret")
+        super().__init__((host, port), _WorkerHandler)
+        self.secret = secret
+        self.feed: queue.Queue = queue.Queue()
+        self._drainer = threading.Thread(target=_drain,
+                                         args=(worker, self.feed, out or sys.stdout, window),
+                                         daemon=True)
+        self._drainer.start()
+
+    def close(self) -> None:
+        self.server_close()
+        self.feed.put(_STOP)
+        self._drainer.join()
+
+
 def build_parser():
     import argparse
 
@@ -411,6 +1108,22 @@ def build_parser():
     p.add_argument("--event-path", default=os.environ.get("GITHUB_EVENT_PATH", ""))
     p.add_argument("--app-token", default="", help="App INSTALLATION token (never GITHUB_TOKEN)")
     p.add_argument("--project-owner", default="", help="org login owning the Project")
+    p.add_argument("--link-index", default=os.environ.get("BOARD_SYNC_LINK_INDEX", ""),
+                   help="JSON file persisting the branch -> issue link index between runs")
+    p.add_argument("--refresh-links", action="store_true",
+                   help="only build/sync the link index (no event, no Status write)")
+    p.add_argument("--stdin", action="store_true",
+                   help="worker mode: apply JSON events ({event, payload}) read line by line")
+    p.add_argument("--serve", type=int, default=None, metavar="PORT",
+                   help="worker mode: accept webhook events on a local HTTP endpoint")
+    p.add_argument("--host", default="127.0.0.1",
+                   help="--serve bind address (off loopback, the webhook secret is required)")
+    p.add_argument("--app-token-file", default="",
+                   help="worker mode: file holding the App token (re-read when it changes)")
+    p.add_argument("--coalesce-ms", type=int, default=int(COALESCE_WINDOW * 1000),
+                   help="worker mode: how long a burst may take to arrive")
+    p.add_argument("--cost-report", action="store_true",
+                   help="print the GraphQL points GitHub charged per query page (stderr)")
     return p
 
 
@@ -426,6 +1139,20 @@ def main(argv=None) -> int:
     owner_login, repo_name = args.repo.split("/", 1)
     project_owner = args.project_owner or os.environ.get("PROJECT_OWNER", owner_login)
     token = args.app_token or os.environ.get("GH_APP_TOKEN") or None
+    links = LinkIndex(owner_login, repo_name, args.link_index or None, token=token)
+    if args.refresh_links:
+        try:
+            rebuilt = links.refresh()
+            links.save()
+        except GhError as e:
+            sys.stderr.write("error: " + _scrub(str(e)) + "\n")
+            return e.code
+        finally:
+            _emit_budget(args.cost_report)
+        _print_json({"links": len(links.branches), "rebuilt": rebuilt})
+        return 0
+    if args.stdin or args.serve is not None:
+        return _run_worker(args, owner_login, repo_name, project_owner, links, token)
     if not args.event_name:
         sys.stderr.write("error: no --event-name / GITHUB_EVENT_NAME\n")
         return 2
@@ -439,7 +1166,7 @@ def main(argv=None) -> int:
         out = apply_event(
             project_owner, repo_name, args.project,
             event_name=args.event_name, action=action, branch=branch, draft=draft,
-            pr_issue_number=pr_issue, token=token,
+            pr_issue_number=pr_issue, links=links, token=token,
         )
     except GhError as e:
         sys.stderr.write("error: " + _scrub(str(e)) + "\n")
@@ -447,10 +1174,40 @@ def main(argv=None) -> int:
     except Exception as e:  # noqa: BLE001
         sys.stderr.write("error: unexpected: " + _scrub(str(e)) + "\n")
         return 1
+    finally:
+        _emit_budget(args.cost_report)
 
     _print_json(out)
     return 0
 
 
+def _run_worker(args, owner, repo, project_owner, links, token) -> int:
+    worker = Worker(owner, repo, args.project, project_owner=project_owner, links=links,
+                    token=token, token_file=args.app_token_file or None)
+    window = max(0, args.coalesce_ms) / 1000
+    try:
+        if args.stdin:
+            run_stream(worker, sys.stdin, window=window)
+            return 0
+        try:
+            server = WorkerServer(worker, args.host, args.serve, window=window,
+                                  secret=os.environ.get("BOARD_SYNC_WEBHOOK_SECRET") or None)
+        except ValueError as e:  # off loopback without a secret
+            sys.stderr.write("error: " + _scrub(str(e)) + "\n")
+            return 2
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+        return 0
+    except OSError as e:
+        sys.stderr.write("error: " + _scrub(str(e)) + "\n")
+        return 1
+    finally:
+        _emit_budget(args.cost_report)
+
+
 if __name__ == "__main__":
     sys.exit(main())